@@ -0,0 +1,130 @@
+import argparse
+import time
+from typing import Callable
+
+import cv2
+import numpy as np
+import supervision as sv
+
+from inference.core.workflows.core_steps.common.serializers import (
+    serialise_sv_detections,
+    serialise_sv_detections_columnar,
+)
+
+
+def generate_detections(
+    detections: int, height: int, width: int, with_masks: bool, seed: int = 42
+) -> sv.Detections:
+    rng = np.random.default_rng(seed)
+    sizes = rng.uniform(10, 120, size=(detections, 2))
+    top_left = rng.uniform(0, 1, size=(detections, 2)) * ([width, height] - sizes)
+    xyxy = np.concatenate([top_left, top_left + sizes], axis=1).astype(np.float32)
+    masks = None
+    if with_masks:
+        masks = np.zeros((detections, height, width), dtype=bool)
+        for mask, (x_min, y_min, x_max, y_max) in zip(masks, xyxy.astype(int)):
+            canvas = mask.view(np.uint8)
+            cv2.ellipse(
+                canvas,
+                ((x_min + x_max) // 2, (y_min + y_max) // 2),
+                ((x_max - x_min) // 2, (y_max - y_min) // 2),
+                0,
+                0,
+                360,
+                1,
+                -1,
+            )
+    return sv.Detections(
+        xyxy=xyxy,
+        mask=masks,
+        confidence=rng.uniform(0, 1, size=detections).astype(np.float32),
+        class_id=rng.integers(0, 80, size=detections),
+        tracker_id=np.arange(detections),
+        data={
+            "class_name": np.array([f"class_{i % 80}" for i in range(detections)]),
+            "detection_id": np.array([f"{i}" for i in range(detections)]),
+            "parent_id": np.array(["image"] * detections),
+            "image_dimensions": np.array([[height, width]] * detections),
+        },
+    )
+
+
+def serialise_detection_by_detection(detections: sv.Detections) -> dict:
+    # reference: per-detection loop serialising the same fields
+    predictions = []
+    for xyxy, mask, confidence, class_id, tracker_id, data in detections:
+        x1, y1, x2, y2 = xyxy.astype(float).tolist()
+        prediction = {
+            "width": abs(x2 - x1),
+            "height": abs(y2 - y1),
+            "x": x1 + abs(x2 - x1) / 2,
+            "y": y1 + abs(y2 - y1) / 2,
+            "confidence": float(confidence),
+            "class_id": int(class_id),
+        }
+        if mask is not None:
+            polygon = sv.mask_to_polygons(mask=mask)
+            prediction["points"] = [
+                {"x": float(x), "y": float(y)} for x, y in polygon[0]
+            ]
+        prediction["tracker_id"] = int(tracker_id)
+        prediction["class"] = str(data["class_name"])
+        prediction["detection_id"] = str(data["detection_id"])
+        prediction["parent_id"] = str(data["parent_id"])
+        predictions.append(prediction)
+    return {"predictions": predictions}
+
+
+def benchmark(
+    name: str,
+    serializer: Callable[[sv.Detections], dict],
+    detections: sv.Detections,
+    iterations: int,
+    warm_up: int,
+) -> None:
+    durations = []
+    for i in range(warm_up + iterations):
+        start = time.perf_counter()
+        _ = serializer(detections)
+        if i >= warm_up:
+            durations.append(time.perf_counter() - start)
+    durations = np.array(durations) * 1000
+    print(
+        f"{name:>20}: mean={durations.mean():.2f}ms median={np.median(durations):.2f}ms "
+        f"p95={np.percentile(durations, 95):.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare serialisation of sv.Detections into Workflows outputs"
+    )
+    parser.add_argument("--detections", type=int, default=500)
+    parser.add_argument("--image_height", type=int, default=1080)
+    parser.add_argument("--image_width", type=int, default=1920)
+    parser.add_argument("--without_masks", action="store_true")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--warm_up", type=int, default=2)
+    args = parser.parse_args()
+    detections = generate_detections(
+        detections=args.detections,
+        height=args.image_height,
+        width=args.image_width,
+        with_masks=not args.without_masks,
+    )
+    for name, serializer in [
+        ("per-detection loop", serialise_detection_by_detection),
+        ("vectorized", serialise_sv_detections),
+        ("vectorized columnar", serialise_sv_detections_columnar),
+    ]:
+        benchmark(
+            name=name,
+            serializer=serializer,
+            detections=detections,
+            iterations=args.iterations,
+            warm_up=args.warm_up,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import argparse
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from inference.core.models.object_detection_base import (
+    ObjectDetectionBaseOnnxRoboflowInferenceModel,
+)
+from inference.core.models.utils.preprocessing import PreprocessingBuffer
+from inference.core.workflows.core_steps.transformations.image_slicer.v1 import (
+    ImageSlicerBlockV1,
+)
+from inference.core.workflows.execution_engine.entities.base import (
+    ImageParentMetadata,
+    WorkflowImageData,
+)
+
+
+def create_model(
+    size: int,
+    preprocessing_buffer: Optional[PreprocessingBuffer],
+) -> ObjectDetectionBaseOnnxRoboflowInferenceModel:
+    # preprocessing does not touch weights - model state is mocked to benchmark it offline
+    model = object.__new__(ObjectDetectionBaseOnnxRoboflowInferenceModel)
+    model.preproc = {}
+    model.resize_method = "Stretch to"
+    model.img_size_h = size
+    model.img_size_w = size
+    model.batching_enabled = True
+    model.image_loader_threadpool = ThreadPoolExecutor()
+    model.preprocessing_buffer = preprocessing_buffer
+    model.uint8_input = False
+    return model
+
+
+def slice_image(
+    image: WorkflowImageData, slice_size: int, overlap_ratio: float
+) -> List[WorkflowImageData]:
+    slices = ImageSlicerBlockV1().run(
+        image=image,
+        slice_width=slice_size,
+        slice_height=slice_size,
+        overlap_ratio_width=overlap_ratio,
+        overlap_ratio_height=overlap_ratio,
+    )
+    return [s["slices"] for s in slices if s["slices"] is not None]
+
+
+def slices_as_copies(slices: List[WorkflowImageData]) -> List[np.ndarray]:
+    # reference: slices materialised as standalone arrays
+    return [s.numpy_image.copy() for s in slices]
+
+
+def slices_as_views(slices: List[WorkflowImageData]) -> List[np.ndarray]:
+    return [s.numpy_image for s in slices]
+
+
+def benchmark(
+    name: str,
+    image: WorkflowImageData,
+    model: ObjectDetectionBaseOnnxRoboflowInferenceModel,
+    materialise: Callable[[List[WorkflowImageData]], List[np.ndarray]],
+    slice_size: int,
+    overlap_ratio: float,
+    iterations: int,
+    warm_up: int,
+) -> None:
+    def run() -> int:
+        slices = slice_image(
+            image=image, slice_size=slice_size, overlap_ratio=overlap_ratio
+        )
+        _ = model.preprocess(materialise(slices))
+        return len(slices)
+
+    durations = []
+    for i in range(warm_up + iterations):
+        start = time.perf_counter()
+        slices_count = run()
+        if i >= warm_up:
+            durations.append(time.perf_counter() - start)
+    tracemalloc.start()
+    _ = run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    durations = np.array(durations) * 1000
+    print(
+        f"{name:>18}: {slices_count} slices | mean={durations.mean():.2f}ms "
+        f"median={np.median(durations):.2f}ms p95={np.percentile(durations, 95):.2f}ms "
+        f"| peak allocated memory={peak / 2**20:.1f}MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare memory and latency of SAHI-style slicing of large images "
+        "followed by preprocessing of slices into model input"
+    )
+    parser.add_argument("--image_height", type=int, default=2160)
+    parser.add_argument("--image_width", type=int, default=3840)
+    parser.add_argument("--slice_size", type=int, default=640)
+    parser.add_argument("--overlap_ratio", type=float, default=0.2)
+    parser.add_argument("--model_input_size", type=int, default=640)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--warm_up", type=int, default=2)
+    args = parser.parse_args()
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="image"),
+        numpy_image=np.random.randint(
+            0, 256, size=(args.image_height, args.image_width, 3), dtype=np.uint8
+        ),
+    )
+    for name, materialise, preprocessing_buffer in [
+        ("copies + legacy", slices_as_copies, None),
+        (
+            "views + fused",
+            slices_as_views,
+            PreprocessingBuffer(
+                height=args.model_input_size, width=args.model_input_size
+            ),
+        ),
+    ]:
+        model = create_model(
+            size=args.model_input_size,
+            preprocessing_buffer=preprocessing_buffer,
+        )
+        benchmark(
+            name=name,
+            image=image,
+            model=model,
+            materialise=materialise,
+            slice_size=args.slice_size,
+            overlap_ratio=args.overlap_ratio,
+            iterations=args.iterations,
+            warm_up=args.warm_up,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import argparse
+import time
+from typing import Callable
+
+import numpy as np
+
+from inference.core.nms import (
+    legacy_non_max_suppression,
+    vectorized_non_max_suppression,
+)
+
+
+def generate_predictions(
+    batch_size: int, anchors: int, num_classes: int, seed: int = 42
+) -> np.ndarray:
+    # mimics YOLOv8 raw output: [x, y, w, h, max_class_confidence, class_confidences...]
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(0, 640, size=(batch_size, anchors, 2))
+    sizes = rng.uniform(5, 120, size=(batch_size, anchors, 2))
+    classes_confidence = rng.uniform(0, 1, size=(batch_size, anchors, num_classes)) ** 8
+    return np.concatenate(
+        [
+            centers,
+            sizes,
+            classes_confidence.max(axis=2, keepdims=True),
+            classes_confidence,
+        ],
+        axis=2,
+    ).astype(np.float32)
+
+
+def benchmark(
+    name: str,
+    nms: Callable,
+    predictions: np.ndarray,
+    iterations: int,
+    warm_up: int,
+    **kwargs,
+) -> None:
+    durations = []
+    for i in range(warm_up + iterations):
+        batch = predictions.copy()
+        start = time.perf_counter()
+        _ = nms(batch, **kwargs)
+        if i >= warm_up:
+            durations.append(time.perf_counter() - start)
+    durations = np.array(durations) * 1000
+    print(
+        f"{name:>10}: mean={durations.mean():.2f}ms median={np.median(durations):.2f}ms "
+        f"p95={np.percentile(durations, 95):.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare legacy and vectorized NMS on synthetic YOLOv8 outputs"
+    )
+    parser.add_argument("--batch_size", type=int, default=1)
+    parser.add_argument("--anchors", type=int, default=8400)
+    parser.add_argument("--num_classes", type=int, default=80)
+    parser.add_argument("--confidence", type=float, default=0.25)
+    parser.add_argument("--iou_threshold", type=float, default=0.45)
+    parser.add_argument("--class_agnostic", action="store_true")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warm_up", type=int, default=5)
+    args = parser.parse_args()
+    predictions = generate_predictions(
+        batch_size=args.batch_size,
+        anchors=args.anchors,
+        num_classes=args.num_classes,
+    )
+    print(
+        f"Predictions shape: {predictions.shape}, candidates above threshold: "
+        f"{int((predictions[:, :, 4] >= args.confidence).sum())}"
+    )
+    for name, nms in [
+        ("legacy", legacy_non_max_suppression),
+        ("vectorized", vectorized_non_max_suppression),
+    ]:
+        benchmark(
+            name=name,
+            nms=nms,
+            predictions=predictions,
+            iterations=args.iterations,
+            warm_up=args.warm_up,
+            conf_thresh=args.confidence,
+            iou_thresh=args.iou_threshold,
+            class_agnostic=args.class_agnostic,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import argparse
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+import onnxruntime
+
+from inference.core.models.utils.onnx import IOBindingSessionRunner
+
+
+def create_synthetic_model(input_size: int, num_outputs: int) -> bytes:
+    # detection-head-like model: single strided conv producing big output tensor
+    from onnx import TensorProto, helper, numpy_helper
+
+    weights = np.random.default_rng(0).random((num_outputs, 3, 8, 8), dtype=np.float32)
+    graph = helper.make_graph(
+        nodes=[
+            helper.make_node(
+                "Conv", ["images", "weights"], ["features"], strides=[8, 8]
+            ),
+            helper.make_node("Flatten", ["features"], ["flat"], axis=2),
+            helper.make_node("Sigmoid", ["flat"], ["output"]),
+        ],
+        name="synthetic",
+        inputs=[
+            helper.make_tensor_value_info(
+                "images", TensorProto.FLOAT, ["batch", 3, input_size, input_size]
+            )
+        ],
+        outputs=[helper.make_tensor_value_info("output", TensorProto.FLOAT, None)],
+        initializer=[numpy_helper.from_array(weights, name="weights")],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    return model.SerializeToString()
+
+
+def benchmark(
+    name: str,
+    run: Callable[[np.ndarray], List[np.ndarray]],
+    img_in: np.ndarray,
+    iterations: int,
+    warm_up: int,
+) -> None:
+    durations = []
+    for i in range(warm_up + iterations):
+        start = time.perf_counter()
+        _ = run(img_in)
+        if i >= warm_up:
+            durations.append(time.perf_counter() - start)
+    durations = np.array(durations) * 1000
+    print(
+        f"{name:>12} (batch={img_in.shape[0]}): mean={durations.mean():.3f}ms "
+        f"median={np.median(durations):.3f}ms p95={np.percentile(durations, 95):.3f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare InferenceSession.run(...) with IO binding and reused output "
+        "buffers on CPU execution provider"
+    )
+    parser.add_argument("--model_path", type=str, default=None)
+    parser.add_argument("--model_input_size", type=int, default=640)
+    parser.add_argument("--num_outputs", type=int, default=84)
+    parser.add_argument("--batch_sizes", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warm_up", type=int, default=5)
+    args = parser.parse_args()
+    model: Optional[bytes] = None
+    if args.model_path is None:
+        model = create_synthetic_model(
+            input_size=args.model_input_size, num_outputs=args.num_outputs
+        )
+    session = onnxruntime.InferenceSession(
+        args.model_path or model, providers=["CPUExecutionProvider"]
+    )
+    model_input = session.get_inputs()[0]
+    runner = IOBindingSessionRunner(session=session, input_name=model_input.name)
+    for batch_size in args.batch_sizes:
+        img_in = np.random.rand(
+            batch_size, 3, args.model_input_size, args.model_input_size
+        ).astype(np.float32)
+        benchmark(
+            name="run",
+            run=lambda x: session.run(None, {model_input.name: x}),
+            img_in=img_in,
+            iterations=args.iterations,
+            warm_up=args.warm_up,
+        )
+        benchmark(
+            name="io_binding",
+            run=runner.run,
+            img_in=img_in,
+            iterations=args.iterations,
+            warm_up=args.warm_up,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import argparse
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+
+from inference.core.models.object_detection_base import (
+    ObjectDetectionBaseOnnxRoboflowInferenceModel,
+)
+from inference.core.models.utils.preprocessing import PreprocessingBuffer
+
+
+def create_model(
+    resize_method: str,
+    size: int,
+    preprocessing_buffer: Optional[PreprocessingBuffer],
+) -> ObjectDetectionBaseOnnxRoboflowInferenceModel:
+    # preprocessing does not touch weights - model state is mocked to benchmark it offline
+    model = object.__new__(ObjectDetectionBaseOnnxRoboflowInferenceModel)
+    model.preproc = {}
+    model.resize_method = resize_method
+    model.img_size_h = size
+    model.img_size_w = size
+    model.batching_enabled = True
+    model.image_loader_threadpool = ThreadPoolExecutor()
+    model.preprocessing_buffer = preprocessing_buffer
+    model.uint8_input = False
+    return model
+
+
+def benchmark(
+    name: str,
+    model: ObjectDetectionBaseOnnxRoboflowInferenceModel,
+    images: List[np.ndarray],
+    iterations: int,
+    warm_up: int,
+) -> None:
+    durations = []
+    for i in range(warm_up + iterations):
+        start = time.perf_counter()
+        _ = model.preprocess(images)
+        if i >= warm_up:
+            durations.append(time.perf_counter() - start)
+    tracemalloc.start()
+    _ = model.preprocess(images)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    durations = np.array(durations) * 1000 / len(images)
+    print(
+        f"{name:>8}: per image mean={durations.mean():.3f}ms median={np.median(durations):.3f}ms "
+        f"p95={np.percentile(durations, 95):.3f}ms | peak allocated memory="
+        f"{peak / len(images) / 2**20:.2f}MB/image"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare legacy and fused preprocessing of object detection model inputs"
+    )
+    parser.add_argument("--batch_size", type=int, default=8)
+    parser.add_argument("--image_height", type=int, default=1080)
+    parser.add_argument("--image_width", type=int, default=1920)
+    parser.add_argument("--model_input_size", type=int, default=640)
+    parser.add_argument("--resize_method", type=str, default="Fit (grey edges) in")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warm_up", type=int, default=5)
+    args = parser.parse_args()
+    images = [
+        np.random.randint(
+            0, 256, size=(args.image_height, args.image_width, 3), dtype=np.uint8
+        )
+        for _ in range(args.batch_size)
+    ]
+    for name, preprocessing_buffer in [
+        ("legacy", None),
+        (
+            "fused",
+            PreprocessingBuffer(
+                height=args.model_input_size, width=args.model_input_size
+            ),
+        ),
+    ]:
+        model = create_model(
+            resize_method=args.resize_method,
+            size=args.model_input_size,
+            preprocessing_buffer=preprocessing_buffer,
+        )
+        benchmark(
+            name=name,
+            model=model,
+            images=images,
+            iterations=args.iterations,
+            warm_up=args.warm_up,
+        )
+
+
+if __name__ == "__main__":
+    main()
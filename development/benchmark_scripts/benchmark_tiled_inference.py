@@ -0,0 +1,188 @@
+import argparse
+import time
+from typing import Any, Dict, Optional
+
+import cv2
+import numpy as np
+
+from inference.core.managers.base import ModelManager
+from inference.core.registries.roboflow import RoboflowModelRegistry
+from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.execution_engine.core import ExecutionEngine
+from inference.models.utils import ROBOFLOW_MODEL_TYPES
+
+SLICING_PARAMETERS = [
+    {"type": "WorkflowParameter", "name": "slice_size", "default_value": 640},
+    {"type": "WorkflowParameter", "name": "overlap", "default_value": 0.2},
+    {"type": "WorkflowParameter", "name": "iou_threshold", "default_value": 0.3},
+]
+
+
+def create_three_blocks_workflow(model_type: str, model_id: str) -> dict:
+    return {
+        "version": "1.0",
+        "inputs": [{"type": "WorkflowImage", "name": "image"}] + SLICING_PARAMETERS,
+        "steps": [
+            {
+                "type": "roboflow_core/image_slicer@v1",
+                "name": "slicer",
+                "image": "$inputs.image",
+                "slice_width": "$inputs.slice_size",
+                "slice_height": "$inputs.slice_size",
+                "overlap_ratio_width": "$inputs.overlap",
+                "overlap_ratio_height": "$inputs.overlap",
+            },
+            {
+                "type": f"roboflow_core/roboflow_{model_type}_model@v2",
+                "name": "model",
+                "images": "$steps.slicer.slices",
+                "model_id": model_id,
+                "iou_threshold": "$inputs.iou_threshold",
+            },
+            {
+                "type": "roboflow_core/detections_stitch@v1",
+                "name": "stitch",
+                "reference_image": "$inputs.image",
+                "predictions": "$steps.model.predictions",
+                "overlap_filtering_strategy": "nms",
+                "iou_threshold": "$inputs.iou_threshold",
+            },
+        ],
+        "outputs": [
+            {
+                "type": "JsonField",
+                "name": "predictions",
+                "selector": "$steps.stitch.predictions",
+            },
+        ],
+    }
+
+
+def create_tiled_inference_workflow(model_type: str, model_id: str) -> dict:
+    return {
+        "version": "1.0",
+        "inputs": [{"type": "WorkflowImage", "name": "image"}] + SLICING_PARAMETERS,
+        "steps": [
+            {
+                "type": f"roboflow_core/roboflow_{model_type}_model@v2",
+                "name": "model",
+                "images": "$inputs.image",
+                "model_id": model_id,
+                "iou_threshold": "$inputs.iou_threshold",
+                "tiled_inference": True,
+                "slice_width": "$inputs.slice_size",
+                "slice_height": "$inputs.slice_size",
+                "overlap_ratio_width": "$inputs.overlap",
+                "overlap_ratio_height": "$inputs.overlap",
+            },
+        ],
+        "outputs": [
+            {
+                "type": "JsonField",
+                "name": "predictions",
+                "selector": "$steps.model.predictions",
+            },
+        ],
+    }
+
+
+def load_image(path: Optional[str], height: int, width: int) -> np.ndarray:
+    if path is not None:
+        image = cv2.imread(path)
+        if image is None:
+            raise ValueError(f"Could not load image: {path}")
+        return image
+    # synthetic "aerial" image - noisy background with many small bright objects
+    rng = np.random.default_rng(42)
+    image = rng.integers(0, 80, size=(height, width, 3), dtype=np.uint8)
+    for x, y in rng.uniform(0, 1, size=(2000, 2)) * [width - 30, height - 30]:
+        cv2.rectangle(
+            image, (int(x), int(y)), (int(x) + 20, int(y) + 12), (230,) * 3, -1
+        )
+    return image
+
+
+def benchmark(
+    name: str,
+    workflow_definition: dict,
+    init_parameters: Dict[str, Any],
+    runtime_parameters: Dict[str, Any],
+    iterations: int,
+    warm_up: int,
+) -> None:
+    execution_engine = ExecutionEngine.init(
+        workflow_definition=workflow_definition,
+        init_parameters=init_parameters,
+    )
+    durations = []
+    for i in range(warm_up + iterations):
+        start = time.perf_counter()
+        result = execution_engine.run(runtime_parameters=runtime_parameters)
+        if i >= warm_up:
+            durations.append(time.perf_counter() - start)
+    durations = np.array(durations) * 1000
+    print(
+        f"{name:>12}: {len(result[0]['predictions'])} detections | "
+        f"mean={durations.mean():.1f}ms median={np.median(durations):.1f}ms "
+        f"p95={np.percentile(durations, 95):.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare SAHI with Image Slicer -> model -> Detections Stitch blocks "
+        "against tiled inference mode of model block"
+    )
+    parser.add_argument("--model_id", type=str, default="yolov8n-640")
+    parser.add_argument(
+        "--model_type",
+        type=str,
+        choices=["object_detection", "instance_segmentation"],
+        default="object_detection",
+    )
+    parser.add_argument("--api_key", type=str, default=None)
+    parser.add_argument(
+        "--image", type=str, default=None, help="Path to (large, aerial) image"
+    )
+    parser.add_argument("--image_height", type=int, default=4000)
+    parser.add_argument("--image_width", type=int, default=6000)
+    parser.add_argument("--slice_size", type=int, default=640)
+    parser.add_argument("--overlap", type=float, default=0.2)
+    parser.add_argument("--iou_threshold", type=float, default=0.3)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--warm_up", type=int, default=2)
+    args = parser.parse_args()
+    model_manager = ModelManager(
+        model_registry=RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
+    )
+    init_parameters = {
+        "workflows_core.model_manager": model_manager,
+        "workflows_core.api_key": args.api_key,
+        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
+    }
+    runtime_parameters = {
+        "image": load_image(
+            path=args.image, height=args.image_height, width=args.image_width
+        ),
+        "slice_size": args.slice_size,
+        "overlap": args.overlap,
+        "iou_threshold": args.iou_threshold,
+    }
+    for name, create_workflow in [
+        ("three blocks", create_three_blocks_workflow),
+        ("tiled", create_tiled_inference_workflow),
+    ]:
+        benchmark(
+            name=name,
+            workflow_definition=create_workflow(
+                model_type=args.model_type, model_id=args.model_id
+            ),
+            init_parameters=init_parameters,
+            runtime_parameters=runtime_parameters,
+            iterations=args.iterations,
+            warm_up=args.warm_up,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from inference.core.interfaces.camera.entities import VideoFrameProducer
+from inference.core.interfaces.camera.pyav_video_frame_producer import (
+    PyAVVideoFrameProducer,
+)
+from inference.core.interfaces.camera.video_source import CV2VideoFrameProducer
+
+
+def decode_video(producer_factory: Callable[[], VideoFrameProducer]) -> int:
+    video = producer_factory()
+    frames = 0
+    while video.grab():
+        success, _ = video.retrieve()
+        if not success:
+            break
+        frames += 1
+    video.release()
+    return frames
+
+
+def benchmark(
+    name: str,
+    producer_factory: Callable[[], VideoFrameProducer],
+    sources: int,
+    iterations: int,
+) -> None:
+    durations, throughputs = [], []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=sources) as executor:
+            frames = sum(
+                executor.map(lambda _: decode_video(producer_factory), range(sources))
+            )
+        duration = time.perf_counter() - start
+        durations.append(duration)
+        throughputs.append(frames / duration)
+    print(
+        f"{name:>32}: mean={np.mean(durations):.2f}s "
+        f"throughput={np.mean(throughputs):.1f} frames/s ({frames} frames per run)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare OpenCV and PyAV video frame producers decoding local video files concurrently"
+    )
+    parser.add_argument("--video_path", type=str, required=True)
+    parser.add_argument("--sources", type=int, default=4)
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--decoder_threads", type=int, default=0)
+    parser.add_argument("--decode_every_nth_frame", type=int, default=5)
+    parser.add_argument("--frame_buffers_pool_size", type=int, default=None)
+    args = parser.parse_args()
+
+    def pyav_factory(
+        skip_frame: Optional[str] = None, decode_every_nth_frame: int = 1
+    ) -> Callable[[], VideoFrameProducer]:
+        return lambda: PyAVVideoFrameProducer(
+            video=args.video_path,
+            decoder_threads=args.decoder_threads,
+            skip_frame=skip_frame,
+            decode_every_nth_frame=decode_every_nth_frame,
+            frame_buffers_pool_size=args.frame_buffers_pool_size,
+        )
+
+    scenarios: List[tuple] = [
+        ("opencv", lambda: CV2VideoFrameProducer(args.video_path)),
+        ("pyav", pyav_factory()),
+        (
+            f"pyav (every {args.decode_every_nth_frame}-th frame)",
+            pyav_factory(decode_every_nth_frame=args.decode_every_nth_frame),
+        ),
+        ("pyav (keyframes only)", pyav_factory(skip_frame="NONKEY")),
+    ]
+    for name, factory in scenarios:
+        benchmark(
+            name=name,
+            producer_factory=factory,
+            sources=args.sources,
+            iterations=args.iterations,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import argparse
+import time
+from typing import Dict
+
+import numpy as np
+
+from inference.core.managers.base import ModelManager
+from inference.core.registries.roboflow import RoboflowModelRegistry
+from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.execution_engine.core import ExecutionEngine
+from inference.models.utils import ROBOFLOW_MODEL_TYPES
+
+DETECTION_WORKFLOW = {
+    "version": "1.0",
+    "inputs": [
+        {"type": "WorkflowImage", "name": "image"},
+        {"type": "WorkflowParameter", "name": "confidence", "default_value": 0.3},
+    ],
+    "steps": [
+        {
+            "type": "roboflow_core/roboflow_object_detection_model@v1",
+            "name": "model",
+            "image": "$inputs.image",
+            "model_id": "yolov8n-640",
+            "confidence": "$inputs.confidence",
+        },
+        {
+            "type": "roboflow_core/bounding_box_visualization@v1",
+            "name": "visualization",
+            "image": "$inputs.image",
+            "predictions": "$steps.model.predictions",
+        },
+    ],
+    "outputs": [
+        {"type": "JsonField", "name": "predictions", "selector": "$steps.model.*"},
+        {
+            "type": "JsonField",
+            "name": "visualization",
+            "selector": "$steps.visualization.image",
+        },
+    ],
+}
+
+TWO_STAGE_WORKFLOW = {
+    "version": "1.0",
+    "inputs": [{"type": "WorkflowImage", "name": "image"}],
+    "steps": [
+        {
+            "type": "roboflow_core/roboflow_object_detection_model@v1",
+            "name": "detection",
+            "image": "$inputs.image",
+            "model_id": "yolov8n-640",
+        },
+        {
+            "type": "roboflow_core/dynamic_crop@v1",
+            "name": "crop",
+            "image": "$inputs.image",
+            "predictions": "$steps.detection.predictions",
+        },
+        {
+            "type": "roboflow_core/roboflow_classification_model@v1",
+            "name": "classifier",
+            "image": "$steps.crop.crops",
+            "model_id": "dog-breed-xpaq6/1",
+        },
+        {
+            "type": "roboflow_core/detections_classes_replacement@v1",
+            "name": "classes_replacement",
+            "object_detection_predictions": "$steps.detection.predictions",
+            "classification_predictions": "$steps.classifier.predictions",
+        },
+        {
+            "type": "roboflow_core/byte_tracker@v3",
+            "name": "tracker",
+            "image": "$inputs.image",
+            "detections": "$steps.classes_replacement.predictions",
+        },
+        {
+            "type": "roboflow_core/label_visualization@v1",
+            "name": "labels",
+            "image": "$inputs.image",
+            "predictions": "$steps.tracker.tracked_detections",
+        },
+    ],
+    "outputs": [
+        {
+            "type": "JsonField",
+            "name": "predictions",
+            "selector": "$steps.tracker.tracked_detections",
+        },
+        {"type": "JsonField", "name": "labels", "selector": "$steps.labels.image"},
+    ],
+}
+
+WORKFLOWS = {
+    "detection": DETECTION_WORKFLOW,
+    "two_stage": TWO_STAGE_WORKFLOW,
+}
+
+
+def benchmark(
+    name: str,
+    workflow_definition: dict,
+    init_parameters: Dict[str, object],
+    use_compiled_workflows_pool: bool,
+    iterations: int,
+    warm_up: int,
+) -> None:
+    durations = []
+    for i in range(warm_up + iterations):
+        start = time.perf_counter()
+        _ = ExecutionEngine.init(
+            workflow_definition=workflow_definition,
+            init_parameters=init_parameters,
+            prevent_local_images_loading=True,
+            use_compiled_workflows_pool=use_compiled_workflows_pool,
+        )
+        if i >= warm_up:
+            durations.append(time.perf_counter() - start)
+    durations = np.array(durations) * 1000
+    print(
+        f"{name:>24}: mean={durations.mean():.3f}ms median={np.median(durations):.3f}ms "
+        f"p95={np.percentile(durations, 95):.3f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare per-request Execution Engine setup time with and without compiled workflows pool"
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warm_up", type=int, default=5)
+    args = parser.parse_args()
+    model_manager = ModelManager(
+        model_registry=RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
+    )
+    for workflow_name, workflow_definition in WORKFLOWS.items():
+        # as in HTTP API - background tasks object is new for each request
+        for use_compiled_workflows_pool in [False, True]:
+            init_parameters = {
+                "workflows_core.model_manager": model_manager,
+                "workflows_core.api_key": None,
+                "workflows_core.background_tasks": object(),
+                "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
+            }
+            suffix = "pool" if use_compiled_workflows_pool else "no pool"
+            benchmark(
+                name=f"{workflow_name} ({suffix})",
+                workflow_definition=workflow_definition,
+                init_parameters=init_parameters,
+                use_compiled_workflows_pool=use_compiled_workflows_pool,
+                iterations=args.iterations,
+                warm_up=args.warm_up,
+            )
+
+
+if __name__ == "__main__":
+    main()
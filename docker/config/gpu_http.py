@@ -4,10 +4,16 @@ from functools import partial
 from inference.core.cache import cache
 from inference.core.env import (
     MAX_ACTIVE_MODELS,
+    MAX_ACTIVE_MODELS_MEMORY_MB,
+    MODELS_EVICTION_POLICY,
+    PINNED_MODELS,
     ACTIVE_LEARNING_ENABLED,
     LAMBDA,
     ENABLE_STREAM_API,
     STREAM_API_PRELOADED_PROCESSES,
+    ENABLE_DYNAMIC_BATCHING,
+    DYNAMIC_BATCHING_MAX_BATCH_SIZE,
+    DYNAMIC_BATCHING_MAX_WAIT_MS,
 )
 from inference.core.interfaces.http.http_api import HttpInterface
 from inference.core.interfaces.stream_manager.manager_app.app import start
@@ -16,6 +22,7 @@ from inference.core.managers.active_learning import (
     BackgroundTaskActiveLearningManager,
 )
 from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.dynamic_batching import WithDynamicBatching
 from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
 from inference.core.registries.roboflow import (
     RoboflowModelRegistry,
@@ -44,7 +51,23 @@ if ACTIVE_LEARNING_ENABLED:
 else:
     model_manager = ModelManager(model_registry=model_registry)
 
-model_manager = WithFixedSizeCache(model_manager, max_size=MAX_ACTIVE_MODELS)
+model_manager = WithFixedSizeCache(
+    model_manager,
+    max_size=MAX_ACTIVE_MODELS,
+    memory_budget=(
+        MAX_ACTIVE_MODELS_MEMORY_MB * 1024 * 1024
+        if MAX_ACTIVE_MODELS_MEMORY_MB is not None
+        else None
+    ),
+    eviction_policy=MODELS_EVICTION_POLICY,
+    pinned_models=PINNED_MODELS,
+)
+if ENABLE_DYNAMIC_BATCHING:
+    model_manager = WithDynamicBatching(
+        model_manager,
+        max_batch_size=DYNAMIC_BATCHING_MAX_BATCH_SIZE,
+        max_wait_ms=DYNAMIC_BATCHING_MAX_WAIT_MS,
+    )
 model_manager.init_pingback()
 interface = HttpInterface(
     model_manager,
@@ -50,6 +50,30 @@ class BaseCache:
         """
         raise NotImplementedError()
 
+    def zadd_buffered(self, key: str, value: Any, score: float, expire: float = None):
+        """
+        Adds a member to the sorted set like `zadd(...)`, but allows the cache to defer the write
+        (and batch it with others) - to be used on hot paths which do not read the value back.
+        Value may be given as zero-argument callable producing it, such that caches deferring
+        the write also defer building the value.
+
+        Args:
+            key (str): The key of the sorted set.
+            value (Any): The value (or callable producing the value) to add to the sorted set.
+            score (float): The score associated with the value.
+            expire (float, optional): The time, in seconds, after which the key will expire. Defaults to None.
+        """
+        if callable(value):
+            value = value()
+        return self.zadd(key, value=value, score=score, expire=expire)
+
+    def get_write_buffer_stats(self) -> Optional[dict]:
+        """
+        Returns statistics of buffered writes (see `zadd_buffered(...)`), or None when
+        the cache does not buffer writes.
+        """
+        return None
+
     def zrangebyscore(
         self,
         key: str,
@@ -0,0 +1,379 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import RLock
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional
+
+import numpy as np
+
+from inference.core import logger
+from inference.core.env import (
+    EMBEDDING_CACHE_FP16,
+    EMBEDDING_CACHE_MAX_MEMORY_MB,
+    EMBEDDING_CACHE_SPILL_DIR,
+    EMBEDDING_CACHE_SPILL_MAX_SIZE_MB,
+)
+
+MB = 1024 * 1024
+FLOAT_DTYPES_TO_COMPRESS = {np.dtype(np.float32), np.dtype(np.float64)}
+
+
+def compute_content_hash(value: Any) -> str:
+    """Computes hash of the content - to be used as cache key when no explicit id is given.
+    Numpy arrays are hashed together with their shape and dtype, `str` and `bytes` directly.
+    """
+    if isinstance(value, np.ndarray):
+        hash_object = hashlib.md5(f"{value.shape}:{value.dtype}".encode("utf-8"))
+        hash_object.update(np.ascontiguousarray(value).data)
+        return hash_object.hexdigest()
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    return hashlib.md5(value).hexdigest()
+
+
+@dataclass(frozen=True)
+class _CompressedArray:
+    data: Any
+    original_dtype: Any
+
+
+@dataclass(frozen=True)
+class _SpilledArray:
+    path: str
+
+
+@dataclass
+class _SpilledEntry:
+    value: Any
+    paths: List[str]
+    size: int
+
+
+class EmbeddingsCache:
+    """Thread-safe LRU cache for embeddings (numpy arrays, torch tensors and nested dicts / lists / tuples
+    of those).
+
+    Entries are kept in `OrderedDict`, so both lookup and eviction of least recently used entry are O(1).
+    The cache is bounded by number of entries and (optionally) by total size of arrays in bytes.
+    Floating point arrays may be stored in float16 (and casted back to original dtype when retrieved)
+    to fit twice as many embeddings in the same budget. When `spill_dir` is given, entries evicted from
+    memory (only those made of numpy arrays) are saved to disk as `.npy` files, read back through
+    memory mapping on the next hit and promoted to memory again.
+
+    The class exposes dict-like interface (`in`, `[]`, `get(...)`, `len(...)`), so it can be used
+    as drop-in replacement for plain dictionaries.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_memory: Optional[int] = None,
+        store_in_fp16: bool = False,
+        spill_dir: Optional[str] = None,
+        spill_max_size: Optional[int] = None,
+        name: str = "embeddings",
+    ):
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self.store_in_fp16 = store_in_fp16
+        self.spill_max_size = spill_max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.spilled_hits = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._entries_sizes: Dict[Hashable, int] = {}
+        self._used_memory = 0
+        self._spilled_entries: OrderedDict = OrderedDict()
+        self._spilled_size = 0
+        self._lock = RLock()
+        self.spill_dir = None
+        if spill_dir is not None:
+            # each cache gets its own sub-directory, so that caches never overwrite each other's files
+            os.makedirs(spill_dir, exist_ok=True)
+            self.spill_dir = tempfile.mkdtemp(prefix=f"{name}-", dir=spill_dir)
+
+    @classmethod
+    def init_from_env(
+        cls, max_entries: Optional[int], name: str = "embeddings"
+    ) -> "EmbeddingsCache":
+        return cls(
+            max_entries=max_entries,
+            max_memory=(
+                EMBEDDING_CACHE_MAX_MEMORY_MB * MB
+                if EMBEDDING_CACHE_MAX_MEMORY_MB is not None
+                else None
+            ),
+            store_in_fp16=EMBEDDING_CACHE_FP16,
+            spill_dir=EMBEDDING_CACHE_SPILL_DIR,
+            spill_max_size=EMBEDDING_CACHE_SPILL_MAX_SIZE_MB * MB,
+            name=name.replace("/", "-"),
+        )
+
+    @property
+    def used_memory(self) -> int:
+        return self._used_memory
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries or key in self._spilled_entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries) + len(self._spilled_entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.keys())
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            if key not in self:
+                self.misses += 1
+                raise KeyError(key)
+            return self._get(key=key)
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key=key, value=value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            if key not in self:
+                raise KeyError(key)
+            self.pop(key)
+
+    def keys(self) -> List[Hashable]:
+        with self._lock:
+            return list(self._spilled_entries.keys()) + list(self._entries.keys())
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self:
+                self.misses += 1
+                return default
+            return self._get(key=key)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._remove(key=key)
+            if self.store_in_fp16:
+                value = _map_leaves(value, _compress_leaf)
+            size = _get_size(value)
+            self._entries[key] = value
+            self._entries_sizes[key] = size
+            self._used_memory += size
+            self._evict_if_needed(protected_key=key)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._spilled_entries:
+                self._promote(key=key)
+            if key not in self._entries:
+                return default
+            value = self._restore(self._entries[key])
+            self._remove(key=key)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._spilled_entries.keys()):
+                self._remove_spilled(key=key)
+            self._entries.clear()
+            self._entries_sizes.clear()
+            self._used_memory = 0
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "spilled_entries": len(self._spilled_entries),
+                "used_memory": self._used_memory,
+                "spilled_size": self._spilled_size,
+                "hits": self.hits,
+                "spilled_hits": self.spilled_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _get(self, key: Hashable) -> Any:
+        if key in self._spilled_entries:
+            self.spilled_hits += 1
+            self._promote(key=key)
+        if key not in self._entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._restore(self._entries[key])
+
+    def _restore(self, value: Any) -> Any:
+        if self.store_in_fp16:
+            return _map_leaves(value, _decompress_leaf)
+        return value
+
+    def _remove(self, key: Hashable) -> None:
+        if key in self._entries:
+            del self._entries[key]
+            self._used_memory -= self._entries_sizes.pop(key)
+        if key in self._spilled_entries:
+            self._remove_spilled(key=key)
+
+    def _evict_if_needed(self, protected_key: Hashable) -> None:
+        while len(self._entries) > 1 and self._is_over_budget():
+            key, value = next(iter(self._entries.items()))
+            if key == protected_key:
+                break
+            size = self._entries_sizes[key]
+            self._remove(key=key)
+            self.evictions += 1
+            self._spill(key=key, value=value, size=size)
+        if self.max_entries is not None and self.max_entries <= 0:
+            self._remove(key=protected_key)
+
+    def _is_over_budget(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_memory is not None and self._used_memory > self.max_memory
+
+    def _spill(self, key: Hashable, value: Any, size: int) -> None:
+        if self.spill_dir is None or not _is_made_of_numpy_arrays(value):
+            return None
+        if self.spill_max_size is not None and size > self.spill_max_size:
+            return None
+        file_prefix = compute_content_hash(repr(key))
+        paths = []
+
+        def save_leaf(leaf: Any) -> Any:
+            if isinstance(leaf, _CompressedArray):
+                return _CompressedArray(
+                    data=save_leaf(leaf.data), original_dtype=leaf.original_dtype
+                )
+            if not isinstance(leaf, np.ndarray):
+                return leaf
+            path = os.path.join(self.spill_dir, f"{file_prefix}_{len(paths)}.npy")
+            np.save(path, leaf)
+            paths.append(path)
+            return _SpilledArray(path=path)
+
+        try:
+            spilled_value = _map_leaves(value, save_leaf)
+        except OSError as error:
+            logger.warning(f"Could not spill embedding to {self.spill_dir}: {error}")
+            _remove_files(paths=paths)
+            return None
+        self._spilled_entries[key] = _SpilledEntry(
+            value=spilled_value, paths=paths, size=size
+        )
+        self._spilled_size += size
+        while (
+            self.spill_max_size is not None and self._spilled_size > self.spill_max_size
+        ):
+            self._remove_spilled(key=next(iter(self._spilled_entries.keys())))
+
+    def _promote(self, key: Hashable) -> None:
+        spilled_entry: _SpilledEntry = self._spilled_entries[key]
+        try:
+            value = _map_leaves(spilled_entry.value, _load_spilled_leaf)
+        except OSError as error:
+            logger.warning(f"Could not load spilled embedding: {error}")
+            self._remove_spilled(key=key)
+            return None
+        self._remove_spilled(key=key)
+        self._entries[key] = value
+        self._entries_sizes[key] = spilled_entry.size
+        self._used_memory += spilled_entry.size
+        self._evict_if_needed(protected_key=key)
+
+    def _remove_spilled(self, key: Hashable) -> None:
+        spilled_entry: _SpilledEntry = self._spilled_entries.pop(key)
+        self._spilled_size -= spilled_entry.size
+        _remove_files(paths=spilled_entry.paths)
+
+    def __del__(self):
+        spill_dir = getattr(self, "spill_dir", None)
+        if spill_dir is not None:
+            shutil.rmtree(spill_dir, ignore_errors=True)
+
+
+def _map_leaves(value: Any, function: Callable[[Any], Any]) -> Any:
+    if isinstance(value, dict):
+        return {k: _map_leaves(v, function) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_map_leaves(v, function) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_map_leaves(v, function) for v in value)
+    return function(value)
+
+
+def _get_size(value: Any) -> int:
+    total_size = 0
+
+    def add_leaf_size(leaf: Any) -> Any:
+        nonlocal total_size
+        if isinstance(leaf, _CompressedArray):
+            leaf = leaf.data
+        if isinstance(leaf, np.ndarray):
+            total_size += leaf.nbytes
+        elif _is_torch_tensor(leaf):
+            total_size += leaf.numel() * leaf.element_size()
+        return leaf
+
+    _map_leaves(value, add_leaf_size)
+    return total_size
+
+
+def _is_torch_tensor(value: Any) -> bool:
+    return callable(getattr(value, "numel", None)) and callable(
+        getattr(value, "element_size", None)
+    )
+
+
+def _is_made_of_numpy_arrays(value: Any) -> bool:
+    is_valid = True
+
+    def check_leaf(leaf: Any) -> Any:
+        nonlocal is_valid
+        if _is_torch_tensor(leaf) or (
+            isinstance(leaf, _CompressedArray) and _is_torch_tensor(leaf.data)
+        ):
+            is_valid = False
+        return leaf
+
+    _map_leaves(value, check_leaf)
+    return is_valid
+
+
+def _compress_leaf(leaf: Any) -> Any:
+    if isinstance(leaf, np.ndarray) and leaf.dtype in FLOAT_DTYPES_TO_COMPRESS:
+        return _CompressedArray(data=leaf.astype(np.float16), original_dtype=leaf.dtype)
+    if _is_torch_tensor(leaf) and leaf.is_floating_point() and leaf.element_size() > 2:
+        return _CompressedArray(data=leaf.half(), original_dtype=leaf.dtype)
+    return leaf
+
+
+def _decompress_leaf(leaf: Any) -> Any:
+    if not isinstance(leaf, _CompressedArray):
+        return leaf
+    if isinstance(leaf.data, np.ndarray):
+        return leaf.data.astype(leaf.original_dtype)
+    return leaf.data.to(leaf.original_dtype)
+
+
+def _load_spilled_leaf(leaf: Any) -> Any:
+    if isinstance(leaf, _SpilledArray):
+        return np.array(np.load(leaf.path, mmap_mode="r"))
+    if isinstance(leaf, _CompressedArray) and isinstance(leaf.data, _SpilledArray):
+        return _CompressedArray(
+            data=_load_spilled_leaf(leaf.data), original_dtype=leaf.original_dtype
+        )
+    return leaf
+
+
+def _remove_files(paths: List[str]) -> None:
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
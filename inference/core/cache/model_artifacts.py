@@ -1,17 +1,34 @@
+import hashlib
 import os.path
 import re
 import shutil
-from typing import List, Optional, Union
+import uuid
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
-from inference.core.env import MODEL_CACHE_DIR
+from filelock import FileLock, Timeout
+
+from inference.core.env import (
+    ENABLE_MODEL_CACHE_DEDUPLICATION,
+    MODEL_CACHE_DIR,
+    MODEL_CACHE_MAX_SIZE_MB,
+)
+from inference.core.logger import logger
 from inference.core.utils.file_system import (
+    atomic_open,
     dump_bytes,
     dump_json,
     dump_text_lines,
+    ensure_parent_dir_exists,
+    ensure_write_is_allowed,
     read_json,
     read_text_file,
+    sanitize_path_segment,
 )
 
+BLOBS_DIR = "_blobs"
+LOCKS_DIR = "_locks"
+MANIFEST_FILE = ".manifest.json"
+
 
 def initialise_cache(model_id: Optional[str] = None) -> None:
     cache_dir = get_cache_dir(model_id=model_id)
@@ -71,8 +88,71 @@ def save_bytes_in_cache(
     model_id: Optional[str] = None,
     allow_override: bool = True,
 ) -> None:
-    cached_file_path = get_cache_file_path(file=file, model_id=model_id)
-    dump_bytes(path=cached_file_path, content=content, allow_override=allow_override)
+    cache_dir = get_cache_dir(model_id=model_id)
+    cached_file_path = os.path.join(cache_dir, file)
+    if model_id is None:
+        dump_bytes(
+            path=cached_file_path, content=content, allow_override=allow_override
+        )
+        return None
+    ensure_write_is_allowed(path=cached_file_path, allow_override=allow_override)
+    digest = hashlib.sha256(content).hexdigest()
+    if ENABLE_MODEL_CACHE_DEDUPLICATION:
+        link_blob_into_cache(
+            digest=digest, target_path=cached_file_path, content=content
+        )
+    else:
+        dump_bytes(path=cached_file_path, content=content, allow_override=True)
+    register_file_in_manifest(
+        manifest_path=os.path.join(cache_dir, MANIFEST_FILE),
+        model_id=model_id,
+        file=file,
+        digest=digest,
+        size=len(content),
+    )
+
+
+def save_file_in_cache(
+    source_path: str,
+    file: str,
+    model_id: Optional[str] = None,
+    allow_override: bool = True,
+) -> None:
+    """Moves file from `source_path` (like a finished download) into the cache - to be used
+    instead of `save_bytes_in_cache(...)` for files that should not be loaded into memory.
+    """
+    cache_dir = get_cache_dir(model_id=model_id)
+    cached_file_path = os.path.join(cache_dir, file)
+    ensure_write_is_allowed(path=cached_file_path, allow_override=allow_override)
+    if model_id is None:
+        ensure_parent_dir_exists(path=cached_file_path)
+        os.replace(source_path, cached_file_path)
+        return None
+    digest, size = compute_file_sha256(path=source_path)
+    if ENABLE_MODEL_CACHE_DEDUPLICATION:
+        link_blob_into_cache(
+            digest=digest, target_path=cached_file_path, source_path=source_path
+        )
+    else:
+        ensure_parent_dir_exists(path=cached_file_path)
+        os.replace(source_path, cached_file_path)
+    register_file_in_manifest(
+        manifest_path=os.path.join(cache_dir, MANIFEST_FILE),
+        model_id=model_id,
+        file=file,
+        digest=digest,
+        size=size,
+    )
+
+
+def compute_file_sha256(path: str, chunk_size: int = 1024 * 1024) -> Tuple[str, int]:
+    sha256 = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha256.update(chunk)
+            size += len(chunk)
+    return sha256.hexdigest(), size
 
 
 def save_json_in_cache(
@@ -105,6 +185,181 @@ def get_cache_file_path(file: str, model_id: Optional[str] = None) -> str:
     return os.path.join(cache_dir, file)
 
 
+def link_blob_into_cache(
+    digest: str,
+    target_path: str,
+    content: Optional[bytes] = None,
+    source_path: Optional[str] = None,
+) -> None:
+    """Saves `content` (or moves file from `source_path`) as blob named after its SHA-256
+    `digest` - unless the blob is already stored - and hardlinks it under `target_path`.
+    Identical artefacts of different models take disk space once. Falls back to copying when
+    hardlinks are not supported.
+    """
+    blob_path = get_blob_path(digest=digest)
+    with FileLock(get_lock_path(name=f"blob-{digest}")):
+        if not os.path.isfile(blob_path):
+            ensure_parent_dir_exists(path=blob_path)
+            if source_path is not None:
+                os.replace(source_path, blob_path)
+            else:
+                with atomic_open(path=blob_path, mode="wb") as f:
+                    f.write(content)
+        ensure_parent_dir_exists(path=target_path)
+        tmp_path = f"{target_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.link(blob_path, tmp_path)
+        except OSError:
+            shutil.copyfile(blob_path, tmp_path)
+        os.replace(tmp_path, target_path)
+    if source_path is not None and os.path.exists(source_path):
+        os.remove(source_path)
+
+
+def register_file_in_manifest(
+    manifest_path: str, model_id: str, file: str, digest: str, size: int
+) -> None:
+    with FileLock(get_lock_path(name=f"manifest-{model_id}")):
+        manifest = {}
+        if os.path.isfile(manifest_path):
+            manifest = read_json(path=manifest_path)
+        manifest[file] = {"sha256": digest, "size": size}
+        dump_json(path=manifest_path, content=manifest, allow_override=True)
+
+
+def load_manifest(model_id: str) -> Dict[str, dict]:
+    """Loads manifest of model artefacts (file name -> SHA-256 and size) saved with
+    `save_bytes_in_cache(...)`. Returns empty manifest if there is none."""
+    manifest_path = get_cache_file_path(file=MANIFEST_FILE, model_id=model_id)
+    if not os.path.isfile(manifest_path):
+        return {}
+    return read_json(path=manifest_path)
+
+
+def model_cache_download_lock(model_id: str) -> FileLock:
+    """Cross-process (and cross-thread) lock to be held while downloading artefacts
+    of a model - others should wait for it and re-check if files are cached."""
+    return FileLock(get_lock_path(name=f"download-{model_id}"))
+
+
+def get_lock_path(name: str) -> str:
+    lock_path = os.path.join(
+        MODEL_CACHE_DIR, LOCKS_DIR, f"{sanitize_path_segment(name)}.lock"
+    )
+    ensure_parent_dir_exists(path=lock_path)
+    return lock_path
+
+
+def get_blob_path(digest: str) -> str:
+    return os.path.join(MODEL_CACHE_DIR, BLOBS_DIR, digest[:2], digest)
+
+
+def mark_model_cache_as_used(model_id: str) -> None:
+    """Updates last usage time of model in cache, which decides on order of removals
+    made by `garbage_collect_cache(...)`."""
+    manifest_path = get_cache_file_path(file=MANIFEST_FILE, model_id=model_id)
+    try:
+        os.utime(manifest_path)
+    except OSError:
+        pass
+
+
+def enforce_cache_size_limit(protected_model_ids: Iterable[str] = ()) -> None:
+    """Runs `garbage_collect_cache(...)` when `MODEL_CACHE_MAX_SIZE_MB` is set."""
+    if MODEL_CACHE_MAX_SIZE_MB is None:
+        return None
+    try:
+        garbage_collect_cache(
+            max_size=MODEL_CACHE_MAX_SIZE_MB * 1024 * 1024,
+            protected_model_ids=protected_model_ids,
+        )
+    except Exception as error:
+        logger.warning(f"Model cache garbage collection failed. Cause: {error}")
+
+
+def garbage_collect_cache(
+    max_size: int, protected_model_ids: Iterable[str] = ()
+) -> List[str]:
+    """Removes blobs not linked to any model, then directories of least recently used
+    models (the ones with manifest), until size of cache directory fits `max_size` (bytes).
+
+    Args:
+        max_size (int): Size limit of cache directory in bytes.
+        protected_model_ids (Iterable[str]): Models that must not be removed (like the ones being loaded).
+
+    Returns:
+        List[str]: Ids of removed models.
+    """
+    protected_model_ids = set(protected_model_ids)
+    removed_models = []
+    with FileLock(get_lock_path(name="garbage-collection")):
+        remove_unused_blobs()
+        cache_size = get_cache_size()
+        if cache_size <= max_size:
+            return removed_models
+        for model_id in find_cached_models_by_last_usage():
+            if model_id in protected_model_ids:
+                continue
+            with model_cache_download_lock(model_id=model_id):
+                clear_cache(model_id=model_id)
+            removed_models.append(model_id)
+            remove_unused_blobs()
+            cache_size = get_cache_size()
+            if cache_size <= max_size:
+                break
+    logger.info(
+        f"Model cache garbage collection removed models: {removed_models}. "
+        f"Cache size: {cache_size} bytes, limit: {max_size} bytes."
+    )
+    return removed_models
+
+
+def remove_unused_blobs() -> None:
+    blobs_dir = os.path.join(MODEL_CACHE_DIR, BLOBS_DIR)
+    for root, _, files in os.walk(blobs_dir):
+        for file in files:
+            blob_path = os.path.join(root, file)
+            if os.stat(blob_path).st_nlink > 1:
+                continue
+            try:
+                # blob being stored and linked right now is locked - skipping it
+                with FileLock(get_lock_path(name=f"blob-{file}"), timeout=0):
+                    if os.stat(blob_path).st_nlink == 1:
+                        os.remove(blob_path)
+            except (Timeout, FileNotFoundError):
+                continue
+
+
+def get_cache_size() -> int:
+    seen_inodes: Set[Tuple[int, int]] = set()
+    size = 0
+    for root, _, files in os.walk(MODEL_CACHE_DIR):
+        for file in files:
+            try:
+                stat = os.stat(os.path.join(root, file))
+            except FileNotFoundError:
+                continue
+            # hardlinks of the same blob count once
+            if (stat.st_dev, stat.st_ino) in seen_inodes:
+                continue
+            seen_inodes.add((stat.st_dev, stat.st_ino))
+            size += stat.st_size
+    return size
+
+
+def find_cached_models_by_last_usage() -> List[str]:
+    models_last_usage = []
+    for root, dirs, files in os.walk(MODEL_CACHE_DIR):
+        if root == MODEL_CACHE_DIR:
+            dirs[:] = [d for d in dirs if d not in {BLOBS_DIR, LOCKS_DIR}]
+        if MANIFEST_FILE not in files:
+            continue
+        model_id = os.path.relpath(root, MODEL_CACHE_DIR).replace(os.sep, "/")
+        last_usage = os.path.getmtime(os.path.join(root, MANIFEST_FILE))
+        models_last_usage.append((last_usage, model_id))
+    return [model_id for _, model_id in sorted(models_last_usage)]
+
+
 def clear_cache(model_id: Optional[str] = None) -> None:
     cache_dir = get_cache_dir(model_id=model_id)
     if os.path.exists(cache_dir):
@@ -1,30 +1,46 @@
 import asyncio
+import heapq
 import inspect
 import json
 import pickle
 import threading
 import time
+from collections import deque
 from contextlib import asynccontextmanager
-from copy import copy
-from typing import Any, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 
 import redis
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from inference.core import logger
 from inference.core.cache.base import BaseCache
 from inference.core.entities.responses.inference import InferenceResponseImage
-from inference.core.env import MEMORY_CACHE_EXPIRE_INTERVAL
+from inference.core.env import (
+    MEMORY_CACHE_EXPIRE_INTERVAL,
+    REDIS_CACHE_FLUSH_BATCH_SIZE,
+    REDIS_CACHE_FLUSH_INTERVAL,
+    REDIS_CACHE_WRITE_BUFFER_SIZE,
+)
 
 
 class RedisCache(BaseCache):
     """
-    MemoryCache is an in-memory cache that implements the BaseCache interface.
+    RedisCache is a Redis-backed cache that implements the BaseCache interface.
+
+    Writes made with `zadd_buffered(...)` (inference results cached after each request) are
+    not sent to Redis on the request path - they are buffered and flushed in pipelined batches
+    by a background thread. When Redis lags behind or is unavailable, the buffer keeps at most
+    `write_buffer_size` writes, dropping the oldest ones.
 
     Attributes:
-        cache (dict): A dictionary to store the cache values.
-        expires (dict): A dictionary to store the expiration times of the cache values.
-        zexpires (dict): A dictionary to store the expiration times of the sorted set values.
+        client (redis.Redis): Redis client.
+        zexpires (dict): Heaps of (expiration time, score) of the sorted set members, per key.
         _expire_thread (threading.Thread): A thread that runs the _expire method.
+        _flush_thread (threading.Thread): A thread that flushes buffered writes.
     """
 
     def __init__(
@@ -34,9 +50,12 @@ class RedisCache(BaseCache):
         db: int = 0,
         ssl: bool = False,
         timeout: float = 2.0,
+        flush_interval: float = REDIS_CACHE_FLUSH_INTERVAL,
+        flush_batch_size: int = REDIS_CACHE_FLUSH_BATCH_SIZE,
+        write_buffer_size: int = REDIS_CACHE_WRITE_BUFFER_SIZE,
     ) -> None:
         """
-        Initializes a new instance of the MemoryCache class.
+        Initializes a new instance of the RedisCache class.
         """
         self.client = redis.Redis(
             host=host,
@@ -50,31 +69,74 @@ class RedisCache(BaseCache):
         logger.debug("Attempting to diagnose Redis connection...")
         self.client.ping()
         logger.debug("Redis connection established.")
-        self.zexpires = dict()
+        self.zexpires: Dict[str, List[Tuple[float, float]]] = dict()
+        self._zexpires_lock = threading.Lock()
+        self._flush_interval = flush_interval
+        self._flush_batch_size = max(flush_batch_size, 1)
+        self._write_buffer: Deque[Tuple[str, Any, float, Optional[float]]] = deque(
+            maxlen=max(write_buffer_size, 1)
+        )
+        self._write_buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._flushed_writes = 0
+        self._dropped_writes = 0
+        self._failed_flushes = 0
+        self._last_flush_duration = 0.0
 
         self._expire_thread = threading.Thread(target=self._expire, daemon=True)
         self._expire_thread.start()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically, daemon=True
+        )
+        self._flush_thread.start()
 
     def _expire(self):
         """
-        Removes the expired keys from the cache and zexpires dictionaries.
+        Removes the expired members of sorted sets.
 
         This method runs in an infinite loop and sleeps for MEMORY_CACHE_EXPIRE_INTERVAL seconds between each iteration.
         """
         while True:
             logger.debug("Redis cleaner thread starts cleaning...")
             now = time.time()
-            for k, v in copy(list(self.zexpires.items())):
-                if v < now:
-                    tolerance_factor = 1e-14  # floating point accuracy
-                    self.zremrangebyscore(
-                        k[0], k[1] - tolerance_factor, k[1] + tolerance_factor
-                    )
-                    del self.zexpires[k]
+            try:
+                self.remove_expired_members(now=now)
+            except redis.RedisError as error:
+                logger.warning(f"Could not remove expired cache entries: {error}")
             logger.debug("Redis cleaner finished task.")
             sleep_time = MEMORY_CACHE_EXPIRE_INTERVAL - (time.time() - now)
             time.sleep(max(sleep_time, 0))
 
+    def remove_expired_members(self, now: Optional[float] = None) -> None:
+        """
+        Removes members which expired before `now` - with a single range removal per key,
+        sent to Redis in one pipeline.
+
+        Members of a sorted set are assumed to share expiration period (which holds for all
+        callers) - then all members with scores up to the highest expired score are expired.
+        """
+        now = time.time() if now is None else now
+        expired_scores = {}
+        with self._zexpires_lock:
+            for key, expirations in list(self.zexpires.items()):
+                while expirations and expirations[0][0] < now:
+                    _, score = heapq.heappop(expirations)
+                    expired_scores[key] = max(score, expired_scores.get(key, score))
+                if not expirations:
+                    del self.zexpires[key]
+        if not expired_scores:
+            return None
+        tolerance_factor = 1e-14  # floating point accuracy
+        pipeline = self.client.pipeline(transaction=False)
+        for key, max_score in expired_scores.items():
+            pipeline.zremrangebyscore(key, "-inf", max_score + tolerance_factor)
+        pipeline.execute()
+
+    def _register_expiration(self, key: str, score: float, expire_at: float) -> None:
+        with self._zexpires_lock:
+            heapq.heappush(self.zexpires.setdefault(key, []), (expire_at, score))
+
     def get(self, key: str):
         """
         Gets the value associated with the given key.
@@ -116,10 +178,109 @@ class RedisCache(BaseCache):
             expire (float, optional): The time, in seconds, after which the key will expire. Defaults to None.
         """
         # serializable_value = self.ensure_serializable(value)
-        value = json.dumps(value)
+        value = serialise_value(value)
         self.client.zadd(key, {value: score})
         if expire:
-            self.zexpires[(key, score)] = expire + time.time()
+            self._register_expiration(
+                key=key, score=score, expire_at=expire + time.time()
+            )
+
+    def zadd_buffered(self, key: str, value: Any, score: float, expire: float = None):
+        """
+        Buffers addition of a member to the sorted set - the write (including building the value
+        when callable is given, and its serialisation) is made by the background thread,
+        pipelined with other buffered writes.
+
+        Args:
+            key (str): The key of the sorted set.
+            value (Any): The value (or callable producing the value) to add to the sorted set.
+            score (float): The score associated with the value.
+            expire (float, optional): The time, in seconds, after which the key will expire. Defaults to None.
+        """
+        expire_at = expire + time.time() if expire else None
+        with self._write_buffer_lock:
+            if len(self._write_buffer) == self._write_buffer.maxlen:
+                self._dropped_writes += 1
+            self._write_buffer.append((key, value, score, expire_at))
+            buffer_size = len(self._write_buffer)
+        if buffer_size >= self._flush_batch_size:
+            self._flush_requested.set()
+
+    def flush(self) -> None:
+        """
+        Sends buffered writes to Redis, in pipelines of at most `flush_batch_size` writes.
+        When Redis fails, not sent writes are put back into the buffer and the error is raised.
+        """
+        with self._flush_lock:
+            while True:
+                with self._write_buffer_lock:
+                    batch = [
+                        self._write_buffer.popleft()
+                        for _ in range(
+                            min(len(self._write_buffer), self._flush_batch_size)
+                        )
+                    ]
+                if not batch:
+                    return None
+                self._flush_batch(batch=batch)
+
+    def _flush_batch(
+        self, batch: List[Tuple[str, Any, float, Optional[float]]]
+    ) -> None:
+        start = time.perf_counter()
+        pipeline = self.client.pipeline(transaction=False)
+        for key, value, score, _ in batch:
+            try:
+                if callable(value):
+                    value = value()
+                pipeline.zadd(key, {serialise_value(value): score})
+            except Exception as error:
+                logger.warning(f"Could not serialise value cached under {key}: {error}")
+        try:
+            pipeline.execute()
+        except redis.RedisError:
+            self._failed_flushes += 1
+            self._return_to_buffer(batch=batch)
+            raise
+        for key, _, score, expire_at in batch:
+            if expire_at is not None:
+                self._register_expiration(key=key, score=score, expire_at=expire_at)
+        self._flushed_writes += len(batch)
+        self._last_flush_duration = time.perf_counter() - start
+
+    def _return_to_buffer(
+        self, batch: List[Tuple[str, Any, float, Optional[float]]]
+    ) -> None:
+        # writes buffered in the meantime are newer - the oldest ones are dropped when full
+        with self._write_buffer_lock:
+            free_slots = self._write_buffer.maxlen - len(self._write_buffer)
+            to_keep = batch[len(batch) - free_slots :] if free_slots > 0 else []
+            self._dropped_writes += len(batch) - len(to_keep)
+            self._write_buffer.extendleft(reversed(to_keep))
+
+    def _flush_periodically(self) -> None:
+        while True:
+            self._flush_requested.wait(timeout=self._flush_interval)
+            self._flush_requested.clear()
+            try:
+                self.flush()
+            except redis.RedisError as error:
+                logger.warning(
+                    f"Could not flush buffered cache writes to Redis: {error}. "
+                    f"Writes waiting in buffer: {len(self._write_buffer)}"
+                )
+
+    def get_write_buffer_stats(self) -> Optional[dict]:
+        with self._write_buffer_lock:
+            buffer_size = len(self._write_buffer)
+        return {
+            "buffered_writes": buffer_size,
+            "buffer_capacity": self._write_buffer.maxlen,
+            "flushed_writes": self._flushed_writes,
+            "dropped_writes": self._dropped_writes,
+            "failed_flushes": self._failed_flushes,
+            "last_flush_duration": self._last_flush_duration,
+        }
 
     def zrangebyscore(
         self,
@@ -194,3 +355,17 @@ class RedisCache(BaseCache):
             return pickle.loads(serialized_value)
         else:
             return None
+
+
+def serialise_value(value: Any) -> Union[str, bytes]:
+    """Serialises sorted set member to JSON - with `orjson` when installed (numpy arrays
+    and scalars are then serialised natively), falling back to `json.dumps(...)`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            pass
+    return json.dumps(value)
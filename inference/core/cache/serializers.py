@@ -1,6 +1,8 @@
-from typing import List, Union
+from typing import Any, Callable, List, Union
 
 from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError
 
 from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
 from inference.core.entities.requests.inference import InferenceRequest
@@ -26,8 +28,8 @@ def to_cachable_inference_item(
             "inference_id": infer_request.id,
             "inference_server_version": __version__,
             "inference_server_id": GLOBAL_INFERENCE_SERVER_ID,
-            "request": jsonable_encoder(infer_request),
-            "response": jsonable_encoder(infer_response),
+            "request": to_jsonable(infer_request),
+            "response": to_jsonable(infer_response),
         }
 
     included_request_fields = {
@@ -39,16 +41,62 @@ def to_cachable_inference_item(
         "source_info",
     }
     request = infer_request.dict(include=included_request_fields)
+    # condensed response consists of plain strings and numbers - no encoding needed
     response = build_condensed_response(infer_response)
     return {
         "inference_id": infer_request.id,
         "inference_server_version": __version__,
         "inference_server_id": GLOBAL_INFERENCE_SERVER_ID,
         "request": jsonable_encoder(request),
-        "response": jsonable_encoder(response),
+        "response": response,
     }
 
 
+def to_buffered_cachable_inference_item(
+    infer_request: InferenceRequest,
+    infer_response: Union[InferenceResponse, List[InferenceResponse]],
+) -> Union[dict, Callable[[], dict]]:
+    """Prepares value of `to_cachable_inference_item(...)` for `cache.zadd_buffered(...)`, without
+    keeping request and response objects alive until buffered write is flushed.
+
+    Condensed item (`TINY_CACHE`) is small and cheap to build, so it is built right away. Full item
+    embeds the whole response - its serialisation is deferred, but only the request dump is retained
+    next to it.
+    """
+    if TINY_CACHE:
+        return to_cachable_inference_item(infer_request, infer_response)
+    inference_id = infer_request.id
+    request = to_jsonable(infer_request)
+
+    def build_item() -> dict:
+        return {
+            "inference_id": inference_id,
+            "inference_server_version": __version__,
+            "inference_server_id": GLOBAL_INFERENCE_SERVER_ID,
+            "request": request,
+            "response": to_jsonable(infer_response),
+        }
+
+    return build_item
+
+
+def to_jsonable(value: Any) -> Any:
+    """Converts pydantic models (or lists of them) into JSON-compatible structures.
+
+    Gives results of `jsonable_encoder(...)`, but serialisation of models is left to pydantic
+    core, which is many times faster for responses with thousands of predictions or points.
+    Falls back to `jsonable_encoder(...)` for values pydantic cannot serialise.
+    """
+    if isinstance(value, list):
+        return [to_jsonable(element) for element in value]
+    if isinstance(value, BaseModel):
+        try:
+            return value.model_dump(mode="json", by_alias=True)
+        except PydanticSerializationError:
+            pass
+    return jsonable_encoder(value)
+
+
 def build_condensed_response(responses):
     if not isinstance(responses, list):
         responses = [responses]
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -24,6 +24,12 @@ class WorkflowInferenceRequest(BaseModel):
         "allow profiling traces to be exported to clients. Only applies for Workflows definitions saved "
         "on Roboflow platform.",
     )
+    detections_serialization_format: Literal["default", "columnar"] = Field(
+        default="default",
+        description="Layout of serialised detections outputs. `default` gives list of dictionaries "
+        "(one per detection), `columnar` - dictionary with list of values for each of the fields, "
+        "which is more compact and faster to produce for outputs with many detections.",
+    )
 
 
 class PredefinedWorkflowInferenceRequest(WorkflowInferenceRequest):
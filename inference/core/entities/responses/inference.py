@@ -167,6 +167,7 @@ class InferenceResponse(BaseModel):
         inference_id (Optional[str]): Unique identifier of inference
         frame_id (Optional[int]): The frame id of the image used in inference if the input was a video.
         time (Optional[float]): The time in seconds it took to produce the predictions including image preprocessing.
+        stage_times (Optional[Dict[str, float]]): The time in seconds spent in each inference stage (if staged execution is enabled).
     """
 
     model_config = ConfigDict(protected_namespaces=())
@@ -181,6 +182,10 @@ class InferenceResponse(BaseModel):
         default=None,
         description="The time in seconds it took to produce the predictions including image preprocessing",
     )
+    stage_times: Optional[Dict[str, float]] = Field(
+        default=None,
+        description="The time in seconds spent in each inference stage (preprocess, predict, postprocess) - available if staged execution is enabled",
+    )
 
 
 class CvInferenceResponse(InferenceResponse):
@@ -221,6 +221,17 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING")
 # Maximum number of active models, default is 8
 MAX_ACTIVE_MODELS = int(os.getenv("MAX_ACTIVE_MODELS", 8))
 
+# Memory budget (in MB) for models kept by model manager, default is None (no limit)
+MAX_ACTIVE_MODELS_MEMORY_MB = os.getenv("MAX_ACTIVE_MODELS_MEMORY_MB", None)
+if MAX_ACTIVE_MODELS_MEMORY_MB is not None:
+    MAX_ACTIVE_MODELS_MEMORY_MB = int(MAX_ACTIVE_MODELS_MEMORY_MB)
+
+# Order of models eviction from model manager - "lru" or "lfu", default is "lru"
+MODELS_EVICTION_POLICY = os.getenv("MODELS_EVICTION_POLICY", "lru")
+
+# Models which are never evicted from model manager, default is None
+PINNED_MODELS = safe_split_value(os.getenv("PINNED_MODELS", None))
+
 # Maximum batch size, default is infinite
 MAX_BATCH_SIZE = os.getenv("MAX_BATCH_SIZE", None)
 if MAX_BATCH_SIZE is not None:
@@ -228,6 +239,45 @@ if MAX_BATCH_SIZE is not None:
 else:
     MAX_BATCH_SIZE = float("inf")
 
+# Flag to enable dynamic batching of concurrent requests in HTTP server, default is False
+ENABLE_DYNAMIC_BATCHING = str2bool(os.getenv("ENABLE_DYNAMIC_BATCHING", False))
+
+# Maximum number of requests merged into one batch by dynamic batching, default is 8
+DYNAMIC_BATCHING_MAX_BATCH_SIZE = int(os.getenv("DYNAMIC_BATCHING_MAX_BATCH_SIZE", 8))
+
+# Maximum time (in ms) request waits for others to form dynamic batch, default is 5
+DYNAMIC_BATCHING_MAX_WAIT_MS = float(os.getenv("DYNAMIC_BATCHING_MAX_WAIT_MS", 5))
+
+# Flag to enable staged (pipelined) execution of preprocess / predict / postprocess for ONNX models, default is False
+ENABLE_STAGED_EXECUTION = str2bool(os.getenv("ENABLE_STAGED_EXECUTION", False))
+STAGED_EXECUTION_PREPROCESS_WORKERS = int(
+    os.getenv("STAGED_EXECUTION_PREPROCESS_WORKERS", 2)
+)
+STAGED_EXECUTION_PREDICT_WORKERS = int(os.getenv("STAGED_EXECUTION_PREDICT_WORKERS", 1))
+STAGED_EXECUTION_POSTPROCESS_WORKERS = int(
+    os.getenv("STAGED_EXECUTION_POSTPROCESS_WORKERS", 2)
+)
+STAGED_EXECUTION_QUEUE_SIZE = int(os.getenv("STAGED_EXECUTION_QUEUE_SIZE", 8))
+
+# Flag to enable fused preprocessing of ONNX models inputs into preallocated batch tensor, default is False
+ENABLE_FUSED_PREPROCESSING = str2bool(os.getenv("ENABLE_FUSED_PREPROCESSING", False))
+
+# Flag to feed ONNX models with raw uint8 NHWC input (normalisation folded into model graph), default is False
+ENABLE_UINT8_ONNX_INPUT = str2bool(os.getenv("ENABLE_UINT8_ONNX_INPUT", False))
+
+# Flag to cache ONNX models optimized by ONNX runtime in model cache directory and load sessions from them, default is False
+ENABLE_ONNX_OPTIMIZED_MODEL_CACHE = str2bool(
+    os.getenv("ENABLE_ONNX_OPTIMIZED_MODEL_CACHE", False)
+)
+
+# Flag to run ONNX models through IO binding with output buffers reused across calls, default is False
+ENABLE_ONNX_IO_BINDING = str2bool(os.getenv("ENABLE_ONNX_IO_BINDING", False))
+
+# Flag to enable decoding of large JPEG inputs in reduced resolution (still not smaller than model input), default is False
+ENABLE_REDUCED_RESOLUTION_DECODING = str2bool(
+    os.getenv("ENABLE_REDUCED_RESOLUTION_DECODING", False)
+)
+
 # Maximum number of candidates, default is 3000
 MAX_CANDIDATES_ENV = "MAX_CANDIDATES"
 DEFAULT_MAX_CANDIDATES = 3000
@@ -238,6 +288,9 @@ MAX_DETECTIONS_ENV = "MAX_DETECTIONS"
 DEFAULT_MAX_DETECTIONS = 300
 MAX_DETECTIONS = int(os.getenv(MAX_DETECTIONS_ENV, DEFAULT_MAX_DETECTIONS))
 
+# Non-maximum suppression implementation - "legacy" (per image and class loop) or "vectorized"
+NMS_ENGINE = os.getenv("NMS_ENGINE", "legacy")
+
 # Loop interval for expiration of memory cache, default is 5
 MEMORY_CACHE_EXPIRE_INTERVAL = int(os.getenv("MEMORY_CACHE_EXPIRE_INTERVAL", 5))
 
@@ -255,6 +308,16 @@ METRICS_URL = os.getenv("METRICS_URL", f"{API_BASE_URL}/inference-stats")
 # Model cache directory, default is "/tmp/cache"
 MODEL_CACHE_DIR = os.getenv("MODEL_CACHE_DIR", "/tmp/cache")
 
+# Flag to store model artefacts once per content (as hash-named blobs hardlinked into model directories), default is False
+ENABLE_MODEL_CACHE_DEDUPLICATION = str2bool(
+    os.getenv("ENABLE_MODEL_CACHE_DEDUPLICATION", False)
+)
+
+# Size limit (in MB) of model cache directory enforced by removal of least recently used models, default is None (no limit)
+MODEL_CACHE_MAX_SIZE_MB = os.getenv("MODEL_CACHE_MAX_SIZE_MB")
+if MODEL_CACHE_MAX_SIZE_MB is not None:
+    MODEL_CACHE_MAX_SIZE_MB = int(MODEL_CACHE_MAX_SIZE_MB)
+
 # Model ID, default is None
 MODEL_ID = os.getenv("MODEL_ID")
 
@@ -289,6 +352,15 @@ REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
 REDIS_SSL = str2bool(os.getenv("REDIS_SSL", False))
 REDIS_TIMEOUT = float(os.getenv("REDIS_TIMEOUT", 2.0))
 
+# Interval (seconds) of flushing buffered inference results cache writes to Redis, default is 0.1
+REDIS_CACHE_FLUSH_INTERVAL = float(os.getenv("REDIS_CACHE_FLUSH_INTERVAL", 0.1))
+
+# Maximum number of buffered writes sent to Redis in a single pipeline, default is 500
+REDIS_CACHE_FLUSH_BATCH_SIZE = int(os.getenv("REDIS_CACHE_FLUSH_BATCH_SIZE", 500))
+
+# Maximum number of writes buffered when Redis lags behind (oldest are dropped), default is 10000
+REDIS_CACHE_WRITE_BUFFER_SIZE = int(os.getenv("REDIS_CACHE_WRITE_BUFFER_SIZE", 10000))
+
 # Required ONNX providers, default is None
 REQUIRED_ONNX_PROVIDERS = safe_split_value(os.getenv("REQUIRED_ONNX_PROVIDERS", None))
 
@@ -305,6 +377,25 @@ SAM2_MAX_EMBEDDING_CACHE_SIZE = int(os.getenv("SAM2_MAX_EMBEDDING_CACHE_SIZE", 1
 SAM2_MAX_LOGITS_CACHE_SIZE = int(os.getenv("SAM2_MAX_LOGITS_CACHE_SIZE", 1000))
 DISABLE_SAM2_LOGITS_CACHE = str2bool(os.getenv("DISABLE_SAM2_LOGITS_CACHE", False))
 
+# Maximum number of image and text embeddings cached by CLIP, default is 1000
+CLIP_EMBEDDING_CACHE_SIZE = int(os.getenv("CLIP_EMBEDDING_CACHE_SIZE", 1000))
+
+# Memory budget (in MB) of each embedding cache (SAM, SAM2, CLIP, OWLv2), default is None (no limit)
+EMBEDDING_CACHE_MAX_MEMORY_MB = os.getenv("EMBEDDING_CACHE_MAX_MEMORY_MB", None)
+if EMBEDDING_CACHE_MAX_MEMORY_MB is not None:
+    EMBEDDING_CACHE_MAX_MEMORY_MB = int(EMBEDDING_CACHE_MAX_MEMORY_MB)
+
+# Flag to store cached embeddings in float16, default is False
+EMBEDDING_CACHE_FP16 = str2bool(os.getenv("EMBEDDING_CACHE_FP16", False))
+
+# Directory to spill embeddings evicted from memory to (as memory-mapped files), default is None (disabled)
+EMBEDDING_CACHE_SPILL_DIR = os.getenv("EMBEDDING_CACHE_SPILL_DIR", None)
+
+# Disk budget (in MB) of each embedding cache spill directory, default is 1024
+EMBEDDING_CACHE_SPILL_MAX_SIZE_MB = int(
+    os.getenv("EMBEDDING_CACHE_SPILL_MAX_SIZE_MB", 1024)
+)
+
 # SAM version ID, default is "vit_h"
 SAM_VERSION_ID = os.getenv("SAM_VERSION_ID", "vit_h")
 SAM2_VERSION_ID = os.getenv("SAM2_VERSION_ID", "hiera_large")
@@ -383,6 +474,29 @@ DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW = int(
 ENABLE_FRAME_DROP_ON_VIDEO_FILE_RATE_LIMITING = str2bool(
     os.getenv("ENABLE_FRAME_DROP_ON_VIDEO_FILE_RATE_LIMITING", "False")
 )
+# Backend decoding video sources - "opencv" or "pyav", default is "opencv"
+VIDEO_SOURCE_DECODER = os.getenv("VIDEO_SOURCE_DECODER", "opencv")
+# Number of FFmpeg decoder threads per source used by "pyav" decoder, default is 0 (chosen by FFmpeg)
+VIDEO_SOURCE_DECODER_THREADS = int(os.getenv("VIDEO_SOURCE_DECODER_THREADS", "0"))
+# Frames skipped by "pyav" decoder without decoding ("NONREF", "NONKEY"), default is None (decode all)
+VIDEO_SOURCE_DECODER_SKIP_FRAME = os.getenv("VIDEO_SOURCE_DECODER_SKIP_FRAME", None)
+# Only every N-th decoded frame is emitted by "pyav" decoder (others are not converted), default is 1
+VIDEO_SOURCE_DECODE_EVERY_NTH_FRAME = int(
+    os.getenv("VIDEO_SOURCE_DECODE_EVERY_NTH_FRAME", "1")
+)
+# Number of preallocated frame buffers reused by "pyav" decoder, default is None (new array per frame)
+VIDEO_SOURCE_FRAME_BUFFERS_POOL_SIZE = os.getenv(
+    "VIDEO_SOURCE_FRAME_BUFFERS_POOL_SIZE", None
+)
+if VIDEO_SOURCE_FRAME_BUFFERS_POOL_SIZE is not None:
+    VIDEO_SOURCE_FRAME_BUFFERS_POOL_SIZE = int(VIDEO_SOURCE_FRAME_BUFFERS_POOL_SIZE)
+# Seconds "pyav" decoder waits for the source to open and for data of the next frame, default is 10.0
+VIDEO_SOURCE_DECODER_OPEN_TIMEOUT = float(
+    os.getenv("VIDEO_SOURCE_DECODER_OPEN_TIMEOUT", "10.0")
+)
+VIDEO_SOURCE_DECODER_READ_TIMEOUT = float(
+    os.getenv("VIDEO_SOURCE_DECODER_READ_TIMEOUT", "10.0")
+)
 
 NUM_CELERY_WORKERS = os.getenv("NUM_CELERY_WORKERS", 4)
 CELERY_LOG_LEVEL = os.getenv("CELERY_LOG_LEVEL", "WARNING")
@@ -420,9 +534,29 @@ WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_BATCH_SIZE = int(
 WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS = int(
     os.getenv("WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS", "8")
 )
+# Maximum number of images sent to model in single inference by Workflows model blocks
+# running locally (capped by model batch size), default is 32
+WORKFLOWS_LOCAL_EXECUTION_MAX_STEP_BATCH_SIZE = int(
+    os.getenv("WORKFLOWS_LOCAL_EXECUTION_MAX_STEP_BATCH_SIZE", "32")
+)
+# Maximum number of batches processed concurrently by Workflows model block running locally, default is 1
+WORKFLOWS_LOCAL_EXECUTION_MAX_STEP_CONCURRENT_BATCHES = int(
+    os.getenv("WORKFLOWS_LOCAL_EXECUTION_MAX_STEP_CONCURRENT_BATCHES", "1")
+)
 ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS = str2bool(
     os.getenv("ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS", True)
 )
+# Flag to execute workflows served by HTTP API in asyncio mode (blocks with `async def run(...)` are awaited
+# in event loop, other blocks are offloaded to thread pool of WORKFLOWS_MAX_CONCURRENT_STEPS threads), default is False
+ENABLE_WORKFLOWS_ASYNC_EXECUTION = str2bool(
+    os.getenv("ENABLE_WORKFLOWS_ASYNC_EXECUTION", "False")
+)
+# Flag to reuse compiled workflows (with initialised steps) among /workflows/run requests, default is False
+ENABLE_COMPILED_WORKFLOWS_POOL = str2bool(
+    os.getenv("ENABLE_COMPILED_WORKFLOWS_POOL", "False")
+)
+# Max number of compiled workflows held in the pool, default is 64
+COMPILED_WORKFLOWS_POOL_SIZE = int(os.getenv("COMPILED_WORKFLOWS_POOL_SIZE", "64"))
 
 MODEL_VALIDATION_DISABLED = str2bool(os.getenv("MODEL_VALIDATION_DISABLED", "False"))
 
@@ -469,3 +603,18 @@ ROBOFLOW_INTERNAL_SERVICE_NAME = os.getenv("ROBOFLOW_INTERNAL_SERVICE_NAME")
 PRELOAD_MODELS = (
     os.getenv("PRELOAD_MODELS").split(",") if os.getenv("PRELOAD_MODELS") else None
 )
+
+# Number of preloaded models loaded concurrently at startup, default is 2
+PRELOAD_MODELS_MAX_CONCURRENT_LOADS = int(
+    os.getenv("PRELOAD_MODELS_MAX_CONCURRENT_LOADS", 2)
+)
+
+# Timeout (in seconds) of loading and warming up each preloaded model, default is 300
+PRELOAD_MODELS_LOAD_TIMEOUT = float(os.getenv("PRELOAD_MODELS_LOAD_TIMEOUT", 300))
+
+# Batch sizes of warm-up inferences run by each preloaded model (comma separated), default is None (no warm-up)
+PRELOAD_MODELS_WARM_UP_BATCH_SIZES = (
+    [int(b) for b in os.getenv("PRELOAD_MODELS_WARM_UP_BATCH_SIZES").split(",")]
+    if os.getenv("PRELOAD_MODELS_WARM_UP_BATCH_SIZES")
+    else None
+)
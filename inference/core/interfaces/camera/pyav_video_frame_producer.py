@@ -0,0 +1,220 @@
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+from inference.core import logger
+from inference.core.interfaces.camera.entities import (
+    SourceProperties,
+    VideoFrameProducer,
+)
+
+try:
+    import av
+except ImportError as import_error:
+    raise ImportError(
+        "Could not import PyAV, which is required by `pyav` video decoder. "
+        "Use pip install av to install missing dependency."
+    ) from import_error
+
+SKIP_FRAME_OPTIONS = {"DEFAULT", "NONREF", "BIDIR", "NONINTRA", "NONKEY", "ALL"}
+# pixel format converted into pooled frame buffers by OpenCV - FFmpeg conversion is used for others
+I420_PIXEL_FORMAT = "yuv420p"
+DEFAULT_OPEN_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 10.0
+
+
+class PyAVVideoFrameProducer(VideoFrameProducer):
+    def __init__(
+        self,
+        video: Union[str, int],
+        decoder_threads: int = 0,
+        skip_frame: Optional[str] = None,
+        decode_every_nth_frame: int = 1,
+        frame_buffers_pool_size: Optional[int] = None,
+        open_options: Optional[Dict[str, str]] = None,
+        open_timeout: Optional[float] = DEFAULT_OPEN_TIMEOUT,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+    ):
+        """`VideoFrameProducer` decoding video with FFmpeg (through PyAV).
+
+        Compared to `CV2VideoFrameProducer`, decoding may be spread across multiple FFmpeg threads
+        (which work without GIL) and frames can be skipped inside the decoder - either by codec
+        (`skip_frame="NONKEY"` decodes only keyframes, `"NONREF"` skips frames no other frame depends on)
+        or by emitting only every N-th decoded frame (remaining frames are never converted into
+        numpy arrays). Frames may also be converted into pool of preallocated arrays - in that case,
+        array given by `retrieve()` is overwritten `frame_buffers_pool_size` frames later, so the pool
+        must be larger than the number of frames held by consumers (`VideoSource` buffer size + frames
+        in processing).
+
+        Args:
+            video (Union[str, int]): Video file / stream reference or id of camera device
+            decoder_threads (int): Number of decoder threads, 0 lets FFmpeg decide
+            skip_frame (Optional[str]): Codec-level frames skipping - one of `SKIP_FRAME_OPTIONS`
+            decode_every_nth_frame (int): Only every N-th decoded frame is emitted
+            frame_buffers_pool_size (Optional[int]): Size of pool of reusable frame buffers - if not
+                given, new array is allocated for each frame
+            open_options (Optional[Dict[str, str]]): Options passed to FFmpeg demuxer
+                (for instance `{"rtsp_transport": "tcp"}`)
+            open_timeout (Optional[float]): Seconds to wait for the source to open, None waits forever
+            read_timeout (Optional[float]): Seconds to wait for data of the next frame - when exceeded
+                (for instance stalled stream), `grab()` returns False, such that `VideoSource` reconnects.
+                None waits forever.
+        """
+        if skip_frame is not None and skip_frame.upper() not in SKIP_FRAME_OPTIONS:
+            raise ValueError(
+                f"skip_frame must be one of {sorted(SKIP_FRAME_OPTIONS)}, got {skip_frame}"
+            )
+        self._decode_every_nth_frame = max(decode_every_nth_frame, 1)
+        self._frame_buffers_pool_size = frame_buffers_pool_size
+        self._frame_buffers: List[np.ndarray] = []
+        self._next_frame_buffer = 0
+        self._i420_buffer: Optional[np.ndarray] = None
+        self._last_frame: Optional["av.VideoFrame"] = None
+        self._container: Optional["av.container.InputContainer"] = None
+        self._frames: Optional[Iterator["av.VideoFrame"]] = None
+        try:
+            self._container = _open_container(
+                video=video,
+                options=open_options,
+                timeout=(open_timeout, read_timeout),
+            )
+            self._stream = self._container.streams.video[0]
+        except (av.error.FFmpegError, IndexError) as error:
+            logger.warning(f"Could not open video source {video} with PyAV: {error}")
+            self.release()
+            return None
+        self._stream.thread_type = "AUTO"
+        self._stream.codec_context.thread_count = decoder_threads
+        if skip_frame is not None:
+            self._stream.codec_context.skip_frame = skip_frame.upper()
+        self._frames = self._container.decode(self._stream)
+
+    def isOpened(self) -> bool:
+        return self._frames is not None
+
+    def grab(self) -> bool:
+        if self._frames is None:
+            return False
+        try:
+            for _ in range(self._decode_every_nth_frame):
+                self._last_frame = next(self._frames)
+        except (StopIteration, av.error.EOFError):
+            self.release()
+            return False
+        except (av.error.ExitError, av.error.TimeoutError) as error:
+            logger.warning(
+                f"Video source stalled - no data within read timeout: {error}"
+            )
+            self.release()
+            return False
+        except av.error.FFmpegError as error:
+            logger.warning(f"Could not decode video frame: {error}")
+            self.release()
+            return False
+        return True
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self._last_frame is None:
+            return False, None
+        if not self._frame_buffers_pool_size:
+            return True, self._last_frame.to_ndarray(format="bgr24")
+        frame = self._last_frame
+        frame_buffer = self._get_frame_buffer(shape=(frame.height, frame.width, 3))
+        if (
+            frame.format.name != I420_PIXEL_FORMAT
+            or frame.height % 2 != 0
+            or frame.width % 2 != 0
+        ):
+            np.copyto(frame_buffer, frame.to_ndarray(format="bgr24"))
+            return True, frame_buffer
+        # FFmpeg planes are gathered into single I420 image (rows of planes may be padded
+        # up to `line_size`), converted by OpenCV straight into the pooled buffer
+        i420_image = self._get_i420_buffer(height=frame.height, width=frame.width)
+        _copy_yuv_planes_into_i420_image(frame=frame, destination=i420_image)
+        cv2.cvtColor(i420_image, cv2.COLOR_YUV2BGR_I420, dst=frame_buffer)
+        return True, frame_buffer
+
+    def initialize_source_properties(self, properties: Dict[str, float]) -> None:
+        if properties:
+            logger.warning(
+                "PyAVVideoFrameProducer does not support setting video source properties after opening "
+                f"the source - ignoring {properties}. Use `open_options` instead."
+            )
+
+    def discover_source_properties(self) -> SourceProperties:
+        fps = 0.0
+        rate = self._stream.average_rate or self._stream.guessed_rate
+        if rate:
+            fps = float(rate) / self._decode_every_nth_frame
+        total_frames = (self._stream.frames or 0) // self._decode_every_nth_frame
+        return SourceProperties(
+            width=self._stream.codec_context.width,
+            height=self._stream.codec_context.height,
+            total_frames=total_frames,
+            is_file=total_frames > 0,
+            fps=fps,
+        )
+
+    def release(self) -> None:
+        self._frames = None
+        self._last_frame = None
+        if self._container is not None:
+            self._container.close()
+            self._container = None
+
+    def _get_frame_buffer(self, shape: Tuple[int, int, int]) -> np.ndarray:
+        if self._frame_buffers and self._frame_buffers[0].shape != shape:
+            # resolution of the stream changed - buffers are allocated again
+            self._frame_buffers = []
+            self._next_frame_buffer = 0
+        if len(self._frame_buffers) < self._frame_buffers_pool_size:
+            frame_buffer = np.empty(shape, dtype=np.uint8)
+            self._frame_buffers.append(frame_buffer)
+            return frame_buffer
+        frame_buffer = self._frame_buffers[self._next_frame_buffer]
+        self._next_frame_buffer = (
+            self._next_frame_buffer + 1
+        ) % self._frame_buffers_pool_size
+        return frame_buffer
+
+    def _get_i420_buffer(self, height: int, width: int) -> np.ndarray:
+        shape = (height * 3 // 2, width)
+        if self._i420_buffer is None or self._i420_buffer.shape != shape:
+            self._i420_buffer = np.empty(shape, dtype=np.uint8)
+        return self._i420_buffer
+
+
+def _copy_yuv_planes_into_i420_image(
+    frame: "av.VideoFrame", destination: np.ndarray
+) -> None:
+    height, width = frame.height, frame.width
+    flat_destination = destination.reshape(-1)
+    planes_shapes = [
+        (height, width),
+        (height // 2, width // 2),
+        (height // 2, width // 2),
+    ]
+    start = 0
+    for plane, (plane_height, plane_width) in zip(frame.planes, planes_shapes):
+        plane_data = np.frombuffer(plane, dtype=np.uint8)
+        plane_data = plane_data[: plane_height * plane.line_size].reshape(
+            plane_height, plane.line_size
+        )
+        end = start + plane_height * plane_width
+        flat_destination[start:end].reshape(plane_height, plane_width)[...] = (
+            plane_data[:, :plane_width]
+        )
+        start = end
+
+
+def _open_container(
+    video: Union[str, int],
+    options: Optional[Dict[str, str]],
+    timeout: Tuple[Optional[float], Optional[float]],
+) -> "av.container.InputContainer":
+    if isinstance(video, int):
+        return av.open(
+            f"/dev/video{video}", format="v4l2", options=options, timeout=timeout
+        )
+    return av.open(video, options=options, timeout=timeout)
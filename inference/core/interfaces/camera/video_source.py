@@ -19,7 +19,15 @@ from inference.core.env import (
     DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW,
     DEFAULT_MINIMUM_ADAPTIVE_MODE_SAMPLES,
     RUNS_ON_JETSON,
+    VIDEO_SOURCE_DECODE_EVERY_NTH_FRAME,
+    VIDEO_SOURCE_DECODER,
+    VIDEO_SOURCE_DECODER_OPEN_TIMEOUT,
+    VIDEO_SOURCE_DECODER_READ_TIMEOUT,
+    VIDEO_SOURCE_DECODER_SKIP_FRAME,
+    VIDEO_SOURCE_DECODER_THREADS,
+    VIDEO_SOURCE_FRAME_BUFFERS_POOL_SIZE,
 )
+from inference.core.exceptions import InvalidEnvironmentVariableError
 from inference.core.interfaces.camera.entities import (
     SourceProperties,
     StatusUpdate,
@@ -46,6 +54,9 @@ VIDEO_CONSUMPTION_FINISHED_EVENT = "VIDEO_CONSUMPTION_FINISHED"
 
 POISON_PILL = "POISON_PILL"
 
+OPENCV_DECODER = "opencv"
+PYAV_DECODER = "pyav"
+
 
 class StreamState(Enum):
     NOT_STARTED = "NOT_STARTED"
@@ -170,6 +181,29 @@ class CV2VideoFrameProducer(VideoFrameProducer):
         self.stream.release()
 
 
+def create_video_frame_producer(video: Union[str, int]) -> VideoFrameProducer:
+    if VIDEO_SOURCE_DECODER == OPENCV_DECODER:
+        return CV2VideoFrameProducer(video)
+    if VIDEO_SOURCE_DECODER == PYAV_DECODER:
+        from inference.core.interfaces.camera.pyav_video_frame_producer import (
+            PyAVVideoFrameProducer,
+        )
+
+        return PyAVVideoFrameProducer(
+            video=video,
+            decoder_threads=VIDEO_SOURCE_DECODER_THREADS,
+            skip_frame=VIDEO_SOURCE_DECODER_SKIP_FRAME,
+            decode_every_nth_frame=VIDEO_SOURCE_DECODE_EVERY_NTH_FRAME,
+            frame_buffers_pool_size=VIDEO_SOURCE_FRAME_BUFFERS_POOL_SIZE,
+            open_timeout=VIDEO_SOURCE_DECODER_OPEN_TIMEOUT,
+            read_timeout=VIDEO_SOURCE_DECODER_READ_TIMEOUT,
+        )
+    raise InvalidEnvironmentVariableError(
+        f"VIDEO_SOURCE_DECODER must be one of {[OPENCV_DECODER, PYAV_DECODER]}, "
+        f"got {VIDEO_SOURCE_DECODER}"
+    )
+
+
 def _consumes_camera_on_jetson(video: Union[str, int]) -> bool:
     if not RUNS_ON_JETSON:
         return False
@@ -275,6 +309,7 @@ class VideoSource:
 
         ENV variables involved:
         * VIDEO_SOURCE_BUFFER_SIZE - default: 64
+        * VIDEO_SOURCE_DECODER - default: opencv (see `create_video_frame_producer(...)`)
         * VIDEO_SOURCE_ADAPTIVE_MODE_STREAM_PACE_TOLERANCE - default: 0.1
         * VIDEO_SOURCE_ADAPTIVE_MODE_READER_PACE_TOLERANCE - default: 5.0
         * VIDEO_SOURCE_MINIMUM_ADAPTIVE_MODE_SAMPLES - default: 10
@@ -587,7 +622,7 @@ class VideoSource:
         if callable(self._stream_reference):
             self._video = self._stream_reference()
         else:
-            self._video = CV2VideoFrameProducer(self._stream_reference)
+            self._video = create_video_frame_producer(self._stream_reference)
         if not self._video.isOpened():
             self._change_state(target_state=StreamState.ERROR)
             raise SourceConnectionError(
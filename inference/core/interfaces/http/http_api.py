@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional, Union
 
 import asgi_correlation_id
 import uvicorn
-from fastapi import BackgroundTasks, Depends, FastAPI, Path, Query, Request
+from fastapi import BackgroundTasks, FastAPI, Path, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
@@ -116,8 +116,10 @@ from inference.core.env import (
     DEDICATED_DEPLOYMENT_WORKSPACE_URL,
     DISABLE_WORKFLOW_ENDPOINTS,
     DOCKER_SOCKET_PATH,
+    ENABLE_COMPILED_WORKFLOWS_POOL,
     ENABLE_PROMETHEUS,
     ENABLE_STREAM_API,
+    ENABLE_WORKFLOWS_ASYNC_EXECUTION,
     ENABLE_WORKFLOWS_PROFILING,
     LAMBDA,
     LEGACY_ROUTE_ENABLED,
@@ -128,6 +130,9 @@ from inference.core.env import (
     NOTEBOOK_PASSWORD,
     NOTEBOOK_PORT,
     PRELOAD_MODELS,
+    PRELOAD_MODELS_LOAD_TIMEOUT,
+    PRELOAD_MODELS_MAX_CONCURRENT_LOADS,
+    PRELOAD_MODELS_WARM_UP_BATCH_SIZES,
     PROFILE,
     ROBOFLOW_SERVICE_SECRET,
     WORKFLOWS_MAX_CONCURRENT_STEPS,
@@ -194,6 +199,7 @@ from inference.core.interfaces.stream_manager.manager_app.errors import (
 from inference.core.managers.base import ModelManager
 from inference.core.managers.metrics import get_container_stats
 from inference.core.managers.prometheus import InferenceInstrumentator
+from inference.core.managers.warm_pool import ModelsWarmPool
 from inference.core.roboflow_api import (
     get_roboflow_dataset_type,
     get_roboflow_workspace,
@@ -206,6 +212,9 @@ from inference.core.workflows.core_steps.common.query_language.errors import (
     InvalidInputTypeError,
     OperationTypeNotRecognisedError,
 )
+from inference.core.workflows.core_steps.loader import (
+    COLUMNAR_DETECTIONS_KINDS_SERIALIZERS,
+)
 from inference.core.workflows.errors import (
     DynamicBlockError,
     ExecutionGraphStructureError,
@@ -586,6 +595,9 @@ class HttpInterface(BaseInterface):
                 container_stats = get_container_stats(
                     docker_socket_path=DOCKER_SOCKET_PATH
                 )
+                models_cache_stats = self.model_manager.get_cache_stats()
+                if models_cache_stats is not None:
+                    container_stats["models_cache"] = models_cache_stats
                 return JSONResponse(status_code=200, content=container_stats)
 
         if DEDICATED_DEPLOYMENT_WORKSPACE_URL:
@@ -707,7 +719,7 @@ class HttpInterface(BaseInterface):
             )
             return orjson_response(resp)
 
-        def process_workflow_inference_request(
+        async def process_workflow_inference_request(
             workflow_request: WorkflowInferenceRequest,
             workflow_specification: dict,
             background_tasks: Optional[BackgroundTasks],
@@ -724,11 +736,23 @@ class HttpInterface(BaseInterface):
                 max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
                 prevent_local_images_loading=True,
                 profiler=profiler,
+                use_compiled_workflows_pool=ENABLE_COMPILED_WORKFLOWS_POOL,
             )
-            workflow_results = execution_engine.run(
-                runtime_parameters=workflow_request.inputs,
-                serialize_results=True,
-            )
+            kinds_serializers_overrides = None
+            if workflow_request.detections_serialization_format == "columnar":
+                kinds_serializers_overrides = COLUMNAR_DETECTIONS_KINDS_SERIALIZERS
+            if ENABLE_WORKFLOWS_ASYNC_EXECUTION:
+                workflow_results = await execution_engine.run_async(
+                    runtime_parameters=workflow_request.inputs,
+                    serialize_results=True,
+                    kinds_serializers_overrides=kinds_serializers_overrides,
+                )
+            else:
+                workflow_results = execution_engine.run(
+                    runtime_parameters=workflow_request.inputs,
+                    serialize_results=True,
+                    kinds_serializers_overrides=kinds_serializers_overrides,
+                )
             with profiler.profile_execution_phase(
                 name="workflow_results_filtering",
                 categories=["inference_package_operation"],
@@ -1189,7 +1213,7 @@ class HttpInterface(BaseInterface):
                         workflow_id=workflow_id,
                         use_cache=workflow_request.use_cache,
                     )
-                return process_workflow_inference_request(
+                return await process_workflow_inference_request(
                     workflow_request=workflow_request,
                     workflow_specification=workflow_specification,
                     background_tasks=background_tasks if not LAMBDA else None,
@@ -1221,7 +1245,7 @@ class HttpInterface(BaseInterface):
                     )
                 else:
                     profiler = NullWorkflowsProfiler.init()
-                return process_workflow_inference_request(
+                return await process_workflow_inference_request(
                     workflow_request=workflow_request,
                     workflow_specification=workflow_request.specification,
                     background_tasks=background_tasks if not LAMBDA else None,
@@ -1460,75 +1484,33 @@ class HttpInterface(BaseInterface):
         # Enable preloading models at startup
         if PRELOAD_MODELS and API_KEY and not LAMBDA:
 
-            class ModelInitState:
-                """Class to track model initialization state."""
-
-                def __init__(self):
-                    self.is_ready = False
-                    self.lock = asyncio.Lock()  # For thread-safe updates
-                    self.initialization_errors = []  # Track errors per model
-
-            model_init_state = ModelInitState()
-
-            async def initialize_models(state: ModelInitState):
-                """Perform asynchronous initialization tasks to load models."""
-                # Limit the number of concurrent tasks to prevent resource exhaustion
-                semaphore = asyncio.Semaphore(2)  # Adjust the limit as needed
-
-                async def load_model(model_id):
-                    try:
-                        async with semaphore:
-                            # Add a timeout to prevent indefinite hanging
-                            await asyncio.wait_for(
-                                model_add(
-                                    AddModelRequest(
-                                        model_id=model_id,
-                                        model_type=None,
-                                        api_key=API_KEY,
-                                    )
-                                ),
-                                timeout=300,  # Timeout after 5 minutes
-                            )
-                            logger.info(f"Model {model_id} loaded successfully.")
-                    except asyncio.TimeoutError:
-                        error_msg = f"Timeout while loading model {model_id}"
-                        logger.error(error_msg)
-                        async with state.lock:
-                            state.initialization_errors.append((model_id, error_msg))
-                    except Exception as e:
-                        error_msg = f"Error loading model {model_id}: {e}"
-                        logger.error(error_msg)
-                        async with state.lock:
-                            state.initialization_errors.append((model_id, str(e)))
-
-                # Create tasks for each model to be loaded
-                tasks = [load_model(model_id) for model_id in PRELOAD_MODELS]
-
-                # Wait for all tasks to complete, collecting exceptions
-                await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Update the readiness state in a thread-safe manner
-                async with state.lock:
-                    state.is_ready = True
+            models_warm_pool = ModelsWarmPool(
+                model_manager=self.model_manager,
+                model_ids=PRELOAD_MODELS,
+                api_key=API_KEY,
+                max_concurrent_loads=PRELOAD_MODELS_MAX_CONCURRENT_LOADS,
+                warm_up_batch_sizes=PRELOAD_MODELS_WARM_UP_BATCH_SIZES,
+                load_timeout=PRELOAD_MODELS_LOAD_TIMEOUT,
+            )
 
             @app.on_event("startup")
             async def startup_model_init():
                 """Initialize the models on startup."""
-                asyncio.create_task(initialize_models(model_init_state))
+                asyncio.create_task(models_warm_pool.initialize())
                 logger.info("Model initialization started in the background.")
 
             @app.get("/readiness", status_code=200)
-            async def readiness(
-                state: ModelInitState = Depends(lambda: model_init_state),
-            ):
-                """Readiness endpoint for Kubernetes readiness probe."""
-                async with state.lock:
-                    if state.is_ready:
-                        return {"status": "ready"}
-                    else:
-                        return JSONResponse(
-                            content={"status": "not ready"}, status_code=503
-                        )
+            async def readiness():
+                """Readiness endpoint for Kubernetes readiness probe - ready once all preloaded models are loaded and warmed up."""
+                if models_warm_pool.is_ready:
+                    return {"status": "ready", "models": models_warm_pool.describe()}
+                return JSONResponse(
+                    content={
+                        "status": "not ready",
+                        "models": models_warm_pool.describe(),
+                    },
+                    status_code=503,
+                )
 
             @app.get("/healthz", status_code=200)
             async def healthz():
@@ -30,6 +30,18 @@ class FrameMetadata(BaseModel):
     frame_timestamp: datetime
     frame_id: int
     source_id: Optional[int]
+    shared_memory_name: Optional[str] = Field(
+        default=None,
+        description="Name of shared memory block holding frame pixels "
+        "(only for pipelines using SharedMemorySinkConfiguration)",
+    )
+    offset: Optional[int] = Field(
+        default=None, description="Offset of frame pixels in shared memory block"
+    )
+    shape: Optional[List[int]] = Field(
+        default=None, description="Shape of frame pixels array"
+    )
+    dtype: Optional[str] = Field(default=None, description="Type of frame pixels")
 
 
 class ConsumePipelineResponse(CommandResponse):
@@ -64,6 +64,19 @@ class MemorySinkConfiguration(BaseModel):
     results_buffer_size: int = 64
 
 
+class SharedMemorySinkConfiguration(BaseModel):
+    type: Literal["SharedMemorySinkConfiguration"]
+    slots: int = Field(
+        default=4,
+        description="Number of slots of the ring buffer - each slot holds one batch of frames with predictions",
+    )
+    slot_size: int = Field(default=8 * 1024 * 1024, description="Size of slot in bytes")
+    write_timeout: Optional[float] = Field(
+        default=1.0,
+        description="Time (in seconds) for which pipeline waits for free slot, before the batch is dropped",
+    )
+
+
 class WorkflowConfiguration(BaseModel):
     type: Literal["WorkflowConfiguration"]
     workflow_specification: Optional[dict] = None
@@ -79,8 +92,11 @@ class WorkflowConfiguration(BaseModel):
 class InitialisePipelinePayload(BaseModel):
     video_configuration: VideoConfiguration
     processing_configuration: WorkflowConfiguration
-    sink_configuration: MemorySinkConfiguration = MemorySinkConfiguration(
-        type="MemorySinkConfiguration"
+    sink_configuration: Union[
+        MemorySinkConfiguration, SharedMemorySinkConfiguration
+    ] = Field(
+        default=MemorySinkConfiguration(type="MemorySinkConfiguration"),
+        discriminator="type",
     )
     consumption_timeout: Optional[float] = None
     api_key: Optional[str] = None
@@ -9,7 +9,7 @@ from multiprocessing import Process, Queue
 from queue import Empty
 from threading import Event, Lock
 from types import FrameType
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from pydantic import ValidationError
 
@@ -37,11 +37,17 @@ from inference.core.interfaces.stream_manager.manager_app.entities import (
     ErrorType,
     InitialisePipelinePayload,
     InitialiseWebRTCPipelinePayload,
+    MemorySinkConfiguration,
     OperationStatus,
+    SharedMemorySinkConfiguration,
 )
 from inference.core.interfaces.stream_manager.manager_app.serialisation import (
     describe_error,
 )
+from inference.core.interfaces.stream_manager.manager_app.shared_memory import (
+    SharedMemoryRingBuffer,
+    SharedMemorySink,
+)
 from inference.core.interfaces.stream_manager.manager_app.webrtc import (
     RTCPeerConnectionWithFPS,
     WebRTCVideoFrameProducer,
@@ -78,6 +84,7 @@ class InferencePipelineManager(Process):
         self._watchdog: Optional[PipelineWatchDog] = None
         self._stop = False
         self._buffer_sink: Optional[InMemoryBufferSink] = None
+        self._frames_buffer: Optional[SharedMemoryRingBuffer] = None
         self._last_consume_time = (
             time.monotonic()
         )  # Track last consume time for the pipeline
@@ -168,10 +175,9 @@ class InferencePipelineManager(Process):
         try:
             parsed_payload = InitialisePipelinePayload.model_validate(payload)
             watchdog = BasePipelineWatchDog()
-            buffer_sink = InMemoryBufferSink.init(
-                queue_size=parsed_payload.sink_configuration.results_buffer_size,
+            on_prediction = self._init_results_sink(
+                sink_configuration=parsed_payload.sink_configuration
             )
-            self._buffer_sink = buffer_sink
             self._inference_pipeline = InferencePipeline.init_with_workflow(
                 video_reference=parsed_payload.video_configuration.video_reference,
                 workflow_specification=parsed_payload.processing_configuration.workflow_specification,
@@ -180,7 +186,7 @@ class InferencePipelineManager(Process):
                 api_key=parsed_payload.api_key,
                 image_input_name=parsed_payload.processing_configuration.image_input_name,
                 workflows_parameters=parsed_payload.processing_configuration.workflows_parameters,
-                on_prediction=self._buffer_sink.on_prediction,
+                on_prediction=on_prediction,
                 max_fps=parsed_payload.video_configuration.max_fps,
                 watchdog=watchdog,
                 source_buffer_filling_strategy=parsed_payload.video_configuration.source_buffer_filling_strategy,
@@ -228,6 +234,33 @@ class InferencePipelineManager(Process):
                 error_type=ErrorType.NOT_FOUND,
             )
 
+    def _init_results_sink(
+        self,
+        sink_configuration: Union[
+            MemorySinkConfiguration, SharedMemorySinkConfiguration
+        ],
+    ) -> Callable[
+        [
+            Union[dict, List[Optional[dict]]],
+            Union[VideoFrame, List[Optional[VideoFrame]]],
+        ],
+        None,
+    ]:
+        if isinstance(sink_configuration, SharedMemorySinkConfiguration):
+            self._frames_buffer = SharedMemoryRingBuffer.create(
+                slots=sink_configuration.slots,
+                slot_size=sink_configuration.slot_size,
+            )
+            shared_memory_sink = SharedMemorySink.init(
+                frames_buffer=self._frames_buffer,
+                write_timeout=sink_configuration.write_timeout,
+            )
+            return shared_memory_sink.on_prediction
+        self._buffer_sink = InMemoryBufferSink.init(
+            queue_size=sink_configuration.results_buffer_size,
+        )
+        return self._buffer_sink.on_prediction
+
     def _start_webrtc(self, request_id: str, payload: dict):
         try:
             parsed_payload = InitialiseWebRTCPipelinePayload.model_validate(payload)
@@ -279,13 +312,10 @@ class InferencePipelineManager(Process):
                     prediction[parsed_payload.stream_output[0]].numpy_image
                 )
 
-            buffer_sink = InMemoryBufferSink.init(
-                queue_size=parsed_payload.sink_configuration.results_buffer_size,
-            )
-            self._buffer_sink = buffer_sink
-            chained_sink = partial(
-                multi_sink, sinks=[buffer_sink.on_prediction, webrtc_sink]
+            results_sink = self._init_results_sink(
+                sink_configuration=parsed_payload.sink_configuration
             )
+            chained_sink = partial(multi_sink, sinks=[results_sink, webrtc_sink])
 
             self._inference_pipeline = InferencePipeline.init_with_workflow(
                 video_reference=webrtc_producer,
@@ -383,6 +413,8 @@ class InferencePipelineManager(Process):
     def _execute_termination(self) -> None:
         self._inference_pipeline.terminate()
         self._inference_pipeline.join()
+        if self._frames_buffer is not None:
+            self._frames_buffer.close(unlink=True)
         self._stop = True
 
     def _mute_pipeline(self, request_id: str) -> None:
@@ -458,6 +490,10 @@ class InferencePipelineManager(Process):
             )
 
     def _consume_results(self, request_id: str, payload: dict) -> None:
+        if self._frames_buffer is not None:
+            return self._consume_shared_memory_results(
+                request_id=request_id, payload=payload
+            )
         try:
             if self._buffer_sink.empty():
                 response_payload = {
@@ -507,6 +543,46 @@ class InferencePipelineManager(Process):
                 error_type=ErrorType.OPERATION_ERROR,
             )
 
+    def _consume_shared_memory_results(self, request_id: str, payload: dict) -> None:
+        try:
+            consumed = self._frames_buffer.consume(timeout=0.0)
+            if consumed is None:
+                response_payload = {
+                    STATUS_KEY: OperationStatus.SUCCESS,
+                    "outputs": [],
+                    "frames_metadata": [],
+                }
+                self._responses_queue.put((request_id, response_payload))
+                return None
+            self._last_consume_time = time.monotonic()
+            predictions, frames = consumed
+            excluded_fields = set(payload.get("excluded_fields") or [])
+            predictions = [
+                (
+                    {k: v for k, v in element.items() if k not in excluded_fields}
+                    if element is not None
+                    else None
+                )
+                for element in predictions
+            ]
+            # frames pixels stay in shared memory - only references are sent back
+            frames_metadata = [
+                frame.to_metadata() if frame is not None else None for frame in frames
+            ]
+            response_payload = {
+                STATUS_KEY: OperationStatus.SUCCESS,
+                "outputs": predictions,
+                "frames_metadata": frames_metadata,
+            }
+            self._responses_queue.put((request_id, response_payload))
+        except Exception as error:
+            self._handle_error(
+                request_id=request_id,
+                error=error,
+                public_error_message="Unexpected error with InferencePipeline results consumption.",
+                error_type=ErrorType.OPERATION_ERROR,
+            )
+
     def _handle_error(
         self,
         request_id: str,
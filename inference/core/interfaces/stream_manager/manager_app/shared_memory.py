@@ -0,0 +1,326 @@
+import json
+import struct
+from dataclasses import dataclass
+from datetime import datetime
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock, Semaphore
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from inference.core import logger
+from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.http.orjson_utils import (
+    serialise_single_workflow_result_element,
+)
+from inference.core.interfaces.stream.utils import wrap_in_list
+from inference.core.interfaces.stream_manager.manager_app.serialisation import (
+    serialise_to_json,
+)
+
+# frames_count, predictions_size
+BATCH_HEADER = struct.Struct("<II")
+# is_present, source_id, frame_id, frame_timestamp, height, width, channels
+FRAME_HEADER = struct.Struct("<?qqdIII")
+# image data is aligned, such that numpy views created on top of shared memory are aligned
+IMAGE_DATA_ALIGNMENT = 64
+NO_SOURCE_ID = -1
+DEFAULT_SLOTS = 4
+DEFAULT_SLOT_SIZE = 8 * 1024 * 1024
+DEFAULT_WRITE_TIMEOUT = 1.0
+
+
+@dataclass(frozen=True)
+class SharedMemoryFrame:
+    """Frame read from `SharedMemoryRingBuffer`. `image` is a view on shared memory (no copy is made) -
+    it stays valid until next `consume(...)` or `release()` call on the buffer."""
+
+    shared_memory_name: str
+    offset: int
+    source_id: Optional[int]
+    frame_id: int
+    frame_timestamp: datetime
+    image: np.ndarray
+
+    def to_metadata(self) -> dict:
+        return {
+            "frame_timestamp": self.frame_timestamp.isoformat(),
+            "frame_id": self.frame_id,
+            "source_id": self.source_id,
+            "shared_memory_name": self.shared_memory_name,
+            "offset": self.offset,
+            "shape": list(self.image.shape),
+            "dtype": str(self.image.dtype),
+        }
+
+
+class SharedMemoryRingBuffer:
+    """Single-producer, single-consumer ring of fixed-size slots in `multiprocessing.shared_memory`.
+
+    Each slot holds one batch of frames emitted by `InferencePipeline` together with serialised predictions.
+    Producer (sink of the pipeline) copies frames pixels into the next free slot, consumer (`CONSUME_RESULT`
+    command handler) gets numpy views on top of shared memory and only passes references (shared memory
+    name, offset, shape and dtype) further - such that image bytes are never pickled nor sent through
+    sockets, and other processes on the host may map them directly. Free and filled slots are counted
+    by semaphores - when all slots are taken, producer waits (up to `write_timeout`) for consumer to
+    release one, applying back-pressure to the pipeline.
+
+    Consumer owns at most one slot at a time - the slot is given back to producer on the next
+    `consume(...)` or `release()` call.
+    """
+
+    @classmethod
+    def create(
+        cls, slots: int = DEFAULT_SLOTS, slot_size: int = DEFAULT_SLOT_SIZE
+    ) -> "SharedMemoryRingBuffer":
+        if slots <= 0 or slot_size <= BATCH_HEADER.size:
+            raise ValueError(
+                f"Invalid shared memory buffer configuration: slots={slots}, slot_size={slot_size}"
+            )
+        shared_memory = SharedMemory(create=True, size=slots * slot_size)
+        return cls(shared_memory=shared_memory, slots=slots, slot_size=slot_size)
+
+    def __init__(self, shared_memory: SharedMemory, slots: int, slot_size: int):
+        self._shared_memory = shared_memory
+        self._slots = slots
+        self._slot_size = slot_size
+        self._free_slots = Semaphore(slots)
+        self._filled_slots = Semaphore(0)
+        self._write_index = 0
+        self._read_index = 0
+        self._leased_slot: Optional[int] = None
+        self._consumer_lock = Lock()
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    @property
+    def slots(self) -> int:
+        return self._slots
+
+    @property
+    def slot_size(self) -> int:
+        return self._slot_size
+
+    def write(
+        self,
+        frames: List[Optional[VideoFrame]],
+        predictions: bytes,
+        timeout: Optional[float] = DEFAULT_WRITE_TIMEOUT,
+    ) -> bool:
+        """Writes batch of frames into the next free slot. Returns False if no slot was released by
+        consumer within `timeout`. Raises `ValueError` if batch does not fit into the slot.
+        """
+        images = [
+            _as_hwc_image(image=frame.image) if frame is not None else None
+            for frame in frames
+        ]
+        images_offsets, predictions_offset = _compute_slot_layout(images=images)
+        required_size = predictions_offset + len(predictions)
+        if required_size > self._slot_size:
+            raise ValueError(
+                f"Batch requires {required_size} bytes, but shared memory slot has {self._slot_size} bytes"
+            )
+        if not self._free_slots.acquire(timeout=timeout):
+            return False
+        slot_offset = (self._write_index % self._slots) * self._slot_size
+        buffer = self._shared_memory.buf
+        BATCH_HEADER.pack_into(buffer, slot_offset, len(frames), len(predictions))
+        for idx, (frame, image, image_offset) in enumerate(
+            zip(frames, images, images_offsets)
+        ):
+            header_offset = slot_offset + BATCH_HEADER.size + idx * FRAME_HEADER.size
+            if frame is None:
+                FRAME_HEADER.pack_into(
+                    buffer, header_offset, False, NO_SOURCE_ID, 0, 0.0, 0, 0, 0
+                )
+                continue
+            FRAME_HEADER.pack_into(
+                buffer,
+                header_offset,
+                True,
+                frame.source_id if frame.source_id is not None else NO_SOURCE_ID,
+                frame.frame_id,
+                frame.frame_timestamp.timestamp(),
+                *image.shape,
+            )
+            target = np.ndarray(
+                image.shape,
+                dtype=np.uint8,
+                buffer=buffer,
+                offset=slot_offset + image_offset,
+            )
+            target[...] = image
+            del target
+        predictions_start = slot_offset + predictions_offset
+        buffer[predictions_start : predictions_start + len(predictions)] = predictions
+        self._write_index += 1
+        self._filled_slots.release()
+        return True
+
+    def consume(
+        self, timeout: Optional[float] = None
+    ) -> Optional[Tuple[List[Optional[dict]], List[Optional[SharedMemoryFrame]]]]:
+        """Releases previously consumed slot and returns predictions and frames of the oldest batch
+        written to the buffer (or None if nothing was written within `timeout`)."""
+        with self._consumer_lock:
+            self._release_leased_slot()
+            if not self._filled_slots.acquire(timeout=timeout):
+                return None
+            slot = self._read_index % self._slots
+            self._read_index += 1
+            self._leased_slot = slot
+            slot_offset = slot * self._slot_size
+            buffer = self._shared_memory.buf
+            frames_count, predictions_size = BATCH_HEADER.unpack_from(
+                buffer, slot_offset
+            )
+            frames_headers = [
+                FRAME_HEADER.unpack_from(
+                    buffer, slot_offset + BATCH_HEADER.size + idx * FRAME_HEADER.size
+                )
+                for idx in range(frames_count)
+            ]
+            images_offsets, predictions_offset = _compute_slot_layout(
+                images=[header[4:] if header[0] else None for header in frames_headers]
+            )
+            frames = []
+            for header, image_offset in zip(frames_headers, images_offsets):
+                (
+                    is_present,
+                    source_id,
+                    frame_id,
+                    frame_timestamp,
+                    height,
+                    width,
+                    channels,
+                ) = header
+                if not is_present:
+                    frames.append(None)
+                    continue
+                image = np.ndarray(
+                    (height, width, channels),
+                    dtype=np.uint8,
+                    buffer=buffer,
+                    offset=slot_offset + image_offset,
+                )
+                frames.append(
+                    SharedMemoryFrame(
+                        shared_memory_name=self.name,
+                        offset=slot_offset + image_offset,
+                        source_id=source_id if source_id != NO_SOURCE_ID else None,
+                        frame_id=frame_id,
+                        frame_timestamp=datetime.fromtimestamp(frame_timestamp),
+                        image=image,
+                    )
+                )
+            predictions_start = slot_offset + predictions_offset
+            predictions = json.loads(
+                bytes(buffer[predictions_start : predictions_start + predictions_size])
+            )
+            return predictions, frames
+
+    def release(self) -> None:
+        with self._consumer_lock:
+            self._release_leased_slot()
+
+    def close(self, unlink: bool = False) -> None:
+        try:
+            self._shared_memory.close()
+        except BufferError:
+            logger.warning(
+                f"Could not close shared memory {self.name} - consumed frames are still referenced."
+            )
+        if unlink:
+            try:
+                self._shared_memory.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _release_leased_slot(self) -> None:
+        if self._leased_slot is None:
+            return None
+        self._leased_slot = None
+        self._free_slots.release()
+
+
+class SharedMemorySink:
+    @classmethod
+    def init(
+        cls,
+        frames_buffer: SharedMemoryRingBuffer,
+        write_timeout: Optional[float] = DEFAULT_WRITE_TIMEOUT,
+    ) -> "SharedMemorySink":
+        return cls(frames_buffer=frames_buffer, write_timeout=write_timeout)
+
+    def __init__(
+        self, frames_buffer: SharedMemoryRingBuffer, write_timeout: Optional[float]
+    ):
+        self._frames_buffer = frames_buffer
+        self._write_timeout = write_timeout
+
+    def on_prediction(
+        self,
+        predictions: Union[dict, List[Optional[dict]]],
+        video_frame: Union[VideoFrame, List[Optional[VideoFrame]]],
+    ) -> None:
+        """Writes batch of frames and serialised workflow results into `SharedMemoryRingBuffer`.
+        Batches which cannot be written (as consumer did not free any slot within `write_timeout` or
+        batch does not fit into the slot) are dropped."""
+        video_frame = wrap_in_list(element=video_frame)
+        predictions = wrap_in_list(element=predictions)
+        serialised_predictions = json.dumps(
+            [
+                (
+                    serialise_single_workflow_result_element(result_element=element)
+                    if element is not None
+                    else None
+                )
+                for element in predictions
+            ],
+            default=serialise_to_json,
+        ).encode("utf-8")
+        frames_ids = [f.frame_id for f in video_frame if f is not None]
+        try:
+            written = self._frames_buffer.write(
+                frames=video_frame,
+                predictions=serialised_predictions,
+                timeout=self._write_timeout,
+            )
+        except ValueError as error:
+            logger.warning(f"Dropping frames {frames_ids}: {error}")
+            return None
+        if not written:
+            logger.warning(
+                f"Dropping frames {frames_ids} - shared memory buffer is full."
+            )
+
+
+def _as_hwc_image(image: np.ndarray) -> np.ndarray:
+    image = np.ascontiguousarray(image, dtype=np.uint8)
+    if image.ndim == 2:
+        return image[:, :, np.newaxis]
+    return image
+
+
+def _compute_slot_layout(
+    images: List[Optional[Union[np.ndarray, Tuple[int, int, int]]]],
+) -> Tuple[List[Optional[int]], int]:
+    offset = BATCH_HEADER.size + len(images) * FRAME_HEADER.size
+    images_offsets = []
+    for image in images:
+        if image is None:
+            images_offsets.append(None)
+            continue
+        shape = image.shape if isinstance(image, np.ndarray) else image
+        offset = _align(offset)
+        images_offsets.append(offset)
+        offset += int(np.prod(shape))
+    return images_offsets, offset
+
+
+def _align(offset: int) -> int:
+    return (
+        (offset + IMAGE_DATA_ALIGNMENT - 1) // IMAGE_DATA_ALIGNMENT
+    ) * IMAGE_DATA_ALIGNMENT
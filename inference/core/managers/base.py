@@ -2,15 +2,17 @@ import time
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
+from fastapi.concurrency import run_in_threadpool
 from fastapi.encoders import jsonable_encoder
 
 from inference.core.cache import cache
-from inference.core.cache.serializers import to_cachable_inference_item
+from inference.core.cache.serializers import to_buffered_cachable_inference_item
 from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
 from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
 from inference.core.env import (
     DISABLE_INFERENCE_CACHE,
+    ENABLE_STAGED_EXECUTION,
     METRICS_ENABLED,
     METRICS_INTERVAL,
     ROBOFLOW_SERVER_UUID,
@@ -107,7 +109,7 @@ class ModelManager:
                 logger.debug(
                     f"ModelManager - caching inference request started for model_id={model_id}"
                 )
-                cache.zadd(
+                cache.zadd_buffered(
                     f"models",
                     value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
                     score=finish_time,
@@ -119,9 +121,10 @@ class ModelManager:
                     and request.image.type == "numpy"
                 ):
                     request.image.value = str(request.image.value)
-                cache.zadd(
+                cache.zadd_buffered(
                     f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value=to_cachable_inference_item(request, rtn_val),
+                    # response is serialised lazily - by the thread flushing writes, if the cache buffers them
+                    value=to_buffered_cachable_inference_item(request, rtn_val),
                     score=finish_time,
                     expire=METRICS_INTERVAL * 2,
                 )
@@ -132,13 +135,13 @@ class ModelManager:
         except Exception as e:
             finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                cache.zadd(
+                cache.zadd_buffered(
                     f"models",
                     value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
                     score=finish_time,
                     expire=METRICS_INTERVAL * 2,
                 )
-                cache.zadd(
+                cache.zadd_buffered(
                     f"error:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
                     value={
                         "request": jsonable_encoder(
@@ -181,7 +184,7 @@ class ModelManager:
                 logger.debug(
                     f"ModelManager - caching inference request started for model_id={model_id}"
                 )
-                cache.zadd(
+                cache.zadd_buffered(
                     f"models",
                     value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
                     score=finish_time,
@@ -193,9 +196,10 @@ class ModelManager:
                     and request.image.type == "numpy"
                 ):
                     request.image.value = str(request.image.value)
-                cache.zadd(
+                cache.zadd_buffered(
                     f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value=to_cachable_inference_item(request, rtn_val),
+                    # response is serialised lazily - by the thread flushing writes, if the cache buffers them
+                    value=to_buffered_cachable_inference_item(request, rtn_val),
                     score=finish_time,
                     expire=METRICS_INTERVAL * 2,
                 )
@@ -206,13 +210,13 @@ class ModelManager:
         except Exception as e:
             finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                cache.zadd(
+                cache.zadd_buffered(
                     f"models",
                     value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
                     score=finish_time,
                     expire=METRICS_INTERVAL * 2,
                 )
-                cache.zadd(
+                cache.zadd_buffered(
                     f"error:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
                     value={
                         "request": jsonable_encoder(
@@ -227,6 +231,12 @@ class ModelManager:
 
     async def model_infer(self, model_id: str, request: InferenceRequest, **kwargs):
         self.check_for_model(model_id)
+        if ENABLE_STAGED_EXECUTION:
+            # stages of concurrent requests may only overlap if requests are not
+            # executed one after another by the event loop
+            return await run_in_threadpool(
+                self._models[model_id].infer_from_request, request
+            )
         return self._models[model_id].infer_from_request(request)
 
     def model_infer_sync(
@@ -396,6 +406,14 @@ class ModelManager:
         """
         return self._models
 
+    def get_cache_stats(self) -> Optional[dict]:
+        """Retrieves statistics of models cache, if manager keeps one.
+
+        Returns:
+            Optional[dict]: Cache statistics or None if not applicable.
+        """
+        return None
+
     def describe_models(self) -> List[ModelDescription]:
         return [
             ModelDescription(
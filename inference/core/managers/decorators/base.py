@@ -191,6 +191,9 @@ class ModelManagerDecorator(ModelManager):
     def models(self):
         return self.model_manager.models()
 
+    def get_cache_stats(self) -> Optional[dict]:
+        return self.model_manager.get_cache_stats()
+
     def predict(self, model_id: str, *args, **kwargs) -> Tuple[np.ndarray, ...]:
         return self.model_manager.predict(model_id, *args, **kwargs)
 
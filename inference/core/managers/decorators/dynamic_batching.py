@@ -0,0 +1,187 @@
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from inference.core import logger
+from inference.core.entities.requests.inference import InferenceRequest
+from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.base import ModelManagerDecorator
+from inference.core.managers.entities import ModelDescription
+
+BACKGROUND_TASKS_PARAM = "background_tasks"
+REQUEST_FIELDS_EXCLUDED_FROM_BATCH_KEY = {"id", "image", "start"}
+
+
+@dataclass
+class RequestsBatch:
+    model_id: str
+    kwargs: Dict[str, Any]
+    requests: List[InferenceRequest] = field(default_factory=list)
+    futures: List[asyncio.Future] = field(default_factory=list)
+    flush_handle: Optional[asyncio.TimerHandle] = None
+
+
+class WithDynamicBatching(ModelManagerDecorator):
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 5.0,
+        executor: Optional[Executor] = None,
+    ):
+        """Dynamic batching decorator - single-image requests to the same model, arriving within
+        `max_wait_ms` window and sharing all parameters (except the image), are merged into
+        one batched inference executed in a worker thread. Results are then dispatched back to
+        awaiting callers. Requests that cannot be batched (lists of images, visualisation requested,
+        models without dynamic batch support) are passed to the decorated manager unchanged.
+
+        Args:
+            model_manager (ModelManager): Instance of a ModelManager.
+            max_batch_size (int, optional): Max number of requests merged into one batch. Defaults to 8.
+            max_wait_ms (float, optional): Max time the first request of a batch waits for others. Defaults to 5.0.
+            executor (Optional[Executor], optional): Executor to run batches in. Defaults to event loop default executor.
+        """
+        super().__init__(model_manager)
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._executor = executor
+        self._open_batches: Dict[str, RequestsBatch] = {}
+
+    async def infer_from_request(
+        self, model_id: str, request: InferenceRequest, **kwargs
+    ) -> InferenceResponse:
+        """Processes a complete inference request, batching it with concurrent requests if possible.
+
+        Args:
+            model_id (str): The identifier of the model.
+            request (InferenceRequest): The request to process.
+
+        Returns:
+            InferenceResponse: The response from the inference.
+        """
+        batch_key = self._get_batch_key(model_id=model_id, request=request, **kwargs)
+        if batch_key is None:
+            return await super().infer_from_request(model_id, request, **kwargs)
+        loop = asyncio.get_running_loop()
+        batch = self._open_batches.get(batch_key)
+        if batch is None:
+            batch = RequestsBatch(model_id=model_id, kwargs=kwargs)
+            batch.flush_handle = loop.call_later(
+                self.max_wait_ms / 1000, self._flush_batch, batch_key
+            )
+            self._open_batches[batch_key] = batch
+        future = loop.create_future()
+        batch.requests.append(request)
+        batch.futures.append(future)
+        if len(batch.requests) >= self.max_batch_size:
+            batch.flush_handle.cancel()
+            self._flush_batch(batch_key=batch_key)
+        return await future
+
+    def describe_models(self) -> List[ModelDescription]:
+        return self.model_manager.describe_models()
+
+    def _get_batch_key(
+        self, model_id: str, request: InferenceRequest, **kwargs
+    ) -> Optional[str]:
+        if self.max_batch_size <= 1:
+            return None
+        image = getattr(request, "image", None)
+        if image is None or isinstance(image, list):
+            return None
+        if getattr(request, "visualize_predictions", False):
+            return None
+        if model_id not in self:
+            return None
+        if not getattr(self[model_id], "batching_enabled", False):
+            return None
+        request_parameters = request.model_dump_json(
+            exclude=REQUEST_FIELDS_EXCLUDED_FROM_BATCH_KEY
+        )
+        kwargs_parameters = sorted(
+            (name, repr(value))
+            for name, value in kwargs.items()
+            if name != BACKGROUND_TASKS_PARAM
+        )
+        return f"{model_id}:{type(request).__name__}:{request_parameters}:{kwargs_parameters}"
+
+    def _flush_batch(self, batch_key: str) -> None:
+        batch = self._open_batches.pop(batch_key, None)
+        if batch is None:
+            return None
+        asyncio.ensure_future(self._execute_batch(batch=batch))
+
+    async def _execute_batch(self, batch: RequestsBatch) -> None:
+        logger.debug(
+            f"WithDynamicBatching - executing batch of {len(batch.requests)} requests "
+            f"for model_id={batch.model_id}"
+        )
+        if len(batch.requests) == 1:
+            await self._execute_single_request(
+                model_id=batch.model_id,
+                request=batch.requests[0],
+                future=batch.futures[0],
+                kwargs=batch.kwargs,
+            )
+            return None
+        batched_request = batch.requests[0].model_copy(
+            update={"image": [request.image for request in batch.requests]}
+        )
+        try:
+            responses = await self._run_in_executor(
+                model_id=batch.model_id,
+                request=batched_request,
+                kwargs=batch.kwargs,
+            )
+        except Exception as error:
+            logger.warning(
+                f"WithDynamicBatching - batched inference failed for model_id={batch.model_id} "
+                f"({error}). Falling back to processing requests one by one."
+            )
+            for request, future in zip(batch.requests, batch.futures):
+                await self._execute_single_request(
+                    model_id=batch.model_id,
+                    request=request,
+                    future=future,
+                    kwargs=batch.kwargs,
+                )
+            return None
+        for request, response, future in zip(batch.requests, responses, batch.futures):
+            response.inference_id = request.id
+            if not future.done():
+                future.set_result(response)
+
+    async def _execute_single_request(
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        future: asyncio.Future,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        try:
+            response = await self._run_in_executor(
+                model_id=model_id, request=request, kwargs=kwargs
+            )
+        except Exception as error:
+            if not future.done():
+                future.set_exception(error)
+            return None
+        if not future.done():
+            future.set_result(response)
+
+    async def _run_in_executor(
+        self, model_id: str, request: InferenceRequest, kwargs: Dict[str, Any]
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            partial(
+                self.model_manager.infer_from_request_sync,
+                model_id,
+                request,
+                **kwargs,
+            ),
+        )
@@ -1,5 +1,8 @@
+import math
+import time
 from collections import deque
-from typing import List, Optional
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Set
 
 from inference.core import logger
 from inference.core.entities.requests.inference import InferenceRequest
@@ -7,24 +10,66 @@ from inference.core.entities.responses.inference import InferenceResponse
 from inference.core.managers.base import Model, ModelManager
 from inference.core.managers.decorators.base import ModelManagerDecorator
 from inference.core.managers.entities import ModelDescription
+from inference.core.utils.memory import (
+    estimate_model_memory_footprint,
+    get_process_rss_bytes,
+)
+
+LRU_EVICTION_POLICY = "lru"
+LFU_EVICTION_POLICY = "lfu"
+EVICTION_POLICIES = {LRU_EVICTION_POLICY, LFU_EVICTION_POLICY}
 
 
 class WithFixedSizeCache(ModelManagerDecorator):
-    def __init__(self, model_manager: ModelManager, max_size: int = 8):
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        max_size: int = 8,
+        memory_budget: Optional[int] = None,
+        eviction_policy: str = LRU_EVICTION_POLICY,
+        pinned_models: Optional[Iterable[str]] = None,
+        usage_half_life: float = 300.0,
+    ):
         """Cache decorator, models will be evicted based on the last utilization (`.infer` call). Internally, a [double-ended queue](https://docs.python.org/3/library/collections.html#collections.deque) is used to keep track of model utilization.
 
+        Apart from the limit on number of models, memory budget may be specified. Memory taken by the model
+        is measured at load time (as the larger of process RSS increase and size of model weights - RSS increase
+        is only taken into account if no other model was loaded at the same time, as it cannot be attributed
+        to a single model in such case) and models are evicted until the total fits the budget. Eviction order is either LRU or LFU (based on number of
+        recent inferences, decaying with `usage_half_life`). Pinned models are never evicted.
+
         Args:
             model_manager (ModelManager): Instance of a ModelManager.
             max_size (int, optional): Max number of models at the same time. Defaults to 8.
+            memory_budget (Optional[int], optional): Max memory (in bytes) taken by models. Defaults to None (no limit).
+            eviction_policy (str, optional): Eviction order - "lru" or "lfu". Defaults to "lru".
+            pinned_models (Optional[Iterable[str]], optional): Models which must never be evicted. Defaults to None.
+            usage_half_life (float, optional): Half-life (in seconds) of usage score used by LFU policy. Defaults to 300.
         """
         super().__init__(model_manager)
+        if eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Eviction policy must be one of {sorted(EVICTION_POLICIES)}, got {eviction_policy}"
+            )
         self.max_size = max_size
+        self.memory_budget = memory_budget
+        self.eviction_policy = eviction_policy
+        self.usage_half_life = usage_half_life
+        self.evictions = 0
+        self.evicted_memory = 0
         self._key_queue = deque(self.model_manager.keys())
+        self._pinned_models: Set[str] = set(pinned_models or [])
+        self._models_memory: Dict[str, int] = {}
+        self._usage_scores: Dict[str, float] = {}
+        self._last_usage: Dict[str, float] = {}
+        self._loads_lock = Lock()
+        self._loads_in_progress = 0
+        self._loads_started = 0
 
     def add_model(
         self, model_id: str, api_key: str, model_id_alias: Optional[str] = None
     ) -> None:
-        """Adds a model to the manager and evicts the least recently used if the cache is full.
+        """Adds a model to the manager and evicts models if the cache is full or memory budget is exceeded.
 
         Args:
             model_id (str): The identifier of the model.
@@ -43,22 +88,51 @@ class WithFixedSizeCache(ModelManagerDecorator):
 
         logger.debug(f"Current capacity of ModelManager: {len(self)}/{self.max_size}")
         while len(self) >= self.max_size:
-            to_remove_model_id = self._key_queue.popleft()
+            to_remove_model_id = self._select_model_to_evict()
+            if to_remove_model_id is None:
+                logger.warning(
+                    f"Reached maximum capacity of ModelManager, but all models are pinned. "
+                    f"Loading {queue_id} above the limit."
+                )
+                break
             logger.debug(
                 f"Reached maximum capacity of ModelManager. Unloading model {to_remove_model_id}"
             )
-            super().remove(to_remove_model_id)
+            self._evict(model_id=to_remove_model_id)
             logger.debug(f"Model {to_remove_model_id} successfully unloaded.")
         logger.debug(f"Marking new model {queue_id} as most recently used.")
         self._key_queue.append(queue_id)
+        with self._loads_lock:
+            self._loads_in_progress += 1
+            self._loads_started += 1
+            load_number = self._loads_started
+            concurrent_load_detected = self._loads_in_progress > 1
+        rss_before_load = get_process_rss_bytes()
         try:
-            return super().add_model(model_id, api_key, model_id_alias=model_id_alias)
+            result = super().add_model(model_id, api_key, model_id_alias=model_id_alias)
         except Exception as error:
             logger.debug(
                 f"Could not initialise model {queue_id}. Removing from WithFixedSizeCache models queue."
             )
             self._key_queue.remove(queue_id)
             raise error
+        finally:
+            with self._loads_lock:
+                self._loads_in_progress -= 1
+                concurrent_load_detected = (
+                    concurrent_load_detected or self._loads_started != load_number
+                )
+        if concurrent_load_detected:
+            # RSS grew due to other models loaded in parallel as well
+            rss_before_load = None
+        self._models_memory[queue_id] = self._measure_model_memory(
+            model_id=queue_id, rss_before_load=rss_before_load
+        )
+        logger.debug(
+            f"Model {queue_id} takes ~{self._models_memory[queue_id]} bytes of memory."
+        )
+        self._enforce_memory_budget(loaded_model_id=queue_id)
+        return result
 
     def clear(self) -> None:
         """Removes all models from the manager."""
@@ -72,8 +146,50 @@ class WithFixedSizeCache(ModelManagerDecorator):
             logger.warning(
                 f"Could not successfully purge model {model_id} from  WithFixedSizeCache models queue"
             )
+        self._models_memory.pop(model_id, None)
+        self._usage_scores.pop(model_id, None)
+        self._last_usage.pop(model_id, None)
         return super().remove(model_id)
 
+    def pin_model(self, model_id: str) -> None:
+        """Protects model from being evicted.
+
+        Args:
+            model_id (str): The identifier of the model.
+        """
+        self._pinned_models.add(model_id)
+
+    def unpin_model(self, model_id: str) -> None:
+        """Makes model subject to eviction again.
+
+        Args:
+            model_id (str): The identifier of the model.
+        """
+        self._pinned_models.discard(model_id)
+
+    @property
+    def used_memory(self) -> int:
+        return sum(self._models_memory.values())
+
+    def get_cache_stats(self) -> dict:
+        return {
+            "max_size": self.max_size,
+            "memory_budget": self.memory_budget,
+            "used_memory": self.used_memory,
+            "eviction_policy": self.eviction_policy,
+            "evictions": self.evictions,
+            "evicted_memory": self.evicted_memory,
+            "models": [
+                {
+                    "model_id": model_id,
+                    "memory": self._models_memory.get(model_id, 0),
+                    "usage_score": self._get_usage_score(model_id=model_id),
+                    "pinned": model_id in self._pinned_models,
+                }
+                for model_id in self._key_queue
+            ],
+        }
+
     async def infer_from_request(
         self, model_id: str, request: InferenceRequest, **kwargs
     ) -> InferenceResponse:
@@ -86,8 +202,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             InferenceResponse: The response from the inference.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_as_used(model_id=model_id)
         return await super().infer_from_request(model_id, request, **kwargs)
 
     def infer_from_request_sync(
@@ -102,8 +217,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             InferenceResponse: The response from the inference.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_as_used(model_id=model_id)
         return super().infer_from_request_sync(model_id, request, **kwargs)
 
     def infer_only(self, model_id: str, request, img_in, img_dims, batch_size=None):
@@ -119,8 +233,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             Response from the inference-only operation.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_as_used(model_id=model_id)
         return super().infer_only(model_id, request, img_in, img_dims, batch_size)
 
     def preprocess(self, model_id: str, request):
@@ -141,3 +254,69 @@ class WithFixedSizeCache(ModelManagerDecorator):
         self, model_id: str, model_id_alias: Optional[str] = None
     ) -> str:
         return model_id if model_id_alias is None else model_id_alias
+
+    def _mark_as_used(self, model_id: str) -> None:
+        self._key_queue.remove(model_id)
+        self._key_queue.append(model_id)
+        self._usage_scores[model_id] = self._get_usage_score(model_id=model_id) + 1
+        self._last_usage[model_id] = time.monotonic()
+
+    def _get_usage_score(self, model_id: str) -> float:
+        if model_id not in self._usage_scores:
+            return 0.0
+        elapsed = time.monotonic() - self._last_usage[model_id]
+        return self._usage_scores[model_id] * math.pow(
+            0.5, elapsed / self.usage_half_life
+        )
+
+    def _select_model_to_evict(
+        self, excluded_model_id: Optional[str] = None
+    ) -> Optional[str]:
+        candidates = [
+            model_id
+            for model_id in self._key_queue
+            if model_id not in self._pinned_models and model_id != excluded_model_id
+        ]
+        if len(candidates) == 0:
+            return None
+        if self.eviction_policy == LFU_EVICTION_POLICY:
+            # `min(...)` picks the first of equally scored models - the least recently used one
+            return min(candidates, key=lambda m: self._get_usage_score(model_id=m))
+        return candidates[0]
+
+    def _evict(self, model_id: str) -> None:
+        self.evictions += 1
+        self.evicted_memory += self._models_memory.get(model_id, 0)
+        self.remove(model_id)
+
+    def _measure_model_memory(
+        self, model_id: str, rss_before_load: Optional[int]
+    ) -> int:
+        rss_after_load = get_process_rss_bytes()
+        rss_increase = 0
+        if rss_before_load is not None and rss_after_load is not None:
+            rss_increase = max(rss_after_load - rss_before_load, 0)
+        try:
+            weights_size = estimate_model_memory_footprint(self[model_id])
+        except Exception as error:
+            logger.debug(f"Could not estimate size of model {model_id}: {error}")
+            weights_size = 0
+        return max(rss_increase, weights_size)
+
+    def _enforce_memory_budget(self, loaded_model_id: str) -> None:
+        if self.memory_budget is None:
+            return None
+        while self.used_memory > self.memory_budget:
+            to_remove_model_id = self._select_model_to_evict(
+                excluded_model_id=loaded_model_id
+            )
+            if to_remove_model_id is None:
+                logger.warning(
+                    f"Models take {self.used_memory} bytes, exceeding memory budget of "
+                    f"{self.memory_budget} bytes, but no model can be evicted."
+                )
+                return None
+            logger.debug(
+                f"Exceeded memory budget of ModelManager. Unloading model {to_remove_model_id}"
+            )
+            self._evict(model_id=to_remove_model_id)
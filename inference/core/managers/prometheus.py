@@ -6,6 +6,7 @@ from prometheus_client.core import REGISTRY, CounterMetricFamily, GaugeMetricFam
 from prometheus_client.registry import Collector
 from prometheus_fastapi_instrumentator import Instrumentator
 
+from inference.core.cache import cache
 from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
 from inference.core.logger import logger
 from inference.core.managers.metrics import get_model_metrics
@@ -100,3 +101,70 @@ class CustomCollector(Collector):
             f"Total number of errors in {self.time_window}s",
             value=num_errors_total,
         )
+        yield from self.collect_models_cache_metrics()
+        yield from self.collect_cache_write_buffer_metrics()
+
+    def collect_models_cache_metrics(self):
+        if self.model_manager is None:
+            return None
+        cache_stats = self.model_manager.get_cache_stats()
+        if cache_stats is None:
+            return None
+        yield GaugeMetricFamily(
+            "models_cache_used_memory_bytes",
+            "Estimated memory taken by models loaded in model manager",
+            value=cache_stats["used_memory"],
+        )
+        if cache_stats["memory_budget"] is not None:
+            yield GaugeMetricFamily(
+                "models_cache_memory_budget_bytes",
+                "Memory budget for models loaded in model manager",
+                value=cache_stats["memory_budget"],
+            )
+        yield CounterMetricFamily(
+            "models_cache_evictions",
+            "Number of models evicted from model manager",
+            value=cache_stats["evictions"],
+        )
+        yield CounterMetricFamily(
+            "models_cache_evicted_memory_bytes",
+            "Estimated memory released by models evicted from model manager",
+            value=cache_stats["evicted_memory"],
+        )
+        for model_stats in cache_stats["models"]:
+            sane_model_id = self.sanitize_string(model_stats["model_id"])
+            yield GaugeMetricFamily(
+                f"models_cache_memory_bytes_{sane_model_id}",
+                "Estimated memory taken by the model",
+                value=model_stats["memory"],
+            )
+
+    def collect_cache_write_buffer_metrics(self):
+        buffer_stats = cache.get_write_buffer_stats()
+        if buffer_stats is None:
+            return None
+        yield GaugeMetricFamily(
+            "cache_write_buffer_depth",
+            "Number of inference results cache writes waiting to be flushed",
+            value=buffer_stats["buffered_writes"],
+        )
+        yield GaugeMetricFamily(
+            "cache_write_buffer_last_flush_seconds",
+            "Duration of the last flush of buffered cache writes",
+            value=buffer_stats["last_flush_duration"],
+        )
+        yield CounterMetricFamily(
+            "cache_write_buffer_flushed_writes",
+            "Number of buffered cache writes flushed",
+            value=buffer_stats["flushed_writes"],
+        )
+        yield CounterMetricFamily(
+            "cache_write_buffer_dropped_writes",
+            "Number of buffered cache writes dropped due to full buffer",
+            value=buffer_stats["dropped_writes"],
+        )
+        yield CounterMetricFamily(
+            "cache_write_buffer_failed_flushes",
+            "Number of failed flushes of buffered cache writes",
+            value=buffer_stats["failed_flushes"],
+        )
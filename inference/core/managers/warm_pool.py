@@ -0,0 +1,175 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from inference.core.env import MAX_BATCH_SIZE
+from inference.core.logger import logger
+from inference.core.managers.base import ModelManager
+from inference.models.aliases import resolve_roboflow_model_alias
+
+MODEL_PENDING = "pending"
+MODEL_LOADING = "loading"
+MODEL_WARMING_UP = "warming_up"
+MODEL_READY = "ready"
+MODEL_FAILED = "failed"
+
+DEFAULT_WARM_UP_IMAGE_SIZE = 640
+
+
+class ModelsWarmPool:
+    """Loads models into the model manager at server startup and warms them up.
+
+    Models are loaded by up to `max_concurrent_loads` worker threads at once - artefacts
+    download, ONNX session creation and validation of different models overlap, instead of
+    blocking event loop one model after another. Each loaded model runs a warm-up inference
+    for each of `warm_up_batch_sizes` (skipping sizes model does not accept), such that
+    first requests of each batch size do not pay for memory arena growth and lazy
+    initialisation of execution providers.
+
+    The pool is ready (`is_ready`) once all models are processed - failed and timed out
+    models are reported in `initialization_errors`. As loading thread cannot be interrupted,
+    timed out model still takes its worker until the load ends - and readiness is reported only
+    after that.
+    """
+
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        model_ids: Iterable[str],
+        api_key: Optional[str],
+        max_concurrent_loads: int = 2,
+        warm_up_batch_sizes: Optional[List[int]] = None,
+        load_timeout: float = 300,
+    ):
+        self._model_manager = model_manager
+        self._model_ids = list(dict.fromkeys(model_ids))
+        self._api_key = api_key
+        self._max_concurrent_loads = max(max_concurrent_loads, 1)
+        self._warm_up_batch_sizes = warm_up_batch_sizes or []
+        self._load_timeout = load_timeout
+        self._lock = threading.Lock()
+        self._models_status: Dict[str, str] = {
+            model_id: MODEL_PENDING for model_id in self._model_ids
+        }
+        self._initialization_errors: List[Tuple[str, str]] = []
+        self._is_ready = False
+
+    @property
+    def is_ready(self) -> bool:
+        return self._is_ready
+
+    @property
+    def initialization_errors(self) -> List[Tuple[str, str]]:
+        with self._lock:
+            return list(self._initialization_errors)
+
+    def describe(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._models_status)
+
+    async def initialize(self) -> None:
+        """Loads and warms up all models, then marks the pool as ready."""
+        loop = asyncio.get_running_loop()
+        # slot of semaphore is given back only once worker thread is done with the model (even
+        # after timeout, as thread cannot be interrupted) - such that the worker is free when the
+        # next model is submitted, and its timeout counts the time of loading only
+        semaphore = asyncio.Semaphore(self._max_concurrent_loads)
+        executor = ThreadPoolExecutor(
+            max_workers=self._max_concurrent_loads,
+            thread_name_prefix="models_warm_pool",
+        )
+        loads = []
+
+        async def prepare(model_id: str) -> None:
+            await semaphore.acquire()
+            load = loop.run_in_executor(executor, self.prepare_model, model_id)
+            load.add_done_callback(lambda _: semaphore.release())
+            loads.append(load)
+            try:
+                await asyncio.wait_for(asyncio.shield(load), timeout=self._load_timeout)
+            except asyncio.TimeoutError:
+                self._register_error(
+                    model_id=model_id,
+                    error=f"Timeout while loading model {model_id}",
+                )
+            except Exception as error:
+                self._register_error(
+                    model_id=model_id,
+                    error=f"Error loading model {model_id}: {error}",
+                )
+
+        try:
+            await asyncio.gather(
+                *[prepare(model_id) for model_id in self._model_ids],
+                return_exceptions=True,
+            )
+            if not all(load.done() for load in loads):
+                logger.info(
+                    "Waiting for timed out models loads to finish before reporting readiness."
+                )
+            await asyncio.gather(*loads, return_exceptions=True)
+        finally:
+            executor.shutdown(wait=False)
+        self._is_ready = True
+        logger.info(
+            f"Models warm pool is ready. Models status: {self.describe()}, "
+            f"errors: {self.initialization_errors}"
+        )
+
+    def prepare_model(self, model_id: str) -> None:
+        """Loads model into the model manager and runs warm-up inferences (blocking)."""
+        self._set_status(model_id=model_id, status=MODEL_LOADING)
+        de_aliased_model_id = resolve_roboflow_model_alias(model_id=model_id)
+        self._model_manager.add_model(de_aliased_model_id, self._api_key)
+        logger.info(f"Model {model_id} loaded successfully.")
+        self._set_status(model_id=model_id, status=MODEL_WARMING_UP)
+        self.warm_up_model(model_id=de_aliased_model_id)
+        self._set_status(model_id=model_id, status=MODEL_READY)
+
+    def warm_up_model(self, model_id: str) -> None:
+        model = self._model_manager[model_id]
+        batch_sizes = select_warm_up_batch_sizes(
+            batch_sizes=self._warm_up_batch_sizes,
+            batching_enabled=getattr(model, "batching_enabled", True),
+            model_batch_size=getattr(model, "batch_size", None),
+        )
+        height = getattr(model, "img_size_h", None) or DEFAULT_WARM_UP_IMAGE_SIZE
+        width = getattr(model, "img_size_w", None) or DEFAULT_WARM_UP_IMAGE_SIZE
+        for batch_size in batch_sizes:
+            images = [
+                (np.random.rand(height, width, 3) * 255).astype(np.uint8)
+                for _ in range(batch_size)
+            ]
+            logger.debug(f"Warming up model {model_id} with batch of {batch_size}")
+            model.infer(
+                images if batch_size > 1 else images[0],
+                usage_inference_test_run=True,
+            )
+
+    def _set_status(self, model_id: str, status: str) -> None:
+        with self._lock:
+            if self._models_status.get(model_id) == MODEL_FAILED:
+                # timed out model keeps being loaded in the background
+                return None
+            self._models_status[model_id] = status
+
+    def _register_error(self, model_id: str, error: str) -> None:
+        logger.error(error)
+        with self._lock:
+            self._models_status[model_id] = MODEL_FAILED
+            self._initialization_errors.append((model_id, error))
+
+
+def select_warm_up_batch_sizes(
+    batch_sizes: List[int],
+    batching_enabled: bool,
+    model_batch_size: Optional[int],
+) -> List[int]:
+    if not batching_enabled and isinstance(model_batch_size, int):
+        max_batch_size = model_batch_size
+    else:
+        max_batch_size = MAX_BATCH_SIZE
+    return sorted({b for b in batch_sizes if 0 < b <= max_batch_size})
@@ -177,12 +177,31 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         )
 
     def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray]:
-        predictions = self.onnx_session.run(None, {self.input_name: img_in})
+        predictions = self.run_onnx_session(img_in)
         return (predictions,)
 
     def preprocess(
         self, image: Any, **kwargs
     ) -> Tuple[np.ndarray, PreprocessReturnMetadata]:
+        if self.preprocessing_buffer is not None:
+            # all images (e.g. crops of second-stage workflows) are resized straight
+            # into single batch tensor, already divided by 255
+            img_in, img_dims = self.load_image_into_batch(
+                image,
+                disable_preproc_auto_orient=kwargs.get(
+                    "disable_preproc_auto_orient", False
+                ),
+                disable_preproc_contrast=kwargs.get("disable_preproc_contrast", False),
+                disable_preproc_grayscale=kwargs.get(
+                    "disable_preproc_grayscale", False
+                ),
+                disable_preproc_static_crop=kwargs.get(
+                    "disable_preproc_static_crop", False
+                ),
+            )
+            return self.normalise_batch(img_in=img_in), PreprocessReturnMetadata(
+                {"img_dims": img_dims}
+            )
         if isinstance(image, list):
             imgs_with_dims = [
                 self.preproc_image(
@@ -221,16 +240,19 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
             img_dims = [img_dims]
 
         img_in /= 255.0
+        img_in = img_in.astype(np.float32)
+        return self.normalise_batch(img_in=img_in), PreprocessReturnMetadata(
+            {"img_dims": img_dims}
+        )
 
+    def normalise_batch(self, img_in: np.ndarray) -> np.ndarray:
         mean = (0.5, 0.5, 0.5)
         std = (0.5, 0.5, 0.5)
 
-        img_in = img_in.astype(np.float32)
-
         img_in[:, 0, :, :] = (img_in[:, 0, :, :] - mean[0]) / std[0]
         img_in[:, 1, :, :] = (img_in[:, 1, :, :] - mean[1]) / std[1]
         img_in[:, 2, :, :] = (img_in[:, 2, :, :] - mean[2]) / std[2]
-        return img_in, PreprocessReturnMetadata({"img_dims": img_dims})
+        return img_in
 
     def infer_from_request(
         self,
@@ -44,6 +44,7 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
 
     task_type = "instance-segmentation"
     num_masks = 32
+    supports_uint8_input = True
 
     def infer(
         self,
@@ -196,19 +197,28 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
     def preprocess(
         self, image: Any, **kwargs
     ) -> Tuple[np.ndarray, PreprocessReturnMetadata]:
-        img_in, img_dims = self.load_image(
+        load_image = (
+            self.load_image_into_batch
+            if self.preprocessing_buffer is not None
+            else self.load_image
+        )
+        img_in, img_dims = load_image(
             image,
             disable_preproc_auto_orient=kwargs.get("disable_preproc_auto_orient"),
             disable_preproc_contrast=kwargs.get("disable_preproc_contrast"),
             disable_preproc_grayscale=kwargs.get("disable_preproc_grayscale"),
             disable_preproc_static_crop=kwargs.get("disable_preproc_static_crop"),
         )
-
-        img_in /= 255.0
+        im_shape = img_in.shape
+        if self.preprocessing_buffer is None:
+            img_in /= 255.0
+        elif self.uint8_input:
+            # postprocessing expects shape of NCHW input
+            im_shape = (im_shape[0], im_shape[3], im_shape[1], im_shape[2])
         return img_in, PreprocessReturnMetadata(
             {
                 "img_dims": img_dims,
-                "im_shape": img_in.shape,
+                "im_shape": im_shape,
                 "disable_preproc_static_crop": kwargs.get(
                     "disable_preproc_static_crop"
                 ),
@@ -30,6 +30,7 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
 
     task_type = "object-detection"
     box_format = "xywh"
+    supports_uint8_input = True
 
     def infer(
         self,
@@ -210,15 +211,23 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         Returns:
             Tuple[np.ndarray, List[Tuple[int, int]]]: Preprocessed image inputs and corresponding dimensions.
         """
-        img_in, img_dims = self.load_image(
-            image,
-            disable_preproc_auto_orient=disable_preproc_auto_orient,
-            disable_preproc_contrast=disable_preproc_contrast,
-            disable_preproc_grayscale=disable_preproc_grayscale,
-            disable_preproc_static_crop=disable_preproc_static_crop,
-        )
-
-        img_in /= 255.0
+        if self.preprocessing_buffer is not None:
+            img_in, img_dims = self.load_image_into_batch(
+                image,
+                disable_preproc_auto_orient=disable_preproc_auto_orient,
+                disable_preproc_contrast=disable_preproc_contrast,
+                disable_preproc_grayscale=disable_preproc_grayscale,
+                disable_preproc_static_crop=disable_preproc_static_crop,
+            )
+        else:
+            img_in, img_dims = self.load_image(
+                image,
+                disable_preproc_auto_orient=disable_preproc_auto_orient,
+                disable_preproc_contrast=disable_preproc_contrast,
+                disable_preproc_grayscale=disable_preproc_grayscale,
+                disable_preproc_static_crop=disable_preproc_static_crop,
+            )
+            img_in /= 255.0
 
         if self.batching_enabled:
             batch_padding = 0
@@ -237,8 +246,10 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
                     f"Consider turning off fix_batch_size, changing `MAX_BATCH_SIZE` in"
                     f"your inference server config, or passing at most {MAX_BATCH_SIZE} images at a time"
                 )
-            width_remainder = img_in.shape[2] % 32
-            height_remainder = img_in.shape[3] % 32
+            # uint8 input is given in NHWC layout
+            spatial_axes = (1, 2) if self.uint8_input else (2, 3)
+            width_remainder = img_in.shape[spatial_axes[0]] % 32
+            height_remainder = img_in.shape[spatial_axes[1]] % 32
             if width_remainder > 0:
                 width_padding = 32 - width_remainder
             else:
@@ -247,11 +258,11 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
                 height_padding = 32 - height_remainder
             else:
                 height_padding = 0
-            img_in = np.pad(
-                img_in,
-                ((0, batch_padding), (0, 0), (0, width_padding), (0, height_padding)),
-                "constant",
-            )
+            if batch_padding > 0 or width_padding > 0 or height_padding > 0:
+                padding = [(0, batch_padding), (0, 0), (0, 0), (0, 0)]
+                padding[spatial_axes[0]] = (0, width_padding)
+                padding[spatial_axes[1]] = (0, height_padding)
+                img_in = np.pad(img_in, padding, "constant")
 
         return img_in, PreprocessReturnMetadata(
             {
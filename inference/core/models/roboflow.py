@@ -1,5 +1,6 @@
 import itertools
 import json
+import math
 import os
 from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
@@ -16,12 +17,15 @@ from inference.core.cache import cache
 from inference.core.cache.model_artifacts import (
     are_all_files_cached,
     clear_cache,
+    enforce_cache_size_limit,
     get_cache_dir,
     get_cache_file_path,
     initialise_cache,
     load_json_from_cache,
     load_text_file_from_cache,
-    save_bytes_in_cache,
+    mark_model_cache_as_used,
+    model_cache_download_lock,
+    save_file_in_cache,
     save_json_in_cache,
     save_text_lines_in_cache,
 )
@@ -37,6 +41,12 @@ from inference.core.env import (
     AWS_SECRET_ACCESS_KEY,
     CORE_MODEL_BUCKET,
     DISABLE_PREPROC_AUTO_ORIENT,
+    ENABLE_FUSED_PREPROCESSING,
+    ENABLE_ONNX_IO_BINDING,
+    ENABLE_ONNX_OPTIMIZED_MODEL_CACHE,
+    ENABLE_REDUCED_RESOLUTION_DECODING,
+    ENABLE_STAGED_EXECUTION,
+    ENABLE_UINT8_ONNX_INPUT,
     INFER_BUCKET,
     LAMBDA,
     MAX_BATCH_SIZE,
@@ -44,27 +54,65 @@ from inference.core.env import (
     MODEL_VALIDATION_DISABLED,
     ONNXRUNTIME_EXECUTION_PROVIDERS,
     REQUIRED_ONNX_PROVIDERS,
+    STAGED_EXECUTION_POSTPROCESS_WORKERS,
+    STAGED_EXECUTION_PREDICT_WORKERS,
+    STAGED_EXECUTION_PREPROCESS_WORKERS,
+    STAGED_EXECUTION_QUEUE_SIZE,
     TENSORRT_CACHE_PATH,
 )
 from inference.core.exceptions import ModelArtefactError, OnnxProviderNotAvailable
 from inference.core.logger import logger
 from inference.core.models.base import Model
 from inference.core.models.utils.batching import create_batches
-from inference.core.models.utils.onnx import has_trt
+from inference.core.models.utils.onnx import (
+    IOBindingSessionRunner,
+    get_optimized_onnx_model_suffix,
+    has_trt,
+    save_optimized_onnx_model,
+    wrap_onnx_model_with_uint8_input,
+)
+from inference.core.models.utils.preprocessing import (
+    PreprocessingBuffer,
+    get_onnx_input_dtype,
+    write_image_into_batch,
+    write_image_into_uint8_batch,
+)
+from inference.core.models.utils.staged_execution import (
+    POSTPROCESS_STAGE,
+    PREDICT_STAGE,
+    PREPROCESS_STAGE,
+    Stage,
+    StagedExecutor,
+)
 from inference.core.roboflow_api import (
     ModelEndpointType,
+    download_file_from_url,
     get_from_url,
     get_roboflow_model_data,
 )
-from inference.core.utils.image_utils import load_image
+from inference.core.utils.image_utils import (
+    load_image,
+    load_image_with_reduced_decoding,
+)
 from inference.core.utils.onnx import get_onnxruntime_execution_providers
-from inference.core.utils.preprocess import letterbox_image, prepare
+from inference.core.utils.preprocess import (
+    STATIC_CROP_KEY,
+    letterbox_image,
+    prepare,
+    static_crop_should_be_applied,
+)
 from inference.core.utils.visualisation import draw_detection_predictions
+from inference.core.workflows.execution_engine.profiling.core import (
+    get_step_profiler,
+)
 from inference.models.aliases import resolve_roboflow_model_alias
+from inference.usage_tracking.collector import usage_collector
 
 NUM_S3_RETRY = 5
 SLEEP_SECONDS_BETWEEN_RETRIES = 3
 MODEL_METADATA_CACHE_EXPIRATION_TIMEOUT = 3600  # 1 hour
+UINT8_INPUT_WEIGHTS_SUFFIX = ".uint8"
+PARTIAL_DOWNLOAD_SUFFIX = ".partial"
 
 S3_CLIENT = None
 if AWS_ACCESS_KEY_ID and AWS_ACCESS_KEY_ID:
@@ -217,11 +265,17 @@ class RoboflowInferenceModel(Model):
     def cache_model_artefacts(self) -> None:
         infer_bucket_files = self.get_all_required_infer_bucket_file()
         if are_all_files_cached(files=infer_bucket_files, model_id=self.endpoint):
+            mark_model_cache_as_used(model_id=self.endpoint)
             return None
-        if is_model_artefacts_bucket_available():
-            self.download_model_artefacts_from_s3()
-            return None
-        self.download_model_artifacts_from_roboflow_api()
+        with model_cache_download_lock(model_id=self.endpoint):
+            # artefacts could be downloaded by other process while waiting for the lock
+            if are_all_files_cached(files=infer_bucket_files, model_id=self.endpoint):
+                return None
+            if is_model_artefacts_bucket_available():
+                self.download_model_artefacts_from_s3()
+            else:
+                self.download_model_artifacts_from_roboflow_api()
+        enforce_cache_size_limit(protected_model_ids=[self.endpoint])
 
     def get_all_required_infer_bucket_file(self) -> List[str]:
         infer_bucket_files = self.get_infer_bucket_file_list()
@@ -277,13 +331,17 @@ class RoboflowInferenceModel(Model):
             raise ModelArtefactError(
                 "Could not find `environment` key in roboflow API model description response."
             )
-        environment = get_from_url(api_data["environment"])
-        model_weights_response = get_from_url(api_data["model"], json_response=False)
-        save_bytes_in_cache(
-            content=model_weights_response.content,
-            file=self.weights_file,
-            model_id=self.endpoint,
-        )
+        # environment and weights are fetched concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            environment_future = executor.submit(get_from_url, api_data["environment"])
+            model_weights_future = executor.submit(
+                download_artefact_into_cache,
+                url=api_data["model"],
+                file=self.weights_file,
+                model_id=self.endpoint,
+            )
+            environment = environment_future.result()
+            model_weights_future.result()
         if "colors" in api_data:
             environment["COLORS"] = api_data["colors"]
         save_json_in_cache(
@@ -383,14 +441,9 @@ class RoboflowInferenceModel(Model):
         Returns:
             Tuple[np.ndarray, Tuple[int, int]]: A tuple containing a numpy array of the preprocessed image pixel data and a tuple of the images original size.
         """
-        np_image, is_bgr = load_image(
+        preprocessed_image, img_dims, is_bgr = self.load_and_prepare_image(
             image,
-            disable_preproc_auto_orient=disable_preproc_auto_orient
-            or "auto-orient" not in self.preproc.keys()
-            or DISABLE_PREPROC_AUTO_ORIENT,
-        )
-        preprocessed_image, img_dims = self.preprocess_image(
-            np_image,
+            disable_preproc_auto_orient=disable_preproc_auto_orient,
             disable_preproc_contrast=disable_preproc_contrast,
             disable_preproc_grayscale=disable_preproc_grayscale,
             disable_preproc_static_crop=disable_preproc_static_crop,
@@ -425,6 +478,84 @@ class RoboflowInferenceModel(Model):
 
         return img_in, img_dims
 
+    def load_and_prepare_image(
+        self,
+        image: Union[Any, InferenceRequestImage],
+        disable_preproc_auto_orient: bool = False,
+        disable_preproc_contrast: bool = False,
+        disable_preproc_grayscale: bool = False,
+        disable_preproc_static_crop: bool = False,
+    ) -> Tuple[np.ndarray, Tuple[int, int], bool]:
+        """
+        Loads an image and applies pre-processing specified by the Roboflow platform, without scaling it to the inference input dimensions.
+
+        Returns:
+            Tuple[np.ndarray, Tuple[int, int], bool]: A tuple containing the pre-processed image, the images original size and the flag telling if image is in BGR order.
+        """
+        disable_preproc_auto_orient = (
+            disable_preproc_auto_orient
+            or "auto-orient" not in self.preproc.keys()
+            or DISABLE_PREPROC_AUTO_ORIENT
+        )
+        minimal_decoding_size = None
+        if ENABLE_REDUCED_RESOLUTION_DECODING:
+            minimal_decoding_size = self.get_minimal_decoding_size(
+                disable_preproc_static_crop=disable_preproc_static_crop
+            )
+        original_size = None
+        if minimal_decoding_size is not None:
+            np_image, is_bgr, original_size = load_image_with_reduced_decoding(
+                image,
+                minimal_size=minimal_decoding_size,
+                disable_preproc_auto_orient=disable_preproc_auto_orient,
+            )
+        else:
+            np_image, is_bgr = load_image(
+                image,
+                disable_preproc_auto_orient=disable_preproc_auto_orient,
+            )
+        preprocessed_image, img_dims = self.preprocess_image(
+            np_image,
+            disable_preproc_contrast=disable_preproc_contrast,
+            disable_preproc_grayscale=disable_preproc_grayscale,
+            disable_preproc_static_crop=disable_preproc_static_crop,
+        )
+        if original_size is not None:
+            # image decoded in reduced resolution - predictions must be
+            # rescaled to the original one
+            img_dims = original_size
+        return preprocessed_image, img_dims, is_bgr
+
+    def get_minimal_decoding_size(
+        self, disable_preproc_static_crop: bool = False
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Computes the minimal (height, width) of decoded image which, after static crop, is not smaller than the model input.
+
+        Returns:
+            Optional[Tuple[int, int]]: Minimal size of decoded image or None if model input size is not known.
+        """
+        img_size_h = getattr(self, "img_size_h", None)
+        img_size_w = getattr(self, "img_size_w", None)
+        if not isinstance(img_size_h, int) or not isinstance(img_size_w, int):
+            return None
+        height_fraction, width_fraction = 1.0, 1.0
+        if static_crop_should_be_applied(
+            preprocessing_config=self.preproc,
+            disable_preproc_static_crop=disable_preproc_static_crop,
+        ):
+            crop_parameters = self.preproc[STATIC_CROP_KEY]
+            height_fraction = (
+                crop_parameters["y_max"] - crop_parameters["y_min"]
+            ) / 100
+            width_fraction = (crop_parameters["x_max"] - crop_parameters["x_min"]) / 100
+        if height_fraction <= 0 or width_fraction <= 0:
+            return None
+        return (
+            math.ceil(img_size_h / height_fraction),
+            math.ceil(img_size_w / width_fraction),
+        )
+
     def preprocess_image(
         self,
         image: np.ndarray,
@@ -490,11 +621,17 @@ class RoboflowCoreModel(RoboflowInferenceModel):
         infer_bucket_files = self.get_infer_bucket_file_list()
         if are_all_files_cached(files=infer_bucket_files, model_id=self.endpoint):
             logger.debug("Model artifacts already downloaded, loading from cache")
+            mark_model_cache_as_used(model_id=self.endpoint)
             return None
-        if is_model_artefacts_bucket_available():
-            self.download_model_artefacts_from_s3()
-            return None
-        self.download_model_from_roboflow_api()
+        with model_cache_download_lock(model_id=self.endpoint):
+            # artefacts could be downloaded by other process while waiting for the lock
+            if are_all_files_cached(files=infer_bucket_files, model_id=self.endpoint):
+                return None
+            if is_model_artefacts_bucket_available():
+                self.download_model_artefacts_from_s3()
+            else:
+                self.download_model_from_roboflow_api()
+        enforce_cache_size_limit(protected_model_ids=[self.endpoint])
 
     def download_model_from_roboflow_api(self) -> None:
         api_data = get_roboflow_model_data(
@@ -510,12 +647,9 @@ class RoboflowCoreModel(RoboflowInferenceModel):
         for weights_url_key in api_data["weights"]:
             weights_url = api_data["weights"][weights_url_key]
             t1 = perf_counter()
-            model_weights_response = get_from_url(weights_url, json_response=False)
             filename = weights_url.split("?")[0].split("/")[-1]
-            save_bytes_in_cache(
-                content=model_weights_response.content,
-                file=filename,
-                model_id=self.endpoint,
+            download_artefact_into_cache(
+                url=weights_url, file=filename, model_id=self.endpoint
             )
             if perf_counter() - t1 > 120:
                 logger.debug(
@@ -573,6 +707,10 @@ class RoboflowCoreModel(RoboflowInferenceModel):
 class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
     """Roboflow Inference Model that operates using an ONNX model file."""
 
+    # models which prepare input with `load_image(...)` followed by division by 255 can be
+    # fed with raw uint8 NHWC batches, with normalisation folded into the model graph
+    supports_uint8_input = False
+
     def __init__(
         self,
         model_id: str,
@@ -608,14 +746,30 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
                 expanded_execution_providers.append(ep)
             self.onnxruntime_execution_providers = expanded_execution_providers
 
+        self.staged_executor: Optional[StagedExecutor] = None
+        self.preprocessing_buffer: Optional[PreprocessingBuffer] = None
+        self.uint8_input = False
+        self.io_binding_runner: Optional[IOBindingSessionRunner] = None
+        self.test_inference_output_shape: Optional[Tuple[int, ...]] = None
+        self.load_time_breakdown: Dict[str, float] = {}
         self.initialize_model()
         self.image_loader_threadpool = ThreadPoolExecutor(max_workers=None)
+        # execution helpers must be in place before validation - test inference has to go
+        # through the same path as requests (uint8 input models cannot take float batches)
+        if ENABLE_STAGED_EXECUTION and self.load_weights:
+            self.staged_executor = self.create_staged_executor()
+        if (ENABLE_FUSED_PREPROCESSING or self.uint8_input) and self.load_weights:
+            self.preprocessing_buffer = self.create_preprocessing_buffer()
+        if ENABLE_ONNX_IO_BINDING and self.load_weights:
+            self.io_binding_runner = self.create_io_binding_runner()
+        t1_validation = perf_counter()
         try:
             self.validate_model()
         except ModelArtefactError as e:
             logger.error(f"Unable to validate model artifacts, clearing cache: {e}")
             self.clear_cache()
             raise ModelArtefactError from e
+        self.load_time_breakdown["validation"] = perf_counter() - t1_validation
 
     def infer(self, image: Any, **kwargs) -> Any:
         """Runs inference on given data.
@@ -625,17 +779,105 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
         input_elements = len(image) if isinstance(image, list) else 1
         max_batch_size = MAX_BATCH_SIZE if self.batching_enabled else self.batch_size
         if (input_elements == 1) or (max_batch_size == float("inf")):
-            return super().infer(image, **kwargs)
+            return self._infer_batch(image, **kwargs)
         logger.debug(
             f"Inference will be executed in batches, as there is {input_elements} input elements and "
             f"maximum batch size for a model is set to: {max_batch_size}"
         )
         inference_results = []
         for batch_input in create_batches(sequence=image, batch_size=max_batch_size):
-            batch_inference_results = super().infer(batch_input, **kwargs)
+            batch_inference_results = self._infer_batch(batch_input, **kwargs)
             inference_results.append(batch_inference_results)
         return self.merge_inference_results(inference_results=inference_results)
 
+    def _infer_batch(self, image: Any, **kwargs) -> Any:
+        if self.staged_executor is None:
+            return super().infer(image, **kwargs)
+        return self.infer_staged(image, **kwargs)
+
+    @usage_collector
+    def infer_staged(self, image: Any, **kwargs) -> Any:
+        """Runs inference through the staged executor - preprocess, predict and postprocess
+        are executed by separate worker pools, so stages of concurrent calls overlap.
+        Time spent in each stage is attached to inference responses as `stage_times` and
+        recorded in the profiler of Workflow step running the inference (if any).
+        """
+        postprocessed, stage_times = self.staged_executor.run(
+            image, profiler=get_step_profiler(), **kwargs
+        )
+        logger.debug(f"Staged inference finished. Stages times: {stage_times}")
+        responses = postprocessed if isinstance(postprocessed, list) else []
+        for response in responses:
+            if isinstance(response, InferenceResponse):
+                response.stage_times = dict(stage_times)
+        return postprocessed
+
+    def create_staged_executor(self) -> StagedExecutor:
+        return StagedExecutor(
+            stages=[
+                Stage(
+                    name=PREPROCESS_STAGE,
+                    function=lambda image, kwargs: self.preprocess(image, **kwargs),
+                    workers=STAGED_EXECUTION_PREPROCESS_WORKERS,
+                ),
+                Stage(
+                    name=PREDICT_STAGE,
+                    function=lambda preprocessed, kwargs: (
+                        self.predict(preprocessed[0], **kwargs),
+                        preprocessed[1],
+                    ),
+                    workers=STAGED_EXECUTION_PREDICT_WORKERS,
+                ),
+                Stage(
+                    name=POSTPROCESS_STAGE,
+                    function=lambda predicted, kwargs: self.postprocess(
+                        predicted[0], predicted[1], **kwargs
+                    ),
+                    workers=STAGED_EXECUTION_POSTPROCESS_WORKERS,
+                ),
+            ],
+            queue_size=STAGED_EXECUTION_QUEUE_SIZE,
+        )
+
+    def create_preprocessing_buffer(self) -> PreprocessingBuffer:
+        # batch produced in preprocessing thread of staged executor is consumed by
+        # another thread - buffers cannot be reused then
+        return PreprocessingBuffer(
+            height=self.img_size_h,
+            width=self.img_size_w,
+            dtype=get_onnx_input_dtype(self.onnx_session.get_inputs()[0].type),
+            reuse=self.staged_executor is None,
+            channels_last=self.uint8_input,
+        )
+
+    def create_io_binding_runner(self) -> IOBindingSessionRunner:
+        # outputs of predict stage are consumed by postprocessing thread of staged
+        # executor - output buffers cannot be reused then
+        return IOBindingSessionRunner(
+            session=self.onnx_session,
+            input_name=self.input_name,
+            reuse_outputs=self.staged_executor is None,
+        )
+
+    def run_onnx_session(self, img_in: np.ndarray) -> List[np.ndarray]:
+        """Runs ONNX session on the model input - through IO binding when enabled.
+
+        Args:
+            img_in (np.ndarray): The preprocessed model input.
+
+        Returns:
+            List[np.ndarray]: Model outputs. With IO binding those are buffers reused by the next call in the same thread.
+        """
+        if self.io_binding_runner is None:
+            return self.onnx_session.run(None, {self.input_name: img_in})
+        return self.io_binding_runner.run(img_in)
+
+    def clear_cache(self) -> None:
+        if getattr(self, "staged_executor", None) is not None:
+            self.staged_executor.shutdown()
+            self.staged_executor = None
+        super().clear_cache()
+
     def merge_inference_results(self, inference_results: List[Any]) -> Any:
         return list(itertools.chain(*inference_results))
 
@@ -667,11 +909,26 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
     def run_test_inference(self) -> None:
         test_image = (np.random.rand(1024, 1024, 3) * 255).astype(np.uint8)
         logger.debug(f"Running test inference. Image size: {test_image.shape}")
-        result = self.infer(test_image, usage_inference_test_run=True)
+        # shape of raw predictions is recorded, so that output shape probe
+        # does not need to run the model again
+        self.predict = self._predict_recording_output_shape
+        try:
+            result = self.infer(test_image, usage_inference_test_run=True)
+        finally:
+            del self.predict
         logger.debug(f"Test inference finished.")
         return result
 
+    def _predict_recording_output_shape(
+        self, img_in: np.ndarray, **kwargs
+    ) -> Tuple[np.ndarray, ...]:
+        predictions = type(self).predict(self, img_in, **kwargs)
+        self.test_inference_output_shape = predictions[0].shape
+        return predictions
+
     def get_model_output_shape(self) -> Tuple[int, int, int]:
+        if self.test_inference_output_shape is not None:
+            return self.test_inference_output_shape
         test_image = (np.random.rand(1024, 1024, 3) * 255).astype(np.uint8)
         logger.debug(f"Getting model output shape. Image size: {test_image.shape}")
         test_image, _ = self.preprocess(test_image)
@@ -693,15 +950,34 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
     def initialize_model(self) -> None:
         """Initializes the ONNX model, setting up the inference session and other necessary properties."""
         logger.debug("Getting model artefacts")
+        t1_artifacts = perf_counter()
         self.get_model_artifacts()
+        self.load_time_breakdown["model_artifacts"] = perf_counter() - t1_artifacts
         logger.debug("Creating inference session")
         if self.load_weights or not self.has_model_metadata:
             t1_session = perf_counter()
             # Create an ONNX Runtime Session with a list of execution providers in priority order. ORT attempts to load providers until one is successful. This keeps the code across devices identical.
             providers = self.onnxruntime_execution_providers
+            weights_path = self.cache_file(self.weights_file)
+            if (
+                ENABLE_UINT8_ONNX_INPUT
+                and self.supports_uint8_input
+                and self.load_weights
+            ):
+                uint8_weights_path = self.prepare_uint8_input_weights()
+                if uint8_weights_path is not None:
+                    weights_path = uint8_weights_path
+                    self.uint8_input = True
 
             if not self.load_weights:
                 providers = ["OpenVINOExecutionProvider", "CPUExecutionProvider"]
+            # TensorRT does not use graph optimizations of ONNX runtime
+            elif ENABLE_ONNX_OPTIMIZED_MODEL_CACHE and not has_trt(providers):
+                optimized_weights_path = self.prepare_optimized_weights(
+                    weights_path=weights_path, providers=providers
+                )
+                if optimized_weights_path is not None:
+                    weights_path = optimized_weights_path
             try:
                 session_options = onnxruntime.SessionOptions()
                 # TensorRT does better graph optimization for its EP than onnx
@@ -710,7 +986,7 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
                         onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
                     )
                 self.onnx_session = onnxruntime.InferenceSession(
-                    self.cache_file(self.weights_file),
+                    weights_path,
                     providers=providers,
                     sess_options=session_options,
                 )
@@ -720,6 +996,7 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
                     f"Unable to load ONNX session. Cause: {e}"
                 ) from e
             logger.debug(f"Session created in {perf_counter() - t1_session} seconds")
+            self.load_time_breakdown["onnx_session"] = perf_counter() - t1_session
 
             if REQUIRED_ONNX_PROVIDERS:
                 available_providers = onnxruntime.get_available_providers()
@@ -735,8 +1012,12 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
             inputs = self.onnx_session.get_inputs()[0]
             input_shape = inputs.shape
             self.batch_size = input_shape[0]
-            self.img_size_h = input_shape[2]
-            self.img_size_w = input_shape[3]
+            if self.uint8_input:
+                self.img_size_h = input_shape[1]
+                self.img_size_w = input_shape[2]
+            else:
+                self.img_size_h = input_shape[2]
+                self.img_size_w = input_shape[3]
             self.input_name = inputs.name
             if isinstance(self.img_size_h, str) or isinstance(self.img_size_w, str):
                 if "resize" in self.preproc:
@@ -788,6 +1069,71 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
                 )
         logger.debug("Model initialisation finished.")
 
+    def prepare_uint8_input_weights(self) -> Optional[str]:
+        """Wraps model weights with subgraph converting raw uint8 NHWC input into normalised NCHW
+        tensor. Wrapped model is saved next to the original weights and reused as long as it is
+        not older than them.
+
+        Returns:
+            Optional[str]: Path to wrapped weights or None if model input cannot be wrapped.
+        """
+        weights_path = self.cache_file(self.weights_file)
+        weights_name, weights_extension = os.path.splitext(self.weights_file)
+        uint8_weights_path = self.cache_file(
+            f"{weights_name}{UINT8_INPUT_WEIGHTS_SUFFIX}{weights_extension}"
+        )
+        if os.path.exists(uint8_weights_path) and os.path.getmtime(
+            uint8_weights_path
+        ) >= os.path.getmtime(weights_path):
+            return uint8_weights_path
+        try:
+            wrap_onnx_model_with_uint8_input(
+                source_path=weights_path, target_path=uint8_weights_path
+            )
+        except (ValueError, ImportError) as error:
+            logger.warning(
+                f"Model {self.endpoint} cannot accept uint8 input - using float input. Cause: {error}"
+            )
+            return None
+        return uint8_weights_path
+
+    def prepare_optimized_weights(
+        self,
+        weights_path: str,
+        providers: List[Union[Tuple[str, Dict], str]],
+    ) -> Optional[str]:
+        """Saves model optimized by ONNX runtime next to the weights, in a file specific to
+        ONNX runtime version and execution providers. Saved model is reused as long as it is
+        not older than the weights.
+
+        Returns:
+            Optional[str]: Path to optimized weights or None if model could not be optimized.
+        """
+        weights_name, weights_extension = os.path.splitext(
+            os.path.basename(weights_path)
+        )
+        optimized_weights_path = self.cache_file(
+            f"{weights_name}{get_optimized_onnx_model_suffix(providers)}{weights_extension}"
+        )
+        if os.path.exists(optimized_weights_path) and os.path.getmtime(
+            optimized_weights_path
+        ) >= os.path.getmtime(weights_path):
+            logger.debug(f"Loading optimized model from {optimized_weights_path}")
+            return optimized_weights_path
+        logger.debug(f"Saving optimized model to {optimized_weights_path}")
+        try:
+            save_optimized_onnx_model(
+                source_path=weights_path,
+                target_path=optimized_weights_path,
+                providers=providers,
+            )
+        except Exception as error:
+            logger.warning(
+                f"Could not save optimized model {self.endpoint} - using original weights. Cause: {error}"
+            )
+            return None
+        return optimized_weights_path
+
     def load_image(
         self,
         image: Any,
@@ -818,6 +1164,69 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
             img_dims = [img_dims]
         return img_in, img_dims
 
+    def load_image_into_batch(
+        self,
+        image: Any,
+        disable_preproc_auto_orient: bool = False,
+        disable_preproc_contrast: bool = False,
+        disable_preproc_grayscale: bool = False,
+        disable_preproc_static_crop: bool = False,
+    ) -> Tuple[np.ndarray, List[Tuple[int, int]]]:
+        """Fused alternative to `load_image(...)` followed by division by 255 - each image is
+        resized straight into `self.preprocessing_buffer` batch, with channels swap,
+        transposition and normalisation done in one pass.
+
+        Returns:
+            Tuple[np.ndarray, List[Tuple[int, int]]]: Normalised NCHW batch and original sizes of images.
+        """
+        images = image if isinstance(image, list) else [image]
+        batch = self.preprocessing_buffer.get_batch(batch_size=len(images))
+        load_into_batch = partial(
+            self._load_image_into_batch_slot,
+            batch=batch,
+            disable_preproc_auto_orient=disable_preproc_auto_orient,
+            disable_preproc_contrast=disable_preproc_contrast,
+            disable_preproc_grayscale=disable_preproc_grayscale,
+            disable_preproc_static_crop=disable_preproc_static_crop,
+        )
+        if len(images) == 1:
+            img_dims = [load_into_batch(0, images[0])]
+        else:
+            img_dims = list(
+                self.image_loader_threadpool.map(
+                    load_into_batch, range(len(images)), images
+                )
+            )
+        return batch, img_dims
+
+    def _load_image_into_batch_slot(
+        self,
+        index: int,
+        image: Any,
+        batch: np.ndarray,
+        **kwargs,
+    ) -> Tuple[int, int]:
+        preprocessed_image, img_dims, is_bgr = self.load_and_prepare_image(
+            image, **kwargs
+        )
+        if self.preprocessing_buffer.channels_last:
+            write_image_into_uint8_batch(
+                image=preprocessed_image,
+                destination=batch[index],
+                resize_method=self.resize_method,
+                is_bgr=is_bgr,
+            )
+            return img_dims
+        # canvas is thread-local - images of batch are loaded in different threads
+        write_image_into_batch(
+            image=preprocessed_image,
+            destination=batch[index],
+            resize_method=self.resize_method,
+            is_bgr=is_bgr,
+            resize_canvas=self.preprocessing_buffer.get_resize_canvas(),
+        )
+        return img_dims
+
     @property
     def weights_file(self) -> str:
         """Returns the file containing the ONNX model weights.
@@ -834,6 +1243,24 @@ class OnnxRoboflowCoreModel(RoboflowCoreModel):
     pass
 
 
+def download_artefact_into_cache(url: str, file: str, model_id: str) -> None:
+    """Streams artefact from `url` into model cache, without holding it in memory.
+
+    Download goes into `<file>.partial` in the model cache directory, which is kept when the
+    download fails - such that the next attempt resumes it instead of starting over.
+    """
+    partial_file_path = get_cache_file_path(
+        file=f"{file}{PARTIAL_DOWNLOAD_SUFFIX}", model_id=model_id
+    )
+    os.makedirs(os.path.dirname(partial_file_path), exist_ok=True)
+    t1 = perf_counter()
+    download_file_from_url(url=url, target_path=partial_file_path)
+    save_file_in_cache(source_path=partial_file_path, file=file, model_id=model_id)
+    logger.debug(
+        f"Downloaded {file} of model {model_id} in {perf_counter() - t1:.2f} seconds"
+    )
+
+
 def get_class_names_from_environment_file(environment: Optional[dict]) -> List[str]:
     if environment is None:
         raise ModelArtefactError(
@@ -1,4 +1,14 @@
-from typing import Dict, List, Tuple, Union
+import hashlib
+import json
+import os
+import platform
+import threading
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import onnxruntime
+
+from inference.core.logger import logger
 
 
 def has_trt(providers: List[Union[Tuple[str, Dict], str]]) -> bool:
@@ -10,3 +20,214 @@ def has_trt(providers: List[Union[Tuple[str, Dict], str]]) -> bool:
         if name == "TensorrtExecutionProvider":
             return True
     return False
+
+
+def wrap_onnx_model_with_uint8_input(source_path: str, target_path: str) -> None:
+    """Saves to `target_path` the model from `source_path` with a subgraph prepended to its
+    first input: `Transpose` (NHWC -> NCHW), `Cast` (to original input type) and `Div` by 255 -
+    such that model accepts raw uint8 NHWC RGB batches instead of normalised NCHW floats.
+
+    Raises:
+        ImportError: When `onnx` package is not installed.
+        ValueError: When model input is not 4D floating point tensor.
+    """
+    try:
+        import onnx
+        from onnx import TensorProto, helper, numpy_helper
+    except ImportError as import_error:
+        raise ImportError(
+            "Could not import onnx, which is required to run ONNX models with uint8 input. "
+            "Use pip install onnx to install missing dependency."
+        ) from import_error
+    model = onnx.load(source_path)
+    graph = model.graph
+    initializers_names = {initializer.name for initializer in graph.initializer}
+    model_inputs = [i for i in graph.input if i.name not in initializers_names]
+    original_input = model_inputs[0]
+    tensor_type = original_input.type.tensor_type
+    float_types = {
+        TensorProto.FLOAT: np.float32,
+        TensorProto.FLOAT16: np.float16,
+    }
+    if tensor_type.elem_type not in float_types or len(tensor_type.shape.dim) != 4:
+        raise ValueError(
+            f"Expected 4D floating point model input, got input `{original_input.name}` "
+            f"of type {tensor_type.elem_type} with {len(tensor_type.shape.dim)} dimensions"
+        )
+    batch, channels, height, width = [
+        dim.dim_param if dim.HasField("dim_param") else dim.dim_value or None
+        for dim in tensor_type.shape.dim
+    ]
+    uint8_input_name = f"{original_input.name}_uint8"
+    uint8_input = helper.make_tensor_value_info(
+        uint8_input_name, TensorProto.UINT8, [batch, height, width, channels]
+    )
+    scale_name = f"{original_input.name}_uint8_scale"
+    graph.initializer.append(
+        numpy_helper.from_array(
+            np.array(255, dtype=float_types[tensor_type.elem_type]), name=scale_name
+        )
+    )
+    prepended_nodes = [
+        helper.make_node(
+            "Transpose",
+            inputs=[uint8_input_name],
+            outputs=[f"{original_input.name}_uint8_nchw"],
+            perm=[0, 3, 1, 2],
+        ),
+        helper.make_node(
+            "Cast",
+            inputs=[f"{original_input.name}_uint8_nchw"],
+            outputs=[f"{original_input.name}_unscaled"],
+            to=tensor_type.elem_type,
+        ),
+        helper.make_node(
+            "Div",
+            inputs=[f"{original_input.name}_unscaled", scale_name],
+            outputs=[original_input.name],
+        ),
+    ]
+    nodes = prepended_nodes + list(graph.node)
+    del graph.node[:]
+    graph.node.extend(nodes)
+    inputs = [uint8_input] + [i for i in graph.input if i is not original_input]
+    del graph.input[:]
+    graph.input.extend(inputs)
+    # saving to temporary file first - concurrent model loaders must never see partial file
+    tmp_path = f"{target_path}.{os.getpid()}.tmp"
+    onnx.save(model, tmp_path)
+    os.replace(tmp_path, target_path)
+
+
+def get_optimized_onnx_model_suffix(
+    providers: List[Union[Tuple[str, Dict], str]]
+) -> str:
+    """Builds suffix of optimized model file name, unique for ONNX runtime version, execution
+    providers (with their options) and machine architecture - optimizations applied by ORT
+    depend on all of them, so file saved under one configuration must not be loaded by other.
+    """
+    configuration = json.dumps(
+        {"providers": providers, "machine": platform.machine()},
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha1(configuration.encode("utf-8")).hexdigest()[:12]
+    return f".ort-{onnxruntime.__version__}-{digest}.optimized"
+
+
+def save_optimized_onnx_model(
+    source_path: str,
+    target_path: str,
+    providers: List[Union[Tuple[str, Dict], str]],
+) -> None:
+    """Saves to `target_path` the model from `source_path` after graph optimizations of
+    ONNX runtime (constant folding, nodes fusions), such that sessions created from saved
+    model skip the most expensive part of optimization.
+
+    Extended optimization level is used - layout optimizations (specific to CPU instruction set)
+    are not serialized and get applied when session is created from the saved model.
+    """
+    session_options = onnxruntime.SessionOptions()
+    session_options.graph_optimization_level = (
+        onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    )
+    # saving to temporary file first - concurrent model loaders must never see partial file
+    tmp_path = f"{target_path}.{os.getpid()}.tmp"
+    session_options.optimized_model_filepath = tmp_path
+    try:
+        onnxruntime.InferenceSession(
+            source_path, providers=providers, sess_options=session_options
+        )
+        os.replace(tmp_path, target_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class IOBindingSessionRunner:
+    """Runs ONNX session through IO binding - input array is bound without copying it to ORT
+    tensor and outputs are written directly into numpy buffers kept alive across calls.
+
+    Buffers are allocated per thread and per input (shape, dtype) on the first call - they
+    get overwritten by the next call in the same thread, so results must be consumed (or copied)
+    before that. When results leave the thread (like in staged execution) runner must be created
+    with `reuse_outputs=False` - then outputs are allocated by ORT at each call.
+    Models with data-dependent output shapes fall back to outputs allocated by ORT.
+    """
+
+    def __init__(
+        self,
+        session: onnxruntime.InferenceSession,
+        input_name: str,
+        reuse_outputs: bool = True,
+    ):
+        self._session = session
+        self._input_name = input_name
+        self._output_names = [output.name for output in session.get_outputs()]
+        self._reuse_outputs = reuse_outputs
+        self._thread_local = threading.local()
+
+    def run(self, img_in: np.ndarray) -> List[np.ndarray]:
+        img_in = np.ascontiguousarray(img_in)
+        if not self._reuse_outputs:
+            return self._run_with_allocated_outputs(
+                binding=self._session.io_binding(), img_in=img_in
+            )
+        bindings = self._get_thread_bindings()
+        key = (img_in.shape, img_in.dtype.str)
+        if key not in bindings:
+            binding = self._session.io_binding()
+            outputs = self._run_with_allocated_outputs(binding=binding, img_in=img_in)
+            bindings[key] = (binding, self._bind_output_buffers(binding, outputs))
+            return outputs
+        binding, buffers = bindings[key]
+        if buffers is None:
+            return self._run_with_allocated_outputs(binding=binding, img_in=img_in)
+        binding.bind_cpu_input(self._input_name, img_in)
+        try:
+            self._session.run_with_iobinding(binding)
+        except RuntimeError as error:
+            logger.debug(
+                f"Could not run session with preallocated outputs, falling back to outputs "
+                f"allocated by ONNX runtime. Cause: {error}"
+            )
+            binding.clear_binding_outputs()
+            bindings[key] = (binding, None)
+            return self._run_with_allocated_outputs(binding=binding, img_in=img_in)
+        return list(buffers)
+
+    def _get_thread_bindings(
+        self,
+    ) -> Dict[
+        Tuple[tuple, str], Tuple[onnxruntime.IOBinding, Optional[List[np.ndarray]]]
+    ]:
+        bindings = getattr(self._thread_local, "bindings", None)
+        if bindings is None:
+            bindings = {}
+            self._thread_local.bindings = bindings
+        return bindings
+
+    def _run_with_allocated_outputs(
+        self, binding: onnxruntime.IOBinding, img_in: np.ndarray
+    ) -> List[np.ndarray]:
+        binding.bind_cpu_input(self._input_name, img_in)
+        for output_name in self._output_names:
+            binding.bind_output(output_name, "cpu")
+        self._session.run_with_iobinding(binding)
+        return binding.copy_outputs_to_cpu()
+
+    def _bind_output_buffers(
+        self, binding: onnxruntime.IOBinding, outputs: List[np.ndarray]
+    ) -> List[np.ndarray]:
+        buffers = [np.empty_like(output) for output in outputs]
+        binding.clear_binding_outputs()
+        for output_name, buffer in zip(self._output_names, buffers):
+            binding.bind_output(
+                name=output_name,
+                device_type="cpu",
+                device_id=0,
+                element_type=buffer.dtype,
+                shape=buffer.shape,
+                buffer_ptr=buffer.ctypes.data,
+            )
+        return buffers
@@ -0,0 +1,192 @@
+import threading
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+LETTERBOX_PADDING_COLORS = {
+    "Fit (black edges) in": (0, 0, 0),
+    "Fit (white edges) in": (255, 255, 255),
+    "Fit (grey edges) in": (114, 114, 114),
+}
+
+
+class PreprocessingBuffer:
+    """Reusable batch tensor (NCHW by default) that images are written into during preprocessing.
+
+    Each thread owns its own tensor (grown when a bigger batch is requested), so batch
+    returned by `get_batch(...)` stays valid until the same thread prepares the next one.
+    When the batch leaves the thread before model execution (like in staged execution),
+    the buffer must be created with `reuse=False` - then each call allocates a fresh tensor,
+    still avoiding intermediate copies made by legacy preprocessing.
+    With `channels_last=True` the tensor is NHWC (used for raw uint8 model inputs).
+    """
+
+    def __init__(
+        self,
+        height: int,
+        width: int,
+        dtype: np.dtype = np.float32,
+        reuse: bool = True,
+        channels_last: bool = False,
+    ):
+        self._height = height
+        self._width = width
+        self._dtype = np.dtype(dtype)
+        self._reuse = reuse
+        self._channels_last = channels_last
+        self._thread_local = threading.local()
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def channels_last(self) -> bool:
+        return self._channels_last
+
+    @property
+    def reuse(self) -> bool:
+        return self._reuse
+
+    def get_batch(self, batch_size: int) -> np.ndarray:
+        if not self._reuse:
+            return self._allocate_batch(batch_size=batch_size)
+        batch = getattr(self._thread_local, "batch", None)
+        if batch is None or batch.shape[0] < batch_size:
+            batch = self._allocate_batch(batch_size=batch_size)
+            self._thread_local.batch = batch
+        return batch[:batch_size]
+
+    def get_resize_canvas(self) -> Optional[np.ndarray]:
+        if not self._reuse or self._channels_last:
+            return None
+        canvas = getattr(self._thread_local, "canvas", None)
+        if canvas is None:
+            canvas = np.empty((self._height, self._width, 3), dtype=np.uint8)
+            self._thread_local.canvas = canvas
+        return canvas
+
+    def _allocate_batch(self, batch_size: int) -> np.ndarray:
+        if self._channels_last:
+            shape = (batch_size, self._height, self._width, 3)
+        else:
+            shape = (batch_size, 3, self._height, self._width)
+        return np.empty(shape, dtype=self._dtype)
+
+
+def write_image_into_batch(
+    image: np.ndarray,
+    destination: np.ndarray,
+    resize_method: str,
+    is_bgr: bool,
+    resize_canvas: Optional[np.ndarray] = None,
+    scale: float = 255.0,
+) -> None:
+    """Resizes (stretching or letterboxing) `image` and writes it into `destination` (CHW slice
+    of batch tensor), swapping BGR channels to RGB and dividing by `scale` in the same pass.
+
+    Results are equal to the ones of legacy pipeline: resize / `letterbox_image(...)`,
+    `cv2.cvtColor(...)`, `np.transpose(...)`, `astype(np.float32)` and division of the batch.
+    `resize_canvas` (uint8 HWC array matching destination size) is used as output of stretching
+    resize when given.
+    """
+    _, height, width = destination.shape
+    if resize_method not in LETTERBOX_PADDING_COLORS:
+        resized = cv2.resize(image, (width, height), dst=resize_canvas)
+        _normalise_into(
+            source=resized, destination=destination, is_bgr=is_bgr, scale=scale
+        )
+        return None
+    resized, (top, left) = _resize_keeping_aspect_ratio(
+        image=image, desired_size=(width, height)
+    )
+    new_height, new_width = resized.shape[:2]
+    color = LETTERBOX_PADDING_COLORS[resize_method]
+    if is_bgr:
+        color = color[::-1]
+    for channel, channel_color in zip(destination, color):
+        padding_value = np.float32(channel_color) / np.float32(scale)
+        channel[:top, :] = padding_value
+        channel[top + new_height :, :] = padding_value
+        channel[top : top + new_height, :left] = padding_value
+        channel[top : top + new_height, left + new_width :] = padding_value
+    _normalise_into(
+        source=resized,
+        destination=destination[:, top : top + new_height, left : left + new_width],
+        is_bgr=is_bgr,
+        scale=scale,
+    )
+    return None
+
+
+def write_image_into_uint8_batch(
+    image: np.ndarray,
+    destination: np.ndarray,
+    resize_method: str,
+    is_bgr: bool,
+) -> None:
+    """Resizes (stretching or letterboxing) `image` and writes it into `destination` (HWC slice
+    of uint8 batch tensor) in RGB order - casting, transposition and normalisation are left to
+    the model graph (see `wrap_onnx_model_with_uint8_input(...)`).
+    """
+    height, width, _ = destination.shape
+    if resize_method not in LETTERBOX_PADDING_COLORS:
+        resized = cv2.resize(image, (width, height), dst=destination)
+        if is_bgr:
+            cv2.cvtColor(resized, cv2.COLOR_BGR2RGB, dst=destination)
+        return None
+    resized, (top, left) = _resize_keeping_aspect_ratio(
+        image=image, desired_size=(width, height)
+    )
+    new_height, new_width = resized.shape[:2]
+    color = LETTERBOX_PADDING_COLORS[resize_method]
+    if is_bgr:
+        color = color[::-1]
+        resized = resized[:, :, ::-1]
+    destination[:top, :] = color
+    destination[top + new_height :, :] = color
+    destination[top : top + new_height, :left] = color
+    destination[top : top + new_height, left + new_width :] = color
+    destination[top : top + new_height, left : left + new_width] = resized
+    return None
+
+
+def _resize_keeping_aspect_ratio(
+    image: np.ndarray, desired_size: Tuple[int, int]
+) -> Tuple[np.ndarray, Tuple[int, int]]:
+    # mirrors `letterbox_image(...)`, but padding is written directly into the batch
+    img_ratio = image.shape[1] / image.shape[0]
+    desired_ratio = desired_size[0] / desired_size[1]
+    if img_ratio >= desired_ratio:
+        new_width = desired_size[0]
+        new_height = int(desired_size[0] / img_ratio)
+    else:
+        new_height = desired_size[1]
+        new_width = int(desired_size[1] * img_ratio)
+    resized = cv2.resize(image, (new_width, new_height))
+    top = (desired_size[1] - new_height) // 2
+    left = (desired_size[0] - new_width) // 2
+    return resized, (top, left)
+
+
+def _normalise_into(
+    source: np.ndarray, destination: np.ndarray, is_bgr: bool, scale: float
+) -> None:
+    if is_bgr:
+        source = source[:, :, ::-1]
+    np.divide(
+        source.transpose(2, 0, 1),
+        np.float32(scale),
+        out=destination,
+        dtype=np.float32,
+        casting="same_kind",
+    )
+
+
+def get_onnx_input_dtype(onnx_type: str) -> np.dtype:
+    if onnx_type == "tensor(float16)":
+        return np.dtype(np.float16)
+    if onnx_type == "tensor(uint8)":
+        return np.dtype(np.uint8)
+    return np.dtype(np.float32)
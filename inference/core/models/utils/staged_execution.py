@@ -0,0 +1,127 @@
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from queue import Queue
+from threading import Thread
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from inference.core.logger import logger
+from inference.core.workflows.execution_engine.profiling.core import (
+    NullWorkflowsProfiler,
+    WorkflowsProfiler,
+)
+
+PREPROCESS_STAGE = "preprocess"
+PREDICT_STAGE = "predict"
+POSTPROCESS_STAGE = "postprocess"
+
+StageFunction = Callable[[Any, Dict[str, Any]], Any]
+
+
+@dataclass
+class Stage:
+    name: str
+    function: StageFunction
+    workers: int
+
+
+@dataclass
+class StagedJob:
+    payload: Any
+    kwargs: Dict[str, Any]
+    future: Future
+    stage_times: Dict[str, float] = field(default_factory=dict)
+    profiler: WorkflowsProfiler = field(default_factory=NullWorkflowsProfiler.init)
+
+
+class StagedExecutor:
+    """Executes jobs through a chain of stages, each served by its own pool of worker threads.
+
+    Stages are connected with bounded queues - when a stage lags behind, upstream workers block
+    on `put(...)`, which propagates back-pressure down to `submit(...)`. As a result, different
+    jobs may be processed by different stages at the same time (for instance image decoding of
+    one request overlaps with model execution for another one, as ONNX runtime releases the GIL).
+    Result of the last stage and time spent in each stage are delivered via `Future`, and
+    each stage is recorded as execution phase of the profiler given at submission.
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 8):
+        if len(stages) == 0:
+            raise ValueError("StagedExecutor requires at least one stage")
+        self._stages = stages
+        self._queues: List[Queue] = [Queue(maxsize=queue_size) for _ in stages]
+        self._threads: List[List[Thread]] = []
+        self._is_running = True
+        for stage_index, stage in enumerate(stages):
+            stage_threads = []
+            for worker_index in range(max(stage.workers, 1)):
+                thread = Thread(
+                    target=self._serve_stage,
+                    args=(stage_index,),
+                    name=f"staged-executor-{stage.name}-{worker_index}",
+                    daemon=True,
+                )
+                thread.start()
+                stage_threads.append(thread)
+            self._threads.append(stage_threads)
+
+    def submit(
+        self,
+        payload: Any,
+        profiler: Optional[WorkflowsProfiler] = None,
+        **kwargs,
+    ) -> Future:
+        if not self._is_running:
+            raise RuntimeError("Could not submit job to StagedExecutor after shutdown")
+        future = Future()
+        future.set_running_or_notify_cancel()
+        job = StagedJob(payload=payload, kwargs=kwargs, future=future)
+        if profiler is not None:
+            job.profiler = profiler
+        self._queues[0].put(job)
+        return future
+
+    def run(
+        self,
+        payload: Any,
+        profiler: Optional[WorkflowsProfiler] = None,
+        **kwargs,
+    ) -> Tuple[Any, Dict[str, float]]:
+        return self.submit(payload, profiler=profiler, **kwargs).result()
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        if not self._is_running:
+            return None
+        self._is_running = False
+        # stages are stopped one by one, such that jobs already in flight are completed
+        for stage_queue, stage_threads in zip(self._queues, self._threads):
+            for _ in stage_threads:
+                stage_queue.put(None)
+            for thread in stage_threads:
+                thread.join(timeout=timeout)
+        self._threads = []
+
+    def _serve_stage(self, stage_index: int) -> None:
+        stage = self._stages[stage_index]
+        input_queue = self._queues[stage_index]
+        is_last_stage = stage_index == len(self._stages) - 1
+        while True:
+            job: Optional[StagedJob] = input_queue.get()
+            if job is None:
+                return None
+            start = perf_counter()
+            try:
+                with job.profiler.profile_execution_phase(
+                    name=f"model_{stage.name}",
+                    categories=["model_inference_stage"],
+                ):
+                    job.payload = stage.function(job.payload, job.kwargs)
+            except Exception as error:
+                logger.debug(f"Stage {stage.name} failed: {error}")
+                job.future.set_exception(error)
+                continue
+            job.stage_times[stage.name] = perf_counter() - start
+            if is_last_stage:
+                job.future.set_result((job.payload, job.stage_times))
+            else:
+                self._queues[stage_index + 1].put(job)
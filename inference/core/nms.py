@@ -1,7 +1,13 @@
-from typing import Optional
+from typing import List, Optional, Union
 
 import numpy as np
 
+from inference.core.env import NMS_ENGINE
+from inference.core.exceptions import InvalidEnvironmentVariableError
+
+LEGACY_NMS_ENGINE = "legacy"
+VECTORIZED_NMS_ENGINE = "vectorized"
+
 
 def w_np_non_max_suppression(
     prediction,
@@ -14,7 +20,55 @@ def w_np_non_max_suppression(
     num_masks: int = 0,
     box_format: str = "xywh",
 ):
-    """Applies non-maximum suppression to predictions.
+    """Applies non-maximum suppression to predictions using the engine selected with
+    `NMS_ENGINE` environment variable (`legacy` - default, or `vectorized`).
+
+    Args:
+        prediction (np.ndarray): Array of predictions. Format for single prediction is
+            [bbox x 4, max_class_confidence, (confidence) x num_of_classes, additional_element x num_masks]
+        conf_thresh (float, optional): Confidence threshold. Defaults to 0.25.
+        iou_thresh (float, optional): IOU threshold. Defaults to 0.45.
+        class_agnostic (bool, optional): Whether to ignore class labels. Defaults to False.
+        max_detections (int, optional): Maximum number of detections. Defaults to 300.
+        max_candidate_detections (int, optional): Maximum number of candidate detections. Defaults to 3000.
+        timeout_seconds (Optional[int], optional): Timeout in seconds. Defaults to None.
+        num_masks (int, optional): Number of masks. Defaults to 0.
+        box_format (str, optional): Format of bounding boxes. Either 'xywh' or 'xyxy'. Defaults to 'xywh'.
+
+    Returns:
+        list: List of filtered predictions after non-maximum suppression. Format of a single result is:
+            [bbox x 4, max_class_confidence, max_class_confidence, id_of_class_with_max_confidence,
+            additional_element x num_masks]
+    """
+    if NMS_ENGINE not in NMS_ENGINES:
+        raise InvalidEnvironmentVariableError(
+            f"NMS_ENGINE must be one of {list(NMS_ENGINES.keys())}, got {NMS_ENGINE}"
+        )
+    return NMS_ENGINES[NMS_ENGINE](
+        prediction,
+        conf_thresh=conf_thresh,
+        iou_thresh=iou_thresh,
+        class_agnostic=class_agnostic,
+        max_detections=max_detections,
+        max_candidate_detections=max_candidate_detections,
+        timeout_seconds=timeout_seconds,
+        num_masks=num_masks,
+        box_format=box_format,
+    )
+
+
+def legacy_non_max_suppression(
+    prediction,
+    conf_thresh: float = 0.25,
+    iou_thresh: float = 0.45,
+    class_agnostic: bool = False,
+    max_detections: int = 300,
+    max_candidate_detections: int = 3000,
+    timeout_seconds: Optional[int] = None,
+    num_masks: int = 0,
+    box_format: str = "xywh",
+):
+    """Applies non-maximum suppression to predictions, image by image and class by class.
 
     Args:
         prediction (np.ndarray): Array of predictions. Format for single prediction is
@@ -104,6 +158,129 @@ def w_np_non_max_suppression(
     return batch_predictions
 
 
+def vectorized_non_max_suppression(
+    prediction: np.ndarray,
+    conf_thresh: float = 0.25,
+    iou_thresh: float = 0.45,
+    class_agnostic: bool = False,
+    max_detections: int = 300,
+    max_candidate_detections: int = 3000,
+    timeout_seconds: Optional[int] = None,
+    num_masks: int = 0,
+    box_format: str = "xywh",
+) -> List[Union[np.ndarray, list]]:
+    """Applies non-maximum suppression to the whole batch of predictions at once.
+
+    Candidates of all images are filtered, scored and ordered with array operations.
+    Boxes are then shifted by an offset unique for each (image, class) pair, such that
+    boxes from different groups never overlap and a single greedy suppression pass
+    handles the whole batch. Only `max_candidate_detections` top-scored candidates
+    of each image take part in suppression and the pass stops for an image as soon as
+    `max_detections` boxes are picked. Overlap is computed exactly as in
+    `legacy_non_max_suppression(...)`.
+
+    Args:
+        prediction (np.ndarray): Array of predictions. Format for single prediction is
+            [bbox x 4, max_class_confidence, (confidence) x num_of_classes, additional_element x num_masks]
+        conf_thresh (float, optional): Confidence threshold. Defaults to 0.25.
+        iou_thresh (float, optional): IOU threshold. Defaults to 0.45.
+        class_agnostic (bool, optional): Whether to ignore class labels. Defaults to False.
+        max_detections (int, optional): Maximum number of detections. Defaults to 300.
+        max_candidate_detections (int, optional): Maximum number of candidate detections. Defaults to 3000.
+        timeout_seconds (Optional[int], optional): Not used, kept for compatibility. Defaults to None.
+        num_masks (int, optional): Number of masks. Defaults to 0.
+        box_format (str, optional): Format of bounding boxes. Either 'xywh' or 'xyxy'. Defaults to 'xywh'.
+
+    Returns:
+        list: For each image - array of filtered predictions (sorted by confidence) or empty list
+            if nothing was detected. Format of a single result is:
+            [bbox x 4, max_class_confidence, max_class_confidence, id_of_class_with_max_confidence,
+            additional_element x num_masks]
+    """
+    batch_size = prediction.shape[0]
+    num_classes = prediction.shape[2] - 5 - num_masks
+    if box_format == "xywh":
+        boxes = prediction[:, :, :4]
+        boxes[:, :, :2] -= boxes[:, :, 2:4] / 2
+        boxes[:, :, 2:4] += boxes[:, :, :2]
+    elif box_format != "xyxy":
+        raise ValueError(
+            "box_format must be either 'xywh' or 'xyxy', got {}".format(box_format)
+        )
+    batch_predictions: List[Union[np.ndarray, list]] = [[] for _ in range(batch_size)]
+    image_ids, anchor_ids = np.nonzero(prediction[:, :, 4] >= conf_thresh)
+    if image_ids.size == 0 or num_classes <= 0:
+        return batch_predictions
+    order = np.lexsort((-prediction[image_ids, anchor_ids, 4], image_ids))
+    image_ids, anchor_ids = image_ids[order], anchor_ids[order]
+    if max_candidate_detections is not None:
+        rank_in_image = np.arange(image_ids.size) - np.searchsorted(
+            image_ids, image_ids, side="left"
+        )
+        top_k_mask = rank_in_image < max_candidate_detections
+        image_ids, anchor_ids = image_ids[top_k_mask], anchor_ids[top_k_mask]
+    candidates = prediction[image_ids, anchor_ids]
+    classes_confidence = candidates[:, 5 : num_classes + 5]
+    class_ids = np.argmax(classes_confidence, axis=1)
+    detections = np.empty(
+        (candidates.shape[0], 7 + candidates.shape[1] - 5 - num_classes),
+        dtype=np.float64,
+    )
+    detections[:, :5] = candidates[:, :5]
+    detections[:, 5] = classes_confidence[np.arange(class_ids.size), class_ids]
+    detections[:, 6] = class_ids
+    detections[:, 7:] = candidates[:, 5 + num_classes :]
+    groups = image_ids if class_agnostic else image_ids * num_classes + class_ids
+    picked = _greedy_suppression(
+        boxes=detections[:, :4],
+        groups=groups,
+        image_ids=image_ids,
+        iou_thresh=iou_thresh,
+        max_detections=max_detections,
+    )
+    picked_image_ids = image_ids[picked]
+    picked_detections = detections[picked]
+    images_with_detections, split_points = np.unique(
+        picked_image_ids, return_index=True
+    )
+    for image_id, image_detections in zip(
+        images_with_detections, np.split(picked_detections, split_points[1:])
+    ):
+        batch_predictions[image_id] = image_detections
+    return batch_predictions
+
+
+def _greedy_suppression(
+    boxes: np.ndarray,
+    groups: np.ndarray,
+    image_ids: np.ndarray,
+    iou_thresh: float,
+    max_detections: int,
+) -> np.ndarray:
+    # boxes are expected to be ordered by (image, confidence desc.) - first
+    # remaining candidate is always the best one of its group
+    span = boxes.max() - boxes.min() + 2
+    offset_boxes = boxes + (groups * span)[:, np.newaxis]
+    x1, y1, x2, y2 = (offset_boxes[:, i] for i in range(4))
+    area = (x2 - x1 + 1) * (y2 - y1 + 1)
+    detections_per_image = np.zeros(image_ids.max() + 1, dtype=np.int64)
+    remaining = np.arange(boxes.shape[0])
+    picked = []
+    while remaining.size > 0:
+        i = remaining[0]
+        picked.append(i)
+        rest = remaining[1:]
+        w = np.maximum(0, np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest]) + 1)
+        h = np.maximum(0, np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest]) + 1)
+        overlap = (w * h) / area[rest]
+        remaining = rest[overlap <= iou_thresh]
+        image_id = image_ids[i]
+        detections_per_image[image_id] += 1
+        if detections_per_image[image_id] >= max_detections:
+            remaining = remaining[image_ids[remaining] != image_id]
+    return np.array(picked, dtype=np.int64)
+
+
 # Malisiewicz et al.
 def non_max_suppression_fast(boxes, overlapThresh):
     """Applies non-maximum suppression to bounding boxes.
@@ -161,3 +338,9 @@ def non_max_suppression_fast(boxes, overlapThresh):
     # return only the bounding boxes that were picked using the
     # integer data type
     return boxes[pick].astype("float")
+
+
+NMS_ENGINES = {
+    LEGACY_NMS_ENGINE: legacy_non_max_suppression,
+    VECTORIZED_NMS_ENGINE: vectorized_non_max_suppression,
+}
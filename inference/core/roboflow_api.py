@@ -1,6 +1,8 @@
+import base64
 import hashlib
 import json
 import os
+import re
 import urllib.parse
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
@@ -590,6 +592,141 @@ def _get_from_url(url: str, json_response: bool = True) -> Union[Response, dict]
     return response
 
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_MAX_RESUME_ATTEMPTS = 5
+DOWNLOAD_TIMEOUT = (10, 60)
+DOWNLOAD_PROGRESS_REPORT_STEP = 0.1
+
+
+@wrap_roboflow_api_errors()
+def download_file_from_url(
+    url: str,
+    target_path: str,
+    on_progress: Optional[Callable[[int, Optional[int]], None]] = None,
+) -> None:
+    """Streams file from `url` into `target_path` chunk by chunk, without keeping it in memory.
+
+    Bytes already present under `target_path` (left by interrupted download) are kept and
+    the download resumes with HTTP range request - if server does not support ranges, it
+    starts over. Dropped connections are resumed up to `DOWNLOAD_MAX_RESUME_ATTEMPTS` times.
+    Size of the file and its MD5 checksum (when provided by the server in `x-goog-hash` or
+    `Content-MD5` headers) are verified once download completes.
+
+    Args:
+        url (str): URL of the file.
+        target_path (str): Path to save the file under.
+        on_progress (Optional[Callable[[int, Optional[int]], None]]): Called with number of downloaded bytes and total size (if known) after each chunk.
+
+    Raises:
+        RoboflowAPIConnectionError: When connection fails more than allowed number of times.
+        RoboflowAPIUnsuccessfulRequestError: When server responds with error or downloaded file is corrupted.
+    """
+    resume_attempts = 0
+    while True:
+        try:
+            expected_size, expected_md5 = _download_remaining_part(
+                url=url, target_path=target_path, on_progress=on_progress
+            )
+            break
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.ReadTimeout,
+        ) as error:
+            resume_attempts += 1
+            if resume_attempts > DOWNLOAD_MAX_RESUME_ATTEMPTS:
+                raise ConnectionError(
+                    f"Download interrupted {resume_attempts} times"
+                ) from error
+            logger.warning(
+                f"Download interrupted at {_get_file_size(target_path)} bytes - resuming. "
+                f"Cause: {error}"
+            )
+    downloaded_size = _get_file_size(target_path)
+    if expected_size is not None and downloaded_size != expected_size:
+        os.remove(target_path)
+        raise RoboflowAPIUnsuccessfulRequestError(
+            f"Downloaded file has {downloaded_size} bytes, expected {expected_size} bytes."
+        )
+    if expected_md5 is not None and _compute_file_md5(target_path) != expected_md5:
+        os.remove(target_path)
+        raise RoboflowAPIUnsuccessfulRequestError(
+            "Checksum of downloaded file does not match the one declared by the server."
+        )
+
+
+def _download_remaining_part(
+    url: str,
+    target_path: str,
+    on_progress: Optional[Callable[[int, Optional[int]], None]],
+) -> Tuple[Optional[int], Optional[str]]:
+    downloaded = _get_file_size(target_path)
+    headers = {"Range": f"bytes={downloaded}-"} if downloaded > 0 else {}
+    with requests.get(
+        wrap_url(url), headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT
+    ) as response:
+        if response.status_code == 416 and downloaded > 0:
+            # range not satisfiable - partial file is corrupted or outdated
+            os.remove(target_path)
+            return _download_remaining_part(
+                url=url, target_path=target_path, on_progress=on_progress
+            )
+        api_key_safe_raise_for_status(response=response)
+        if response.status_code == 206:
+            mode = "ab"
+            total_size = _get_total_size_from_content_range(
+                response.headers.get("Content-Range")
+            )
+        else:
+            mode, downloaded = "wb", 0
+            content_length = response.headers.get("Content-Length")
+            total_size = int(content_length) if content_length is not None else None
+        expected_md5 = _get_expected_md5(
+            headers=response.headers, partial=response.status_code == 206
+        )
+        next_report = DOWNLOAD_PROGRESS_REPORT_STEP
+        with open(target_path, mode) as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                downloaded += len(chunk)
+                if on_progress is not None:
+                    on_progress(downloaded, total_size)
+                if total_size and downloaded / total_size >= next_report:
+                    logger.debug(
+                        f"Downloaded {downloaded}/{total_size} bytes of {target_path}"
+                    )
+                    next_report += DOWNLOAD_PROGRESS_REPORT_STEP
+    return total_size, expected_md5
+
+
+def _get_total_size_from_content_range(content_range: Optional[str]) -> Optional[int]:
+    match = re.match(r"bytes \d+-\d+/(\d+)", content_range or "")
+    return int(match.group(1)) if match else None
+
+
+def _get_expected_md5(headers: dict, partial: bool) -> Optional[str]:
+    # x-goog-hash describes the whole object, Content-MD5 - the response body only
+    for hash_entry in headers.get("x-goog-hash", "").split(","):
+        name, _, value = hash_entry.strip().partition("=")
+        if name == "md5" and value:
+            return base64.b64decode(value).hex()
+    if not partial and headers.get("Content-MD5"):
+        return base64.b64decode(headers["Content-MD5"]).hex()
+    return None
+
+
+def _compute_file_md5(path: str) -> str:
+    md5 = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _get_file_size(path: str) -> int:
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
 def _add_params_to_url(url: str, params: List[Tuple[str, str]]) -> str:
     if len(params) == 0:
         return url
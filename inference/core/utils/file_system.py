@@ -1,7 +1,9 @@
 import json
 import os.path
 import re
-from typing import List, Optional, Union
+import uuid
+from contextlib import contextmanager
+from typing import IO, Generator, List, Optional, Union
 
 
 def read_text_file(
@@ -32,7 +34,7 @@ def dump_json(
 ) -> None:
     ensure_write_is_allowed(path=path, allow_override=allow_override)
     ensure_parent_dir_exists(path=path)
-    with open(path, "w") as f:
+    with atomic_open(path=path, mode="w") as f:
         json.dump(content, fp=f, **kwargs)
 
 
@@ -44,17 +46,33 @@ def dump_text_lines(
 ) -> None:
     ensure_write_is_allowed(path=path, allow_override=allow_override)
     ensure_parent_dir_exists(path=path)
-    with open(path, "w") as f:
+    with atomic_open(path=path, mode="w") as f:
         f.write(lines_connector.join(content))
 
 
 def dump_bytes(path: str, content: bytes, allow_override: bool = False) -> None:
     ensure_write_is_allowed(path=path, allow_override=allow_override)
     ensure_parent_dir_exists(path=path)
-    with open(path, "wb") as f:
+    with atomic_open(path=path, mode="wb") as f:
         f.write(content)
 
 
+@contextmanager
+def atomic_open(path: str, mode: str = "wb") -> Generator[IO, None, None]:
+    """Opens temporary file next to `path` for writing and renames it to `path` once
+    writing succeeds - readers (also in other processes) never see partially written file,
+    and existing file is replaced (not modified in place, which matters for hardlinked files).
+    """
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, mode) as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def ensure_parent_dir_exists(path: str) -> None:
     absolute_path = os.path.abspath(path)
     parent_dir = os.path.dirname(absolute_path)
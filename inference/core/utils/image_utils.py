@@ -37,6 +37,24 @@ from inference.core.utils.function import deprecated
 from inference.core.utils.requests import api_key_safe_raise_for_status
 
 BASE64_DATA_TYPE_PATTERN = re.compile(r"^data:image\/[a-z]+;base64,")
+# JPEG, PNG, TIFF (little and big endian) - WEBP is verified separately
+ENCODED_IMAGES_SIGNATURES = (
+    b"\xff\xd8\xff",
+    b"\x89PNG\r\n\x1a\n",
+    b"II*\x00",
+    b"MM\x00*",
+)
+BASE64_IMAGE_HEADER_LENGTH = 12
+BASE64_HEADER_PEEK_LENGTH = 64
+
+JPEG_MAGIC_BYTES = b"\xff\xd8\xff"
+JPEG_REDUCED_DECODING_FLAGS = {
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+EXIF_ORIENTATION_TAG = 0x0112
+EXIF_ORIENTATIONS_SWAPPING_AXES = {5, 6, 7, 8}
 
 
 class ImageType(Enum):
@@ -103,6 +121,124 @@ def load_image(
     return np_image, is_bgr
 
 
+def load_image_with_reduced_decoding(
+    value: Any,
+    minimal_size: Tuple[int, int],
+    disable_preproc_auto_orient: bool = False,
+) -> Tuple[np.ndarray, bool, Optional[Tuple[int, int]]]:
+    """Loads an image like `load_image(...)`, but JPEG payloads (base64, multipart or encoded bytes)
+    much larger than `minimal_size` are decoded with OpenCV reduced-size modes
+    (`IMREAD_REDUCED_COLOR_2/4/8`), which skip most of the decoding work.
+
+    Args:
+        value (Any): Image value - as accepted by `load_image(...)`.
+        minimal_size (Tuple[int, int]): Minimal (height, width) of decoded image.
+        disable_preproc_auto_orient (bool): Flag to disable preprocessing auto-orientation.
+
+    Returns:
+        Tuple[np.ndarray, bool, Optional[Tuple[int, int]]]: Loaded image, flag indicating if the image
+            is in BGR format and (height, width) of the image in full resolution - None if the image
+            was decoded in full resolution.
+    """
+    payload, image_type = extract_image_payload_and_type(value=value)
+    encoded_image = extract_encoded_jpeg_bytes(value=payload, image_type=image_type)
+    if encoded_image is None:
+        np_image, is_bgr = load_image(
+            value=value, disable_preproc_auto_orient=disable_preproc_auto_orient
+        )
+        return np_image, is_bgr, None
+    cv_imread_flags = choose_image_decoding_flags(
+        disable_preproc_auto_orient=disable_preproc_auto_orient
+    )
+    try:
+        original_size = peek_jpeg_size(
+            value=encoded_image,
+            disable_preproc_auto_orient=disable_preproc_auto_orient,
+        )
+        reduction_factor = choose_jpeg_reduction_factor(
+            image_size=original_size, minimal_size=minimal_size
+        )
+    except (OSError, SyntaxError, ValueError) as error:
+        # malformed headers - leaving it to OpenCV decoder to report the problem
+        logger.debug(f"Could not read JPEG headers: {error}")
+        reduction_factor = 1
+    if reduction_factor > 1:
+        cv_imread_flags = (
+            cv_imread_flags | JPEG_REDUCED_DECODING_FLAGS[reduction_factor]
+        )
+    np_image = load_image_from_encoded_bytes(
+        value=encoded_image, cv_imread_flags=cv_imread_flags
+    )
+    np_image = convert_gray_image_to_bgr(image=np_image)
+    logger.debug(
+        f"Loaded inference image. Shape: {np_image.shape}, reduction factor: {reduction_factor}"
+    )
+    if reduction_factor == 1:
+        return np_image, True, None
+    return np_image, True, original_size
+
+
+def extract_encoded_jpeg_bytes(
+    value: Any, image_type: Optional[ImageType]
+) -> Optional[bytes]:
+    """Extracts JPEG bytes from base64, multipart or raw bytes payload - without decoding the image.
+
+    Returns:
+        Optional[bytes]: JPEG bytes or None if payload is not JPEG given in one of supported forms.
+    """
+    if image_type is ImageType.MULTIPART:
+        value.seek(0)
+        encoded_image = value.read()
+        return encoded_image if encoded_image[:3] == JPEG_MAGIC_BYTES else None
+    if image_type not in {None, ImageType.BASE64}:
+        return None
+    if (
+        image_type is None
+        and isinstance(value, (bytes, bytearray))
+        and value[:3] == JPEG_MAGIC_BYTES
+    ):
+        return bytes(value)
+    if not isinstance(value, (str, bytes)) or (
+        isinstance(value, str) and value.startswith("http")
+    ):
+        return None
+    try:
+        encoded_image = decode_base64_payload(value=value)
+    except (InputImageLoadError, ValueError, UnicodeDecodeError):
+        return None
+    if encoded_image[:3] != JPEG_MAGIC_BYTES:
+        return None
+    return encoded_image
+
+
+def peek_jpeg_size(
+    value: bytes, disable_preproc_auto_orient: bool = False
+) -> Tuple[int, int]:
+    """Reads (height, width) of JPEG image from its headers - taking into account EXIF
+    orientation, unless auto-orientation is disabled."""
+    with Image.open(BytesIO(value)) as image:
+        width, height = image.size
+        if disable_preproc_auto_orient:
+            return height, width
+        orientation = image.getexif().get(EXIF_ORIENTATION_TAG)
+    if orientation in EXIF_ORIENTATIONS_SWAPPING_AXES:
+        return width, height
+    return height, width
+
+
+def choose_jpeg_reduction_factor(
+    image_size: Tuple[int, int], minimal_size: Tuple[int, int]
+) -> int:
+    """Chooses the biggest JPEG decoding reduction factor (1, 2, 4 or 8) keeping image
+    at least as large as `minimal_size` (both given as (height, width))."""
+    for factor in sorted(JPEG_REDUCED_DECODING_FLAGS.keys(), reverse=True):
+        reduced_height = (image_size[0] + factor - 1) // factor
+        reduced_width = (image_size[1] + factor - 1) // factor
+        if reduced_height >= minimal_size[0] and reduced_width >= minimal_size[1]:
+            return factor
+    return 1
+
+
 def choose_image_decoding_flags(disable_preproc_auto_orient: bool) -> int:
     """Choose the appropriate OpenCV image decoding flags.
 
@@ -256,6 +392,26 @@ def load_image_base64(
     Returns:
         np.ndarray: The loaded image as a numpy array.
     """
+    value = decode_base64_payload(value=value)
+    image_np = np.frombuffer(value, np.uint8)
+    result = cv2.imdecode(image_np, cv_imread_flags)
+    if result is None:
+        raise InputImageLoadError(
+            message="Could not load valid image from base64 string.",
+            public_message="Malformed base64 input image.",
+        )
+    return result
+
+
+def decode_base64_payload(value: Union[str, bytes]) -> bytes:
+    """Decodes base64 image payload (optionally prefixed with data URI) into encoded image bytes.
+
+    Args:
+        value (Union[str, bytes]): Base64 encoded string representing the image.
+
+    Returns:
+        bytes: Encoded image.
+    """
     # New routes accept images via json body (str), legacy routes accept bytes which need to be decoded as strings
     if not isinstance(value, str):
         value = value.decode("utf-8")
@@ -272,14 +428,7 @@ def load_image_base64(
             message="Could not load valid image from base64 string.",
             public_message="Empty image payload.",
         )
-    image_np = np.frombuffer(value, np.uint8)
-    result = cv2.imdecode(image_np, cv_imread_flags)
-    if result is None:
-        raise InputImageLoadError(
-            message="Could not load valid image from base64 string.",
-            public_message="Malformed base64 input image.",
-        )
-    return result
+    return value
 
 
 def load_image_from_buffer(
@@ -378,6 +527,23 @@ def load_image_from_url(
     Returns:
         Image.Image: The loaded PIL image.
     """
+    return load_image_from_encoded_bytes(
+        value=load_image_bytes_from_url(value=value),
+        cv_imread_flags=cv_imread_flags,
+    )
+
+
+def load_image_bytes_from_url(value: str) -> bytes:
+    """Downloads encoded image from a given URL, without decoding it.
+
+    Performs the same URL security checks as `load_image_from_url(...)`.
+
+    Args:
+        value (str): URL of the image.
+
+    Returns:
+        bytes: Encoded image.
+    """
     _ensure_url_input_allowed()
     try:
         parsed_url = urllib.parse.urlparse(value)
@@ -405,9 +571,7 @@ def load_image_from_url(
     try:
         response = requests.get(value, stream=True)
         api_key_safe_raise_for_status(response=response)
-        return load_image_from_encoded_bytes(
-            value=response.content, cv_imread_flags=cv_imread_flags
-        )
+        return response.content
     except (RequestException, ConnectionError) as error:
         raise InputImageLoadError(
             message=f"Could not load image from url: {value}. Details: {error}",
@@ -483,6 +647,58 @@ def _ensure_location_matches_destination_blacklist(destination: str) -> None:
     return None
 
 
+def has_known_encoded_image_signature(value: bytes) -> bool:
+    """Checks if bytes start with the signature of one of common encoded image formats.
+
+    Args:
+        value (bytes): The beginning of byte sequence representing the image.
+
+    Returns:
+        bool: True when format signature is recognised.
+    """
+    if value.startswith(b"RIFF") and value[8:12] == b"WEBP":
+        return True
+    return value.startswith(ENCODED_IMAGES_SIGNATURES)
+
+
+def verify_encoded_image(value: bytes) -> None:
+    """Cheaply checks if encoded image is valid, without decoding pixels - such that malformed
+    images are rejected even if their decoding is deferred.
+
+    Args:
+        value (bytes): The byte sequence representing the image.
+
+    Raises:
+        InputImageLoadError: When image structure is invalid.
+    """
+    try:
+        with Image.open(BytesIO(value)) as image:
+            image.verify()
+    except Exception as error:
+        raise InputImageLoadError(
+            message=f"Could not decode bytes as image. Cause: {error}",
+            public_message="Data is not valid image.",
+        ) from error
+
+
+def peek_base64_image_header(value: str) -> Optional[bytes]:
+    """Decodes only the beginning of base64 image payload (optionally prefixed with data URI).
+
+    Args:
+        value (str): Base64 encoded string representing the image.
+
+    Returns:
+        Optional[bytes]: First bytes of encoded image or None if payload is not valid base64.
+    """
+    value = BASE64_DATA_TYPE_PATTERN.sub("", value[:BASE64_HEADER_PEEK_LENGTH])
+    try:
+        return pybase64.b64decode(
+            value[: BASE64_IMAGE_HEADER_LENGTH // 3 * 4], validate=True
+        )
+    except (binascii.Error, ValueError):
+        return None
+
+
 def load_image_from_encoded_bytes(
     value: bytes, cv_imread_flags: int = cv2.IMREAD_COLOR
 ) -> np.ndarray:
@@ -0,0 +1,63 @@
+import os
+import resource
+import sys
+from typing import Any, Optional
+
+from inference.core.cache.model_artifacts import get_cache_dir
+
+
+def get_process_rss_bytes() -> Optional[int]:
+    """Returns resident set size of the current process in bytes (current value on Linux,
+    peak value on other platforms) or None if it cannot be determined."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except (OSError, ValueError):
+        return None
+    # ru_maxrss is given in bytes on macOS and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def estimate_model_memory_footprint(model: Any) -> int:
+    """Estimates memory taken by model weights - as the larger of: total size of torch
+    parameters and buffers of modules attached to the model, and size of model artifacts
+    stored in model cache directory (which is a good proxy for ONNX sessions)."""
+    return max(
+        _get_torch_modules_size(model=model),
+        _get_model_artifacts_size(model=model),
+    )
+
+
+def _get_torch_modules_size(model: Any) -> int:
+    total_size = 0
+    for attribute in list(getattr(model, "__dict__", {}).values()):
+        if not callable(getattr(attribute, "parameters", None)) or not callable(
+            getattr(attribute, "buffers", None)
+        ):
+            continue
+        try:
+            tensors = list(attribute.parameters()) + list(attribute.buffers())
+            total_size += sum(t.numel() * t.element_size() for t in tensors)
+        except Exception:
+            continue
+    return total_size
+
+
+def _get_model_artifacts_size(model: Any) -> int:
+    endpoint = getattr(model, "endpoint", None)
+    if not isinstance(endpoint, str):
+        return 0
+    cache_dir = get_cache_dir(model_id=endpoint)
+    total_size = 0
+    for root, _, files in os.walk(cache_dir):
+        for file in files:
+            try:
+                total_size += os.path.getsize(os.path.join(root, file))
+            except OSError:
+                continue
+    return total_size
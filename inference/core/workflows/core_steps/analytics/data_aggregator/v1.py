@@ -342,6 +342,10 @@ class DataAggregatorBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
 
+    @classmethod
+    def is_stateful(cls) -> bool:
+        return True
+
     def run(
         self,
         data: Dict[str, Any],
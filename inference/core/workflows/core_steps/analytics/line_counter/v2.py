@@ -116,6 +116,10 @@ class LineCounterBlockV2(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return LineCounterManifest
 
+    @classmethod
+    def is_stateful(cls) -> bool:
+        return True
+
     def run(
         self,
         detections: sv.Detections,
@@ -99,6 +99,10 @@ class PathDeviationAnalyticsBlockV2(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return PathDeviationManifest
 
+    @classmethod
+    def is_stateful(cls) -> bool:
+        return True
+
     def run(
         self,
         detections: sv.Detections,
@@ -111,6 +111,10 @@ class TimeInZoneBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return TimeInZoneManifest
 
+    @classmethod
+    def is_stateful(cls) -> bool:
+        return True
+
     def run(
         self,
         image: WorkflowImageData,
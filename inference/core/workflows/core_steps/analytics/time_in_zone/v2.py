@@ -113,6 +113,10 @@ class TimeInZoneBlockV2(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return TimeInZoneManifest
 
+    @classmethod
+    def is_stateful(cls) -> bool:
+        return True
+
     def run(
         self,
         image: WorkflowImageData,
@@ -0,0 +1,97 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Union
+
+from inference.core.entities.requests.inference import InferenceRequest
+from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.env import (
+    MAX_BATCH_SIZE,
+    WORKFLOWS_LOCAL_EXECUTION_MAX_STEP_BATCH_SIZE,
+    WORKFLOWS_LOCAL_EXECUTION_MAX_STEP_CONCURRENT_BATCHES,
+)
+from inference.core.managers.base import ModelManager
+from inference.core.workflows.execution_engine.profiling.core import (
+    get_step_profiler,
+)
+
+
+def run_inference_in_model_batches(
+    model_manager: ModelManager,
+    model_id: str,
+    request: InferenceRequest,
+    max_batch_size: int = WORKFLOWS_LOCAL_EXECUTION_MAX_STEP_BATCH_SIZE,
+    max_concurrent_batches: int = WORKFLOWS_LOCAL_EXECUTION_MAX_STEP_CONCURRENT_BATCHES,
+) -> List[InferenceResponse]:
+    """Runs inference for all images of `request` (e.g. all crops gathered by Workflows
+    Execution Engine across input images) in chunks matching batch size of the model.
+
+    Each chunk is processed with single (batched) `infer_from_request_sync(...)` call, up to
+    `max_concurrent_batches` of them at once. Responses are returned in the order of images
+    in request. Size of each chunk is recorded in the profiler of current Workflow step.
+    """
+    images = request.image if isinstance(request.image, list) else [request.image]
+    batch_size = get_model_max_batch_size(
+        model_manager=model_manager,
+        model_id=model_id,
+        max_batch_size=max_batch_size,
+    )
+    if len(images) <= batch_size:
+        chunks_requests = [request]
+    else:
+        chunks_requests = [
+            request.model_copy(update={"image": images[i : i + batch_size]})
+            for i in range(0, len(images), batch_size)
+        ]
+    profiler = get_step_profiler()
+
+    def infer_chunk(chunk_index: int) -> List[InferenceResponse]:
+        chunk_request = chunks_requests[chunk_index]
+        chunk_size = (
+            len(chunk_request.image) if isinstance(chunk_request.image, list) else 1
+        )
+        with profiler.profile_execution_phase(
+            name="model_batch_inference",
+            categories=["workflow_block_operation"],
+            metadata={
+                "model_id": model_id,
+                "batch_index": chunk_index,
+                "batch_size": chunk_size,
+            },
+        ):
+            responses = model_manager.infer_from_request_sync(
+                model_id=model_id, request=chunk_request
+            )
+        return _ensure_list(responses=responses)
+
+    workers = min(max(max_concurrent_batches, 1), len(chunks_requests))
+    if workers <= 1:
+        chunks_responses = [infer_chunk(i) for i in range(len(chunks_requests))]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunks_responses = list(
+                executor.map(infer_chunk, range(len(chunks_requests)))
+            )
+    return [response for responses in chunks_responses for response in responses]
+
+
+def get_model_max_batch_size(
+    model_manager: ModelManager,
+    model_id: str,
+    max_batch_size: int,
+) -> int:
+    model = model_manager[model_id]
+    model_batch_size = getattr(model, "batch_size", None)
+    if not getattr(model, "batching_enabled", True) and isinstance(
+        model_batch_size, int
+    ):
+        model_max_batch_size = model_batch_size
+    else:
+        model_max_batch_size = MAX_BATCH_SIZE
+    return max(int(min(model_max_batch_size, max_batch_size)), 1)
+
+
+def _ensure_list(
+    responses: Union[InferenceResponse, List[InferenceResponse]],
+) -> List[InferenceResponse]:
+    if isinstance(responses, list):
+        return responses
+    return [responses]
@@ -2,7 +2,6 @@ import os
 from typing import Any, List, Optional, Tuple, Union
 from uuid import uuid4
 
-import cv2
 import numpy as np
 import pybase64
 import supervision as sv
@@ -10,7 +9,12 @@ from pydantic import ValidationError
 
 from inference.core.utils.image_utils import (
     attempt_loading_image_from_string,
-    load_image_from_url,
+    decode_base64_payload,
+    has_known_encoded_image_signature,
+    load_image_bytes_from_url,
+    load_image_from_encoded_bytes,
+    peek_base64_image_header,
+    verify_encoded_image,
 )
 from inference.core.workflows.core_steps.common.utils import (
     add_inference_keypoints_to_sv_detections,
@@ -69,20 +73,30 @@ def deserialize_image_kind(
         if isinstance(image, dict):
             image = image["value"]
         if isinstance(image, str):
+            # images in common formats are kept encoded - decoding happens
+            # on the first access to `WorkflowImageData.numpy_image`
             base64_image = None
             image_reference = None
             if image.startswith("http://") or image.startswith("https://"):
                 image_reference = image
-                image = load_image_from_url(value=image)
+                image_bytes = load_image_bytes_from_url(value=image)
+                base64_image = pybase64.b64encode(image_bytes).decode("ascii")
+                image = None
+                if has_known_encoded_image_signature(value=image_bytes):
+                    verify_encoded_image(value=image_bytes)
+                else:
+                    image = load_image_from_encoded_bytes(value=image_bytes)
             elif not prevent_local_images_loading and os.path.exists(image):
                 # prevent_local_images_loading is introduced to eliminate
                 # server vulnerability - namely it prevents local server
                 # file system from being exploited.
                 image_reference = image
-                image = cv2.imread(image)
+                image = None
             else:
                 base64_image = image
-                image = attempt_loading_image_from_string(image)[0]
+                image = _load_image_unless_decoding_can_be_deferred(
+                    base64_image=base64_image
+                )
             parent_metadata = ImageParentMetadata(parent_id=parameter)
             return WorkflowImageData(
                 parent_metadata=parent_metadata,
@@ -105,6 +119,16 @@ def deserialize_image_kind(
     )
 
 
+def _load_image_unless_decoding_can_be_deferred(
+    base64_image: str,
+) -> Optional[np.ndarray]:
+    header = peek_base64_image_header(value=base64_image)
+    if header is not None and has_known_encoded_image_signature(value=header):
+        verify_encoded_image(value=decode_base64_payload(value=base64_image))
+        return None
+    return attempt_loading_image_from_string(base64_image)[0]
+
+
 def deserialize_video_metadata_kind(
     parameter: str,
     video_metadata: Any,
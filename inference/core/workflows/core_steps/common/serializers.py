@@ -1,5 +1,6 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import cv2
 import numpy as np
 import supervision as sv
 
@@ -40,106 +41,276 @@ from inference.core.workflows.execution_engine.entities.base import (
     WorkflowImageData,
 )
 
+# polygons with fewer points are skipped by `sv.mask_to_polygons(...)`
+MIN_POLYGON_POINT_COUNT = 3
+
 
 def serialise_sv_detections(detections: sv.Detections) -> dict:
-    serialized_detections = []
-    image_dimensions = None
-    for xyxy, mask, confidence, class_id, tracker_id, data in detections:
-        detection_dict = {}
-        image_dimensions = data.get(IMAGE_DIMENSIONS_KEY)
-        if isinstance(xyxy, np.ndarray):
-            xyxy = xyxy.astype(float).tolist()
-        x1, y1, x2, y2 = xyxy
-        detection_dict[WIDTH_KEY] = abs(x2 - x1)
-        detection_dict[HEIGHT_KEY] = abs(y2 - y1)
-        detection_dict[X_KEY] = x1 + detection_dict[WIDTH_KEY] / 2
-        detection_dict[Y_KEY] = y1 + detection_dict[HEIGHT_KEY] / 2
-
-        detection_dict[CONFIDENCE_KEY] = float(confidence)
-        detection_dict[CLASS_ID_KEY] = int(class_id)
-        if mask is not None:
-            polygon = sv.mask_to_polygons(mask=mask)
-            detection_dict[POLYGON_KEY] = []
-            for x, y in polygon[0]:
-                detection_dict[POLYGON_KEY].append(
+    columns = _serialise_detections_columns(detections=detections)
+    for column_name in _DETECTION_DICT_COLUMNS:
+        if column_name not in columns:
+            continue
+        if column_name == POLYGON_KEY:
+            columns[POLYGON_KEY] = [
+                [{X_KEY: x, Y_KEY: y} for x, y in polygon]
+                for polygon in columns[POLYGON_KEY]
+            ]
+        if column_name == KEYPOINTS_KEY_IN_INFERENCE_RESPONSE:
+            columns[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE] = [
+                [
                     {
-                        X_KEY: float(x),
-                        Y_KEY: float(y),
+                        "class_id": class_id,
+                        "class": class_name,
+                        "confidence": confidence,
+                        "x": x,
+                        "y": y,
                     }
-                )
-        if tracker_id is not None:
-            detection_dict[TRACKER_ID_KEY] = int(tracker_id)
-        detection_dict[CLASS_NAME_KEY] = str(data["class_name"])
-        detection_dict[DETECTION_ID_KEY] = str(data[DETECTION_ID_KEY])
-        if PATH_DEVIATION_KEY_IN_SV_DETECTIONS in data:
-            detection_dict[PATH_DEVIATION_KEY_IN_INFERENCE_RESPONSE] = data[
-                PATH_DEVIATION_KEY_IN_SV_DETECTIONS
-            ]
-        if TIME_IN_ZONE_KEY_IN_SV_DETECTIONS in data:
-            detection_dict[TIME_IN_ZONE_KEY_IN_INFERENCE_RESPONSE] = data[
-                TIME_IN_ZONE_KEY_IN_SV_DETECTIONS
-            ]
-        if (
-            BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS in data
-            and BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS in data
-            and BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS in data
-            and BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS in data
-        ):
-            detection_dict[BOUNDING_RECT_ANGLE_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS
-            ]
-            detection_dict[BOUNDING_RECT_RECT_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS
-            ]
-            detection_dict[BOUNDING_RECT_HEIGHT_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS
+                    for class_id, class_name, confidence, (x, y) in zip(*keypoints)
+                ]
+                for keypoints in columns[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE]
             ]
-            detection_dict[BOUNDING_RECT_WIDTH_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS
+    serialized_detections = [
+        dict(zip(columns.keys(), values)) for values in zip(*columns.values())
+    ]
+    return {
+        "image": _serialise_image_dimensions(detections=detections),
+        "predictions": serialized_detections,
+    }
+
+
+def serialise_sv_detections_columnar(detections: sv.Detections) -> dict:
+    """Serialises detections into compact, columnar layout - `predictions` is a dictionary
+    with list of values (one per detection) for each of the fields present in standard
+    layout (see `serialise_sv_detections(...)`). Polygons are lists of `[x, y]` pairs and
+    keypoints of each detection - dictionaries with lists of values of keypoints fields.
+    """
+    columns = _serialise_detections_columns(detections=detections)
+    if KEYPOINTS_KEY_IN_INFERENCE_RESPONSE in columns:
+        columns[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE] = [
+            {
+                "class_id": class_ids,
+                "class": class_names,
+                "confidence": confidences,
+                "xy": xy,
+            }
+            for class_ids, class_names, confidences, xy in columns[
+                KEYPOINTS_KEY_IN_INFERENCE_RESPONSE
             ]
-        if PARENT_ID_KEY in data:
-            detection_dict[PARENT_ID_KEY] = str(data[PARENT_ID_KEY])
-        if (
-            KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS in data
-            and KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS in data
-            and KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS in data
-            and KEYPOINTS_XY_KEY_IN_SV_DETECTIONS in data
-        ):
-            kp_class_id = data[KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS]
-            kp_class_name = data[KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS]
-            kp_confidence = data[KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS]
-            kp_xy = data[KEYPOINTS_XY_KEY_IN_SV_DETECTIONS]
-            detection_dict[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE] = []
-            for (
-                keypoint_class_id,
-                keypoint_class_name,
-                keypoint_confidence,
-                (x, y),
-            ) in zip(kp_class_id, kp_class_name, kp_confidence, kp_xy):
-                detection_dict[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE].append(
-                    {
-                        "class_id": int(keypoint_class_id),
-                        "class": str(keypoint_class_name),
-                        "confidence": float(keypoint_confidence),
-                        "x": float(x),
-                        "y": float(y),
-                    }
-                )
-        if DETECTED_CODE_KEY in data:
-            detection_dict[DETECTED_CODE_KEY] = data[DETECTED_CODE_KEY]
-        serialized_detections.append(detection_dict)
+        ]
+    return {
+        "image": _serialise_image_dimensions(detections=detections),
+        "predictions": columns,
+    }
+
+
+_DETECTION_DICT_COLUMNS = [
+    WIDTH_KEY,
+    HEIGHT_KEY,
+    X_KEY,
+    Y_KEY,
+    CONFIDENCE_KEY,
+    CLASS_ID_KEY,
+    POLYGON_KEY,
+    TRACKER_ID_KEY,
+    CLASS_NAME_KEY,
+    DETECTION_ID_KEY,
+    PATH_DEVIATION_KEY_IN_INFERENCE_RESPONSE,
+    TIME_IN_ZONE_KEY_IN_INFERENCE_RESPONSE,
+    BOUNDING_RECT_ANGLE_KEY_IN_INFERENCE_RESPONSE,
+    BOUNDING_RECT_RECT_KEY_IN_INFERENCE_RESPONSE,
+    BOUNDING_RECT_HEIGHT_KEY_IN_INFERENCE_RESPONSE,
+    BOUNDING_RECT_WIDTH_KEY_IN_INFERENCE_RESPONSE,
+    PARENT_ID_KEY,
+    KEYPOINTS_KEY_IN_INFERENCE_RESPONSE,
+    DETECTED_CODE_KEY,
+]
+
+
+def _serialise_detections_columns(detections: sv.Detections) -> Dict[str, list]:
+    # columns are computed as whole-array operations and ordered as keys of detection dict
+    columns = {}
+    data = detections.data
+    xyxy = np.asarray(detections.xyxy, dtype=float).reshape(-1, 4)
+    widths = np.abs(xyxy[:, 2] - xyxy[:, 0])
+    heights = np.abs(xyxy[:, 3] - xyxy[:, 1])
+    columns[WIDTH_KEY] = widths.tolist()
+    columns[HEIGHT_KEY] = heights.tolist()
+    columns[X_KEY] = (xyxy[:, 0] + widths / 2).tolist()
+    columns[Y_KEY] = (xyxy[:, 1] + heights / 2).tolist()
+    columns[CONFIDENCE_KEY] = detections.confidence.astype(float).tolist()
+    columns[CLASS_ID_KEY] = detections.class_id.astype(int).tolist()
+    if detections.mask is not None:
+        columns[POLYGON_KEY] = [
+            polygon.astype(float).tolist()
+            for polygon in masks_to_first_polygons(
+                masks=detections.mask, xyxy=detections.xyxy
+            )
+        ]
+    if detections.tracker_id is not None:
+        columns[TRACKER_ID_KEY] = detections.tracker_id.astype(int).tolist()
+    columns[CLASS_NAME_KEY] = [
+        str(e) for e in _get_data_column(data=data, key="class_name")
+    ]
+    columns[DETECTION_ID_KEY] = [
+        str(e) for e in _get_data_column(data=data, key=DETECTION_ID_KEY)
+    ]
+    if PATH_DEVIATION_KEY_IN_SV_DETECTIONS in data:
+        columns[PATH_DEVIATION_KEY_IN_INFERENCE_RESPONSE] = _get_data_column(
+            data=data, key=PATH_DEVIATION_KEY_IN_SV_DETECTIONS
+        )
+    if TIME_IN_ZONE_KEY_IN_SV_DETECTIONS in data:
+        columns[TIME_IN_ZONE_KEY_IN_INFERENCE_RESPONSE] = _get_data_column(
+            data=data, key=TIME_IN_ZONE_KEY_IN_SV_DETECTIONS
+        )
+    if (
+        BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS in data
+        and BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS in data
+        and BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS in data
+        and BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS in data
+    ):
+        for sv_key, response_key in [
+            (
+                BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS,
+                BOUNDING_RECT_ANGLE_KEY_IN_INFERENCE_RESPONSE,
+            ),
+            (
+                BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS,
+                BOUNDING_RECT_RECT_KEY_IN_INFERENCE_RESPONSE,
+            ),
+            (
+                BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS,
+                BOUNDING_RECT_HEIGHT_KEY_IN_INFERENCE_RESPONSE,
+            ),
+            (
+                BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS,
+                BOUNDING_RECT_WIDTH_KEY_IN_INFERENCE_RESPONSE,
+            ),
+        ]:
+            columns[response_key] = _get_data_column(data=data, key=sv_key)
+    if PARENT_ID_KEY in data:
+        columns[PARENT_ID_KEY] = [
+            str(e) for e in _get_data_column(data=data, key=PARENT_ID_KEY)
+        ]
+    if (
+        KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS in data
+        and KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS in data
+        and KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS in data
+        and KEYPOINTS_XY_KEY_IN_SV_DETECTIONS in data
+    ):
+        columns[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE] = [
+            (
+                np.asarray(class_ids).astype(int).tolist(),
+                [str(e) for e in class_names],
+                np.asarray(confidences).astype(float).tolist(),
+                np.asarray(xy).astype(float).reshape(-1, 2).tolist(),
+            )
+            for class_ids, class_names, confidences, xy in zip(
+                _get_data_column(
+                    data=data, key=KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS
+                ),
+                _get_data_column(
+                    data=data, key=KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS
+                ),
+                _get_data_column(
+                    data=data, key=KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS
+                ),
+                _get_data_column(data=data, key=KEYPOINTS_XY_KEY_IN_SV_DETECTIONS),
+            )
+        ]
+    if DETECTED_CODE_KEY in data:
+        columns[DETECTED_CODE_KEY] = _get_data_column(data=data, key=DETECTED_CODE_KEY)
+    return columns
+
+
+def _get_data_column(data: Dict[str, Union[np.ndarray, list]], key: str) -> list:
+    # elements are exactly the ones found in data of detections iterated one by one
+    value = data[key]
+    if isinstance(value, np.ndarray):
+        return list(value)
+    return [[element] for element in value]
+
+
+def _serialise_image_dimensions(detections: sv.Detections) -> dict:
     image_metadata = {
         "width": None,
         "height": None,
     }  # TODO: this breaks the contract of
     # standard inference, but to fix that problem, we would need sv.Detections to provide
     # detection-level metadata.
-    if image_dimensions is not None:
+    if len(detections) > 0 and IMAGE_DIMENSIONS_KEY in detections.data:
+        image_dimensions = _get_data_column(
+            data=detections.data, key=IMAGE_DIMENSIONS_KEY
+        )[-1]
         image_metadata = {
             "width": image_dimensions[1].item(),
             "height": image_dimensions[0].item(),
         }
-    return {"image": image_metadata, "predictions": serialized_detections}
+    return image_metadata
+
+
+def masks_to_first_polygons(
+    masks: np.ndarray, xyxy: Optional[np.ndarray] = None
+) -> List[np.ndarray]:
+    """Gives the first polygon that `sv.mask_to_polygons(...)` finds in each of `masks`.
+
+    Contours are traced only within bounding box of each mask (padded by 1 pixel), instead of
+    the whole image. Boxes of detections (`xyxy`) are tried first - and used when they hold
+    all pixels of the mask, otherwise the box is found from the mask itself.
+    """
+    height, width = masks.shape[1:]
+    polygons = []
+    for i, mask in enumerate(masks):
+        box = None
+        if xyxy is not None:
+            box = _get_padded_box(xyxy=xyxy[i], height=height, width=width, padding=2)
+            top, bottom, left, right = box
+            if np.count_nonzero(mask[top:bottom, left:right]) != np.count_nonzero(mask):
+                box = None
+        if box is None:
+            box = _find_padded_mask_box(mask=mask)
+        top, bottom, left, right = box
+        if bottom <= top or right <= left:
+            # empty mask - nothing to be found, the same as by `sv.mask_to_polygons(...)`
+            raise IndexError("Could not find polygon in empty mask")
+        contours, _ = cv2.findContours(
+            mask[top:bottom, left:right].astype(np.uint8),
+            cv2.RETR_TREE,
+            cv2.CHAIN_APPROX_SIMPLE,
+            offset=(left, top),
+        )
+        mask_polygons = [
+            np.squeeze(contour, axis=1)
+            for contour in contours
+            if contour.shape[0] >= MIN_POLYGON_POINT_COUNT
+        ]
+        polygons.append(mask_polygons[0])
+    return polygons
+
+
+def _get_padded_box(
+    xyxy: np.ndarray, height: int, width: int, padding: int
+) -> Tuple[int, int, int, int]:
+    x_min, y_min, x_max, y_max = xyxy
+    return (
+        max(int(np.floor(y_min)) - padding, 0),
+        min(int(np.ceil(y_max)) + padding + 1, height),
+        max(int(np.floor(x_min)) - padding, 0),
+        min(int(np.ceil(x_max)) + padding + 1, width),
+    )
+
+
+def _find_padded_mask_box(mask: np.ndarray) -> Tuple[int, int, int, int]:
+    rows = np.flatnonzero(mask.any(axis=1))
+    columns = np.flatnonzero(mask.any(axis=0))
+    if len(rows) == 0:
+        return 0, 0, 0, 0
+    height, width = mask.shape
+    return (
+        max(int(rows[0]) - 1, 0),
+        min(int(rows[-1]) + 2, height),
+        max(int(columns[0]) - 1, 0),
+        min(int(columns[-1]) + 2, width),
+    )
 
 
 def serialise_image(image: WorkflowImageData) -> Dict[str, Any]:
@@ -0,0 +1,269 @@
+from dataclasses import replace
+from typing import Callable, List, Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+import supervision as sv
+from supervision import crop_image
+
+from inference.core.workflows.core_steps.common.utils import (
+    attach_parents_coordinates_to_sv_detections,
+)
+from inference.core.workflows.core_steps.transformations.image_slicer.v1 import (
+    generate_offsets,
+)
+from inference.core.workflows.execution_engine.constants import IMAGE_DIMENSIONS_KEY
+from inference.core.workflows.execution_engine.entities.base import (
+    Batch,
+    WorkflowImageData,
+)
+from inference.core.workflows.prototypes.block import BlockResult
+
+
+def run_tiled_inference(
+    images: Batch[WorkflowImageData],
+    infer: Callable[..., BlockResult],
+    slice_wh: Tuple[int, int],
+    overlap_ratio_wh: Tuple[float, float],
+    iou_threshold: float,
+    class_agnostic_nms: bool,
+) -> BlockResult:
+    """Runs [SAHI](https://ieeexplore.ieee.org/document/9897990) inference with detection
+    model block in one step - equivalent of Image Slicer -> model -> Detections Stitch chain.
+
+    Tiles of all input images are passed to `infer(...)` (execution of model block) at once,
+    so that they are processed in batches of model size. Predictions of tiles are
+    stitched back into coordinates of input images with `stitch_tiles_detections(...)`.
+    """
+    tiles, tiles_offsets = [], []
+    for image in images:
+        image_tiles, image_offsets = generate_tiles(
+            image=image,
+            slice_wh=slice_wh,
+            overlap_ratio_wh=overlap_ratio_wh,
+        )
+        tiles.extend(image_tiles)
+        tiles_offsets.append(image_offsets)
+    tiles_results = infer(images=tiles)
+    results, tiles_start = [], 0
+    for image, image_offsets in zip(images, tiles_offsets):
+        tiles_end = tiles_start + len(image_offsets)
+        image_tiles_results = tiles_results[tiles_start:tiles_end]
+        tiles_start = tiles_end
+        image_numpy = image.numpy_image
+        detections = stitch_tiles_detections(
+            tiles_detections=[r["predictions"] for r in image_tiles_results],
+            offsets=image_offsets,
+            resolution_wh=(image_numpy.shape[1], image_numpy.shape[0]),
+            iou_threshold=iou_threshold,
+            class_agnostic_nms=class_agnostic_nms,
+        )
+        detections = attach_parents_coordinates_to_sv_detections(
+            detections=detections,
+            image=image,
+        )
+        results.append({**image_tiles_results[0], "predictions": detections})
+    return results
+
+
+def generate_tiles(
+    image: WorkflowImageData,
+    slice_wh: Tuple[int, int],
+    overlap_ratio_wh: Tuple[float, float],
+) -> Tuple[List[WorkflowImageData], np.ndarray]:
+    """Splits image into overlapping tiles being views of the image pixels.
+
+    Returns tiles and array of shape `(n, 2)` with `(x_min, y_min)` offsets of tiles.
+    """
+    image_numpy = image.numpy_image
+    offsets = generate_offsets(
+        resolution_wh=(image_numpy.shape[1], image_numpy.shape[0]),
+        slice_wh=slice_wh,
+        overlap_ratio_wh=overlap_ratio_wh,
+    )
+    tiles = []
+    for offset in offsets:
+        x_min, y_min, _, _ = offset
+        tiles.append(
+            WorkflowImageData.create_crop(
+                origin_image_data=image,
+                crop_identifier=f"tiled_inference.{uuid4()}",
+                cropped_image=crop_image(image=image_numpy, xyxy=offset),
+                offset_x=x_min,
+                offset_y=y_min,
+            )
+        )
+    return tiles, offsets[:, :2]
+
+
+def stitch_tiles_detections(
+    tiles_detections: List[sv.Detections],
+    offsets: np.ndarray,
+    resolution_wh: Tuple[int, int],
+    iou_threshold: float,
+    class_agnostic_nms: bool,
+) -> sv.Detections:
+    """Merges detections of image tiles into detections of the whole image.
+
+    Boxes of all tiles are shifted by offsets of their tiles in one step and filtered with
+    single (class-aware, unless `class_agnostic_nms` is set) box NMS pass. Masks are pasted
+    into full-resolution canvas only for detections surviving NMS - one assignment per tile.
+    """
+    if len(tiles_detections) != len(offsets):
+        raise ValueError(
+            f"Expected offset for each tile, got {len(offsets)} offsets for "
+            f"{len(tiles_detections)} tiles."
+        )
+    tiles_masks = [d.mask for d in tiles_detections]
+    merged = sv.Detections.merge([replace(d, mask=None) for d in tiles_detections])
+    detections_in_tiles = np.array([len(d) for d in tiles_detections], dtype=int)
+    if len(merged) == 0:
+        return _empty_stitched_detections(
+            tiles_detections=tiles_detections,
+            resolution_wh=resolution_wh,
+        )
+    shifts = np.repeat(offsets, detections_in_tiles, axis=0)
+    merged.xyxy = merged.xyxy + np.concatenate([shifts, shifts], axis=1)
+    if class_agnostic_nms or merged.class_id is None:
+        groups = np.zeros(len(merged), dtype=int)
+    else:
+        groups = merged.class_id.astype(int)
+    keep = batched_box_non_max_suppression(
+        xyxy=merged.xyxy,
+        confidence=merged.confidence,
+        groups=groups,
+        iou_threshold=iou_threshold,
+    )
+    stitched = merged[keep]
+    if any(mask is not None for mask in tiles_masks):
+        stitched.mask = _paste_tiles_masks(
+            tiles_masks=tiles_masks,
+            offsets=offsets,
+            keep=keep,
+            detections_in_tiles=detections_in_tiles,
+            resolution_wh=resolution_wh,
+        )
+    width, height = resolution_wh
+    stitched[IMAGE_DIMENSIONS_KEY] = np.array([[height, width]] * len(stitched))
+    return stitched
+
+
+def batched_box_non_max_suppression(
+    xyxy: np.ndarray,
+    confidence: np.ndarray,
+    groups: np.ndarray,
+    iou_threshold: float,
+) -> np.ndarray:
+    """Greedy IoU-based NMS of boxes from all groups (classes) in one pass.
+
+    Boxes are shifted by an offset unique for each group, such that boxes from different
+    groups never overlap. Instead of full IoU matrix, IoU is computed only for pairs of
+    overlapping boxes (found with sort and sweep along x axis) and greedy suppression
+    only visits boxes which suppress any other box - for sparse scenes typical for
+    SAHI, this is close to linear in number of boxes.
+
+    Returns boolean array indicating which boxes to keep.
+    """
+    keep = np.ones(xyxy.shape[0], dtype=bool)
+    if xyxy.shape[0] < 2:
+        return keep
+    span = xyxy.max() - xyxy.min() + 1
+    boxes = xyxy + (groups * span)[:, np.newaxis]
+    first, second = _find_overlapping_boxes_pairs(boxes=boxes)
+    iou = _pairs_iou(boxes=boxes, first=first, second=second)
+    suppressing = iou > iou_threshold
+    first, second = first[suppressing], second[suppressing]
+    if first.size == 0:
+        return keep
+    rank = np.empty(xyxy.shape[0], dtype=int)
+    rank[np.argsort(-confidence, kind="stable")] = np.arange(xyxy.shape[0])
+    first_is_stronger = rank[first] < rank[second]
+    stronger = np.where(first_is_stronger, first, second)
+    weaker = np.where(first_is_stronger, second, first)
+    edges_order = np.argsort(rank[stronger], kind="stable")
+    stronger, weaker = stronger[edges_order], weaker[edges_order]
+    starts = np.flatnonzero(np.r_[True, stronger[1:] != stronger[:-1]])
+    ends = np.r_[starts[1:], stronger.size]
+    # boxes are visited in order of confidence - status of the box is final once visited,
+    # as only stronger boxes can suppress it
+    for start, end in zip(starts, ends):
+        if keep[stronger[start]]:
+            keep[weaker[start:end]] = False
+    return keep
+
+
+def _find_overlapping_boxes_pairs(boxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    x_order = np.argsort(boxes[:, 0], kind="stable")
+    sorted_boxes = boxes[x_order]
+    boxes_count = sorted_boxes.shape[0]
+    candidates_start = np.arange(1, boxes_count + 1)
+    candidates_end = np.searchsorted(
+        sorted_boxes[:, 0], sorted_boxes[:, 2], side="left"
+    )
+    candidates_count = np.maximum(candidates_end - candidates_start, 0)
+    first = np.repeat(np.arange(boxes_count), candidates_count)
+    within_candidates = np.arange(first.size) - np.repeat(
+        np.cumsum(candidates_count) - candidates_count, candidates_count
+    )
+    second = candidates_start[first] + within_candidates
+    y_overlap = (sorted_boxes[first, 1] < sorted_boxes[second, 3]) & (
+        sorted_boxes[second, 1] < sorted_boxes[first, 3]
+    )
+    return x_order[first[y_overlap]], x_order[second[y_overlap]]
+
+
+def _pairs_iou(boxes: np.ndarray, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    first_boxes, second_boxes = boxes[first], boxes[second]
+    top_left = np.maximum(first_boxes[:, :2], second_boxes[:, :2])
+    bottom_right = np.minimum(first_boxes[:, 2:], second_boxes[:, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=1)
+    first_area = np.prod(first_boxes[:, 2:] - first_boxes[:, :2], axis=1)
+    second_area = np.prod(second_boxes[:, 2:] - second_boxes[:, :2], axis=1)
+    union = first_area + second_area - intersection
+    return np.divide(
+        intersection,
+        union,
+        out=np.zeros_like(intersection, dtype=np.float64),
+        where=union > 0,
+    )
+
+
+def _paste_tiles_masks(
+    tiles_masks: List[Optional[np.ndarray]],
+    offsets: np.ndarray,
+    keep: np.ndarray,
+    detections_in_tiles: np.ndarray,
+    resolution_wh: Tuple[int, int],
+) -> np.ndarray:
+    width, height = resolution_wh
+    tiles_ends = np.cumsum(detections_in_tiles)
+    tile_of_detection = np.repeat(np.arange(len(tiles_masks)), detections_in_tiles)
+    kept_in_tiles = np.bincount(tile_of_detection[keep], minlength=len(tiles_masks))
+    masks = np.zeros((int(kept_in_tiles.sum()), height, width), dtype=bool)
+    kept_start = 0
+    for tile_mask, (x_min, y_min), tile_end, tile_size, tile_kept in zip(
+        tiles_masks, offsets, tiles_ends, detections_in_tiles, kept_in_tiles
+    ):
+        if tile_kept == 0:
+            continue
+        tile_keep = keep[tile_end - tile_size : tile_end]
+        mask_h, mask_w = tile_mask.shape[1:]
+        masks[
+            kept_start : kept_start + tile_kept,
+            y_min : y_min + mask_h,
+            x_min : x_min + mask_w,
+        ] = tile_mask[tile_keep]
+        kept_start += tile_kept
+    return masks
+
+
+def _empty_stitched_detections(
+    tiles_detections: List[sv.Detections],
+    resolution_wh: Tuple[int, int],
+) -> sv.Detections:
+    width, height = resolution_wh
+    empty = replace(tiles_detections[0], data=dict(tiles_detections[0].data))
+    if empty.mask is not None:
+        empty.mask = np.zeros((0, height, width), dtype=bool)
+    empty[IMAGE_DIMENSIONS_KEY] = np.zeros((0, 2), dtype=int)
+    return empty
@@ -91,6 +91,7 @@ from inference.core.workflows.core_steps.common.entities import StepExecutionMod
 from inference.core.workflows.core_steps.common.serializers import (
     serialise_image,
     serialise_sv_detections,
+    serialise_sv_detections_columnar,
     serialize_video_metadata_kind,
     serialize_wildcard_kind,
 )
@@ -409,6 +410,13 @@ KINDS_SERIALIZERS = {
     BAR_CODE_DETECTION_KIND.name: serialise_sv_detections,
     WILDCARD_KIND.name: serialize_wildcard_kind,
 }
+COLUMNAR_DETECTIONS_KINDS_SERIALIZERS = {
+    OBJECT_DETECTION_PREDICTION_KIND.name: serialise_sv_detections_columnar,
+    INSTANCE_SEGMENTATION_PREDICTION_KIND.name: serialise_sv_detections_columnar,
+    KEYPOINT_DETECTION_PREDICTION_KIND.name: serialise_sv_detections_columnar,
+    QR_CODE_DETECTION_KIND.name: serialise_sv_detections_columnar,
+    BAR_CODE_DETECTION_KIND.name: serialise_sv_detections_columnar,
+}
 KINDS_DESERIALIZERS = {
     IMAGE_KIND.name: deserialize_image_kind,
     VIDEO_METADATA_KIND.name: deserialize_video_metadata_kind,
@@ -13,6 +13,9 @@ from inference.core.env import (
     WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS,
 )
 from inference.core.managers.base import ModelManager
+from inference.core.workflows.core_steps.common.batching import (
+    run_inference_in_model_batches,
+)
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
 from inference.core.workflows.core_steps.common.utils import (
     attach_parents_coordinates_to_batch_of_sv_detections,
@@ -272,11 +275,11 @@ class RoboflowInstanceSegmentationModelBlockV1(WorkflowBlock):
             model_id=model_id,
             api_key=self._api_key,
         )
-        predictions = self._model_manager.infer_from_request_sync(
-            model_id=model_id, request=request
+        predictions = run_inference_in_model_batches(
+            model_manager=self._model_manager,
+            model_id=model_id,
+            request=request,
         )
-        if not isinstance(predictions, list):
-            predictions = [predictions]
         predictions = [
             e.model_dump(by_alias=True, exclude_none=True) for e in predictions
         ]
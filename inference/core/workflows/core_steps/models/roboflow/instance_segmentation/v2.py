@@ -1,6 +1,8 @@
+from functools import partial
 from typing import List, Literal, Optional, Type, Union
 
 from pydantic import ConfigDict, Field, PositiveInt
+from typing_extensions import Annotated
 
 from inference.core.entities.requests.inference import (
     InstanceSegmentationInferenceRequest,
@@ -13,7 +15,11 @@ from inference.core.env import (
     WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS,
 )
 from inference.core.managers.base import ModelManager
+from inference.core.workflows.core_steps.common.batching import (
+    run_inference_in_model_batches,
+)
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.core_steps.common.tiling import run_tiled_inference
 from inference.core.workflows.core_steps.common.utils import (
     attach_parents_coordinates_to_batch_of_sv_detections,
     attach_prediction_type_info_to_sv_detections_batch,
@@ -144,6 +150,43 @@ class BlockManifest(WorkflowBlockManifest):
         examples=["my_project", "$inputs.al_target_project"],
     )
 
+    tiled_inference: Union[bool, Selector(kind=[BOOLEAN_KIND])] = Field(
+        default=False,
+        description="Run SAHI inference in a single step - input image is split into overlapping "
+        "slices, slices of all images are inferred in batches and predictions are stitched back into "
+        "coordinates of input image with NMS applied across slices (using `iou_threshold` and "
+        "`class_agnostic_nms`).",
+        examples=[True, "$inputs.tiled_inference"],
+    )
+    slice_width: Union[PositiveInt, Selector(kind=[INTEGER_KIND])] = Field(
+        default=640,
+        description="Width of each slice, in pixels (used with `tiled_inference`)",
+        examples=[320, "$inputs.slice_width"],
+    )
+    slice_height: Union[PositiveInt, Selector(kind=[INTEGER_KIND])] = Field(
+        default=640,
+        description="Height of each slice, in pixels (used with `tiled_inference`)",
+        examples=[320, "$inputs.slice_height"],
+    )
+    overlap_ratio_width: Union[
+        Annotated[float, Field(ge=0.0, lt=1.0)],
+        Selector(kind=[FLOAT_ZERO_TO_ONE_KIND]),
+    ] = Field(
+        default=0.2,
+        description="Overlap ratio between consecutive slices in the width dimension "
+        "(used with `tiled_inference`)",
+        examples=[0.2, "$inputs.overlap_ratio_width"],
+    )
+    overlap_ratio_height: Union[
+        Annotated[float, Field(ge=0.0, lt=1.0)],
+        Selector(kind=[FLOAT_ZERO_TO_ONE_KIND]),
+    ] = Field(
+        default=0.2,
+        description="Overlap ratio between consecutive slices in the height dimension "
+        "(used with `tiled_inference`)",
+        examples=[0.2, "$inputs.overlap_ratio_height"],
+    )
+
     @classmethod
     def get_parameters_accepting_batches(cls) -> List[str]:
         return ["images"]
@@ -197,41 +240,44 @@ class RoboflowInstanceSegmentationModelBlockV2(WorkflowBlock):
         tradeoff_factor: Optional[float],
         disable_active_learning: Optional[bool],
         active_learning_target_dataset: Optional[str],
+        tiled_inference: bool = False,
+        slice_width: int = 640,
+        slice_height: int = 640,
+        overlap_ratio_width: float = 0.2,
+        overlap_ratio_height: float = 0.2,
     ) -> BlockResult:
         if self._step_execution_mode is StepExecutionMode.LOCAL:
-            return self.run_locally(
-                images=images,
-                model_id=model_id,
-                class_agnostic_nms=class_agnostic_nms,
-                class_filter=class_filter,
-                confidence=confidence,
-                iou_threshold=iou_threshold,
-                max_detections=max_detections,
-                max_candidates=max_candidates,
-                mask_decode_mode=mask_decode_mode,
-                tradeoff_factor=tradeoff_factor,
-                disable_active_learning=disable_active_learning,
-                active_learning_target_dataset=active_learning_target_dataset,
-            )
+            run_in_execution_mode = self.run_locally
         elif self._step_execution_mode is StepExecutionMode.REMOTE:
-            return self.run_remotely(
-                images=images,
-                model_id=model_id,
-                class_agnostic_nms=class_agnostic_nms,
-                class_filter=class_filter,
-                confidence=confidence,
-                iou_threshold=iou_threshold,
-                max_detections=max_detections,
-                max_candidates=max_candidates,
-                mask_decode_mode=mask_decode_mode,
-                tradeoff_factor=tradeoff_factor,
-                disable_active_learning=disable_active_learning,
-                active_learning_target_dataset=active_learning_target_dataset,
-            )
+            run_in_execution_mode = self.run_remotely
         else:
             raise ValueError(
                 f"Unknown step execution mode: {self._step_execution_mode}"
             )
+        infer = partial(
+            run_in_execution_mode,
+            model_id=model_id,
+            class_agnostic_nms=class_agnostic_nms,
+            class_filter=class_filter,
+            confidence=confidence,
+            iou_threshold=iou_threshold,
+            max_detections=max_detections,
+            max_candidates=max_candidates,
+            mask_decode_mode=mask_decode_mode,
+            tradeoff_factor=tradeoff_factor,
+            disable_active_learning=disable_active_learning,
+            active_learning_target_dataset=active_learning_target_dataset,
+        )
+        if tiled_inference:
+            return run_tiled_inference(
+                images=images,
+                infer=infer,
+                slice_wh=(slice_width, slice_height),
+                overlap_ratio_wh=(overlap_ratio_width, overlap_ratio_height),
+                iou_threshold=iou_threshold,
+                class_agnostic_nms=bool(class_agnostic_nms),
+            )
+        return infer(images=images)
 
     def run_locally(
         self,
@@ -269,11 +315,11 @@ class RoboflowInstanceSegmentationModelBlockV2(WorkflowBlock):
             model_id=model_id,
             api_key=self._api_key,
         )
-        predictions = self._model_manager.infer_from_request_sync(
-            model_id=model_id, request=request
+        predictions = run_inference_in_model_batches(
+            model_manager=self._model_manager,
+            model_id=model_id,
+            request=request,
         )
-        if not isinstance(predictions, list):
-            predictions = [predictions]
         predictions = [
             e.model_dump(by_alias=True, exclude_none=True) for e in predictions
         ]
@@ -11,6 +11,9 @@ from inference.core.env import (
     WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS,
 )
 from inference.core.managers.base import ModelManager
+from inference.core.workflows.core_steps.common.batching import (
+    run_inference_in_model_batches,
+)
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
 from inference.core.workflows.core_steps.common.utils import attach_prediction_type_info
 from inference.core.workflows.execution_engine.constants import (
@@ -179,15 +182,12 @@ class RoboflowMultiLabelClassificationModelBlockV2(WorkflowBlock):
             model_id=model_id,
             api_key=self._api_key,
         )
-        predictions = self._model_manager.infer_from_request_sync(
-            model_id=model_id, request=request
+        predictions = run_inference_in_model_batches(
+            model_manager=self._model_manager,
+            model_id=model_id,
+            request=request,
         )
-        if isinstance(predictions, list):
-            predictions = [
-                e.dict(by_alias=True, exclude_none=True) for e in predictions
-            ]
-        else:
-            predictions = [predictions.dict(by_alias=True, exclude_none=True)]
+        predictions = [e.dict(by_alias=True, exclude_none=True) for e in predictions]
         return self._post_process_result(
             predictions=predictions,
             images=images,
@@ -214,6 +214,10 @@ class ModelMonitoringInferenceAggregatorBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
 
+    @classmethod
+    def is_stateful(cls) -> bool:
+        return True
+
     def run(
         self,
         fire_and_forget: bool,
@@ -110,6 +110,10 @@ class ByteTrackerBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return ByteTrackerBlockManifest
 
+    @classmethod
+    def is_stateful(cls) -> bool:
+        return True
+
     def run(
         self,
         metadata: VideoMetadata,
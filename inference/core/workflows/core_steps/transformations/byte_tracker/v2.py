@@ -116,6 +116,10 @@ class ByteTrackerBlockV2(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return ByteTrackerBlockManifest
 
+    @classmethod
+    def is_stateful(cls) -> bool:
+        return True
+
     def run(
         self,
         image: WorkflowImageData,
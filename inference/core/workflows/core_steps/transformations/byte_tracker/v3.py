@@ -142,6 +142,10 @@ class ByteTrackerBlockV3(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return ByteTrackerBlockManifest
 
+    @classmethod
+    def is_stateful(cls) -> bool:
+        return True
+
     def run(
         self,
         image: WorkflowImageData,
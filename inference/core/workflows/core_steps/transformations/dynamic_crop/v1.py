@@ -1,4 +1,5 @@
 from dataclasses import replace
+from functools import partial
 from typing import Dict, List, Literal, Optional, Tuple, Type, Union
 
 import cv2
@@ -167,27 +168,29 @@ def crop_image(
     for idx, ((x_min, y_min, x_max, y_max), detection_id) in enumerate(
         zip(detections.xyxy.round().astype(dtype=int), detections[detection_id_key])
     ):
+        # view of origin image - pixels are not copied
         cropped_image = image.numpy_image[y_min:y_max, x_min:x_max]
         if not cropped_image.size:
             crops.append({"crops": None})
             continue
+        cropped_image_factory = None
         if mask_opacity > 0 and detections.mask is not None:
-            detection_mask = detections.mask[idx]
-            cropped_mask = np.stack(
-                [detection_mask[y_min:y_max, x_min:x_max]] * 3, axis=-1
-            )
-            cropped_image = overlay_crop_with_mask(
+            # overlay is only computed once consumer of the crop needs its pixels
+            cropped_image_factory = partial(
+                overlay_crop_with_mask,
                 crop=cropped_image,
-                mask=cropped_mask,
+                mask=detections.mask[idx][y_min:y_max, x_min:x_max],
                 mask_opacity=mask_opacity,
                 background_color=background_color,
             )
+            cropped_image = None
         result = WorkflowImageData.create_crop(
             origin_image_data=image,
             crop_identifier=detection_id,
             cropped_image=cropped_image,
             offset_x=x_min,
             offset_y=y_min,
+            cropped_image_factory=cropped_image_factory,
         )
         crops.append({"crops": result})
     return crops
@@ -200,8 +203,11 @@ def overlay_crop_with_mask(
     background_color: Union[str, Tuple[int, int, int]],
 ) -> np.ndarray:
     bgr_color = convert_color_to_bgr_tuple(color=background_color)
-    background = (np.ones_like(crop) * bgr_color).astype(np.uint8)
-    blended_crop = np.where(mask > 0, crop, background)
+    blended_crop = np.empty_like(crop)
+    blended_crop[...] = np.asarray(bgr_color).astype(np.uint8)
+    if mask.ndim < crop.ndim:
+        mask = mask[..., np.newaxis]
+    np.copyto(blended_crop, crop, where=mask > 0)
     return cv2.addWeighted(blended_crop, mask_opacity, crop, 1.0 - mask_opacity, 0)
 
 
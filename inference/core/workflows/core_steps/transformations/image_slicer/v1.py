@@ -32,6 +32,10 @@ instance segmentation) running against output images from this block. At the end
 Detections Stitch block must be applied on top of predictions to merge them as if 
 the prediction was made against input image, not its slices.
 
+Object Detection and Instance Segmentation model blocks (`v2`) can perform the whole procedure 
+in a single step when `tiled_inference` is enabled - slices of all images are inferred in batches and 
+predictions are stitched with vectorized operations, which is faster than chaining three blocks.
+
 We recommend adjusting the size of slices to match the model's input size and the scale of objects in the dataset 
 the model was trained on. Models generally perform best on data that is similar to what they encountered during 
 training. The default size of slices is 640, but this might not be optimal if the model's input size is 320, as each 
@@ -128,6 +132,7 @@ class ImageSlicerBlockV1(WorkflowBlock):
         slices = []
         for offset in offsets:
             x_min, y_min, _, _ = offset
+            # view of origin image - slices do not copy pixels
             crop_numpy = crop_image(image=image_numpy, xyxy=offset)
             if crop_numpy.size:
                 cropped_image = WorkflowImageData.create_crop(
@@ -344,6 +344,10 @@ class PerspectiveCorrectionBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return PerspectiveCorrectionManifest
 
+    @classmethod
+    def is_stateful(cls) -> bool:
+        return True
+
     def run(
         self,
         images: Batch[WorkflowImageData],
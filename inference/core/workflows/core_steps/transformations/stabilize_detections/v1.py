@@ -97,6 +97,10 @@ class StabilizeTrackedDetectionsBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
 
+    @classmethod
+    def is_stateful(cls) -> bool:
+        return True
+
     def run(
         self,
         image: WorkflowImageData,
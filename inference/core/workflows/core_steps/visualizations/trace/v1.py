@@ -89,6 +89,11 @@ class TraceVisualizationBlockV1(ColorableVisualizationBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return TraceManifest
 
+    @classmethod
+    def is_stateful(cls) -> bool:
+        # sv.TraceAnnotator instances keep history of tracks
+        return True
+
     def run(
         self,
         image: WorkflowImageData,
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Type
 
 from packaging.specifiers import SpecifierSet
 from packaging.version import Version
@@ -37,6 +37,7 @@ class ExecutionEngine(BaseExecutionEngine):
         prevent_local_images_loading: bool = False,
         workflow_id: Optional[str] = None,
         profiler: Optional[WorkflowsProfiler] = None,
+        use_compiled_workflows_pool: bool = False,
     ) -> "ExecutionEngine":
         requested_engine_version = retrieve_requested_execution_engine_version(
             workflow_definition=workflow_definition,
@@ -51,6 +52,7 @@ class ExecutionEngine(BaseExecutionEngine):
             prevent_local_images_loading=prevent_local_images_loading,
             workflow_id=workflow_id,
             profiler=profiler,
+            use_compiled_workflows_pool=use_compiled_workflows_pool,
         )
         return cls(engine=engine)
 
@@ -66,12 +68,30 @@ class ExecutionEngine(BaseExecutionEngine):
         fps: float = 0,
         _is_preview: bool = False,
         serialize_results: bool = False,
+        kinds_serializers_overrides: Optional[Dict[str, Callable[[Any], Any]]] = None,
     ) -> List[Dict[str, Any]]:
         return self._engine.run(
             runtime_parameters=runtime_parameters,
             fps=fps,
             _is_preview=_is_preview,
             serialize_results=serialize_results,
+            kinds_serializers_overrides=kinds_serializers_overrides,
+        )
+
+    async def run_async(
+        self,
+        runtime_parameters: Dict[str, Any],
+        fps: float = 0,
+        _is_preview: bool = False,
+        serialize_results: bool = False,
+        kinds_serializers_overrides: Optional[Dict[str, Callable[[Any], Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        return await self._engine.run_async(
+            runtime_parameters=runtime_parameters,
+            fps=fps,
+            _is_preview=_is_preview,
+            serialize_results=serialize_results,
+            kinds_serializers_overrides=kinds_serializers_overrides,
         )
 
 
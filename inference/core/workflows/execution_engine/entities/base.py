@@ -1,10 +1,12 @@
 import base64
+import threading
 from copy import copy
 from dataclasses import dataclass, replace
 from datetime import datetime
 from enum import Enum
 from typing import (
     Any,
+    Callable,
     Dict,
     Generic,
     Iterator,
@@ -225,7 +227,24 @@ class ImageParentMetadata:
     origin_coordinates: Optional[OriginCoordinatesSystem] = None
 
 
+IMAGE_REPRESENTATIONS = [
+    "numpy_image",
+    "base64_image",
+    "image_reference",
+    "numpy_image_factory",
+]
+
+
 class WorkflowImageData:
+    """Image flowing through the Workflow.
+
+    Image may be provided in encoded form (base64 payload or reference to file / URL) -
+    it is decoded on the first access to `numpy_image` (exactly once, also when accessed
+    from multiple threads). Original encoded payload is kept, such that `base64_image`
+    of the image that was never replaced with new pixels does not require JPEG re-encoding.
+    Pixels may also be given as `numpy_image_factory` - callable invoked (once) on the first
+    access to `numpy_image` - which lets crops defer their materialisation to consumers.
+    """
 
     def __init__(
         self,
@@ -235,8 +254,14 @@ class WorkflowImageData:
         base64_image: Optional[str] = None,
         numpy_image: Optional[np.ndarray] = None,
         video_metadata: Optional[VideoMetadata] = None,
+        numpy_image_factory: Optional[Callable[[], np.ndarray]] = None,
     ):
-        if not base64_image and numpy_image is None and not image_reference:
+        if (
+            not base64_image
+            and numpy_image is None
+            and not image_reference
+            and numpy_image_factory is None
+        ):
             raise ValueError("Could not initialise empty `WorkflowImageData`.")
         self._parent_metadata = parent_metadata
         self._workflow_root_ancestor_metadata = (
@@ -247,7 +272,21 @@ class WorkflowImageData:
         self._image_reference = image_reference
         self._base64_image = base64_image
         self._numpy_image = numpy_image
+        self._numpy_image_factory = numpy_image_factory
         self._video_metadata = video_metadata
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        if self._numpy_image_factory is not None:
+            # factories are usually closures, which cannot be pickled
+            _ = self.numpy_image
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     @classmethod
     def copy_and_replace(
@@ -262,10 +301,11 @@ class WorkflowImageData:
         * image_reference
         * base64_image
         * numpy_image
+        * numpy_image_factory
         * video_metadata
 
-        When more than one from ["numpy_image", "base64_image", "image_reference"] args are
-        given, they MUST be compliant.
+        When more than one from ["numpy_image", "base64_image", "image_reference",
+        "numpy_image_factory"] args are given, they MUST be compliant.
         """
         parent_metadata = origin_image_data._parent_metadata
         workflow_root_ancestor_metadata = (
@@ -274,11 +314,13 @@ class WorkflowImageData:
         image_reference = origin_image_data._image_reference
         base64_image = origin_image_data._base64_image
         numpy_image = origin_image_data._numpy_image
+        numpy_image_factory = origin_image_data._numpy_image_factory
         video_metadata = origin_image_data._video_metadata
-        if any(k in kwargs for k in ["numpy_image", "base64_image", "image_reference"]):
+        if any(k in kwargs for k in IMAGE_REPRESENTATIONS):
             numpy_image = kwargs.get("numpy_image")
             base64_image = kwargs.get("base64_image")
             image_reference = kwargs.get("image_reference")
+            numpy_image_factory = kwargs.get("numpy_image_factory")
         if "parent_metadata" in kwargs:
             if workflow_root_ancestor_metadata is parent_metadata:
                 workflow_root_ancestor_metadata = kwargs["parent_metadata"]
@@ -296,6 +338,7 @@ class WorkflowImageData:
             base64_image=base64_image,
             numpy_image=numpy_image,
             video_metadata=video_metadata,
+            numpy_image_factory=numpy_image_factory,
         )
 
     @classmethod
@@ -303,14 +346,19 @@ class WorkflowImageData:
         cls,
         origin_image_data: "WorkflowImageData",
         crop_identifier: str,
-        cropped_image: np.ndarray,
+        cropped_image: Optional[np.ndarray],
         offset_x: int,
         offset_y: int,
         preserve_video_metadata: bool = False,
+        cropped_image_factory: Optional[Callable[[], np.ndarray]] = None,
     ) -> "WorkflowImageData":
         """
         Creates new instance of `WorkflowImageData` being a crop of original image,
         making adjustment to all metadata.
+
+        Pixels of the crop are either given as `cropped_image` (preferably view of origin
+        image, not a copy) or produced by `cropped_image_factory` on the first access to
+        `numpy_image` of the crop.
         """
         parent_metadata = ImageParentMetadata(
             parent_id=crop_identifier,
@@ -343,6 +391,7 @@ class WorkflowImageData:
             workflow_root_ancestor_metadata=workflow_root_ancestor_metadata,
             numpy_image=cropped_image,
             video_metadata=video_metadata,
+            numpy_image_factory=cropped_image_factory,
         )
 
     @property
@@ -380,25 +429,34 @@ class WorkflowImageData:
     def numpy_image(self) -> np.ndarray:
         if self._numpy_image is not None:
             return self._numpy_image
+        with self._lock:
+            if self._numpy_image is None:
+                self._numpy_image = self._decode_image()
+        return self._numpy_image
+
+    def _decode_image(self) -> np.ndarray:
+        if self._numpy_image_factory is not None:
+            numpy_image = self._numpy_image_factory()
+            self._numpy_image_factory = None
+            return numpy_image
         if self._base64_image:
-            self._numpy_image = attempt_loading_image_from_string(self._base64_image)[0]
-            return self._numpy_image
+            return attempt_loading_image_from_string(self._base64_image)[0]
         if self._image_reference.startswith(
             "http://"
         ) or self._image_reference.startswith("https://"):
-            self._numpy_image = load_image_from_url(value=self._image_reference)
-        else:
-            self._numpy_image = cv2.imread(self._image_reference)
-        return self._numpy_image
+            return load_image_from_url(value=self._image_reference)
+        return cv2.imread(self._image_reference)
 
     @property
     def base64_image(self) -> str:
         if self._base64_image is not None:
             return self._base64_image
         numpy_image = self.numpy_image
-        self._base64_image = base64.b64encode(
-            encode_image_to_jpeg_bytes(numpy_image, jpeg_quality=95)
-        ).decode("ascii")
+        with self._lock:
+            if self._base64_image is None:
+                self._base64_image = base64.b64encode(
+                    encode_image_to_jpeg_bytes(numpy_image, jpeg_quality=95)
+                ).decode("ascii")
         return self._base64_image
 
     @property
@@ -406,7 +464,7 @@ class WorkflowImageData:
         if self._video_metadata is not None:
             return self._video_metadata
         return VideoMetadata(
-            video_identifier=self.parent_metadata.parent_id,
+            video_identifier=self._parent_metadata.parent_id,
             frame_number=0,
             frame_timestamp=datetime.now(),
             fps=30,
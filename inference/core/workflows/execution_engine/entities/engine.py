@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from inference.core.workflows.execution_engine.profiling.core import WorkflowsProfiler
 
@@ -16,6 +16,7 @@ class BaseExecutionEngine(ABC):
         prevent_local_images_loading: bool = False,
         workflow_id: Optional[str] = None,
         profiler: Optional[WorkflowsProfiler] = None,
+        use_compiled_workflows_pool: bool = False,
     ) -> "BaseExecutionEngine":
         pass
 
@@ -26,5 +27,18 @@ class BaseExecutionEngine(ABC):
         fps: float = 0,
         _is_preview: bool = False,
         serialize_results: bool = False,
+        kinds_serializers_overrides: Optional[Dict[str, Callable[[Any], Any]]] = None,
     ) -> List[Dict[str, Any]]:
         pass
+
+    async def run_async(
+        self,
+        runtime_parameters: Dict[str, Any],
+        fps: float = 0,
+        _is_preview: bool = False,
+        serialize_results: bool = False,
+        kinds_serializers_overrides: Optional[Dict[str, Callable[[Any], Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        raise NotImplementedError(
+            f"Execution Engine {self.__class__.__name__} does not support asyncio execution."
+        )
@@ -5,6 +5,7 @@ import time
 from abc import ABC, abstractmethod
 from collections import deque
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any, Deque, Dict, Generator, List, Optional, Union
 
 
@@ -238,6 +239,31 @@ class BaseWorkflowsProfiler(WorkflowsProfiler):
         self._current_run_events.append(event)
 
 
+_STEP_PROFILER: ContextVar[Optional[WorkflowsProfiler]] = ContextVar(
+    "step_profiler", default=None
+)
+
+
+@contextmanager
+def step_profiler_context(profiler: WorkflowsProfiler) -> Generator[None, None, None]:
+    """Makes `profiler` available to the code of step executed within the context."""
+    token = _STEP_PROFILER.set(profiler)
+    try:
+        yield None
+    finally:
+        _STEP_PROFILER.reset(token)
+
+
+def get_step_profiler() -> WorkflowsProfiler:
+    """Returns profiler of the Workflow run executing current step - such that blocks can
+    record their own execution phases. Outside of step execution `NullWorkflowsProfiler`
+    is returned."""
+    profiler = _STEP_PROFILER.get()
+    if profiler is None:
+        return NullWorkflowsProfiler.init()
+    return profiler
+
+
 def execution_phase(
     name: str,
     categories: Optional[List[str]] = None,
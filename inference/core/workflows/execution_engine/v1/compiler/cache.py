@@ -1,13 +1,35 @@
 import hashlib
+import json
 from collections import deque
 from threading import Lock
 from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
 
 from inference.core.workflows.errors import WorkflowEnvironmentConfigurationError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 V = TypeVar("V")
 
 
+def compute_workflow_definition_fingerprint(workflow_definition: dict) -> str:
+    """
+    Stable fingerprint of workflow definition - keys order does not matter. `orjson` is used
+    when installed, as serialisation of large definitions with `json` dominates the cost
+    of cache lookup.
+    """
+    if orjson is not None:
+        try:
+            serialised = orjson.dumps(workflow_definition, option=orjson.OPT_SORT_KEYS)
+            return hashlib.md5(serialised).hexdigest()
+        except TypeError:
+            pass
+    serialised = json.dumps(workflow_definition, sort_keys=True).encode("utf-8")
+    return hashlib.md5(serialised).hexdigest()
+
+
 class BasicWorkflowsCache(Generic[V]):
     """
     Base cache which is capable of hashing compound payloads based on
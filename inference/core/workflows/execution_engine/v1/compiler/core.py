@@ -1,6 +1,4 @@
-import json
 from dataclasses import dataclass
-from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Union
 
 import networkx as nx
@@ -19,6 +17,7 @@ from inference.core.workflows.execution_engine.profiling.core import (
 )
 from inference.core.workflows.execution_engine.v1.compiler.cache import (
     BasicWorkflowsCache,
+    compute_workflow_definition_fingerprint,
 )
 from inference.core.workflows.execution_engine.v1.compiler.entities import (
     BlockSpecification,
@@ -64,10 +63,7 @@ class GraphCompilationResult:
 COMPILATION_CACHE = BasicWorkflowsCache[GraphCompilationResult](
     cache_size=256,
     hash_functions=[
-        (
-            "workflow_definition",
-            partial(json.dumps, sort_keys=True),
-        ),
+        ("workflow_definition", compute_workflow_definition_fingerprint),
         ("execution_engine_version", lambda version: str(version)),
     ],
 )
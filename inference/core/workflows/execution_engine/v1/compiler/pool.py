@@ -0,0 +1,180 @@
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+from packaging.version import Version
+
+from inference.core.env import COMPILED_WORKFLOWS_POOL_SIZE
+from inference.core.workflows.execution_engine.profiling.core import (
+    WorkflowsProfiler,
+    execution_phase,
+)
+from inference.core.workflows.execution_engine.v1.compiler.cache import (
+    BasicWorkflowsCache,
+    compute_workflow_definition_fingerprint,
+)
+from inference.core.workflows.execution_engine.v1.compiler.core import (
+    compile_workflow,
+    compile_workflow_graph,
+)
+from inference.core.workflows.execution_engine.v1.compiler.entities import (
+    BlockSpecification,
+    CompiledWorkflow,
+    InitialisedStep,
+)
+from inference.core.workflows.execution_engine.v1.compiler.steps_initialiser import (
+    initialise_step,
+)
+from inference.core.workflows.execution_engine.v1.dynamic_blocks.block_assembler import (
+    ensure_dynamic_blocks_allowed,
+)
+
+# init parameters which are different for each request served by HTTP API - blocks
+# requesting them cannot be shared and their values do not take part in pool key
+PER_RUN_INIT_PARAMETERS = {"workflows_core.background_tasks"}
+
+
+@dataclass(frozen=True)
+class PooledWorkflow:
+    compiled_workflow: CompiledWorkflow
+    initializers: Dict[str, Union[Any, Callable[[None], Any]]]
+    steps_instantiated_per_run: List[str]
+
+
+class CompiledWorkflowsPool:
+    """
+    Pool of ready-to-run `CompiledWorkflow` instances. Contrary to `COMPILATION_CACHE` (which only
+    holds compiled graph) it saves initialisation of steps, collection of input substitutions and
+    graph dump, which otherwise takes place each time Execution Engine is initialised.
+
+    Entries are keyed by fingerprint of definition, Execution Engine version and identity of
+    init parameters (values of primitives and `id(...)` of objects like model manager) - apart from
+    `per_run_init_parameters`. Instances of blocks are shared among runs, apart from stateful
+    blocks (see `WorkflowBlock.is_stateful()`) and blocks requesting per-run init parameters -
+    those are instantiated again for each run.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        per_run_init_parameters: Optional[Set[str]] = None,
+    ):
+        if per_run_init_parameters is None:
+            per_run_init_parameters = PER_RUN_INIT_PARAMETERS
+        self._per_run_init_parameters = per_run_init_parameters
+        self._cache = BasicWorkflowsCache[PooledWorkflow](
+            cache_size=size,
+            hash_functions=[
+                ("workflow_definition", compute_workflow_definition_fingerprint),
+                ("execution_engine_version", lambda version: str(version)),
+                ("init_parameters", self._compute_init_parameters_identity),
+            ],
+        )
+
+    @execution_phase(
+        name="compiled_workflows_pool_lookup",
+        categories=["execution_engine_operation"],
+    )
+    def get_compiled_workflow(
+        self,
+        workflow_definition: dict,
+        init_parameters: Dict[str, Union[Any, Callable[[None], Any]]],
+        execution_engine_version: Optional[Version] = None,
+        profiler: Optional[WorkflowsProfiler] = None,
+    ) -> CompiledWorkflow:
+        key = self._cache.get_hash_key(
+            workflow_definition=workflow_definition,
+            execution_engine_version=execution_engine_version,
+            init_parameters=init_parameters,
+        )
+        pooled_workflow = self._cache.get(key=key)
+        if pooled_workflow is None:
+            compiled_workflow = compile_workflow(
+                workflow_definition=workflow_definition,
+                init_parameters=init_parameters,
+                execution_engine_version=execution_engine_version,
+                profiler=profiler,
+            )
+            graph_compilation_results = compile_workflow_graph(
+                workflow_definition=workflow_definition,
+                execution_engine_version=execution_engine_version,
+            )
+            pooled_workflow = PooledWorkflow(
+                compiled_workflow=compiled_workflow,
+                initializers=graph_compilation_results.initializers,
+                steps_instantiated_per_run=[
+                    step_name
+                    for step_name, step in compiled_workflow.steps.items()
+                    if self._requires_instance_per_run(step=step)
+                ],
+            )
+            self._cache.cache(key=key, value=pooled_workflow)
+            return compiled_workflow
+        ensure_dynamic_blocks_allowed(
+            dynamic_blocks_definitions=workflow_definition.get(
+                "dynamic_blocks_definitions", []
+            )
+        )
+        return self._prepare_workflow_for_run(
+            pooled_workflow=pooled_workflow,
+            init_parameters=init_parameters,
+        )
+
+    def _prepare_workflow_for_run(
+        self,
+        pooled_workflow: PooledWorkflow,
+        init_parameters: Dict[str, Union[Any, Callable[[None], Any]]],
+    ) -> CompiledWorkflow:
+        compiled_workflow = pooled_workflow.compiled_workflow
+        if not pooled_workflow.steps_instantiated_per_run:
+            return replace(compiled_workflow, init_parameters=init_parameters)
+        steps = dict(compiled_workflow.steps)
+        for step_name in pooled_workflow.steps_instantiated_per_run:
+            pooled_step = steps[step_name]
+            steps[step_name] = initialise_step(
+                step_manifest=pooled_step.manifest,
+                block_specification=pooled_step.block_specification,
+                explicit_init_parameters=init_parameters,
+                initializers=pooled_workflow.initializers,
+            )
+        return replace(compiled_workflow, steps=steps, init_parameters=init_parameters)
+
+    def _requires_instance_per_run(self, step: InitialisedStep) -> bool:
+        block_specification = step.block_specification
+        if block_specification.block_class.is_stateful():
+            return True
+        return any(
+            self._is_per_run_init_parameter(
+                block_specification=block_specification,
+                init_parameter=init_parameter,
+            )
+            for init_parameter in block_specification.block_class.get_init_parameters()
+        )
+
+    def _is_per_run_init_parameter(
+        self, block_specification: BlockSpecification, init_parameter: str
+    ) -> bool:
+        full_parameter_name = f"{block_specification.block_source}.{init_parameter}"
+        return (
+            full_parameter_name in self._per_run_init_parameters
+            or init_parameter in self._per_run_init_parameters
+        )
+
+    def _compute_init_parameters_identity(
+        self, init_parameters: Dict[str, Union[Any, Callable[[None], Any]]]
+    ) -> str:
+        # objects are identified by `id(...)` - ids cannot be reused while pooled workflow
+        # (holding reference to init parameters) lives in the pool
+        chunks = []
+        for name in sorted(init_parameters.keys()):
+            if name in self._per_run_init_parameters:
+                continue
+            value = init_parameters[name]
+            if value is None or isinstance(value, (str, int, float, bool, Enum)):
+                chunks.append(f"{name}={value!r}")
+            else:
+                chunks.append(f"{name}@{id(value)}")
+        return "|".join(chunks)
+
+
+COMPILED_WORKFLOWS_POOL = CompiledWorkflowsPool(size=COMPILED_WORKFLOWS_POOL_SIZE)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from packaging.version import Version
 
@@ -13,7 +13,13 @@ from inference.core.workflows.execution_engine.v1.compiler.core import compile_w
 from inference.core.workflows.execution_engine.v1.compiler.entities import (
     CompiledWorkflow,
 )
-from inference.core.workflows.execution_engine.v1.executor.core import run_workflow
+from inference.core.workflows.execution_engine.v1.compiler.pool import (
+    COMPILED_WORKFLOWS_POOL,
+)
+from inference.core.workflows.execution_engine.v1.executor.core import (
+    run_workflow,
+    run_workflow_async,
+)
 from inference.core.workflows.execution_engine.v1.executor.runtime_input_assembler import (
     assemble_runtime_parameters,
 )
@@ -35,17 +41,26 @@ class ExecutionEngineV1(BaseExecutionEngine):
         prevent_local_images_loading: bool = False,
         workflow_id: Optional[str] = None,
         profiler: Optional[WorkflowsProfiler] = None,
+        use_compiled_workflows_pool: bool = False,
     ) -> "ExecutionEngineV1":
         if init_parameters is None:
             init_parameters = {}
         if profiler is None:
             profiler = NullWorkflowsProfiler.init()
-        compiled_workflow = compile_workflow(
-            workflow_definition=workflow_definition,
-            init_parameters=init_parameters,
-            execution_engine_version=EXECUTION_ENGINE_V1_VERSION,
-            profiler=profiler,
-        )
+        if use_compiled_workflows_pool:
+            compiled_workflow = COMPILED_WORKFLOWS_POOL.get_compiled_workflow(
+                workflow_definition=workflow_definition,
+                init_parameters=init_parameters,
+                execution_engine_version=EXECUTION_ENGINE_V1_VERSION,
+                profiler=profiler,
+            )
+        else:
+            compiled_workflow = compile_workflow(
+                workflow_definition=workflow_definition,
+                init_parameters=init_parameters,
+                execution_engine_version=EXECUTION_ENGINE_V1_VERSION,
+                profiler=profiler,
+            )
         return cls(
             compiled_workflow=compiled_workflow,
             max_concurrent_steps=max_concurrent_steps,
@@ -74,30 +89,71 @@ class ExecutionEngineV1(BaseExecutionEngine):
         fps: float = 0,
         _is_preview: bool = False,
         serialize_results: bool = False,
+        kinds_serializers_overrides: Optional[Dict[str, Callable[[Any], Any]]] = None,
     ) -> List[Dict[str, Any]]:
         self._profiler.start_workflow_run()
-        runtime_parameters = assemble_runtime_parameters(
-            runtime_parameters=runtime_parameters,
-            defined_inputs=self._compiled_workflow.workflow_definition.inputs,
-            kinds_deserializers=self._compiled_workflow.kinds_deserializers,
-            prevent_local_images_loading=self._prevent_local_images_loading,
-            profiler=self._profiler,
+        runtime_parameters = self._prepare_runtime_parameters(
+            runtime_parameters=runtime_parameters
         )
-        validate_runtime_input(
+        result = run_workflow(
+            workflow=self._compiled_workflow,
             runtime_parameters=runtime_parameters,
-            input_substitutions=self._compiled_workflow.input_substitutions,
+            max_concurrent_steps=self._max_concurrent_steps,
+            usage_fps=fps,
+            usage_workflow_id=self._workflow_id,
+            usage_workflow_preview=_is_preview,
+            kinds_serializers={
+                **self._compiled_workflow.kinds_serializers,
+                **(kinds_serializers_overrides or {}),
+            },
+            serialize_results=serialize_results,
             profiler=self._profiler,
         )
-        result = run_workflow(
+        self._profiler.end_workflow_run()
+        return result
+
+    async def run_async(
+        self,
+        runtime_parameters: Dict[str, Any],
+        fps: float = 0,
+        _is_preview: bool = False,
+        serialize_results: bool = False,
+        kinds_serializers_overrides: Optional[Dict[str, Callable[[Any], Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        self._profiler.start_workflow_run()
+        runtime_parameters = self._prepare_runtime_parameters(
+            runtime_parameters=runtime_parameters
+        )
+        result = await run_workflow_async(
             workflow=self._compiled_workflow,
             runtime_parameters=runtime_parameters,
             max_concurrent_steps=self._max_concurrent_steps,
             usage_fps=fps,
             usage_workflow_id=self._workflow_id,
             usage_workflow_preview=_is_preview,
-            kinds_serializers=self._compiled_workflow.kinds_serializers,
+            kinds_serializers={
+                **self._compiled_workflow.kinds_serializers,
+                **(kinds_serializers_overrides or {}),
+            },
             serialize_results=serialize_results,
             profiler=self._profiler,
         )
         self._profiler.end_workflow_run()
         return result
+
+    def _prepare_runtime_parameters(
+        self, runtime_parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        runtime_parameters = assemble_runtime_parameters(
+            runtime_parameters=runtime_parameters,
+            defined_inputs=self._compiled_workflow.workflow_definition.inputs,
+            kinds_deserializers=self._compiled_workflow.kinds_deserializers,
+            prevent_local_images_loading=self._prevent_local_images_loading,
+            profiler=self._profiler,
+        )
+        validate_runtime_input(
+            runtime_parameters=runtime_parameters,
+            input_substitutions=self._compiled_workflow.input_substitutions,
+            profiler=self._profiler,
+        )
+        return runtime_parameters
@@ -82,6 +82,11 @@ def assembly_custom_python_block(
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return manifest
 
+    @classmethod
+    def is_stateful(cls) -> bool:
+        # custom code may keep state in `self` - dynamic blocks are never shared among runs
+        return True
+
     return type(
         f"DynamicBlock[{unique_identifier}]",
         (WorkflowBlock,),
@@ -89,6 +94,7 @@ def assembly_custom_python_block(
             "__init__": constructor,
             "get_init_parameters": get_init_parameters,
             "get_manifest": get_manifest,
+            "is_stateful": is_stateful,
             "run": run,
         },
     )
@@ -1,6 +1,11 @@
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from functools import partial
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import networkx as nx
 
 from inference.core import logger
 from inference.core.workflows.errors import (
@@ -12,6 +17,7 @@ from inference.core.workflows.execution_engine.profiling.core import (
     NullWorkflowsProfiler,
     WorkflowsProfiler,
     execution_phase,
+    step_profiler_context,
 )
 from inference.core.workflows.execution_engine.v1.compiler.entities import (
     CompiledWorkflow,
@@ -24,12 +30,15 @@ from inference.core.workflows.execution_engine.v1.executor.execution_data_manage
 )
 from inference.core.workflows.execution_engine.v1.executor.flow_coordinator import (
     ParallelStepExecutionCoordinator,
+    StepExecutionCoordinator,
+    establish_execution_order,
 )
 from inference.core.workflows.execution_engine.v1.executor.output_constructor import (
     construct_workflow_output,
 )
 from inference.core.workflows.execution_engine.v1.executor.utils import (
-    run_steps_in_parallel,
+    is_async_block,
+    run_block,
 )
 from inference.core.workflows.prototypes.block import WorkflowBlock
 from inference.usage_tracking.collector import usage_collector
@@ -55,16 +64,13 @@ def run_workflow(
     execution_coordinator = ParallelStepExecutionCoordinator.init(
         execution_graph=workflow.execution_graph,
     )
-    next_steps = execution_coordinator.get_steps_to_execute_next(profiler=profiler)
-    while next_steps is not None:
-        execute_steps(
-            next_steps=next_steps,
-            workflow=workflow,
-            execution_data_manager=execution_data_manager,
-            max_concurrent_steps=max_concurrent_steps,
-            profiler=profiler,
-        )
-        next_steps = execution_coordinator.get_steps_to_execute_next(profiler=profiler)
+    execute_steps(
+        execution_coordinator=execution_coordinator,
+        workflow=workflow,
+        execution_data_manager=execution_data_manager,
+        max_concurrent_steps=max_concurrent_steps,
+        profiler=profiler,
+    )
     with profiler.profile_execution_phase(
         name="outputs_construction",
         categories=["execution_engine_operation"],
@@ -78,30 +84,380 @@ def run_workflow(
         )
 
 
+@usage_collector
+async def run_workflow_async(
+    workflow: CompiledWorkflow,
+    runtime_parameters: Dict[str, Any],
+    max_concurrent_steps: int,
+    kinds_serializers: Optional[Dict[str, Callable[[Any], Any]]],
+    serialize_results: bool = False,
+    profiler: Optional[WorkflowsProfiler] = None,
+) -> List[Dict[str, Any]]:
+    if profiler is None:
+        profiler = NullWorkflowsProfiler.init()
+    with profiler.profile_execution_phase(
+        name="workflow_execution",
+        categories=["execution_engine_operation"],
+    ):
+        execution_data_manager = ExecutionDataManager.init(
+            execution_graph=workflow.execution_graph,
+            runtime_parameters=runtime_parameters,
+        )
+        execution_coordinator = ParallelStepExecutionCoordinator.init(
+            execution_graph=workflow.execution_graph,
+        )
+        executor = ThreadPoolExecutor(max_workers=max_concurrent_steps)
+        try:
+            await execute_steps_async(
+                execution_coordinator=execution_coordinator,
+                workflow=workflow,
+                execution_data_manager=execution_data_manager,
+                executor=executor,
+                profiler=profiler,
+            )
+        finally:
+            # not waiting for steps still running in threads after failure of other step
+            executor.shutdown(wait=False)
+        with profiler.profile_execution_phase(
+            name="outputs_construction",
+            categories=["execution_engine_operation"],
+        ):
+            return construct_workflow_output(
+                workflow_outputs=workflow.workflow_definition.outputs,
+                execution_graph=workflow.execution_graph,
+                execution_data_manager=execution_data_manager,
+                serialize_results=serialize_results,
+                kinds_serializers=kinds_serializers,
+            )
+
+
+async def execute_steps_async(
+    execution_coordinator: StepExecutionCoordinator,
+    workflow: CompiledWorkflow,
+    execution_data_manager: ExecutionDataManager,
+    executor: ThreadPoolExecutor,
+    profiler: WorkflowsProfiler,
+) -> None:
+    """
+    Each step is scheduled as `asyncio` task as soon as all of its predecessors are completed.
+    Blocks exposing `async def run(...)` are awaited in the event loop (not occupying any thread
+    while waiting for I/O), other blocks are offloaded to `executor` - such that only CPU-bound /
+    blocking steps are limited by its size.
+    """
+    running_steps: Dict[asyncio.Future, str] = {}
+    steps_scheduling_times: Dict[str, float] = {}
+    steps_timings: Dict[str, Tuple[float, float]] = {}
+    execution_start = time.monotonic()
+
+    def schedule_ready_steps() -> None:
+        for step_selector in execution_coordinator.get_steps_ready_for_execution():
+            logger.info(f"Scheduling step: {step_selector}.")
+            task = asyncio.ensure_future(
+                safe_execute_step_async(
+                    step_selector=step_selector,
+                    workflow=workflow,
+                    execution_data_manager=execution_data_manager,
+                    executor=executor,
+                    profiler=profiler,
+                )
+            )
+            running_steps[task] = step_selector
+            steps_scheduling_times[step_selector] = time.monotonic()
+
+    schedule_ready_steps()
+    try:
+        while running_steps:
+            done, _ = await asyncio.wait(
+                running_steps.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                step_selector = running_steps.pop(task)
+                task.result()
+                steps_timings[step_selector] = (
+                    steps_scheduling_times[step_selector],
+                    time.monotonic(),
+                )
+                execution_coordinator.mark_step_as_completed(
+                    step_selector=step_selector
+                )
+            schedule_ready_steps()
+    finally:
+        for task in running_steps:
+            task.cancel()
+    report_steps_dispatch_summary(
+        execution_graph=workflow.execution_graph,
+        steps_timings=steps_timings,
+        execution_start=execution_start,
+        execution_end=time.monotonic(),
+        profiler=profiler,
+    )
+
+
+async def safe_execute_step_async(
+    step_selector: str,
+    workflow: CompiledWorkflow,
+    execution_data_manager: ExecutionDataManager,
+    executor: ThreadPoolExecutor,
+    profiler: WorkflowsProfiler,
+) -> None:
+    step_name = get_last_chunk_of_selector(selector=step_selector)
+    step_instance = workflow.steps[step_name].step
+    if not is_async_block(step_instance=step_instance):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            partial(
+                safe_execute_step,
+                step_selector=step_selector,
+                workflow=workflow,
+                execution_data_manager=execution_data_manager,
+                profiler=profiler,
+            ),
+        )
+    try:
+        with profiler.profile_execution_phase(
+            name="step_execution",
+            categories=["execution_engine_operation"],
+            metadata={"step_selector": step_selector},
+        ):
+            logger.info(
+                f"started execution of: {step_selector} - {datetime.now().isoformat()}"
+            )
+            with step_profiler_context(profiler=profiler):
+                await run_async_step(
+                    step_selector=step_selector,
+                    workflow=workflow,
+                    execution_data_manager=execution_data_manager,
+                    profiler=profiler,
+                )
+            logger.info(
+                f"finished execution of: {step_selector} - {datetime.now().isoformat()}"
+            )
+    except WorkflowError as error:
+        raise error
+    except Exception as error:
+        logger.exception(f"Execution of step {step_selector} encountered error.")
+        raise StepExecutionError(
+            public_message=f"Error during execution of step: {step_selector}. Details: {error}",
+            context="workflow_execution | step_execution",
+            inner_error=error,
+        ) from error
+
+
+async def run_async_step(
+    step_selector: str,
+    workflow: CompiledWorkflow,
+    execution_data_manager: ExecutionDataManager,
+    profiler: WorkflowsProfiler,
+) -> None:
+    step_name = get_last_chunk_of_selector(selector=step_selector)
+    step_instance = workflow.steps[step_name].step
+    step_manifest = workflow.steps[step_name].manifest
+    if not execution_data_manager.is_step_simd(step_selector=step_selector):
+        with profiler.profile_execution_phase(
+            name="step_input_assembly",
+            categories=["execution_engine_operation"],
+            metadata={"step": step_selector},
+        ):
+            step_input = execution_data_manager.get_non_simd_step_input(
+                step_selector=step_selector
+            )
+        if step_input is None:
+            # discarded by conditional execution
+            return None
+        with profiler.profile_execution_phase(
+            name="step_code_execution",
+            categories=["workflow_block_operation"],
+            metadata={"step": step_selector},
+        ):
+            step_result = await step_instance.run(**step_input)
+        if isinstance(step_result, list):
+            raise ExecutionEngineRuntimeError(
+                public_message=f"Error in execution engine. Non-SIMD step {step_name} "
+                f"produced list of results which is not expected. This is most likely bug. "
+                f"Contact Roboflow team through github issues "
+                f"(https://github.com/roboflow/inference/issues) providing full context of"
+                f"the problem - including workflow definition you use.",
+                context="workflow_execution | step_output_registration",
+            )
+        with profiler.profile_execution_phase(
+            name="step_output_registration",
+            categories=["execution_engine_operation"],
+            metadata={"step": step_selector},
+        ):
+            execution_data_manager.register_non_simd_step_output(
+                step_selector=step_selector,
+                output=step_result,
+            )
+        return None
+    if step_manifest.accepts_batch_input():
+        with profiler.profile_execution_phase(
+            name="step_input_assembly",
+            categories=["execution_engine_operation"],
+            metadata={"step": step_selector},
+        ):
+            step_input = execution_data_manager.get_simd_step_input(
+                step_selector=step_selector,
+            )
+        indices = step_input.indices
+        with profiler.profile_execution_phase(
+            name="step_code_execution",
+            categories=["workflow_block_operation"],
+            metadata={"step": step_selector, "data_size": len(indices)},
+        ):
+            outputs = []
+            if indices:
+                outputs = await step_instance.run(**step_input.parameters)
+    else:
+        inputs = list(
+            execution_data_manager.iterate_over_simd_step_input(
+                step_selector=step_selector
+            )
+        )
+        indices = [input_definition.index for input_definition in inputs]
+        with profiler.profile_execution_phase(
+            name="step_code_execution",
+            categories=["workflow_block_operation"],
+            metadata={"step": step_selector, "data_size": len(indices)},
+        ):
+            # elements of batch are awaited concurrently
+            outputs = list(
+                await asyncio.gather(
+                    *[
+                        step_instance.run(**input_definition.parameters)
+                        for input_definition in inputs
+                    ]
+                )
+            )
+    with profiler.profile_execution_phase(
+        name="step_output_registration",
+        categories=["execution_engine_operation"],
+        metadata={"step": step_selector},
+    ):
+        execution_data_manager.register_simd_step_output(
+            step_selector=step_selector,
+            indices=indices,
+            outputs=outputs,
+        )
+
+
 @execution_phase(
-    name="group_of_steps_execution",
+    name="steps_execution",
     categories=["execution_engine_operation"],
-    runtime_metadata=["next_steps", "max_concurrent_steps"],
+    runtime_metadata=["max_concurrent_steps"],
 )
 def execute_steps(
-    next_steps: List[str],
+    execution_coordinator: StepExecutionCoordinator,
     workflow: CompiledWorkflow,
     execution_data_manager: ExecutionDataManager,
     max_concurrent_steps: int,
     profiler: Optional[WorkflowsProfiler] = None,
 ) -> None:
-    logger.info(f"Executing steps: {next_steps}.")
-    steps_functions = [
-        partial(
-            safe_execute_step,
-            step_selector=step_selector,
-            workflow=workflow,
-            execution_data_manager=execution_data_manager,
-            profiler=profiler,
-        )
-        for step_selector in next_steps
-    ]
-    _ = run_steps_in_parallel(steps=steps_functions, max_workers=max_concurrent_steps)
+    """
+    Dispatches each step to the thread pool the moment all of its predecessors finish - such that
+    slow step only delays steps depending on it (not the whole topological generation). When there
+    are more ready steps than free workers, steps heading the longest chains go first.
+    """
+    if profiler is None:
+        profiler = NullWorkflowsProfiler.init()
+    steps_timings: Dict[str, Tuple[float, float]] = {}
+    running_steps: Dict[Future, str] = {}
+    execution_start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max_concurrent_steps) as executor:
+        try:
+            while True:
+                free_workers = max_concurrent_steps - len(running_steps)
+                for (
+                    step_selector
+                ) in execution_coordinator.get_steps_ready_for_execution(
+                    limit=free_workers
+                ):
+                    logger.info(f"Executing step: {step_selector}.")
+                    future = executor.submit(
+                        execute_step_measuring_time,
+                        step_selector=step_selector,
+                        workflow=workflow,
+                        execution_data_manager=execution_data_manager,
+                        profiler=profiler,
+                    )
+                    running_steps[future] = step_selector
+                if not running_steps:
+                    break
+                done, _ = wait(running_steps.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    step_selector = running_steps.pop(future)
+                    steps_timings[step_selector] = future.result()
+                    execution_coordinator.mark_step_as_completed(
+                        step_selector=step_selector
+                    )
+        finally:
+            for future in running_steps:
+                future.cancel()
+    report_steps_dispatch_summary(
+        execution_graph=workflow.execution_graph,
+        steps_timings=steps_timings,
+        execution_start=execution_start,
+        execution_end=time.monotonic(),
+        profiler=profiler,
+    )
+
+
+def execute_step_measuring_time(
+    step_selector: str,
+    workflow: CompiledWorkflow,
+    execution_data_manager: ExecutionDataManager,
+    profiler: WorkflowsProfiler,
+) -> Tuple[float, float]:
+    start = time.monotonic()
+    safe_execute_step(
+        step_selector=step_selector,
+        workflow=workflow,
+        execution_data_manager=execution_data_manager,
+        profiler=profiler,
+    )
+    return start, time.monotonic()
+
+
+def report_steps_dispatch_summary(
+    execution_graph: nx.DiGraph,
+    steps_timings: Dict[str, Tuple[float, float]],
+    execution_start: float,
+    execution_end: float,
+    profiler: WorkflowsProfiler,
+) -> None:
+    """
+    Notifies profiler about time saved by dataflow dispatch. Duration of execution in topological
+    generations is estimated as sum of durations of the slowest step in each generation, given
+    unlimited workers - so the time saved is lower bound.
+    """
+    if isinstance(profiler, NullWorkflowsProfiler):
+        return None
+    estimated_generations_duration = 0.0
+    for generation in establish_execution_order(execution_graph=execution_graph):
+        durations = [
+            steps_timings[step][1] - steps_timings[step][0]
+            for step in generation
+            if step in steps_timings
+        ]
+        estimated_generations_duration += max(durations, default=0.0)
+    duration = execution_end - execution_start
+    profiler.notify_event(
+        name="steps_dispatch_summary",
+        categories=["execution_engine_operation"],
+        metadata={
+            "duration_ms": round(duration * 1000, 3),
+            "estimated_duration_in_generations_ms": round(
+                estimated_generations_duration * 1000, 3
+            ),
+            "estimated_idle_time_saved_ms": round(
+                max(estimated_generations_duration - duration, 0.0) * 1000, 3
+            ),
+            "steps_start_offsets_ms": {
+                step: round((start - execution_start) * 1000, 3)
+                for step, (start, _) in steps_timings.items()
+            },
+        },
+    )
 
 
 @execution_phase(
@@ -121,12 +477,13 @@ def safe_execute_step(
         logger.info(
             f"started execution of: {step_selector} - {datetime.now().isoformat()}"
         )
-        run_step(
-            step_selector=step_selector,
-            workflow=workflow,
-            execution_data_manager=execution_data_manager,
-            profiler=profiler,
-        )
+        with step_profiler_context(profiler=profiler):
+            run_step(
+                step_selector=step_selector,
+                workflow=workflow,
+                execution_data_manager=execution_data_manager,
+                profiler=profiler,
+            )
         logger.info(
             f"finished execution of: {step_selector} - {datetime.now().isoformat()}"
         )
@@ -212,7 +569,9 @@ def run_simd_step_in_batch_mode(
             # no inputs - discarded either by conditional exec or by not accepting empty
             outputs = []
         else:
-            outputs = step_instance.run(**step_input.parameters)
+            outputs = run_block(
+                step_instance=step_instance, parameters=step_input.parameters
+            )
     with profiler.profile_execution_phase(
         name="step_output_registration",
         categories=["execution_engine_operation"],
@@ -249,7 +608,10 @@ def run_simd_step_in_non_batch_mode(
                     "step": step_selector,
                 },
             ):
-                result = step_instance.run(**input_definition.parameters)
+                result = run_block(
+                    step_instance=step_instance,
+                    parameters=input_definition.parameters,
+                )
             results.append(result)
             indices.append(input_definition.index)
     with profiler.profile_execution_phase(
@@ -290,7 +652,7 @@ def run_non_simd_step(
             "step": step_selector,
         },
     ):
-        step_result = step_instance.run(**step_input)
+        step_result = run_block(step_instance=step_instance, parameters=step_input)
     if isinstance(step_result, list):
         raise ExecutionEngineRuntimeError(
             public_message=f"Error in execution engine. Non-SIMD step {step_name} "
@@ -1,5 +1,6 @@
 import abc
-from typing import List, Optional
+import heapq
+from typing import Dict, List, Optional, Tuple
 
 import networkx as nx
 
@@ -30,6 +31,18 @@ class StepExecutionCoordinator(metaclass=abc.ABCMeta):
     ) -> Optional[List[str]]:
         pass
 
+    @abc.abstractmethod
+    def get_steps_ready_for_execution(self, limit: Optional[int] = None) -> List[str]:
+        pass
+
+    @abc.abstractmethod
+    def mark_step_as_completed(self, step_selector: str) -> None:
+        pass
+
+    @abc.abstractmethod
+    def all_steps_completed(self) -> bool:
+        pass
+
 
 class ParallelStepExecutionCoordinator(StepExecutionCoordinator):
 
@@ -41,6 +54,11 @@ class ParallelStepExecutionCoordinator(StepExecutionCoordinator):
         self._execution_graph = execution_graph.copy()
         self.__execution_order: Optional[List[List[str]]] = None
         self.__execution_pointer = 0
+        self.__steps_flow_graph: Optional[nx.DiGraph] = None
+        self.__pending_predecessors: Dict[str, int] = {}
+        self.__ready_steps: List[Tuple[int, str]] = []
+        self.__critical_path_lengths: Dict[str, int] = {}
+        self.__not_completed_steps = 0
 
     @execution_phase(
         name="next_steps_selection",
@@ -65,6 +83,83 @@ class ParallelStepExecutionCoordinator(StepExecutionCoordinator):
             return candidate_steps
         return next_step
 
+    def get_steps_ready_for_execution(self, limit: Optional[int] = None) -> List[str]:
+        """
+        Dataflow counterpart of `get_steps_to_execute_next(...)` - returns steps which predecessors
+        are all completed (see `mark_step_as_completed(...)`) and were not returned before. Contrary to
+        execution in groups, step is ready as soon as its own dependencies are done, regardless of
+        other steps from the same topological generation.
+
+        Ready steps are returned starting from the ones at the head of the longest chain of steps
+        still to be executed (critical path) - when only `limit` steps can be started, delaying those
+        would delay the whole workflow. Steps above `limit` stay in the queue.
+        """
+        if self.__steps_flow_graph is None:
+            self._initialise_dataflow_state()
+        if limit is None:
+            limit = len(self.__ready_steps)
+        ready_steps = []
+        while self.__ready_steps and len(ready_steps) < limit:
+            _, step = heapq.heappop(self.__ready_steps)
+            ready_steps.append(step)
+        return ready_steps
+
+    def mark_step_as_completed(self, step_selector: str) -> None:
+        if self.__steps_flow_graph is None:
+            self._initialise_dataflow_state()
+        self.__not_completed_steps -= 1
+        for successor in self.__steps_flow_graph.successors(step_selector):
+            self.__pending_predecessors[successor] -= 1
+            if self.__pending_predecessors[successor] == 0:
+                self._push_ready_step(step=successor)
+
+    def all_steps_completed(self) -> bool:
+        if self.__steps_flow_graph is None:
+            self._initialise_dataflow_state()
+        return self.__not_completed_steps == 0
+
+    def get_critical_path_length(self, step_selector: str) -> int:
+        if self.__steps_flow_graph is None:
+            self._initialise_dataflow_state()
+        return self.__critical_path_lengths[step_selector]
+
+    def _initialise_dataflow_state(self) -> None:
+        super_start_node = "<start>"
+        steps_flow_graph = construct_steps_flow_graph(
+            execution_graph=self._execution_graph,
+            super_start_node=super_start_node,
+        )
+        steps_flow_graph.remove_node(super_start_node)
+        self.__steps_flow_graph = steps_flow_graph
+        self.__critical_path_lengths = assign_critical_path_lengths(
+            steps_flow_graph=steps_flow_graph
+        )
+        self.__pending_predecessors = {
+            step: steps_flow_graph.in_degree(step) for step in steps_flow_graph.nodes
+        }
+        self.__not_completed_steps = len(self.__pending_predecessors)
+        self.__ready_steps = []
+        for step, pending_predecessors in self.__pending_predecessors.items():
+            if pending_predecessors == 0:
+                self._push_ready_step(step=step)
+
+    def _push_ready_step(self, step: str) -> None:
+        heapq.heappush(self.__ready_steps, (-self.__critical_path_lengths[step], step))
+
+
+def assign_critical_path_lengths(steps_flow_graph: nx.DiGraph) -> Dict[str, int]:
+    """Number of steps in the longest chain starting from given step (including the step)."""
+    critical_path_lengths = {}
+    for step in reversed(list(nx.topological_sort(steps_flow_graph))):
+        critical_path_lengths[step] = 1 + max(
+            (
+                critical_path_lengths[successor]
+                for successor in steps_flow_graph.successors(step)
+            ),
+            default=0,
+        )
+    return critical_path_lengths
+
 
 def establish_execution_order(
     execution_graph: nx.DiGraph,
@@ -1,6 +1,10 @@
+import asyncio
 import concurrent
+import inspect
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, List, TypeVar
+from typing import Any, Callable, Dict, List, TypeVar
+
+from inference.core.workflows.prototypes.block import WorkflowBlock
 
 T = TypeVar("T")
 
@@ -14,3 +18,16 @@ def run_steps_in_parallel(
 
 def _run(fun: Callable[[], T]) -> T:
     return fun()
+
+
+def is_async_block(step_instance: WorkflowBlock) -> bool:
+    return inspect.iscoroutinefunction(step_instance.run)
+
+
+def run_block(step_instance: WorkflowBlock, parameters: Dict[str, Any]) -> Any:
+    result = step_instance.run(**parameters)
+    if inspect.iscoroutine(result):
+        # block exposing `async def run(...)` executed in synchronous mode - steps are
+        # executed in worker threads, so there is no running event loop to collide with
+        return asyncio.run(result)
+    return result
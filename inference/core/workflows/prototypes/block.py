@@ -82,6 +82,10 @@ class WorkflowBlock(ABC):
     def get_init_parameters(cls) -> List[str]:
         return []
 
+    @classmethod
+    def is_stateful(cls) -> bool:
+        return False
+
     @classmethod
     @abstractmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
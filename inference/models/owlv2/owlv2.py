@@ -11,6 +11,7 @@ import torchvision
 from transformers import Owlv2ForObjectDetection, Owlv2Processor
 from transformers.models.owlv2.modeling_owlv2 import box_iou
 
+from inference.core.cache.embeddings import EmbeddingsCache
 from inference.core.entities.responses.inference import (
     InferenceResponseImage,
     ObjectDetectionInferenceResponse,
@@ -52,25 +53,6 @@ def to_corners(box):
     return torch.stack([x1, y1, x2, y2], dim=-1)
 
 
-from collections import OrderedDict
-
-
-class LimitedSizeDict(OrderedDict):
-    def __init__(self, *args, **kwds):
-        self.size_limit = kwds.pop("size_limit", None)
-        OrderedDict.__init__(self, *args, **kwds)
-        self._check_size_limit()
-
-    def __setitem__(self, key, value):
-        OrderedDict.__setitem__(self, key, value)
-        self._check_size_limit()
-
-    def _check_size_limit(self):
-        if self.size_limit is not None:
-            while len(self) > self.size_limit:
-                self.popitem(last=False)
-
-
 def preprocess_image(
     np_image: np.ndarray,
     image_size: Tuple[int, int],
@@ -287,11 +269,15 @@ class OwlV2(RoboflowCoreModel):
 
     def reset_cache(self):
         # each entry should be on the order of 300*4KB, so 1000 is 400MB of CUDA memory
-        self.image_embed_cache = LimitedSizeDict(size_limit=OWLV2_IMAGE_CACHE_SIZE)
+        self.image_embed_cache = EmbeddingsCache.init_from_env(
+            max_entries=OWLV2_IMAGE_CACHE_SIZE, name=f"{self.endpoint}/images"
+        )
         # each entry should be on the order of 10 bytes, so 1000 is 10KB
-        self.image_size_cache = LimitedSizeDict(size_limit=OWLV2_IMAGE_CACHE_SIZE)
+        self.image_size_cache = EmbeddingsCache(max_entries=OWLV2_IMAGE_CACHE_SIZE)
         # entry size will vary depending on the number of samples, but 10 should be safe
-        self.class_embeddings_cache = LimitedSizeDict(size_limit=OWLV2_MODEL_CACHE_SIZE)
+        self.class_embeddings_cache = EmbeddingsCache.init_from_env(
+            max_entries=OWLV2_MODEL_CACHE_SIZE, name=f"{self.endpoint}/classes"
+        )
 
     def draw_predictions(
         self,
@@ -10,6 +10,7 @@ import torch
 from segment_anything import SamPredictor, sam_model_registry
 from shapely.geometry import Polygon as ShapelyPolygon
 
+from inference.core.cache.embeddings import EmbeddingsCache, compute_content_hash
 from inference.core.entities.requests.inference import InferenceRequestImage
 from inference.core.entities.requests.sam import (
     SamEmbeddingRequest,
@@ -33,9 +34,7 @@ class SegmentAnything(RoboflowCoreModel):
         sam: The segmentation model.
         predictor: The predictor for the segmentation model.
         ort_session: ONNX runtime inference session.
-        embedding_cache: Cache for embeddings.
-        image_size_cache: Cache for image sizes.
-        embedding_cache_keys: Keys for the embedding cache.
+        embedding_cache: Cache for embeddings (together with sizes of embedded images).
         low_res_logits_cache: Cache for low resolution logits.
         segmentation_cache_keys: Keys for the segmentation cache.
     """
@@ -61,9 +60,9 @@ class SegmentAnything(RoboflowCoreModel):
                 "CPUExecutionProvider",
             ],
         )
-        self.embedding_cache = {}
-        self.image_size_cache = {}
-        self.embedding_cache_keys = []
+        self.embedding_cache = EmbeddingsCache.init_from_env(
+            max_entries=SAM_MAX_EMBEDDING_CACHE_SIZE, name=self.endpoint
+        )
 
         self.low_res_logits_cache = {}
         self.segmentation_cache_keys = []
@@ -79,13 +78,13 @@ class SegmentAnything(RoboflowCoreModel):
 
     def embed_image(self, image: Any, image_id: Optional[str] = None, **kwargs):
         """
-        Embeds an image and caches the result if an image_id is provided. If the image has been embedded before and cached,
+        Embeds an image and caches the result. If the image has been embedded before and cached,
         the cached result will be returned.
 
         Args:
             image (Any): The image to be embedded. The format should be compatible with the preproc_image method.
             image_id (Optional[str]): An identifier for the image. If provided, the embedding result will be cached
-                                      with this ID. Defaults to None.
+                                      with this ID, otherwise hash of image content is used. Defaults to None.
             **kwargs: Additional keyword arguments.
 
         Returns:
@@ -95,29 +94,23 @@ class SegmentAnything(RoboflowCoreModel):
         Notes:
             - Embeddings and image sizes are cached to improve performance on repeated requests for the same image.
             - The cache has a maximum size defined by SAM_MAX_EMBEDDING_CACHE_SIZE. When the cache exceeds this size,
-              the oldest entries are removed.
+              the least recently used entries are removed.
 
         Example:
             >>> img_array = ... # some image array
             >>> embed_image(img_array, image_id="sample123")
             (array([...]), (224, 224))
         """
-        if image_id and image_id in self.embedding_cache:
-            return (
-                self.embedding_cache[image_id],
-                self.image_size_cache[image_id],
-            )
+        if image_id and (cached := self.embedding_cache.get(image_id)) is not None:
+            return cached
         img_in = self.preproc_image(image)
+        if not image_id:
+            image_id = compute_content_hash(img_in)
+            if (cached := self.embedding_cache.get(image_id)) is not None:
+                return cached
         self.predictor.set_image(img_in)
         embedding = self.predictor.get_image_embedding().cpu().numpy()
-        if image_id:
-            self.embedding_cache[image_id] = embedding
-            self.image_size_cache[image_id] = img_in.shape[:2]
-            self.embedding_cache_keys.append(image_id)
-            if len(self.embedding_cache_keys) > SAM_MAX_EMBEDDING_CACHE_SIZE:
-                cache_key = self.embedding_cache_keys.pop(0)
-                del self.embedding_cache[cache_key]
-                del self.image_size_cache[cache_key]
+        self.embedding_cache[image_id] = (embedding, img_in.shape[:2])
         return (embedding, img_in.shape[:2])
 
     def infer_from_request(self, request: SamInferenceRequest):
@@ -226,7 +219,7 @@ class SegmentAnything(RoboflowCoreModel):
             - Embeddings, segmentations, and low-resolution logits can be cached to improve performance
               on repeated requests for the same image.
             - The cache has a maximum size defined by SAM_MAX_EMBEDDING_CACHE_SIZE. When the cache exceeds this size,
-              the oldest entries are removed.
+              the least recently used entries are removed.
         """
         if not embeddings:
             if not image and not image_id:
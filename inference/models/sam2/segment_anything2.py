@@ -1,5 +1,4 @@
 import copy
-import hashlib
 from io import BytesIO
 from time import perf_counter
 from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
@@ -16,6 +15,7 @@ sam2.utils.misc.get_sdp_backends = lambda z: [
 from sam2.build_sam import build_sam2
 from sam2.sam2_image_predictor import SAM2ImagePredictor
 
+from inference.core.cache.embeddings import EmbeddingsCache, compute_content_hash
 from inference.core.entities.requests.inference import InferenceRequestImage
 from inference.core.entities.requests.sam2 import (
     Sam2EmbeddingRequest,
@@ -56,9 +56,7 @@ class SegmentAnything2(RoboflowCoreModel):
         sam: The segmentation model.
         predictor: The predictor for the segmentation model.
         ort_session: ONNX runtime inference session.
-        embedding_cache: Cache for embeddings.
-        image_size_cache: Cache for image sizes.
-        embedding_cache_keys: Keys for the embedding cache.
+        embedding_cache: Cache for embeddings (together with sizes of embedded images).
 
     """
 
@@ -91,9 +89,9 @@ class SegmentAnything2(RoboflowCoreModel):
 
         self.predictor = SAM2ImagePredictor(self.sam)
 
-        self.embedding_cache = {}
-        self.image_size_cache = {}
-        self.embedding_cache_keys = []
+        self.embedding_cache = EmbeddingsCache.init_from_env(
+            max_entries=embedding_cache_size, name=self.endpoint
+        )
         self.low_res_logits_cache: Dict[Tuple[str, str], LogitsCacheType] = {}
         self.low_res_logits_cache_keys = []
 
@@ -129,45 +127,29 @@ class SegmentAnything2(RoboflowCoreModel):
 
         Notes:
             - Embeddings and image sizes are cached to improve performance on repeated requests for the same image.
-            - The cache has a maximum size defined by SAM2_MAX_CACHE_SIZE. When the cache exceeds this size,
-              the oldest entries are removed.
+            - The cache has a maximum size defined by SAM2_MAX_EMBEDDING_CACHE_SIZE. When the cache exceeds this size,
+              the least recently used entries are removed.
 
         Example:
             >>> img_array = ... # some image array
             >>> embed_image(img_array, image_id="sample123")
             (array([...]), (224, 224))
         """
-        if image_id and image_id in self.embedding_cache:
-            return (
-                self.embedding_cache[image_id],
-                self.image_size_cache[image_id],
-                image_id,
-            )
+        if image_id and (cached := self.embedding_cache.get(image_id)) is not None:
+            return (*cached, image_id)
 
         img_in = self.preproc_image(image)
         if image_id is None:
-            image_id = hashlib.md5(img_in.tobytes()).hexdigest()[:12]
+            image_id = compute_content_hash(img_in)[:12]
 
-        if image_id in self.embedding_cache:
-            return (
-                self.embedding_cache[image_id],
-                self.image_size_cache[image_id],
-                image_id,
-            )
+        if (cached := self.embedding_cache.get(image_id)) is not None:
+            return (*cached, image_id)
 
         with torch.inference_mode():
             self.predictor.set_image(img_in)
             embedding_dict = self.predictor._features
 
-        self.embedding_cache[image_id] = embedding_dict
-        self.image_size_cache[image_id] = img_in.shape[:2]
-        if image_id in self.embedding_cache_keys:
-            self.embedding_cache_keys.remove(image_id)
-        self.embedding_cache_keys.append(image_id)
-        if len(self.embedding_cache_keys) > self.embedding_cache_size:
-            cache_key = self.embedding_cache_keys.pop(0)
-            del self.embedding_cache[cache_key]
-            del self.image_size_cache[cache_key]
+        self.embedding_cache[image_id] = (embedding_dict, img_in.shape[:2])
         return (embedding_dict, img_in.shape[:2], image_id)
 
     def infer_from_request(self, request: Sam2InferenceRequest):
@@ -341,9 +323,7 @@ class SegmentAnything2(RoboflowCoreModel):
 
 def hash_prompt_set(image_id: str, prompt_set: Sam2PromptSet) -> Tuple[str, str]:
     """Computes unique hash from a prompt set."""
-    md5_hash = hashlib.md5()
-    md5_hash.update(str(prompt_set).encode("utf-8"))
-    return image_id, md5_hash.hexdigest()[:12]
+    return image_id, compute_content_hash(str(prompt_set))[:12]
 
 
 def maybe_load_low_res_logits_from_cache(
@@ -23,7 +23,7 @@ from PIL import Image
 from inference.core.cache.model_artifacts import (
     get_cache_dir,
     get_cache_file_path,
-    save_bytes_in_cache,
+    model_cache_download_lock,
 )
 from inference.core.entities.requests.inference import LMMInferenceRequest
 from inference.core.entities.responses.inference import (
@@ -34,10 +34,13 @@ from inference.core.env import API_KEY, DEVICE, MODEL_CACHE_DIR
 from inference.core.exceptions import ModelArtefactError
 from inference.core.logger import logger
 from inference.core.models.base import PreprocessReturnMetadata
-from inference.core.models.roboflow import RoboflowInferenceModel
+from inference.core.models.roboflow import (
+    PARTIAL_DOWNLOAD_SUFFIX,
+    RoboflowInferenceModel,
+    download_artefact_into_cache,
+)
 from inference.core.roboflow_api import (
     ModelEndpointType,
-    get_from_url,
     get_roboflow_base_lora,
     get_roboflow_model_data,
 )
@@ -175,11 +178,8 @@ class TransformerModel(RoboflowInferenceModel):
             filename = weights_url.split("?")[0].split("/")[-1]
             if filename.endswith(".npz"):
                 continue
-            model_weights_response = get_from_url(weights_url, json_response=False)
-            save_bytes_in_cache(
-                content=model_weights_response.content,
-                file=filename,
-                model_id=self.endpoint,
+            download_artefact_into_cache(
+                url=weights_url, file=filename, model_id=self.endpoint
             )
             if filename.endswith("tar.gz"):
                 try:
@@ -259,26 +259,29 @@ class LoRATransformerModel(TransformerModel):
     def get_lora_base_from_roboflow(self, repo, revision) -> str:
         base_dir = os.path.join("lora-bases", repo, revision)
         cache_dir = get_cache_dir(base_dir)
-        if os.path.exists(cache_dir):
+        if is_lora_base_cached(cache_dir=cache_dir):
             return cache_dir
-        api_data = get_roboflow_base_lora(self.api_key, repo, revision, self.device_id)
-        if "weights" not in api_data:
-            raise ModelArtefactError(
-                f"`weights` key not available in Roboflow API response while downloading model weights."
+        with model_cache_download_lock(model_id=base_dir):
+            # base could be downloaded by other process while waiting for the lock
+            if is_lora_base_cached(cache_dir=cache_dir):
+                return cache_dir
+            api_data = get_roboflow_base_lora(
+                self.api_key, repo, revision, self.device_id
             )
+            if "weights" not in api_data:
+                raise ModelArtefactError(
+                    f"`weights` key not available in Roboflow API response while downloading model weights."
+                )
 
-        weights_url = api_data["weights"]["model"]
-        model_weights_response = get_from_url(weights_url, json_response=False)
-        filename = weights_url.split("?")[0].split("/")[-1]
-        assert filename.endswith("tar.gz")
-        save_bytes_in_cache(
-            content=model_weights_response.content,
-            file=filename,
-            model_id=base_dir,
-        )
-        tar_file_path = get_cache_file_path(filename, base_dir)
-        with tarfile.open(tar_file_path, "r:gz") as tar:
-            tar.extractall(path=cache_dir)
+            weights_url = api_data["weights"]["model"]
+            filename = weights_url.split("?")[0].split("/")[-1]
+            assert filename.endswith("tar.gz")
+            download_artefact_into_cache(
+                url=weights_url, file=filename, model_id=base_dir
+            )
+            tar_file_path = get_cache_file_path(filename, base_dir)
+            with tarfile.open(tar_file_path, "r:gz") as tar:
+                tar.extractall(path=cache_dir)
 
         return cache_dir
 
@@ -296,3 +299,11 @@ class LoRATransformerModel(TransformerModel):
             "preprocessor_config.json",
             "tokenizer_config.json",
         ]
+
+
+def is_lora_base_cached(cache_dir: str) -> bool:
+    # directory holding only partial download (or not extracted archive) is left by interrupted attempt
+    return os.path.isdir(cache_dir) and any(
+        not f.endswith(PARTIAL_DOWNLOAD_SUFFIX) and not f.endswith(".tar.gz")
+        for f in os.listdir(cache_dir)
+    )
@@ -122,7 +122,7 @@ class YOLACT(OnnxRoboflowInferenceModel):
     def predict(
         self, img_in: np.ndarray, **kwargs
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-        return self.onnx_session.run(None, {self.input_name: img_in})
+        return self.run_onnx_session(img_in)
 
     def postprocess(
         self,
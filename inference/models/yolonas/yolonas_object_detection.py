@@ -28,7 +28,7 @@ class YOLONASObjectDetection(ObjectDetectionBaseOnnxRoboflowInferenceModel):
         Returns:
             Tuple[np.ndarray]: NumPy array representing the predictions, including boxes, confidence scores, and class confidence scores.
         """
-        predictions = self.onnx_session.run(None, {self.input_name: img_in})
+        predictions = self.run_onnx_session(img_in)
         boxes = predictions[0]
         class_confs = predictions[1]
         confs = np.expand_dims(np.max(class_confs, axis=2), axis=2)
@@ -26,7 +26,7 @@ class YOLOv7InstanceSegmentation(InstanceSegmentationBaseOnnxRoboflowInferenceMo
         Returns:
             Tuple[np.ndarray, np.ndarray]: Tuple containing two NumPy arrays representing the predictions and protos.
         """
-        predictions = self.onnx_session.run(None, {self.input_name: img_in})
+        predictions = self.run_onnx_session(img_in)
         protos = predictions[4]
         predictions = predictions[0]
         return predictions, protos
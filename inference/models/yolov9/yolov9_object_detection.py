@@ -36,7 +36,7 @@ class YOLOv9ObjectDetection(ObjectDetectionBaseOnnxRoboflowInferenceModel):
             Tuple[np.ndarray]: NumPy array representing the predictions.
         """
         # (b x 8 x 8000)
-        predictions = self.onnx_session.run(None, {self.input_name: img_in})[0]
+        predictions = self.run_onnx_session(img_in)[0]
         predictions = predictions.transpose(0, 2, 1)
         boxes = predictions[:, :, :4]
         class_confs = predictions[:, :, 4:]
@@ -1,5 +1,5 @@
 import json
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from typing_extensions import Annotated
@@ -7,6 +7,7 @@ from typing_extensions import Annotated
 from inference_cli.lib.benchmark.dataset import PREDEFINED_DATASETS
 from inference_cli.lib.benchmark_adapter import (
     run_infer_api_speed_benchmark,
+    run_model_load_time_benchmark,
     run_python_package_speed_benchmark,
     run_workflow_api_speed_benchmark,
 )
@@ -259,5 +260,56 @@ def python_package_speed(
         raise typer.Exit(code=1)
 
 
+@benchmark_app.command()
+def model_load_time(
+    model_ids: Annotated[
+        List[str],
+        typer.Option(
+            "--model_id",
+            "-m",
+            help="Model ID in format project/version. Option can be given multiple times.",
+        ),
+    ],
+    loads_per_model: Annotated[
+        int,
+        typer.Option(
+            "--loads_per_model",
+            "-l",
+            help="Number of times each model is loaded - first load may include download of "
+            "model artefacts and preparation of cached optimized weights",
+        ),
+    ] = 2,
+    api_key: Annotated[
+        Optional[str],
+        typer.Option(
+            "--api-key",
+            "-a",
+            help="Roboflow API key for your workspace. If not given - env variable `ROBOFLOW_API_KEY` will be used",
+        ),
+    ] = None,
+    output_location: Annotated[
+        Optional[str],
+        typer.Option(
+            "--output_location",
+            "-o",
+            help="Location where to save the result (path to file or directory)",
+        ),
+    ] = None,
+):
+    try:
+        run_model_load_time_benchmark(
+            model_ids=model_ids,
+            loads_per_model=loads_per_model,
+            api_key=api_key,
+            output_location=output_location,
+        )
+    except KeyboardInterrupt:
+        print("Benchmark interrupted.")
+        return
+    except Exception as error:
+        typer.echo(f"Command failed. Cause: {error}")
+        raise typer.Exit(code=1)
+
+
 if __name__ == "__main__":
     benchmark_app()
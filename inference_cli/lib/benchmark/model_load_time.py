@@ -0,0 +1,44 @@
+import time
+from typing import Dict, List, Optional
+
+from inference_cli.lib.exceptions import InferencePackageMissingError
+
+try:
+    from inference import get_model
+except Exception as error:
+    raise InferencePackageMissingError(
+        "You need to install `inference` package to use this feature. Run `pip install inference`"
+    ) from error
+
+
+def run_model_load_time_benchmark(
+    model_ids: List[str],
+    loads_per_model: int = 1,
+    api_key: Optional[str] = None,
+) -> List[Dict[str, float]]:
+    results = []
+    for model_id in model_ids:
+        for load_id in range(loads_per_model):
+            start = time.perf_counter()
+            model = get_model(model_id=model_id, api_key=api_key)
+            total = time.perf_counter() - start
+            load_time_breakdown = getattr(model, "load_time_breakdown", {})
+            result = {
+                "model_id": model_id,
+                "load_id": load_id,
+                "total": total,
+                **load_time_breakdown,
+            }
+            print(format_load_time(result=result))
+            results.append(result)
+            del model
+    return results
+
+
+def format_load_time(result: dict) -> str:
+    breakdown = " | ".join(
+        f"{key}={value * 1000:.1f}ms"
+        for key, value in result.items()
+        if key not in {"model_id", "load_id"}
+    )
+    return f"{result['model_id']} (load #{result['load_id'] + 1}) | {breakdown}"
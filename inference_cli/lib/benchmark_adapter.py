@@ -2,7 +2,7 @@ import os.path
 from dataclasses import asdict
 from datetime import datetime
 from threading import Thread
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from inference_cli.lib.benchmark.api_speed import (
     coordinate_infer_api_speed_benchmark,
@@ -193,6 +193,43 @@ def run_python_package_speed_benchmark(
     )
 
 
+def run_model_load_time_benchmark(
+    model_ids: List[str],
+    loads_per_model: int = 1,
+    api_key: Optional[str] = None,
+    output_location: Optional[str] = None,
+) -> None:
+    # importing here not to affect other entrypoints by missing `inference` core library
+    from inference_cli.lib.benchmark.model_load_time import (
+        run_model_load_time_benchmark,
+    )
+
+    results = run_model_load_time_benchmark(
+        model_ids=model_ids,
+        loads_per_model=loads_per_model,
+        api_key=api_key,
+    )
+    if output_location is None:
+        return None
+    if os.path.isdir(output_location):
+        target_path = os.path.join(
+            output_location, f"{datetime.now().isoformat()}.json"
+        )
+    else:
+        target_path = output_location
+    print(f"Saving load times under: {target_path}")
+    content = {
+        "benchmark_parameters": {
+            "datetime": datetime.now().isoformat(),
+            "model_ids": model_ids,
+            "loads_per_model": loads_per_model,
+        },
+        "benchmark_results": results,
+        "platform": retrieve_platform_specifics(),
+    }
+    dump_json(path=target_path, content=content)
+
+
 def dump_benchmark_results(
     output_location: str,
     benchmark_parameters: dict,
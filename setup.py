@@ -62,6 +62,8 @@ setuptools.setup(
     ),
     extras_require={
         "sam": read_requirements("requirements/requirements.sam.txt"),
+        "pyav": read_requirements("requirements/requirements.pyav.txt"),
+        "onnx": read_requirements("requirements/requirements.onnx.txt"),
     },
     classifiers=[
         "Programming Language :: Python :: 3",
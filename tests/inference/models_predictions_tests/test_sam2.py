@@ -259,3 +259,39 @@ def test_model_clears_cache_properly(sam2_small_model, truck_image):
         assert masks is not None
         assert scores is not None
         assert low_res_logits is not None
+
+
+def test_sam2_low_res_logits_cache_add_and_lookup_without_model_weights() -> None:
+    # given
+    model = object.__new__(SegmentAnything2)
+    model.low_res_logits_cache = {}
+    model.low_res_logits_cache_keys = []
+    model.low_res_logits_cache_size = 2
+    prompt = Sam2PromptSet(
+        prompts=[{"points": [{"x": 1235, "y": 530, "positive": True}]}]
+    )
+    extended_prompt = Sam2PromptSet(
+        prompts=[
+            {
+                "points": [
+                    {"x": 1235, "y": 530, "positive": True},
+                    {"x": 10, "y": 500, "positive": False},
+                ]
+            }
+        ]
+    )
+    logits = np.ones((1, 256, 256), dtype=np.float32)
+
+    # when
+    model.add_low_res_logits_to_cache(logits, "truck", prompt)
+    model.add_low_res_logits_to_cache(logits, "truck", prompt)
+    result = maybe_load_low_res_logits_from_cache(
+        "truck", extended_prompt, model.low_res_logits_cache
+    )
+
+    # then
+    assert hash_prompt_set("truck", prompt) == hash_prompt_set("truck", prompt)
+    assert hash_prompt_set("truck", prompt) != hash_prompt_set("truck", extended_prompt)
+    assert list(model.low_res_logits_cache) == [hash_prompt_set("truck", prompt)]
+    assert model.low_res_logits_cache_keys == [hash_prompt_set("truck", prompt)]
+    assert result.shape == (1, 1, 256, 256)
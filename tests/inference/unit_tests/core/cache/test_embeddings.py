@@ -0,0 +1,157 @@
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from inference.core.cache.embeddings import EmbeddingsCache, compute_content_hash
+
+
+def test_embeddings_cache_evicts_least_recently_used_entry() -> None:
+    # given
+    cache = EmbeddingsCache(max_entries=2)
+    cache["a"] = np.zeros((2,))
+    cache["b"] = np.ones((2,))
+
+    # when
+    _ = cache["a"]
+    cache["c"] = np.ones((3,))
+
+    # then
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.evictions == 1
+
+
+def test_embeddings_cache_respects_memory_budget() -> None:
+    # given
+    cache = EmbeddingsCache(max_memory=100)
+
+    # when
+    cache["a"] = np.zeros((10,), dtype=np.float32)
+    cache["b"] = np.zeros((10,), dtype=np.float32)
+    cache["c"] = np.zeros((10,), dtype=np.float32)
+
+    # then
+    assert cache.keys() == ["b", "c"]
+    assert cache.used_memory == 80
+
+
+def test_embeddings_cache_keeps_entry_exceeding_memory_budget_if_it_is_the_only_one() -> (
+    None
+):
+    # given
+    cache = EmbeddingsCache(max_memory=10)
+
+    # when
+    cache["a"] = np.zeros((10,), dtype=np.float32)
+    cache["b"] = np.zeros((100,), dtype=np.float32)
+
+    # then
+    assert cache.keys() == ["b"]
+
+
+def test_embeddings_cache_counts_hits_and_misses() -> None:
+    # given
+    cache = EmbeddingsCache(max_entries=2)
+    cache["a"] = np.zeros((2,))
+
+    # when
+    _ = cache.get("a")
+    _ = cache.get("b")
+    with pytest.raises(KeyError):
+        _ = cache["c"]
+
+    # then
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 2
+
+
+def test_embeddings_cache_stores_floats_in_fp16_and_restores_original_dtype() -> None:
+    # given
+    cache = EmbeddingsCache(store_in_fp16=True)
+    embedding = np.array([0.5, 0.25], dtype=np.float32)
+
+    # when
+    cache["a"] = {"embedding": embedding, "size": (10, 20)}
+    result = cache["a"]
+
+    # then
+    assert cache.used_memory == 4
+    assert result["embedding"].dtype == np.float32
+    assert np.allclose(result["embedding"], embedding)
+    assert result["size"] == (10, 20)
+
+
+def test_embeddings_cache_spills_evicted_entries_to_disk_and_promotes_them_on_hit(
+    empty_local_dir: str,
+) -> None:
+    # given
+    cache = EmbeddingsCache(max_entries=1, spill_dir=empty_local_dir)
+    cache["a"] = (np.arange(4, dtype=np.float32), (2, 2))
+
+    # when
+    cache["b"] = (np.ones((4,), dtype=np.float32), (2, 2))
+    spilled_files = os.listdir(cache.spill_dir)
+    result = cache["a"]
+
+    # then
+    assert len(spilled_files) == 1
+    assert np.allclose(result[0], np.arange(4))
+    assert result[1] == (2, 2)
+    assert cache.get_stats()["spilled_hits"] == 1
+    assert cache.get_stats()["spilled_entries"] == 1, "b should be spilled instead"
+    assert len(cache) == 2
+
+
+def test_embeddings_cache_drops_spilled_entries_above_disk_budget(
+    empty_local_dir: str,
+) -> None:
+    # given
+    cache = EmbeddingsCache(max_entries=1, spill_dir=empty_local_dir, spill_max_size=20)
+
+    # when
+    for key in ["a", "b", "c"]:
+        cache[key] = np.zeros((4,), dtype=np.float32)
+
+    # then
+    assert "a" not in cache
+    assert "b" in cache
+    assert "c" in cache
+    assert len(os.listdir(cache.spill_dir)) == 1
+
+
+def test_embeddings_cache_is_thread_safe() -> None:
+    # given
+    cache = EmbeddingsCache(max_entries=10)
+
+    def write(thread_id: int) -> None:
+        for i in range(200):
+            cache[f"{thread_id}-{i}"] = np.zeros((2,))
+            _ = cache.get(f"{thread_id}-{i - 1}")
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+
+    # when
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # then
+    assert len(cache) == 10
+    assert cache.used_memory == 10 * 16
+
+
+def test_compute_content_hash_takes_shape_into_account() -> None:
+    # given
+    image = np.zeros((4, 6), dtype=np.uint8)
+
+    # when
+    result = compute_content_hash(image)
+
+    # then
+    assert result == compute_content_hash(image.copy())
+    assert result != compute_content_hash(image.reshape((6, 4)))
+    assert compute_content_hash("text") == compute_content_hash(b"text")
@@ -1,5 +1,8 @@
+import hashlib
 import json
 import os.path
+import threading
+import time
 from unittest import mock
 from unittest.mock import MagicMock, call
 
@@ -9,13 +12,18 @@ from inference.core.cache import model_artifacts
 from inference.core.cache.model_artifacts import (
     are_all_files_cached,
     clear_cache,
+    garbage_collect_cache,
     get_cache_dir,
     get_cache_file_path,
+    get_cache_size,
     initialise_cache,
     is_file_cached,
     load_json_from_cache,
+    load_manifest,
     load_text_file_from_cache,
+    model_cache_download_lock,
     save_bytes_in_cache,
+    save_file_in_cache,
     save_json_in_cache,
     save_text_lines_in_cache,
 )
@@ -314,3 +322,154 @@ def test_clear_cache_when_nothing_to_delete(
     get_cache_dir_mock.assert_called_once_with(model_id="some/2")
     assert os.listdir(empty_local_dir) == ["some"]
     assert os.listdir(os.path.join(empty_local_dir, "some")) == ["1"]
+
+
+@mock.patch.object(model_artifacts, "ENABLE_MODEL_CACHE_DEDUPLICATION", True)
+def test_save_bytes_in_cache_when_deduplication_enabled(empty_local_dir: str) -> None:
+    # given
+    content = b"SOME WEIGHTS"
+    digest = hashlib.sha256(content).hexdigest()
+
+    # when
+    with mock.patch.object(model_artifacts, "MODEL_CACHE_DIR", empty_local_dir):
+        save_bytes_in_cache(content=content, file="weights.onnx", model_id="some/1")
+        save_bytes_in_cache(content=content, file="weights.onnx", model_id="some/2")
+        save_bytes_in_cache(content=b"OTHER", file="weights.onnx", model_id="some/2")
+        save_bytes_in_cache(content=content, file="weights.onnx", model_id="some/3")
+        manifest = load_manifest(model_id="some/3")
+
+    # then
+    first_path = os.path.join(empty_local_dir, "some", "1", "weights.onnx")
+    third_path = os.path.join(empty_local_dir, "some", "3", "weights.onnx")
+    blob_path = os.path.join(empty_local_dir, "_blobs", digest[:2], digest)
+    assert_bytes_file_content_correct(file_path=first_path, content=content)
+    assert_bytes_file_content_correct(
+        file_path=os.path.join(empty_local_dir, "some", "2", "weights.onnx"),
+        content=b"OTHER",
+    )
+    assert os.path.samefile(first_path, blob_path)
+    assert os.path.samefile(third_path, blob_path)
+    assert os.stat(blob_path).st_nlink == 3
+    assert manifest == {"weights.onnx": {"sha256": digest, "size": len(content)}}
+
+
+@mock.patch.object(model_artifacts, "ENABLE_MODEL_CACHE_DEDUPLICATION", False)
+def test_save_file_in_cache(empty_local_dir: str) -> None:
+    # given
+    content = b"SOME WEIGHTS"
+    source_path = os.path.join(empty_local_dir, "weights.onnx.partial")
+    with open(source_path, "wb") as f:
+        f.write(content)
+
+    # when
+    with mock.patch.object(model_artifacts, "MODEL_CACHE_DIR", empty_local_dir):
+        save_file_in_cache(
+            source_path=source_path, file="weights.onnx", model_id="some/1"
+        )
+        manifest = load_manifest(model_id="some/1")
+
+    # then
+    assert not os.path.exists(source_path), "Source file is expected to be moved"
+    assert_bytes_file_content_correct(
+        file_path=os.path.join(empty_local_dir, "some", "1", "weights.onnx"),
+        content=content,
+    )
+    assert manifest == {
+        "weights.onnx": {
+            "sha256": hashlib.sha256(content).hexdigest(),
+            "size": len(content),
+        }
+    }
+
+
+@mock.patch.object(model_artifacts, "ENABLE_MODEL_CACHE_DEDUPLICATION", True)
+def test_save_file_in_cache_when_deduplication_enabled(empty_local_dir: str) -> None:
+    # given
+    content = b"SOME WEIGHTS"
+    digest = hashlib.sha256(content).hexdigest()
+    for model_id in ["some/1", "some/2"]:
+        with open(os.path.join(empty_local_dir, f"{model_id[-1]}.partial"), "wb") as f:
+            f.write(content)
+
+    # when
+    with mock.patch.object(model_artifacts, "MODEL_CACHE_DIR", empty_local_dir):
+        for model_id in ["some/1", "some/2"]:
+            save_file_in_cache(
+                source_path=os.path.join(empty_local_dir, f"{model_id[-1]}.partial"),
+                file="weights.onnx",
+                model_id=model_id,
+            )
+
+    # then
+    blob_path = os.path.join(empty_local_dir, "_blobs", digest[:2], digest)
+    for model_id in ["some/1", "some/2"]:
+        cached_path = os.path.join(empty_local_dir, model_id, "weights.onnx")
+        assert os.path.samefile(cached_path, blob_path)
+        assert not os.path.exists(
+            os.path.join(empty_local_dir, f"{model_id[-1]}.partial")
+        )
+    assert os.stat(blob_path).st_nlink == 3
+
+
+def test_garbage_collect_cache_removes_least_recently_used_models(
+    empty_local_dir: str,
+) -> None:
+    # given
+    with mock.patch.object(model_artifacts, "MODEL_CACHE_DIR", empty_local_dir):
+        with mock.patch.object(
+            model_artifacts, "ENABLE_MODEL_CACHE_DEDUPLICATION", True
+        ):
+            save_bytes_in_cache(content=b"A" * 1000, file="w.onnx", model_id="a/1")
+            save_bytes_in_cache(content=b"A" * 1000, file="w.onnx", model_id="a/2")
+            save_bytes_in_cache(content=b"B" * 1000, file="w.onnx", model_id="b/1")
+            save_bytes_in_cache(content=b"C" * 1000, file="w.onnx", model_id="c/1")
+        for model_id, last_usage in [("a/1", 10), ("a/2", 40), ("b/1", 20), ("c/1", 5)]:
+            manifest_path = get_cache_file_path(
+                file=model_artifacts.MANIFEST_FILE, model_id=model_id
+            )
+            os.utime(manifest_path, (last_usage, last_usage))
+        size_before = get_cache_size()
+
+        # when
+        removed = garbage_collect_cache(max_size=2500, protected_model_ids=["c/1"])
+        size_after = get_cache_size()
+
+    # then
+    assert removed == ["a/1", "b/1"]
+    assert size_after < 2500 < size_before
+    assert os.path.isfile(os.path.join(empty_local_dir, "a", "2", "w.onnx"))
+    assert os.path.isfile(os.path.join(empty_local_dir, "c", "1", "w.onnx"))
+    assert not os.path.exists(os.path.join(empty_local_dir, "b", "1"))
+    blobs = [
+        f
+        for _, _, files in os.walk(os.path.join(empty_local_dir, "_blobs"))
+        for f in files
+    ]
+    assert len(blobs) == 2, "Blob of b/1 is not used anymore"
+
+
+def test_model_cache_download_lock_is_exclusive_between_threads(
+    empty_local_dir: str,
+) -> None:
+    # given
+    events = []
+
+    def download(name: str) -> None:
+        with model_cache_download_lock(model_id="some/1"):
+            events.append(f"{name}-start")
+            time.sleep(0.05)
+            events.append(f"{name}-end")
+
+    # when
+    with mock.patch.object(model_artifacts, "MODEL_CACHE_DIR", empty_local_dir):
+        threads = [
+            threading.Thread(target=download, args=(name,)) for name in ["a", "b"]
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    # then
+    assert events[0].split("-")[0] == events[1].split("-")[0]
+    assert events[2].split("-")[0] == events[3].split("-")[0]
@@ -0,0 +1,159 @@
+import json
+import time
+from typing import Generator
+from unittest import mock
+from unittest.mock import MagicMock, call
+
+import numpy as np
+import pytest
+import redis
+
+from inference.core.cache import redis as redis_cache_module
+from inference.core.cache.redis import RedisCache, serialise_value
+
+
+@pytest.fixture
+def redis_client_mock() -> Generator[MagicMock, None, None]:
+    with mock.patch.object(redis_cache_module.redis, "Redis") as redis_class_mock:
+        yield redis_class_mock.return_value
+
+
+def test_zadd_buffered_does_not_call_redis_until_flush(
+    redis_client_mock: MagicMock,
+) -> None:
+    # given
+    cache = RedisCache(flush_interval=1000, flush_batch_size=2)
+    pipeline = redis_client_mock.pipeline.return_value
+
+    # when
+    cache.zadd_buffered("models", value="a", score=1.0)
+    cache.zadd_buffered("inference:1", value={"b": 1}, score=2.0, expire=10)
+    cache.zadd_buffered("inference:1", value={"c": 2}, score=3.0)
+    calls_before_flush = pipeline.zadd.call_count
+    cache.flush()
+
+    # then
+    assert calls_before_flush == 0
+    assert pipeline.zadd.call_args_list == [
+        call("models", {serialise_value("a"): 1.0}),
+        call("inference:1", {serialise_value({"b": 1}): 2.0}),
+        call("inference:1", {serialise_value({"c": 2}): 3.0}),
+    ]
+    assert pipeline.execute.call_count == 2, "Expected batches of 2 writes"
+    redis_client_mock.zadd.assert_not_called()
+    assert [score for _, score in cache.zexpires["inference:1"]] == [2.0]
+    assert cache.get_write_buffer_stats()["flushed_writes"] == 3
+    assert cache.get_write_buffer_stats()["buffered_writes"] == 0
+
+
+def test_zadd_buffered_builds_lazy_value_when_flushing(
+    redis_client_mock: MagicMock,
+) -> None:
+    # given
+    cache = RedisCache(flush_interval=1000)
+    value_factory = MagicMock(return_value={"inference_id": "1"})
+
+    # when
+    cache.zadd_buffered("inference:1", value=value_factory, score=1.0)
+    calls_before_flush = value_factory.call_count
+    cache.flush()
+
+    # then
+    assert calls_before_flush == 0
+    redis_client_mock.pipeline.return_value.zadd.assert_called_once_with(
+        "inference:1", {serialise_value({"inference_id": "1"}): 1.0}
+    )
+
+
+def test_serialise_value_handles_numpy_values() -> None:
+    # when
+    result = serialise_value({"confidence": np.float32(0.5), "box": np.array([1, 2])})
+
+    # then
+    assert json.loads(result) == {"confidence": 0.5, "box": [1, 2]}
+
+
+def test_zadd_buffered_drops_oldest_writes_when_buffer_is_full(
+    redis_client_mock: MagicMock,
+) -> None:
+    # given
+    cache = RedisCache(flush_interval=1000, write_buffer_size=2)
+    pipeline = redis_client_mock.pipeline.return_value
+
+    # when
+    for score in range(3):
+        cache.zadd_buffered("models", value=score, score=score)
+    cache.flush()
+
+    # then
+    assert pipeline.zadd.call_args_list == [
+        call("models", {serialise_value(1): 1}),
+        call("models", {serialise_value(2): 2}),
+    ]
+    assert cache.get_write_buffer_stats()["dropped_writes"] == 1
+
+
+def test_flush_keeps_writes_in_buffer_when_redis_fails(
+    redis_client_mock: MagicMock,
+) -> None:
+    # given
+    cache = RedisCache(flush_interval=1000)
+    pipeline = redis_client_mock.pipeline.return_value
+    pipeline.execute.side_effect = [redis.ConnectionError("Redis down"), None]
+    cache.zadd_buffered("models", value="a", score=1.0)
+
+    # when
+    with pytest.raises(redis.ConnectionError):
+        cache.flush()
+    stats_after_failure = cache.get_write_buffer_stats()
+    cache.flush()
+
+    # then
+    assert stats_after_failure["buffered_writes"] == 1
+    assert stats_after_failure["failed_flushes"] == 1
+    assert pipeline.zadd.call_count == 2
+    assert cache.get_write_buffer_stats()["buffered_writes"] == 0
+
+
+def test_buffered_writes_are_flushed_by_background_thread_when_batch_is_full(
+    redis_client_mock: MagicMock,
+) -> None:
+    # given
+    cache = RedisCache(flush_interval=1000, flush_batch_size=2)
+
+    # when
+    cache.zadd_buffered("models", value="a", score=1.0)
+    cache.zadd_buffered("models", value="b", score=2.0)
+    deadline = time.time() + 5
+    while cache.get_write_buffer_stats()["flushed_writes"] < 2:
+        assert time.time() < deadline, "Buffer was not flushed on time"
+        time.sleep(0.01)
+
+    # then
+    assert redis_client_mock.pipeline.return_value.zadd.call_count == 2
+
+
+def test_remove_expired_members_removes_range_once_per_key(
+    redis_client_mock: MagicMock,
+) -> None:
+    # given
+    cache = RedisCache(flush_interval=1000)
+    pipeline = redis_client_mock.pipeline.return_value
+    with mock.patch.object(redis_cache_module.time, "time", return_value=100.0):
+        cache.zadd("models", value="a", score=1.0, expire=10)
+        cache.zadd("models", value="a", score=2.0, expire=10)
+        cache.zadd("models", value="a", score=50.0, expire=50)
+        cache.zadd("inference:1", value="b", score=3.0, expire=10)
+        cache.zadd("inference:2", value="c", score=4.0)
+
+    # when
+    cache.remove_expired_members(now=120.0)
+
+    # then
+    assert sorted(pipeline.zremrangebyscore.call_args_list) == [
+        call("inference:1", "-inf", 3.0 + 1e-14),
+        call("models", "-inf", 2.0 + 1e-14),
+    ]
+    assert pipeline.execute.call_count == 1
+    assert list(cache.zexpires.keys()) == ["models"]
+    redis_client_mock.zremrangebyscore.assert_not_called()
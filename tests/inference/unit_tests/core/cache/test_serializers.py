@@ -1,11 +1,16 @@
 import os
+from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
+from fastapi.encoders import jsonable_encoder
 
+from inference.core.cache import serializers
 from inference.core.cache.serializers import (
     build_condensed_response,
+    to_buffered_cachable_inference_item,
     to_cachable_inference_item,
+    to_jsonable,
 )
 from inference.core.entities.requests.inference import (
     ClassificationInferenceRequest,
@@ -14,6 +19,7 @@ from inference.core.entities.requests.inference import (
 from inference.core.entities.responses.inference import (
     ClassificationInferenceResponse,
     ClassificationPrediction,
+    InferenceResponseImage,
     InstanceSegmentationInferenceResponse,
     InstanceSegmentationPrediction,
     Keypoint,
@@ -159,6 +165,30 @@ def test_to_cachable_inference_item_with_tiny_cache_object_detection(
     )
 
 
+@mock.patch.object(serializers, "TINY_CACHE", True)
+def test_to_buffered_cachable_inference_item_with_tiny_cache_builds_item_eagerly(
+    mock_object_detection_data,
+):
+    mock_request, mock_response = mock_object_detection_data
+    result = to_buffered_cachable_inference_item(mock_request, mock_response)
+    assert result == to_cachable_inference_item(mock_request, mock_response)
+
+
+@mock.patch.object(serializers, "TINY_CACHE", False)
+def test_to_buffered_cachable_inference_item_no_tiny_cache_defers_response_serialisation(
+    mock_object_detection_data,
+):
+    mock_request, mock_response = mock_object_detection_data
+    expected_result = to_cachable_inference_item(mock_request, mock_response)
+    build_item = to_buffered_cachable_inference_item(mock_request, mock_response)
+    mock_request.id = "changed-after-request"
+    assert callable(build_item)
+    assert build_item() == expected_result
+    assert all(
+        cell.cell_contents is not mock_request for cell in build_item.__closure__
+    ), "Request object should not be retained until item is built"
+
+
 def test_build_condensed_response_no_predictions_object_detection(
     mock_object_detection_data,
 ):
@@ -261,3 +291,39 @@ def test_build_condensed_response_object_detection(mock_object_detection_data):
     assert len(result) == 1
     assert "predictions" in result[0]
     assert "time" in result[0]
+
+
+def test_to_jsonable_gives_results_of_jsonable_encoder() -> None:
+    # given
+    response = InstanceSegmentationInferenceResponse(
+        image=InferenceResponseImage(width=640, height=480),
+        predictions=[
+            InstanceSegmentationPrediction(
+                **{
+                    "class": "person",
+                    "confidence": 0.9,
+                    "detection_id": "1",
+                    "x": 10,
+                    "y": 20,
+                    "width": 30,
+                    "height": 40,
+                    "points": [Point(x=i, y=i + 0.5) for i in range(10)],
+                    "class_id": 1,
+                }
+            )
+        ],
+        time=0.25,
+    )
+    request = ObjectDetectionInferenceRequest(
+        model_id="some/1",
+        image={"type": "url", "value": "https://some.com/image.jpg"},
+        api_key="my_api_key",
+    )
+
+    # when
+    result = to_jsonable([response, response])
+    request_result = to_jsonable(request)
+
+    # then
+    assert result == jsonable_encoder([response, response])
+    assert request_result == jsonable_encoder(request)
@@ -0,0 +1,212 @@
+import io
+import socket
+import time
+from threading import Event, Thread
+
+import av
+import cv2
+import numpy as np
+import pytest
+
+from inference.core.interfaces.camera.pyav_video_frame_producer import (
+    PyAVVideoFrameProducer,
+)
+from inference.core.interfaces.camera.video_source import VideoSource
+
+
+def test_discover_source_properties_when_local_file_given(
+    local_video_path: str,
+) -> None:
+    # given
+    video = PyAVVideoFrameProducer(local_video_path)
+
+    # when
+    result = video.discover_source_properties()
+
+    # then
+    assert result.is_file is True, "Path refers to video file, not stream"
+    assert result.total_frames == 431, "This video has 431 frames in total"
+    assert result.height == 240, "Video height is 240"
+    assert result.width == 426, "Video height is 426"
+    assert abs(result.fps - 30.0) < 1e-5, "Video file FPS is around 30"
+
+
+def test_pyav_producer_when_invalid_video_reference_given() -> None:
+    # when
+    video = PyAVVideoFrameProducer("invalid")
+
+    # then
+    assert video.isOpened() is False
+    assert video.grab() is False
+
+
+def test_pyav_producer_decodes_the_same_frames_as_opencv(
+    local_video_path: str,
+) -> None:
+    # given
+    video = PyAVVideoFrameProducer(local_video_path, decoder_threads=2)
+    cv2_video = cv2.VideoCapture(local_video_path)
+
+    # when
+    frames_count = 0
+    while video.grab():
+        _, frame = video.retrieve()
+        _, cv2_frame = cv2_video.read()
+        frames_count += 1
+        if frames_count <= 5:
+            # different color conversion implementations are allowed to differ slightly
+            assert frame.shape == cv2_frame.shape
+            assert (
+                np.abs(frame.astype(np.int16) - cv2_frame.astype(np.int16)).mean() < 2.0
+            )
+
+    # then
+    assert frames_count == 431
+    assert video.isOpened() is False, "Producer should be released at the end of file"
+
+
+def test_pyav_producer_when_every_nth_frame_is_decoded(local_video_path: str) -> None:
+    # given
+    video = PyAVVideoFrameProducer(local_video_path, decode_every_nth_frame=10)
+
+    # when
+    frames_count = 0
+    while video.grab():
+        frames_count += 1
+
+    # then
+    assert frames_count == 43
+    assert abs(video.discover_source_properties().fps - 3.0) < 1e-5
+
+
+def test_pyav_producer_when_only_keyframes_are_decoded(local_video_path: str) -> None:
+    # given
+    video = PyAVVideoFrameProducer(local_video_path, skip_frame="NONKEY")
+
+    # when
+    frames_count = 0
+    while video.grab():
+        frames_count += 1
+
+    # then
+    assert 0 < frames_count < 431
+
+
+def test_pyav_producer_when_invalid_skip_frame_option_given(
+    local_video_path: str,
+) -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = PyAVVideoFrameProducer(local_video_path, skip_frame="invalid")
+
+
+def test_pyav_producer_reuses_preallocated_frame_buffers(
+    local_video_path: str,
+) -> None:
+    # given
+    video = PyAVVideoFrameProducer(local_video_path, frame_buffers_pool_size=2)
+
+    # when
+    frames = []
+    for _ in range(3):
+        video.grab()
+        frames.append(video.retrieve()[1])
+    video.release()
+
+    # then
+    assert frames[0] is frames[2], "Third frame should be decoded into the first buffer"
+    assert frames[0] is not frames[1]
+    assert frames[1].shape == (240, 426, 3)
+
+
+def test_pyav_producer_decodes_the_same_frames_into_preallocated_frame_buffers(
+    local_video_path: str,
+) -> None:
+    # given
+    video = PyAVVideoFrameProducer(local_video_path)
+    pooled_video = PyAVVideoFrameProducer(local_video_path, frame_buffers_pool_size=2)
+
+    # when
+    for _ in range(5):
+        video.grab()
+        pooled_video.grab()
+        _, frame = video.retrieve()
+        _, pooled_frame = pooled_video.retrieve()
+
+        # then
+        # OpenCV and FFmpeg color conversions are allowed to differ slightly
+        assert pooled_frame.shape == frame.shape
+        assert (
+            np.abs(pooled_frame.astype(np.int16) - frame.astype(np.int16)).mean() < 2.0
+        )
+
+
+def _remux_into_mpegts(video_path: str) -> bytes:
+    source = av.open(video_path)
+    source_stream = source.streams.video[0]
+    buffer = io.BytesIO()
+    target = av.open(buffer, "w", format="mpegts")
+    target_stream = target.add_stream_from_template(source_stream)
+    for packet in source.demux(source_stream):
+        if packet.dts is None:
+            continue
+        packet.stream = target_stream
+        target.mux(packet)
+    target.close()
+    source.close()
+    return buffer.getvalue()
+
+
+def test_pyav_producer_when_stream_stalls(local_video_path: str) -> None:
+    # given
+    stream_data = _remux_into_mpegts(video_path=local_video_path)
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    stop_serving = Event()
+
+    def serve_stalling_stream() -> None:
+        connection, _ = server.accept()
+        connection.sendall(stream_data[: len(stream_data) // 4])
+        stop_serving.wait()
+        connection.close()
+
+    server_thread = Thread(target=serve_stalling_stream, daemon=True)
+    server_thread.start()
+    video = PyAVVideoFrameProducer(
+        f"tcp://127.0.0.1:{server.getsockname()[1]}", read_timeout=0.5
+    )
+
+    # when
+    try:
+        frames_count = 0
+        start = time.monotonic()
+        while video.grab():
+            frames_count += 1
+        duration = time.monotonic() - start
+    finally:
+        stop_serving.set()
+        server_thread.join()
+        server.close()
+
+    # then
+    assert 0 < frames_count < 431
+    assert duration < 5.0, "Stalled stream should be detected after read timeout"
+    assert video.isOpened() is False
+
+
+def test_video_source_consumes_video_with_pyav_producer(
+    local_video_path: str,
+) -> None:
+    # given
+    source = VideoSource.init(
+        video_reference=lambda: PyAVVideoFrameProducer(local_video_path)
+    )
+
+    # when
+    source.start()
+    frames = [frame for frame in source]
+
+    # then
+    assert len(frames) == 431
+    assert frames[-1].frame_id == 431
@@ -240,6 +240,82 @@ def test_inference_pipeline_manager_consumption(
     assert status_5[1]["status"] == OperationStatus.SUCCESS, "Operation should succeed"
 
 
+@pytest.mark.timeout(30)
+@mock.patch.object(inference_pipeline_manager.InferencePipeline, "init_with_workflow")
+def test_inference_pipeline_manager_consumption_through_shared_memory(
+    pipeline_init_mock: MagicMock,
+) -> None:
+    # given
+    image = np.arange(27, dtype=np.uint8).reshape((3, 3, 3))
+
+    def init_pipeline_and_emit_predictions(**kwargs) -> MagicMock:
+        kwargs["on_prediction"](
+            [None, {"some": "value", "other": "value"}],
+            [
+                None,
+                VideoFrame(
+                    image=image,
+                    frame_id=0,
+                    frame_timestamp=datetime.now(),
+                    source_id=1,
+                ),
+            ],
+        )
+        return MagicMock()
+
+    pipeline_init_mock.side_effect = init_pipeline_and_emit_predictions
+    command_queue, responses_queue = Queue(), Queue()
+    manager = InferencePipelineManager(
+        pipeline_id="my_pipeline",
+        command_queue=command_queue,
+        responses_queue=responses_queue,
+    )
+    init_payload = assembly_valid_init_payload()
+    init_payload["sink_configuration"] = {
+        "type": "SharedMemorySinkConfiguration",
+        "slots": 2,
+        "slot_size": 4096,
+    }
+
+    # when
+    command_queue.put(("1", init_payload))
+    command_queue.put(
+        ("2", {"type": CommandType.CONSUME_RESULT, "excluded_fields": ["other"]})
+    )
+    command_queue.put(("3", {"type": CommandType.CONSUME_RESULT}))
+    command_queue.put(("4", {"type": CommandType.TERMINATE}))
+
+    manager.run()
+
+    status_1 = responses_queue.get()
+    status_2 = responses_queue.get()
+    status_3 = responses_queue.get()
+    status_4 = responses_queue.get()
+
+    # then
+    assert status_1[1]["status"] == OperationStatus.SUCCESS, "Init should succeed"
+    assert status_2[0] == "2", "2nd request should be reported in responses_queue 2nd"
+    assert status_2[1]["status"] == OperationStatus.SUCCESS, "Operation should succeed"
+    assert status_2[1]["outputs"] == [
+        None,
+        {"some": "value"},
+    ], "Operation should yield buffer result without excluded fields"
+    frames_metadata = status_2[1]["frames_metadata"]
+    assert frames_metadata[0] is None, "Missing frame should be reported as None"
+    assert frames_metadata[1]["frame_id"] == 0
+    assert frames_metadata[1]["source_id"] == 1
+    assert frames_metadata[1]["shape"] == [3, 3, 3]
+    assert frames_metadata[1]["dtype"] == "uint8"
+    assert (
+        frames_metadata[1]["shared_memory_name"] == manager._frames_buffer.name
+    ), "Reference to shared memory block should be returned instead of pixels"
+    assert status_3[1]["outputs"] == [], "Operation should yield empty result"
+    assert status_4 == (
+        "4",
+        {"status": OperationStatus.SUCCESS},
+    ), "Termination of pipeline must happen"
+
+
 @pytest.mark.timeout(30)
 @mock.patch.object(inference_pipeline_manager.InferencePipeline, "init_with_workflow")
 def test_inference_pipeline_manager_when_init_pipeline_operation_is_requested_but_model_not_found(
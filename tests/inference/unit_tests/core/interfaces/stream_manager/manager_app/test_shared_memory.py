@@ -0,0 +1,197 @@
+import json
+from datetime import datetime
+from multiprocessing.shared_memory import SharedMemory
+from typing import Generator
+
+import numpy as np
+import pytest
+
+from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.stream_manager.manager_app.shared_memory import (
+    SharedMemoryRingBuffer,
+    SharedMemorySink,
+)
+
+
+@pytest.fixture
+def frames_buffer() -> Generator[SharedMemoryRingBuffer, None, None]:
+    frames_buffer = SharedMemoryRingBuffer.create(slots=2, slot_size=4096)
+    yield frames_buffer
+    frames_buffer.close(unlink=True)
+
+
+def create_video_frame(frame_id: int, image: np.ndarray) -> VideoFrame:
+    return VideoFrame(
+        image=image,
+        frame_id=frame_id,
+        frame_timestamp=datetime.now(),
+        source_id=1,
+    )
+
+
+def test_shared_memory_ring_buffer_when_batch_is_written_and_consumed(
+    frames_buffer: SharedMemoryRingBuffer,
+) -> None:
+    # given
+    first_image = np.arange(48, dtype=np.uint8).reshape((4, 4, 3))
+    second_image = np.arange(16, dtype=np.uint8).reshape((4, 4))
+    frames = [
+        create_video_frame(frame_id=7, image=first_image),
+        None,
+        create_video_frame(frame_id=8, image=second_image),
+    ]
+
+    # when
+    written = frames_buffer.write(
+        frames=frames,
+        predictions=json.dumps([{"predictions": []}, None, {}]).encode("utf-8"),
+    )
+    predictions, result = frames_buffer.consume(timeout=0.0)
+
+    # then
+    assert written is True
+    assert predictions == [{"predictions": []}, None, {}]
+    assert result[1] is None
+    assert np.array_equal(result[0].image, first_image)
+    assert np.array_equal(result[2].image, second_image[:, :, np.newaxis])
+    assert result[0].image.base is not None, "Image should be a view on shared memory"
+    assert result[0].offset % 64 == 0, "Image data should be aligned"
+    assert result[0].frame_id == 7
+    assert result[0].source_id == 1
+    assert result[0].frame_timestamp == frames[0].frame_timestamp
+    assert result[2].frame_id == 8
+    del result
+
+
+def test_shared_memory_ring_buffer_references_can_be_mapped_by_other_readers(
+    frames_buffer: SharedMemoryRingBuffer,
+) -> None:
+    # given
+    image = np.arange(48, dtype=np.uint8).reshape((4, 4, 3))
+    frames_buffer.write(
+        frames=[create_video_frame(frame_id=0, image=image)], predictions=b"[{}]"
+    )
+    _, frames = frames_buffer.consume(timeout=0.0)
+    metadata = frames[0].to_metadata()
+    del frames
+
+    # when
+    shared_memory = SharedMemory(name=metadata["shared_memory_name"])
+    mapped_image = np.ndarray(
+        metadata["shape"],
+        dtype=metadata["dtype"],
+        buffer=shared_memory.buf,
+        offset=metadata["offset"],
+    )
+
+    # then
+    assert np.array_equal(mapped_image, image)
+    del mapped_image
+    shared_memory.close()
+
+
+def test_shared_memory_ring_buffer_when_nothing_was_written(
+    frames_buffer: SharedMemoryRingBuffer,
+) -> None:
+    # when
+    result = frames_buffer.consume(timeout=0.0)
+
+    # then
+    assert result is None
+
+
+def test_shared_memory_ring_buffer_applies_back_pressure_when_all_slots_are_taken(
+    frames_buffer: SharedMemoryRingBuffer,
+) -> None:
+    # given
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+    for frame_id in range(2):
+        frames_buffer.write(
+            frames=[create_video_frame(frame_id=frame_id, image=image)],
+            predictions=b"[{}]",
+        )
+
+    # when
+    write_to_full_buffer = frames_buffer.write(
+        frames=[create_video_frame(frame_id=2, image=image)],
+        predictions=b"[{}]",
+        timeout=0.0,
+    )
+    _, first_frames = frames_buffer.consume(timeout=0.0)
+    write_while_frame_is_leased = frames_buffer.write(
+        frames=[create_video_frame(frame_id=2, image=image)],
+        predictions=b"[{}]",
+        timeout=0.0,
+    )
+    _, second_frames = frames_buffer.consume(timeout=0.0)
+    write_after_release = frames_buffer.write(
+        frames=[create_video_frame(frame_id=2, image=image)],
+        predictions=b"[{}]",
+        timeout=0.0,
+    )
+
+    # then
+    assert write_to_full_buffer is False
+    assert first_frames[0].frame_id == 0
+    assert write_while_frame_is_leased is False
+    assert second_frames[0].frame_id == 1
+    assert write_after_release is True
+    del first_frames, second_frames
+
+
+def test_shared_memory_ring_buffer_when_batch_does_not_fit_into_slot(
+    frames_buffer: SharedMemoryRingBuffer,
+) -> None:
+    # given
+    image = np.zeros((64, 64, 3), dtype=np.uint8)
+
+    # when
+    with pytest.raises(ValueError):
+        frames_buffer.write(
+            frames=[create_video_frame(frame_id=0, image=image)], predictions=b"[{}]"
+        )
+
+
+def test_shared_memory_sink_writes_serialised_workflow_results(
+    frames_buffer: SharedMemoryRingBuffer,
+) -> None:
+    # given
+    sink = SharedMemorySink.init(frames_buffer=frames_buffer, write_timeout=0.0)
+    video_frame = create_video_frame(
+        frame_id=3, image=np.ones((4, 4, 3), dtype=np.uint8)
+    )
+
+    # when
+    sink.on_prediction(
+        predictions=[None, {"predictions": [{"class": "a"}]}],
+        video_frame=[None, video_frame],
+    )
+    predictions, frames = frames_buffer.consume(timeout=0.0)
+
+    # then
+    assert predictions == [None, {"predictions": [{"class": "a"}]}]
+    assert frames[0] is None
+    assert frames[1].frame_id == 3
+    assert frames_buffer.consume(timeout=0.0) is None
+    del frames
+
+
+def test_shared_memory_sink_drops_batch_when_buffer_is_full(
+    frames_buffer: SharedMemoryRingBuffer,
+) -> None:
+    # given
+    sink = SharedMemorySink.init(frames_buffer=frames_buffer, write_timeout=0.0)
+    image = np.ones((4, 4, 3), dtype=np.uint8)
+
+    # when
+    for frame_id in range(3):
+        sink.on_prediction(
+            predictions={"frame": frame_id},
+            video_frame=create_video_frame(frame_id=frame_id, image=image),
+        )
+    consumed = [frames_buffer.consume(timeout=0.0) for _ in range(3)]
+
+    # then
+    assert [c[0] for c in consumed[:2]] == [[{"frame": 0}], [{"frame": 1}]]
+    assert consumed[2] is None, "Third batch should be dropped"
+    del consumed
@@ -0,0 +1,163 @@
+import asyncio
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from inference.core.entities.requests.inference import (
+    InferenceRequestImage,
+    ObjectDetectionInferenceRequest,
+)
+from inference.core.entities.responses.inference import (
+    ObjectDetectionInferenceResponse,
+)
+from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.dynamic_batching import WithDynamicBatching
+
+
+class RecordingModel:
+    def __init__(self, batching_enabled: bool = True, fail_on_batch: bool = False):
+        self.batching_enabled = batching_enabled
+        self.fail_on_batch = fail_on_batch
+        self.batch_sizes: List[int] = []
+
+    def infer_from_request(self, request: ObjectDetectionInferenceRequest):
+        images = request.image if isinstance(request.image, list) else [request.image]
+        self.batch_sizes.append(len(images))
+        if self.fail_on_batch and len(images) > 1:
+            raise RuntimeError("batch failed")
+        responses = [
+            ObjectDetectionInferenceResponse(
+                predictions=[],
+                image={"width": int(image.value), "height": int(image.value)},
+                inference_id=request.id,
+            )
+            for image in images
+        ]
+        if not isinstance(request.image, list):
+            return responses[0]
+        return responses
+
+
+def _build_request(
+    value: int, confidence: float = 0.5
+) -> ObjectDetectionInferenceRequest:
+    return ObjectDetectionInferenceRequest(
+        model_id="some/1",
+        image=InferenceRequestImage(type="numpy", value=str(value)),
+        confidence=confidence,
+    )
+
+
+def _build_manager(model: RecordingModel, **kwargs) -> WithDynamicBatching:
+    model_manager = ModelManager(model_registry=MagicMock())
+    model_manager._models = {"some/1": model}
+    return WithDynamicBatching(model_manager, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_infer_from_request_merges_concurrent_requests_into_single_batch() -> (
+    None
+):
+    # given
+    model = RecordingModel()
+    model_manager = _build_manager(model, max_batch_size=8, max_wait_ms=50)
+    requests = [_build_request(value=i + 1) for i in range(4)]
+
+    # when
+    results = await asyncio.gather(
+        *[model_manager.infer_from_request("some/1", request) for request in requests]
+    )
+
+    # then
+    assert model.batch_sizes == [4]
+    assert [r.image.width for r in results] == [1, 2, 3, 4]
+    assert [r.inference_id for r in results] == [r.id for r in requests]
+
+
+@pytest.mark.asyncio
+async def test_infer_from_request_flushes_batch_when_max_batch_size_reached() -> None:
+    # given
+    model = RecordingModel()
+    model_manager = _build_manager(model, max_batch_size=2, max_wait_ms=1000)
+    requests = [_build_request(value=i + 1) for i in range(5)]
+
+    # when
+    results = await asyncio.gather(
+        *[model_manager.infer_from_request("some/1", request) for request in requests]
+    )
+
+    # then
+    assert sorted(model.batch_sizes) == [1, 2, 2]
+    assert [r.image.width for r in results] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_infer_from_request_does_not_merge_requests_with_different_parameters() -> (
+    None
+):
+    # given
+    model = RecordingModel()
+    model_manager = _build_manager(model, max_batch_size=8, max_wait_ms=50)
+    requests = [
+        _build_request(value=1, confidence=0.3),
+        _build_request(value=2, confidence=0.5),
+        _build_request(value=3, confidence=0.3),
+    ]
+
+    # when
+    results = await asyncio.gather(
+        *[model_manager.infer_from_request("some/1", request) for request in requests]
+    )
+
+    # then
+    assert sorted(model.batch_sizes) == [1, 2]
+    assert [r.image.width for r in results] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_infer_from_request_when_model_does_not_support_batching() -> None:
+    # given
+    model = RecordingModel(batching_enabled=False)
+    model_manager = _build_manager(model, max_batch_size=8, max_wait_ms=50)
+    requests = [_build_request(value=i + 1) for i in range(3)]
+
+    # when
+    results = await asyncio.gather(
+        *[model_manager.infer_from_request("some/1", request) for request in requests]
+    )
+
+    # then
+    assert model.batch_sizes == [1, 1, 1]
+    assert [r.image.width for r in results] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_infer_from_request_when_batched_inference_fails() -> None:
+    # given
+    model = RecordingModel(fail_on_batch=True)
+    model_manager = _build_manager(model, max_batch_size=8, max_wait_ms=50)
+    requests = [_build_request(value=i + 1) for i in range(3)]
+
+    # when
+    results = await asyncio.gather(
+        *[model_manager.infer_from_request("some/1", request) for request in requests]
+    )
+
+    # then
+    assert model.batch_sizes == [3, 1, 1, 1]
+    assert [r.image.width for r in results] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_infer_from_request_propagates_errors_of_single_requests() -> None:
+    # given
+    model_manager = _build_manager(RecordingModel(), max_batch_size=8, max_wait_ms=1)
+    model_manager.model_manager._models["some/1"] = MagicMock(batching_enabled=True)
+    model_manager.model_manager._models["some/1"].infer_from_request.side_effect = (
+        RuntimeError("inference failed")
+    )
+
+    # when
+    with pytest.raises(RuntimeError):
+        _ = await model_manager.infer_from_request("some/1", _build_request(value=1))
@@ -0,0 +1,195 @@
+import threading
+from typing import Dict
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+
+from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators import fixed_size_cache
+from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
+
+
+def _build_manager(models_memory: Dict[str, int], **kwargs) -> WithFixedSizeCache:
+    model_registry = MagicMock()
+    model_registry.get_model.side_effect = lambda model_id, api_key: (
+        lambda model_id, api_key: MagicMock(size=models_memory[model_id])
+    )
+    return WithFixedSizeCache(ModelManager(model_registry=model_registry), **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def measured_memory():
+    with mock.patch.object(
+        fixed_size_cache, "get_process_rss_bytes", return_value=None
+    ), mock.patch.object(
+        fixed_size_cache,
+        "estimate_model_memory_footprint",
+        side_effect=lambda model: model.size,
+    ):
+        yield
+
+
+def test_add_model_evicts_least_recently_used_model_when_max_size_reached() -> None:
+    # given
+    model_manager = _build_manager({"a/1": 1, "b/1": 1, "c/1": 1}, max_size=2)
+    model_manager.add_model("a/1", api_key="key")
+    model_manager.add_model("b/1", api_key="key")
+    model_manager.add_model("a/1", api_key="key")
+
+    # when
+    model_manager.add_model("c/1", api_key="key")
+
+    # then
+    assert set(model_manager.keys()) == {"a/1", "c/1"}
+    assert model_manager.evictions == 1
+
+
+def test_add_model_evicts_models_until_memory_budget_is_met() -> None:
+    # given
+    model_manager = _build_manager(
+        {"small/1": 10, "medium/1": 30, "large/1": 80}, memory_budget=100
+    )
+    model_manager.add_model("small/1", api_key="key")
+    model_manager.add_model("medium/1", api_key="key")
+
+    # when
+    model_manager.add_model("large/1", api_key="key")
+
+    # then
+    assert set(model_manager.keys()) == {"large/1"}
+    assert model_manager.used_memory == 80
+    assert model_manager.evictions == 2
+
+
+def test_add_model_evicts_only_as_much_as_needed_to_meet_memory_budget() -> None:
+    # given
+    model_manager = _build_manager({"a/1": 40, "b/1": 40, "c/1": 40}, memory_budget=100)
+    model_manager.add_model("a/1", api_key="key")
+    model_manager.add_model("b/1", api_key="key")
+
+    # when
+    model_manager.add_model("c/1", api_key="key")
+
+    # then
+    assert set(model_manager.keys()) == {"b/1", "c/1"}
+    assert model_manager.used_memory == 80
+    assert model_manager.get_cache_stats()["evicted_memory"] == 40
+
+
+def test_add_model_never_evicts_pinned_models() -> None:
+    # given
+    model_manager = _build_manager(
+        {"a/1": 60, "b/1": 30, "c/1": 30},
+        memory_budget=100,
+        pinned_models=["a/1"],
+    )
+    model_manager.add_model("a/1", api_key="key")
+    model_manager.add_model("b/1", api_key="key")
+
+    # when
+    model_manager.add_model("c/1", api_key="key")
+
+    # then
+    assert set(model_manager.keys()) == {"a/1", "c/1"}
+
+
+def test_add_model_keeps_new_model_when_budget_cannot_be_met() -> None:
+    # given
+    model_manager = _build_manager(
+        {"a/1": 60, "b/1": 60}, memory_budget=100, pinned_models=["a/1"]
+    )
+    model_manager.add_model("a/1", api_key="key")
+
+    # when
+    model_manager.add_model("b/1", api_key="key")
+
+    # then
+    assert set(model_manager.keys()) == {"a/1", "b/1"}
+
+
+@pytest.mark.asyncio
+async def test_add_model_evicts_least_frequently_used_model_for_lfu_policy() -> None:
+    # given
+    model_manager = _build_manager(
+        {"a/1": 1, "b/1": 1, "c/1": 1}, max_size=2, eviction_policy="lfu"
+    )
+    model_manager.add_model("a/1", api_key="key")
+    model_manager.add_model("b/1", api_key="key")
+    for _ in range(3):
+        await model_manager.infer_from_request("a/1", request=MagicMock())
+    await model_manager.infer_from_request("b/1", request=MagicMock())
+
+    # when
+    model_manager.add_model("c/1", api_key="key")
+
+    # then
+    assert set(model_manager.keys()) == {"a/1", "c/1"}
+
+
+def test_add_model_does_not_charge_model_for_memory_of_models_loaded_concurrently() -> (
+    None
+):
+    # given
+    process_rss = {"value": 0}
+    barrier = threading.Barrier(2)
+
+    def load(model_id: str, api_key: str) -> MagicMock:
+        if model_id != "c/1":
+            barrier.wait(timeout=5)
+        process_rss["value"] += 100
+        if model_id != "c/1":
+            barrier.wait(timeout=5)
+        return MagicMock(size=10)
+
+    model_registry = MagicMock()
+    model_registry.get_model.return_value = load
+    model_manager = WithFixedSizeCache(ModelManager(model_registry=model_registry))
+
+    # when
+    with mock.patch.object(
+        fixed_size_cache,
+        "get_process_rss_bytes",
+        side_effect=lambda: process_rss["value"],
+    ):
+        threads = [
+            threading.Thread(target=model_manager.add_model, args=(model_id, "key"))
+            for model_id in ["a/1", "b/1"]
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        model_manager.add_model("c/1", api_key="key")
+
+    # then
+    assert (
+        model_manager.used_memory == 10 + 10 + 100
+    ), "RSS increase should only be attributed to model loaded alone"
+
+
+def test_get_cache_stats() -> None:
+    # given
+    model_manager = _build_manager(
+        {"a/1": 10, "b/1": 20}, memory_budget=100, pinned_models=["b/1"]
+    )
+    model_manager.add_model("a/1", api_key="key")
+    model_manager.add_model("b/1", api_key="key")
+
+    # when
+    result = model_manager.get_cache_stats()
+
+    # then
+    assert result["used_memory"] == 30
+    assert result["memory_budget"] == 100
+    assert result["evictions"] == 0
+    assert [(m["model_id"], m["memory"], m["pinned"]) for m in result["models"]] == [
+        ("a/1", 10, False),
+        ("b/1", 20, True),
+    ]
+
+
+def test_init_when_invalid_eviction_policy_given() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = _build_manager({}, eviction_policy="invalid")
@@ -1,8 +1,12 @@
+import asyncio
+from threading import Barrier
+from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 
 from inference.core.exceptions import InferenceModelNotFound
+from inference.core.managers import base
 from inference.core.managers.base import ModelManager
 from inference.core.managers.entities import ModelDescription
 
@@ -102,6 +106,31 @@ async def test_infer_from_request_when_model_is_available_but_exception_raised()
     model_manager._models["some/1"].infer_from_request.assert_called_once_with(request)
 
 
+@pytest.mark.asyncio
+@mock.patch.object(base, "ENABLE_STAGED_EXECUTION", True)
+async def test_infer_from_request_runs_concurrent_requests_in_parallel_when_staged_execution_enabled() -> (
+    None
+):
+    # given
+    model_registry = MagicMock()
+    model_manager = ModelManager(model_registry=model_registry)
+    model_mock = MagicMock()
+    # both requests must be inside the model at the same time to pass the barrier
+    barrier = Barrier(2, timeout=5)
+    model_mock.infer_from_request.side_effect = lambda request: barrier.wait()
+    model_manager._models = {"some/1": model_mock}
+
+    # when
+    results = await asyncio.gather(
+        model_manager.infer_from_request(model_id="some/1", request=MagicMock()),
+        model_manager.infer_from_request(model_id="some/1", request=MagicMock()),
+    )
+
+    # then
+    assert sorted(results) == [0, 1]
+    assert model_mock.infer_from_request.call_count == 2
+
+
 def test_make_response_when_model_available() -> None:
     # given
     model_registry = MagicMock()
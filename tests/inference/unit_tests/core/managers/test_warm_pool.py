@@ -0,0 +1,149 @@
+import asyncio
+import threading
+import time
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from inference.core.managers.base import ModelManager
+from inference.core.managers.warm_pool import (
+    MODEL_FAILED,
+    MODEL_READY,
+    ModelsWarmPool,
+    select_warm_up_batch_sizes,
+)
+
+
+class StubModel:
+    def __init__(self, batching_enabled: bool = True, batch_size="batch"):
+        self.batching_enabled = batching_enabled
+        self.batch_size = batch_size
+        self.img_size_h = 32
+        self.img_size_w = 48
+        self.inferred_batches: List[int] = []
+
+    def infer(self, image, **kwargs):
+        assert kwargs == {"usage_inference_test_run": True}
+        images = image if isinstance(image, list) else [image]
+        assert all(i.shape == (32, 48, 3) for i in images)
+        self.inferred_batches.append(len(images))
+
+
+def create_model_manager(
+    load_time: float = 0.0, load_times: Optional[Dict[str, float]] = None
+) -> ModelManager:
+    model_registry = MagicMock()
+    model_manager = ModelManager(model_registry=model_registry)
+    active_loads = []
+    model_manager.max_active_loads = 0
+    lock = threading.Lock()
+
+    def load(model_id: str, api_key: str) -> StubModel:
+        if model_id == "broken/1":
+            raise RuntimeError("broken model")
+        with lock:
+            active_loads.append(model_id)
+            model_manager.max_active_loads = max(
+                model_manager.max_active_loads, len(active_loads)
+            )
+        time.sleep((load_times or {}).get(model_id, load_time))
+        with lock:
+            active_loads.remove(model_id)
+        return StubModel(batching_enabled=model_id != "static/1", batch_size=2)
+
+    model_registry.get_model.return_value = load
+    return model_manager
+
+
+def test_models_warm_pool_loads_models_concurrently_and_warms_them_up() -> None:
+    # given
+    model_manager = create_model_manager(load_time=0.2)
+    warm_pool = ModelsWarmPool(
+        model_manager=model_manager,
+        model_ids=["a/1", "b/1", "static/1", "a/1"],
+        api_key="some",
+        max_concurrent_loads=3,
+        warm_up_batch_sizes=[1, 4],
+    )
+
+    # when
+    assert warm_pool.is_ready is False
+    asyncio.run(warm_pool.initialize())
+
+    # then
+    assert warm_pool.is_ready is True
+    assert warm_pool.initialization_errors == []
+    assert warm_pool.describe() == {
+        "a/1": MODEL_READY,
+        "b/1": MODEL_READY,
+        "static/1": MODEL_READY,
+    }
+    assert model_manager.max_active_loads == 3
+    assert model_manager["a/1"].inferred_batches == [1, 4]
+    assert model_manager["static/1"].inferred_batches == [
+        1
+    ], "Model with static batch size of 2 cannot be warmed up with batch of 4"
+
+
+def test_models_warm_pool_becomes_ready_despite_failed_and_timed_out_models() -> None:
+    # given
+    model_manager = create_model_manager(load_time=0.5)
+    warm_pool = ModelsWarmPool(
+        model_manager=model_manager,
+        model_ids=["broken/1", "slow/1"],
+        api_key="some",
+        load_timeout=0.1,
+    )
+
+    # when
+    asyncio.run(warm_pool.initialize())
+
+    # then
+    assert warm_pool.is_ready is True
+    assert warm_pool.describe() == {"broken/1": MODEL_FAILED, "slow/1": MODEL_FAILED}
+    errors = dict(warm_pool.initialization_errors)
+    assert "broken model" in errors["broken/1"]
+    assert errors["slow/1"] == "Timeout while loading model slow/1"
+    assert "slow/1" in model_manager, "Readiness must wait until timed out load ends"
+
+
+def test_models_warm_pool_starts_timeout_when_worker_is_free() -> None:
+    # given
+    model_manager = create_model_manager(load_times={"slow/1": 0.6, "fast/1": 0.1})
+    warm_pool = ModelsWarmPool(
+        model_manager=model_manager,
+        model_ids=["slow/1", "fast/1"],
+        api_key="some",
+        max_concurrent_loads=1,
+        load_timeout=0.3,
+    )
+
+    # when
+    asyncio.run(warm_pool.initialize())
+
+    # then
+    assert warm_pool.describe() == {"slow/1": MODEL_FAILED, "fast/1": MODEL_READY}
+    assert model_manager.max_active_loads == 1
+
+
+@pytest.mark.parametrize(
+    "batching_enabled, model_batch_size, expected",
+    [
+        (True, "batch", [1, 2, 8]),
+        (False, 2, [1, 2]),
+        (False, 1, [1]),
+    ],
+)
+def test_select_warm_up_batch_sizes(
+    batching_enabled: bool, model_batch_size, expected: List[int]
+) -> None:
+    # when
+    result = select_warm_up_batch_sizes(
+        batch_sizes=[8, 1, 2, 0, 2],
+        batching_enabled=batching_enabled,
+        model_batch_size=model_batch_size,
+    )
+
+    # then
+    assert result == expected
@@ -0,0 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from inference.core.models.classification_base import (
+    ClassificationBaseOnnxRoboflowInferenceModel,
+)
+from inference.core.models.utils.preprocessing import PreprocessingBuffer
+
+
+def create_model(
+    resize_method: str,
+    preprocessing_buffer: Optional[PreprocessingBuffer],
+) -> ClassificationBaseOnnxRoboflowInferenceModel:
+    model = object.__new__(ClassificationBaseOnnxRoboflowInferenceModel)
+    model.preproc = {}
+    model.resize_method = resize_method
+    model.img_size_h = 224
+    model.img_size_w = 224
+    model.batching_enabled = True
+    model.image_loader_threadpool = ThreadPoolExecutor(max_workers=2)
+    model.preprocessing_buffer = preprocessing_buffer
+    model.uint8_input = False
+    return model
+
+
+@pytest.mark.parametrize("resize_method", ["Stretch to", "Fit (black edges) in"])
+def test_classification_preprocessing_into_batch_gives_results_of_legacy_preprocessing(
+    resize_method: str,
+) -> None:
+    # given
+    image = np.random.randint(0, 256, size=(480, 640, 3), dtype=np.uint8)
+    crops = [image[10:200, 20:100], image[100:400, 300:640], image[0:50, 0:50]]
+    legacy_model = create_model(resize_method=resize_method, preprocessing_buffer=None)
+    fused_model = create_model(
+        resize_method=resize_method,
+        preprocessing_buffer=PreprocessingBuffer(height=224, width=224),
+    )
+
+    # when
+    legacy_result, legacy_metadata = legacy_model.preprocess(crops)
+    fused_result, fused_metadata = fused_model.preprocess(crops)
+
+    # then
+    assert fused_result.dtype == np.float32
+    assert np.array_equal(fused_result, legacy_result)
+    assert list(fused_metadata["img_dims"]) == list(legacy_metadata["img_dims"])
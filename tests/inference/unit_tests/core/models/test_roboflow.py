@@ -1,13 +1,22 @@
 import json
+import os
 from typing import Optional
 from unittest import mock
 from unittest.mock import MagicMock
 
+import numpy as np
+import onnx
 import pytest
+from onnx import TensorProto, helper, numpy_helper
 
+from inference.core.cache import model_artifacts
+from inference.core.entities.responses.inference import (
+    ObjectDetectionInferenceResponse,
+)
 from inference.core.exceptions import ModelArtefactError
 from inference.core.models import roboflow
 from inference.core.models.roboflow import (
+    OnnxRoboflowInferenceModel,
     class_mapping_not_available_in_environment,
     color_mapping_available_in_environment,
     get_class_names_from_environment_file,
@@ -194,3 +203,125 @@ def test_get_class_names_from_environment_file() -> None:
         "class_k",
         "class_l",
     ]
+
+
+class StubOnnxModel(OnnxRoboflowInferenceModel):
+    def preprocess(self, image, **kwargs):
+        return np.zeros((1, 3, 32, 32), dtype=np.float32), {}
+
+    def predict(self, img_in, **kwargs):
+        self.predict_calls += 1
+        return (np.zeros((1, 7, 84), dtype=np.float32),)
+
+    def postprocess(self, predictions, preprocess_return_metadata, **kwargs):
+        return ["response"]
+
+
+def test_get_model_output_shape_reuses_predictions_of_test_inference() -> None:
+    # given
+    model = object.__new__(StubOnnxModel)
+    model.batching_enabled = True
+    model.batch_size = "batch"
+    model.staged_executor = None
+    model.test_inference_output_shape = None
+    model.predict_calls = 0
+
+    # when
+    test_inference_result = model.run_test_inference()
+    output_shape = model.get_model_output_shape()
+
+    # then
+    assert test_inference_result == ["response"]
+    assert output_shape == (1, 7, 84)
+    assert model.predict_calls == 1
+    assert "predict" not in vars(model), "Recording of output shape must be reverted"
+
+
+def _save_yolov8_like_model(model_dir: str) -> None:
+    os.makedirs(model_dir, exist_ok=True)
+    weights = np.random.default_rng(42).random((6, 3, 3, 3), dtype=np.float32)
+    graph = helper.make_graph(
+        nodes=[
+            helper.make_node("Conv", ["images", "weights"], ["conv"], pads=[1] * 4),
+            helper.make_node("Reshape", ["conv", "output_shape"], ["output0"]),
+        ],
+        name="yolov8_like",
+        inputs=[
+            helper.make_tensor_value_info(
+                "images", TensorProto.FLOAT, ["batch", 3, 32, 32]
+            )
+        ],
+        outputs=[helper.make_tensor_value_info("output0", TensorProto.FLOAT, None)],
+        initializer=[
+            numpy_helper.from_array(weights, name="weights"),
+            numpy_helper.from_array(
+                np.array([0, 6, -1], dtype=np.int64), name="output_shape"
+            ),
+        ],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    onnx.save(model, os.path.join(model_dir, "weights.onnx"))
+    with open(os.path.join(model_dir, "environment.json"), "w") as f:
+        json.dump(
+            {
+                "PREPROCESSING": {
+                    "resize": {"enabled": True, "format": "Stretch to"},
+                }
+            },
+            f,
+        )
+    with open(os.path.join(model_dir, "class_names.txt"), "w") as f:
+        f.write("class_a\nclass_b\n")
+
+
+@mock.patch.object(roboflow, "MODEL_VALIDATION_DISABLED", False)
+def test_object_detection_model_loads_and_infers_with_uint8_input(
+    empty_local_dir: str,
+) -> None:
+    # given
+    from inference.models.yolov8.yolov8_object_detection import YOLOv8ObjectDetection
+
+    _save_yolov8_like_model(model_dir=os.path.join(empty_local_dir, "uint8", "1"))
+    _save_yolov8_like_model(model_dir=os.path.join(empty_local_dir, "float", "1"))
+    image = np.random.default_rng(7).integers(0, 256, (48, 40, 3), dtype=np.uint8)
+
+    # when
+    with mock.patch.object(model_artifacts, "MODEL_CACHE_DIR", empty_local_dir):
+        with mock.patch.object(roboflow, "ENABLE_UINT8_ONNX_INPUT", True):
+            uint8_model = YOLOv8ObjectDetection(model_id="uint8/1", api_key="dummy")
+        float_model = YOLOv8ObjectDetection(model_id="float/1", api_key="dummy")
+        uint8_result = uint8_model.infer(image, confidence=0.0)
+        float_result = float_model.infer(image, confidence=0.0)
+
+    # then
+    assert uint8_model.uint8_input is True
+    assert uint8_model.onnx_session.get_inputs()[0].type == "tensor(uint8)"
+    assert os.path.exists(
+        os.path.join(empty_local_dir, "uint8", "1", "weights.onnx")
+    ), "Model artefacts must not be removed from cache"
+    assert uint8_model.preprocessing_buffer.channels_last is True
+    assert isinstance(uint8_result[0], ObjectDetectionInferenceResponse)
+    assert len(uint8_result[0].predictions) > 0
+    assert len(uint8_result[0].predictions) == len(float_result[0].predictions)
+
+
+@mock.patch.object(roboflow, "MODEL_VALIDATION_DISABLED", False)
+@mock.patch.object(roboflow, "ENABLE_UINT8_ONNX_INPUT", True)
+@mock.patch.object(roboflow, "wrap_onnx_model_with_uint8_input")
+def test_object_detection_model_falls_back_to_float_input_when_onnx_not_installed(
+    wrap_onnx_model_with_uint8_input_mock: MagicMock,
+    empty_local_dir: str,
+) -> None:
+    # given
+    from inference.models.yolov8.yolov8_object_detection import YOLOv8ObjectDetection
+
+    wrap_onnx_model_with_uint8_input_mock.side_effect = ImportError("no onnx")
+    _save_yolov8_like_model(model_dir=os.path.join(empty_local_dir, "some", "1"))
+
+    # when
+    with mock.patch.object(model_artifacts, "MODEL_CACHE_DIR", empty_local_dir):
+        model = YOLOv8ObjectDetection(model_id="some/1", api_key="dummy")
+
+    # then
+    assert model.uint8_input is False
+    assert model.onnx_session.get_inputs()[0].type == "tensor(float)"
@@ -0,0 +1,299 @@
+import os.path
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import onnx
+import onnxruntime
+import pytest
+from onnx import TensorProto, helper, numpy_helper
+
+from inference.core.models.utils.onnx import (
+    IOBindingSessionRunner,
+    get_optimized_onnx_model_suffix,
+    save_optimized_onnx_model,
+    wrap_onnx_model_with_uint8_input,
+)
+from inference.core.models.utils.preprocessing import (
+    PreprocessingBuffer,
+    write_image_into_batch,
+    write_image_into_uint8_batch,
+)
+
+
+def _save_conv_model(path: str, input_shape: list) -> None:
+    weights = np.random.default_rng(42).random((4, 3, 3, 3), dtype=np.float32)
+    graph = helper.make_graph(
+        nodes=[
+            helper.make_node("Conv", ["images", "weights"], ["output"], pads=[1] * 4)
+        ],
+        name="conv",
+        inputs=[
+            helper.make_tensor_value_info("images", TensorProto.FLOAT, input_shape)
+        ],
+        outputs=[helper.make_tensor_value_info("output", TensorProto.FLOAT, None)],
+        initializer=[numpy_helper.from_array(weights, name="weights")],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    onnx.save(model, path)
+
+
+@pytest.mark.parametrize(
+    "resize_method", ["Stretch to", "Fit (grey edges) in", "Fit (white edges) in"]
+)
+def test_model_wrapped_with_uint8_input_gives_results_of_float_input_model(
+    empty_local_dir: str,
+    resize_method: str,
+) -> None:
+    # given
+    source_path = os.path.join(empty_local_dir, "weights.onnx")
+    target_path = os.path.join(empty_local_dir, "weights.uint8.onnx")
+    _save_conv_model(path=source_path, input_shape=["batch", 3, 64, 96])
+    images = [
+        np.random.randint(0, 256, size=(120, 100, 3), dtype=np.uint8),
+        np.random.randint(0, 256, size=(48, 200, 3), dtype=np.uint8),
+    ]
+    float_batch = PreprocessingBuffer(height=64, width=96).get_batch(batch_size=2)
+    uint8_batch = PreprocessingBuffer(
+        height=64, width=96, dtype=np.uint8, channels_last=True
+    ).get_batch(batch_size=2)
+    for index, image in enumerate(images):
+        write_image_into_batch(
+            image=image,
+            destination=float_batch[index],
+            resize_method=resize_method,
+            is_bgr=True,
+        )
+        write_image_into_uint8_batch(
+            image=image,
+            destination=uint8_batch[index],
+            resize_method=resize_method,
+            is_bgr=True,
+        )
+
+    # when
+    wrap_onnx_model_with_uint8_input(source_path=source_path, target_path=target_path)
+
+    # then
+    float_session = onnxruntime.InferenceSession(source_path)
+    uint8_session = onnxruntime.InferenceSession(target_path)
+    uint8_input = uint8_session.get_inputs()[0]
+    assert uint8_input.type == "tensor(uint8)"
+    assert uint8_input.shape == ["batch", 64, 96, 3]
+    expected = float_session.run(None, {"images": float_batch})[0]
+    result = uint8_session.run(None, {uint8_input.name: uint8_batch})[0]
+    assert np.allclose(result, expected, atol=1e-6)
+    assert set(os.listdir(empty_local_dir)) == {"weights.onnx", "weights.uint8.onnx"}
+
+
+def test_wrap_onnx_model_with_uint8_input_when_input_is_not_image_batch(
+    empty_local_dir: str,
+) -> None:
+    # given
+    source_path = os.path.join(empty_local_dir, "weights.onnx")
+    graph = helper.make_graph(
+        nodes=[helper.make_node("Relu", ["vector"], ["output"])],
+        name="relu",
+        inputs=[helper.make_tensor_value_info("vector", TensorProto.FLOAT, [1, 8])],
+        outputs=[helper.make_tensor_value_info("output", TensorProto.FLOAT, [1, 8])],
+    )
+    onnx.save(helper.make_model(graph), source_path)
+
+    # when
+    with pytest.raises(ValueError):
+        wrap_onnx_model_with_uint8_input(
+            source_path=source_path,
+            target_path=os.path.join(empty_local_dir, "weights.uint8.onnx"),
+        )
+
+
+def _create_conv_model_with_two_outputs(input_shape: list) -> onnx.ModelProto:
+    weights = np.random.default_rng(42).random((4, 3, 3, 3), dtype=np.float32)
+    graph = helper.make_graph(
+        nodes=[
+            helper.make_node("Conv", ["images", "weights"], ["output"], pads=[1] * 4),
+            helper.make_node("ReduceMax", ["output"], ["max_output"], keepdims=0),
+        ],
+        name="conv",
+        inputs=[
+            helper.make_tensor_value_info("images", TensorProto.FLOAT, input_shape)
+        ],
+        outputs=[
+            helper.make_tensor_value_info("output", TensorProto.FLOAT, None),
+            helper.make_tensor_value_info("max_output", TensorProto.FLOAT, None),
+        ],
+        initializer=[numpy_helper.from_array(weights, name="weights")],
+    )
+    return helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+
+
+def _create_session(model: onnx.ModelProto) -> onnxruntime.InferenceSession:
+    return onnxruntime.InferenceSession(
+        model.SerializeToString(), providers=["CPUExecutionProvider"]
+    )
+
+
+def test_io_binding_session_runner_reuses_output_buffers_for_the_same_input_shape() -> (
+    None
+):
+    # given
+    session = _create_session(
+        model=_create_conv_model_with_two_outputs(input_shape=["batch", 3, 32, 32])
+    )
+    runner = IOBindingSessionRunner(session=session, input_name="images")
+    first_input = np.random.rand(2, 3, 32, 32).astype(np.float32)
+    second_input = np.random.rand(2, 3, 32, 32).astype(np.float32)
+    third_input = np.random.rand(3, 3, 32, 32).astype(np.float32)
+
+    # when
+    first_result = [o.copy() for o in runner.run(first_input)]
+    second_result = runner.run(second_input)
+    second_result_repeated = runner.run(second_input)
+    third_result = runner.run(third_input)
+
+    # then
+    for result, img_in in [
+        (first_result, first_input),
+        (second_result, second_input),
+        (third_result, third_input),
+    ]:
+        expected = session.run(None, {"images": img_in})
+        assert len(result) == 2
+        assert np.allclose(result[0], expected[0])
+        assert np.allclose(result[1], expected[1])
+    assert second_result[0] is second_result_repeated[0]
+    assert third_result[0].shape == (3, 4, 32, 32)
+
+
+def test_io_binding_session_runner_does_not_share_buffers_between_threads() -> None:
+    # given
+    session = _create_session(
+        model=_create_conv_model_with_two_outputs(input_shape=["batch", 3, 32, 32])
+    )
+    runner = IOBindingSessionRunner(session=session, input_name="images")
+    img_in = np.random.rand(1, 3, 32, 32).astype(np.float32)
+    _ = runner.run(img_in)
+    main_thread_result = runner.run(img_in)
+
+    # when
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        _ = executor.submit(runner.run, img_in).result()
+        other_thread_result = executor.submit(runner.run, img_in).result()
+
+    # then
+    assert not np.shares_memory(main_thread_result[0], other_thread_result[0])
+
+
+def test_io_binding_session_runner_when_outputs_reuse_disabled() -> None:
+    # given
+    session = _create_session(
+        model=_create_conv_model_with_two_outputs(input_shape=["batch", 3, 32, 32])
+    )
+    runner = IOBindingSessionRunner(
+        session=session, input_name="images", reuse_outputs=False
+    )
+    img_in = np.random.rand(1, 3, 32, 32).astype(np.float32)
+
+    # when
+    first_result = runner.run(img_in)
+    second_result = runner.run(img_in)
+
+    # then
+    assert not np.shares_memory(first_result[0], second_result[0])
+    assert np.allclose(first_result[0], second_result[0])
+
+
+def test_io_binding_session_runner_when_output_shape_depends_on_data() -> None:
+    # given
+    graph = helper.make_graph(
+        nodes=[helper.make_node("NonZero", ["images"], ["indices"])],
+        name="non_zero",
+        inputs=[helper.make_tensor_value_info("images", TensorProto.FLOAT, [1, 4])],
+        outputs=[helper.make_tensor_value_info("indices", TensorProto.INT64, None)],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    runner = IOBindingSessionRunner(
+        session=_create_session(model=model), input_name="images"
+    )
+
+    # when
+    first_result = runner.run(np.array([[1, 0, 0, 0]], dtype=np.float32))
+    second_result = runner.run(np.array([[1, 1, 0, 1]], dtype=np.float32))
+    third_result = runner.run(np.array([[0, 0, 1, 0]], dtype=np.float32))
+
+    # then
+    assert first_result[0].tolist() == [[0], [0]]
+    assert second_result[0].tolist() == [[0, 0, 0], [0, 1, 3]]
+    assert third_result[0].tolist() == [[0], [2]]
+
+
+def test_save_optimized_onnx_model_gives_model_with_results_of_original_one(
+    empty_local_dir: str,
+) -> None:
+    # given
+    source_path = os.path.join(empty_local_dir, "weights.onnx")
+    target_path = os.path.join(empty_local_dir, "weights.optimized.onnx")
+    onnx.save(
+        _create_conv_model_with_two_outputs(input_shape=["batch", 3, 32, 32]),
+        source_path,
+    )
+    img_in = np.random.rand(2, 3, 32, 32).astype(np.float32)
+
+    # when
+    save_optimized_onnx_model(
+        source_path=source_path,
+        target_path=target_path,
+        providers=["CPUExecutionProvider"],
+    )
+
+    # then
+    expected = onnxruntime.InferenceSession(source_path).run(None, {"images": img_in})
+    result = onnxruntime.InferenceSession(target_path).run(None, {"images": img_in})
+    assert np.allclose(result[0], expected[0], atol=1e-5)
+    assert np.allclose(result[1], expected[1], atol=1e-5)
+    assert set(os.listdir(empty_local_dir)) == {
+        "weights.onnx",
+        "weights.optimized.onnx",
+    }
+
+
+def test_save_optimized_onnx_model_when_model_is_invalid(
+    empty_local_dir: str,
+) -> None:
+    # given
+    source_path = os.path.join(empty_local_dir, "weights.onnx")
+    target_path = os.path.join(empty_local_dir, "weights.optimized.onnx")
+    with open(source_path, "wb") as f:
+        f.write(b"not a model")
+
+    # when
+    with pytest.raises(Exception):
+        save_optimized_onnx_model(
+            source_path=source_path,
+            target_path=target_path,
+            providers=["CPUExecutionProvider"],
+        )
+
+    # then
+    assert os.listdir(empty_local_dir) == ["weights.onnx"]
+
+
+def test_get_optimized_onnx_model_suffix_depends_on_providers_configuration() -> None:
+    # when
+    cpu_suffix = get_optimized_onnx_model_suffix(providers=["CPUExecutionProvider"])
+    cuda_suffix = get_optimized_onnx_model_suffix(
+        providers=["CUDAExecutionProvider", "CPUExecutionProvider"]
+    )
+    cuda_device_suffix = get_optimized_onnx_model_suffix(
+        providers=[
+            ("CUDAExecutionProvider", {"device_id": 1}),
+            "CPUExecutionProvider",
+        ]
+    )
+
+    # then
+    assert cpu_suffix == get_optimized_onnx_model_suffix(
+        providers=["CPUExecutionProvider"]
+    )
+    assert len({cpu_suffix, cuda_suffix, cuda_device_suffix}) == 3
+    assert cpu_suffix.startswith(f".ort-{onnxruntime.__version__}-")
+    assert cpu_suffix.endswith(".optimized")
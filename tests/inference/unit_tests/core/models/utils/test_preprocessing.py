@@ -0,0 +1,206 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+import pytest
+
+from inference.core.models.utils.preprocessing import (
+    PreprocessingBuffer,
+    get_onnx_input_dtype,
+    write_image_into_batch,
+    write_image_into_uint8_batch,
+)
+from inference.core.utils.preprocess import letterbox_image
+
+
+def legacy_preprocessing(
+    image: np.ndarray, width: int, height: int, resize_method: str, is_bgr: bool
+) -> np.ndarray:
+    if resize_method == "Stretch to":
+        resized = cv2.resize(image, (width, height), cv2.INTER_CUBIC)
+    else:
+        color = {
+            "Fit (black edges) in": (0, 0, 0),
+            "Fit (white edges) in": (255, 255, 255),
+            "Fit (grey edges) in": (114, 114, 114),
+        }[resize_method]
+        resized = letterbox_image(image, (width, height), color=color)
+    if is_bgr:
+        resized = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+    img_in = np.transpose(resized, (2, 0, 1))
+    img_in = img_in.astype(np.float32)
+    img_in = np.expand_dims(img_in, axis=0)
+    img_in /= 255.0
+    return img_in
+
+
+@pytest.mark.parametrize(
+    "resize_method",
+    [
+        "Stretch to",
+        "Fit (black edges) in",
+        "Fit (white edges) in",
+        "Fit (grey edges) in",
+    ],
+)
+@pytest.mark.parametrize("is_bgr", [True, False])
+@pytest.mark.parametrize("image_shape", [(480, 640, 3), (640, 360, 3), (64, 64, 3)])
+def test_write_image_into_batch_gives_results_of_legacy_preprocessing(
+    resize_method: str,
+    is_bgr: bool,
+    image_shape: tuple,
+) -> None:
+    # given
+    image = np.random.randint(0, 256, size=image_shape, dtype=np.uint8)
+    image[0, :, 0] = 255
+    buffer = PreprocessingBuffer(height=320, width=256)
+    batch = buffer.get_batch(batch_size=2)
+    batch.fill(-1.0)
+
+    # when
+    write_image_into_batch(
+        image=image,
+        destination=batch[1],
+        resize_method=resize_method,
+        is_bgr=is_bgr,
+        resize_canvas=buffer.get_resize_canvas(),
+    )
+
+    # then
+    expected = legacy_preprocessing(
+        image=image,
+        width=256,
+        height=320,
+        resize_method=resize_method,
+        is_bgr=is_bgr,
+    )
+    assert batch.dtype == np.float32
+    assert np.array_equal(batch[1:2], expected)
+    assert np.all(batch[0] == -1.0), "Other slots of batch must not be touched"
+
+
+@pytest.mark.parametrize(
+    "resize_method",
+    ["Stretch to", "Fit (black edges) in", "Fit (grey edges) in"],
+)
+@pytest.mark.parametrize("is_bgr", [True, False])
+def test_write_image_into_uint8_batch_gives_not_normalised_results_of_legacy_preprocessing(
+    resize_method: str,
+    is_bgr: bool,
+) -> None:
+    # given
+    image = np.random.randint(0, 256, size=(480, 640, 3), dtype=np.uint8)
+    buffer = PreprocessingBuffer(
+        height=320, width=256, dtype=np.uint8, channels_last=True
+    )
+    batch = buffer.get_batch(batch_size=1)
+
+    # when
+    write_image_into_uint8_batch(
+        image=image,
+        destination=batch[0],
+        resize_method=resize_method,
+        is_bgr=is_bgr,
+    )
+
+    # then
+    expected = legacy_preprocessing(
+        image=image,
+        width=256,
+        height=320,
+        resize_method=resize_method,
+        is_bgr=is_bgr,
+    )
+    assert batch.shape == (1, 320, 256, 3)
+    assert np.array_equal(
+        batch.transpose(0, 3, 1, 2).astype(np.float32) / 255.0, expected
+    )
+
+
+def test_write_image_into_batch_casts_to_float16_buffer() -> None:
+    # given
+    image = np.random.randint(0, 256, size=(480, 640, 3), dtype=np.uint8)
+    buffer = PreprocessingBuffer(height=320, width=320, dtype=np.float16)
+    batch = buffer.get_batch(batch_size=1)
+
+    # when
+    write_image_into_batch(
+        image=image,
+        destination=batch[0],
+        resize_method="Fit (grey edges) in",
+        is_bgr=True,
+    )
+
+    # then
+    expected = legacy_preprocessing(
+        image=image,
+        width=320,
+        height=320,
+        resize_method="Fit (grey edges) in",
+        is_bgr=True,
+    )
+    assert batch.dtype == np.float16
+    assert np.array_equal(batch, expected.astype(np.float16))
+
+
+def test_preprocessing_buffer_reuses_memory_within_thread() -> None:
+    # given
+    buffer = PreprocessingBuffer(height=32, width=32)
+
+    # when
+    first = buffer.get_batch(batch_size=4)
+    second = buffer.get_batch(batch_size=2)
+    third = buffer.get_batch(batch_size=8)
+    fourth = buffer.get_batch(batch_size=3)
+
+    # then
+    assert second.shape == (2, 3, 32, 32)
+    assert np.shares_memory(first, second)
+    assert not np.shares_memory(first, third), "Buffer should grow for bigger batch"
+    assert np.shares_memory(third, fourth)
+    assert buffer.get_resize_canvas() is buffer.get_resize_canvas()
+
+
+def test_preprocessing_buffer_does_not_share_memory_between_threads() -> None:
+    # given
+    buffer = PreprocessingBuffer(height=32, width=32)
+    main_thread_batch = buffer.get_batch(batch_size=1)
+
+    # when
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_thread_batch = executor.submit(buffer.get_batch, 1).result()
+
+    # then
+    assert not np.shares_memory(main_thread_batch, other_thread_batch)
+
+
+def test_preprocessing_buffer_allocates_new_batch_each_time_when_reuse_disabled() -> (
+    None
+):
+    # given
+    buffer = PreprocessingBuffer(height=32, width=32, reuse=False)
+
+    # when
+    first = buffer.get_batch(batch_size=2)
+    second = buffer.get_batch(batch_size=2)
+
+    # then
+    assert not np.shares_memory(first, second)
+    assert buffer.get_resize_canvas() is None
+
+
+@pytest.mark.parametrize(
+    "onnx_type, expected",
+    [
+        ("tensor(float)", np.float32),
+        ("tensor(float16)", np.float16),
+        ("tensor(uint8)", np.uint8),
+        ("tensor(double)", np.float32),
+    ],
+)
+def test_get_onnx_input_dtype(onnx_type: str, expected: np.dtype) -> None:
+    # when
+    result = get_onnx_input_dtype(onnx_type=onnx_type)
+
+    # then
+    assert result == expected
@@ -0,0 +1,135 @@
+import time
+from threading import Event
+
+import pytest
+
+from inference.core.models.utils.staged_execution import Stage, StagedExecutor
+from inference.core.workflows.execution_engine.profiling.core import (
+    BaseWorkflowsProfiler,
+)
+
+
+def test_staged_executor_runs_job_through_all_stages() -> None:
+    # given
+    executor = StagedExecutor(
+        stages=[
+            Stage(name="first", function=lambda p, kwargs: p + kwargs["a"], workers=1),
+            Stage(name="second", function=lambda p, kwargs: p * 2, workers=2),
+        ]
+    )
+
+    try:
+        # when
+        result, stage_times = executor.run(1, a=2)
+    finally:
+        executor.shutdown()
+
+    # then
+    assert result == 6
+    assert set(stage_times.keys()) == {"first", "second"}
+
+
+def test_staged_executor_propagates_stage_errors() -> None:
+    # given
+    def failing_stage(payload, kwargs):
+        raise ValueError("invalid")
+
+    executor = StagedExecutor(
+        stages=[
+            Stage(name="first", function=lambda p, kwargs: p, workers=1),
+            Stage(name="second", function=failing_stage, workers=1),
+        ]
+    )
+
+    try:
+        # when
+        future = executor.submit(1)
+        with pytest.raises(ValueError):
+            _ = future.result(timeout=5)
+    finally:
+        executor.shutdown()
+
+
+def test_staged_executor_overlaps_stages_of_different_jobs() -> None:
+    # given
+    second_stage_started = Event()
+    first_stage_of_second_job_finished = Event()
+
+    def first_stage(payload, kwargs):
+        if payload == 1:
+            first_stage_of_second_job_finished.set()
+        return payload
+
+    def second_stage(payload, kwargs):
+        if payload == 0:
+            second_stage_started.set()
+            # job 0 may only finish once job 1 went through first stage
+            assert first_stage_of_second_job_finished.wait(timeout=5)
+        return payload
+
+    executor = StagedExecutor(
+        stages=[
+            Stage(name="first", function=first_stage, workers=1),
+            Stage(name="second", function=second_stage, workers=1),
+        ]
+    )
+
+    try:
+        # when
+        first_future = executor.submit(0)
+        assert second_stage_started.wait(timeout=5)
+        second_future = executor.submit(1)
+        first_result, _ = first_future.result(timeout=5)
+        second_result, _ = second_future.result(timeout=5)
+    finally:
+        executor.shutdown()
+
+    # then
+    assert (first_result, second_result) == (0, 1)
+
+
+def test_staged_executor_completes_jobs_in_flight_on_shutdown() -> None:
+    # given
+    def slow_stage(payload, kwargs):
+        time.sleep(0.01)
+        return payload
+
+    executor = StagedExecutor(
+        stages=[
+            Stage(name="first", function=slow_stage, workers=1),
+            Stage(name="second", function=slow_stage, workers=1),
+        ],
+        queue_size=16,
+    )
+    futures = [executor.submit(i) for i in range(5)]
+
+    # when
+    executor.shutdown()
+
+    # then
+    assert [f.result(timeout=1)[0] for f in futures] == [0, 1, 2, 3, 4]
+    with pytest.raises(RuntimeError):
+        _ = executor.submit(6)
+
+
+def test_staged_executor_records_stages_in_profiler() -> None:
+    # given
+    profiler = BaseWorkflowsProfiler.init()
+    executor = StagedExecutor(
+        stages=[
+            Stage(name="first", function=lambda p, kwargs: p, workers=1),
+            Stage(name="second", function=lambda p, kwargs: p, workers=1),
+        ]
+    )
+
+    try:
+        # when
+        _ = executor.run(1, profiler=profiler)
+    finally:
+        executor.shutdown()
+
+    # then
+    trace = profiler.export_trace()
+    assert [event["name"] for event in trace] == ["model_first", "model_second"]
+    assert all(event["ph"] == "X" for event in trace)
+    assert all(event["cat"] == "model_inference_stage" for event in trace)
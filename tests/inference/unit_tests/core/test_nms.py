@@ -0,0 +1,175 @@
+import numpy as np
+import pytest
+
+from inference.core.nms import (
+    legacy_non_max_suppression,
+    vectorized_non_max_suppression,
+)
+
+
+def _generate_predictions(
+    batch_size: int,
+    anchors: int,
+    num_classes: int,
+    num_masks: int = 0,
+    seed: int = 42,
+) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(0, 640, size=(batch_size, anchors, 2))
+    sizes = rng.uniform(5, 120, size=(batch_size, anchors, 2))
+    classes_confidence = rng.uniform(0, 1, size=(batch_size, anchors, num_classes)) ** 4
+    masks = rng.normal(size=(batch_size, anchors, num_masks))
+    return np.concatenate(
+        [
+            centers,
+            sizes,
+            classes_confidence.max(axis=2, keepdims=True),
+            classes_confidence,
+            masks,
+        ],
+        axis=2,
+    ).astype(np.float32)
+
+
+def _assert_batch_predictions_equal(result: list, expected: list) -> None:
+    assert len(result) == len(expected)
+    for result_image, expected_image in zip(result, expected):
+        result_image = np.array(result_image)
+        expected_image = np.array(expected_image)
+        assert result_image.shape == expected_image.shape
+        if expected_image.size == 0:
+            continue
+        result_order = np.lexsort((result_image[:, 0], -result_image[:, 4]))
+        expected_order = np.lexsort((expected_image[:, 0], -expected_image[:, 4]))
+        assert np.allclose(result_image[result_order], expected_image[expected_order])
+
+
+@pytest.mark.parametrize("class_agnostic", [False, True])
+@pytest.mark.parametrize("num_masks", [0, 32])
+def test_vectorized_non_max_suppression_matches_legacy_implementation(
+    class_agnostic: bool,
+    num_masks: int,
+) -> None:
+    # given
+    predictions = _generate_predictions(
+        batch_size=3, anchors=2000, num_classes=10, num_masks=num_masks
+    )
+
+    # when
+    result = vectorized_non_max_suppression(
+        predictions.copy(),
+        conf_thresh=0.3,
+        iou_thresh=0.5,
+        class_agnostic=class_agnostic,
+        num_masks=num_masks,
+    )
+    expected = legacy_non_max_suppression(
+        predictions.copy(),
+        conf_thresh=0.3,
+        iou_thresh=0.5,
+        class_agnostic=class_agnostic,
+        num_masks=num_masks,
+    )
+
+    # then
+    _assert_batch_predictions_equal(result=result, expected=expected)
+
+
+def test_vectorized_non_max_suppression_matches_legacy_implementation_for_xyxy_boxes() -> (
+    None
+):
+    # given
+    predictions = _generate_predictions(batch_size=2, anchors=1000, num_classes=5)
+    predictions[:, :, 2:4] += predictions[:, :, :2]
+
+    # when
+    result = vectorized_non_max_suppression(
+        predictions.copy(), conf_thresh=0.2, box_format="xyxy"
+    )
+    expected = legacy_non_max_suppression(
+        predictions.copy(), conf_thresh=0.2, box_format="xyxy"
+    )
+
+    # then
+    _assert_batch_predictions_equal(result=result, expected=expected)
+
+
+def test_vectorized_non_max_suppression_respects_max_detections() -> None:
+    # given
+    predictions = _generate_predictions(batch_size=2, anchors=2000, num_classes=3)
+
+    # when
+    result = vectorized_non_max_suppression(
+        predictions.copy(), conf_thresh=0.1, max_detections=7
+    )
+    expected = legacy_non_max_suppression(
+        predictions.copy(), conf_thresh=0.1, max_detections=7
+    )
+
+    # then
+    assert [len(e) for e in result] == [7, 7]
+    _assert_batch_predictions_equal(result=result, expected=expected)
+
+
+def test_vectorized_non_max_suppression_when_nothing_passes_confidence_threshold() -> (
+    None
+):
+    # given
+    predictions = _generate_predictions(batch_size=2, anchors=100, num_classes=3)
+
+    # when
+    result = vectorized_non_max_suppression(predictions, conf_thresh=1.1)
+
+    # then
+    assert result == [[], []]
+
+
+def test_vectorized_non_max_suppression_when_only_some_images_have_detections() -> None:
+    # given
+    predictions = _generate_predictions(batch_size=3, anchors=100, num_classes=3)
+    predictions[1, :, 4] = 0.0
+
+    # when
+    result = vectorized_non_max_suppression(predictions, conf_thresh=0.3)
+
+    # then
+    assert len(result[0]) > 0
+    assert result[1] == []
+    assert len(result[2]) > 0
+
+
+def test_vectorized_non_max_suppression_keeps_overlapping_boxes_of_different_classes() -> (
+    None
+):
+    # given
+    predictions = np.array(
+        [
+            [
+                [100, 100, 50, 50, 0.9, 0.9, 0.1],
+                [101, 101, 50, 50, 0.8, 0.1, 0.8],
+                [102, 102, 50, 50, 0.7, 0.7, 0.1],
+            ]
+        ],
+        dtype=np.float32,
+    )
+
+    # when
+    result = vectorized_non_max_suppression(predictions.copy(), conf_thresh=0.5)
+    agnostic_result = vectorized_non_max_suppression(
+        predictions.copy(), conf_thresh=0.5, class_agnostic=True
+    )
+
+    # then
+    assert np.allclose(result[0][:, 4], [0.9, 0.8])
+    assert np.allclose(result[0][:, 6], [0, 1])
+    assert np.allclose(result[0][0, :4], [75, 75, 125, 125])
+    assert np.allclose(agnostic_result[0][:, 4], [0.9])
+
+
+def test_vectorized_non_max_suppression_when_invalid_box_format_given() -> None:
+    # given
+    predictions = _generate_predictions(batch_size=1, anchors=10, num_classes=3)
+
+    # when
+    with pytest.raises(ValueError):
+        _ = vectorized_non_max_suppression(predictions, box_format="invalid")
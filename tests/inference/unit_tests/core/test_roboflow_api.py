@@ -1,5 +1,10 @@
+import base64
+import hashlib
 import json
-from typing import Type
+import os.path
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Generator, Optional, Type
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -27,6 +32,7 @@ from inference.core.roboflow_api import (
     ModelEndpointType,
     annotate_image_at_roboflow,
     delete_cached_workflow_response_if_exists,
+    download_file_from_url,
     get_roboflow_active_learning_configuration,
     get_roboflow_dataset_type,
     get_roboflow_labeling_batches,
@@ -2167,3 +2173,202 @@ def test_get_workflow_specification_when_valid_response_given_on_consecutive_req
         }
     )
     assert len(ephemeral_cache.cache) == 1, "Expected cache content to appear"
+
+
+class ArtefactsServer:
+    """Local HTTP server standing in for artefacts storage - supports range requests
+    (unless disabled) and can drop the connection after sending given number of bytes.
+    """
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.supports_ranges = True
+        self.declared_md5: Optional[str] = hashlib.md5(content).digest().hex()
+        self.drop_connection_after: Optional[int] = None
+        self.received_ranges = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                range_header = self.headers.get("Range")
+                server.received_ranges.append(range_header)
+                start = 0
+                if range_header is not None and server.supports_ranges:
+                    start = int(range_header[len("bytes=") :].rstrip("-"))
+                if start >= len(server.content):
+                    self.send_response(416)
+                    self.end_headers()
+                    return None
+                body = server.content[start:]
+                self.send_response(206 if start > 0 else 200)
+                self.send_header("Content-Length", str(len(body)))
+                if start > 0:
+                    self.send_header(
+                        "Content-Range",
+                        f"bytes {start}-{len(server.content) - 1}/{len(server.content)}",
+                    )
+                if server.declared_md5 is not None:
+                    md5 = base64.b64encode(bytes.fromhex(server.declared_md5))
+                    self.send_header(
+                        "x-goog-hash", f"crc32c=AAAAAA==,md5={md5.decode()}"
+                    )
+                self.end_headers()
+                if server.drop_connection_after is not None:
+                    body = body[: server.drop_connection_after]
+                    server.drop_connection_after = None
+                    self.close_connection = True
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self._http_server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._http_server.server_port}/weights.onnx"
+        self._thread = threading.Thread(
+            target=self._http_server.serve_forever, daemon=True
+        )
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        self._http_server.shutdown()
+        self._http_server.server_close()
+
+
+@pytest.fixture
+def artefacts_server() -> Generator[ArtefactsServer, None, None]:
+    server = ArtefactsServer(content=os.urandom(3 * 1024 * 1024 + 17))
+    yield server
+    server.shutdown()
+
+
+def test_download_file_from_url_when_file_is_not_downloaded_yet(
+    artefacts_server: ArtefactsServer,
+    empty_local_dir: str,
+) -> None:
+    # given
+    target_path = os.path.join(empty_local_dir, "weights.onnx.partial")
+    progress = []
+
+    # when
+    download_file_from_url(
+        url=artefacts_server.url,
+        target_path=target_path,
+        on_progress=lambda downloaded, total: progress.append((downloaded, total)),
+    )
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == artefacts_server.content
+    assert artefacts_server.received_ranges == [None]
+    assert len(progress) >= 4, "Expected progress to be reported for each chunk"
+    assert progress[-1] == (
+        len(artefacts_server.content),
+        len(artefacts_server.content),
+    )
+
+
+def test_download_file_from_url_resumes_partial_download(
+    artefacts_server: ArtefactsServer,
+    empty_local_dir: str,
+) -> None:
+    # given
+    target_path = os.path.join(empty_local_dir, "weights.onnx.partial")
+    with open(target_path, "wb") as f:
+        f.write(artefacts_server.content[:1000])
+
+    # when
+    download_file_from_url(url=artefacts_server.url, target_path=target_path)
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == artefacts_server.content
+    assert artefacts_server.received_ranges == ["bytes=1000-"]
+
+
+def test_download_file_from_url_starts_over_when_server_does_not_support_ranges(
+    artefacts_server: ArtefactsServer,
+    empty_local_dir: str,
+) -> None:
+    # given
+    artefacts_server.supports_ranges = False
+    target_path = os.path.join(empty_local_dir, "weights.onnx.partial")
+    with open(target_path, "wb") as f:
+        f.write(b"STALE CONTENT")
+
+    # when
+    download_file_from_url(url=artefacts_server.url, target_path=target_path)
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == artefacts_server.content
+
+
+def test_download_file_from_url_starts_over_when_partial_file_is_too_large(
+    artefacts_server: ArtefactsServer,
+    empty_local_dir: str,
+) -> None:
+    # given
+    target_path = os.path.join(empty_local_dir, "weights.onnx.partial")
+    with open(target_path, "wb") as f:
+        f.write(artefacts_server.content + b"GARBAGE")
+
+    # when
+    download_file_from_url(url=artefacts_server.url, target_path=target_path)
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == artefacts_server.content
+    assert artefacts_server.received_ranges[-1] is None
+
+
+def test_download_file_from_url_resumes_when_connection_is_dropped(
+    artefacts_server: ArtefactsServer,
+    empty_local_dir: str,
+) -> None:
+    # given
+    artefacts_server.drop_connection_after = 1024 * 1024 + 5
+    target_path = os.path.join(empty_local_dir, "weights.onnx.partial")
+
+    # when
+    download_file_from_url(url=artefacts_server.url, target_path=target_path)
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == artefacts_server.content
+    assert len(artefacts_server.received_ranges) == 2
+    assert artefacts_server.received_ranges[0] is None
+    assert artefacts_server.received_ranges[1].startswith("bytes=")
+
+
+def test_download_file_from_url_when_checksum_does_not_match(
+    artefacts_server: ArtefactsServer,
+    empty_local_dir: str,
+) -> None:
+    # given
+    artefacts_server.declared_md5 = hashlib.md5(b"OTHER CONTENT").digest().hex()
+    target_path = os.path.join(empty_local_dir, "weights.onnx.partial")
+
+    # when
+    with pytest.raises(RoboflowAPIUnsuccessfulRequestError):
+        download_file_from_url(url=artefacts_server.url, target_path=target_path)
+
+    # then
+    assert not os.path.exists(target_path), "Corrupted file must be removed"
+
+
+def test_download_file_from_url_when_server_responds_with_error(
+    empty_local_dir: str,
+    requests_mock: Mocker,
+) -> None:
+    # given
+    requests_mock.get("https://storage.com/weights.onnx", status_code=500)
+    target_path = os.path.join(empty_local_dir, "weights.onnx.partial")
+
+    # when
+    with pytest.raises(RoboflowAPIUnsuccessfulRequestError):
+        download_file_from_url(
+            url="https://storage.com/weights.onnx", target_path=target_path
+        )
+
+    # then
+    assert not os.path.exists(target_path)
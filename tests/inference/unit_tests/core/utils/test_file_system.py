@@ -5,6 +5,7 @@ import pytest
 from humanfriendly.testing import touch
 
 from inference.core.utils.file_system import (
+    atomic_open,
     dump_bytes,
     dump_json,
     dump_text_lines,
@@ -382,3 +383,42 @@ def assert_text_file_content_correct(file_path: str, content: str) -> None:
 def assert_bytes_file_content_correct(file_path: str, content: bytes) -> None:
     with open(file_path, "rb") as f:
         assert f.read() == content
+
+
+def test_atomic_open_when_write_fails(empty_local_dir: str) -> None:
+    # given
+    file_path = os.path.join(empty_local_dir, "some.txt")
+    with open(file_path, "w") as f:
+        f.write("original")
+
+    # when
+    with pytest.raises(ValueError):
+        with atomic_open(path=file_path, mode="w") as f:
+            f.write("partial")
+            raise ValueError()
+
+    # then
+    assert os.listdir(empty_local_dir) == ["some.txt"]
+    with open(file_path) as f:
+        assert f.read() == "original"
+
+
+def test_atomic_open_replaces_file_instead_of_modifying_it(
+    empty_local_dir: str,
+) -> None:
+    # given
+    file_path = os.path.join(empty_local_dir, "some.txt")
+    link_path = os.path.join(empty_local_dir, "link.txt")
+    with open(file_path, "w") as f:
+        f.write("original")
+    os.link(file_path, link_path)
+
+    # when
+    with atomic_open(path=file_path, mode="w") as f:
+        f.write("new")
+
+    # then
+    with open(file_path) as f:
+        assert f.read() == "new"
+    with open(link_path) as f:
+        assert f.read() == "original"
@@ -1,6 +1,7 @@
+import base64
 import io
 import pickle
-from typing import Any
+from typing import Any, Optional
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -23,10 +24,13 @@ from inference.core.utils.image_utils import (
     ImageType,
     attempt_loading_image_from_string,
     choose_image_decoding_flags,
+    choose_jpeg_reduction_factor,
     convert_gray_image_to_bgr,
     extract_image_payload_and_type,
+    has_known_encoded_image_signature,
     load_image,
     load_image_base64,
+    load_image_bytes_from_url,
     load_image_from_buffer,
     load_image_from_encoded_bytes,
     load_image_from_numpy_str,
@@ -34,6 +38,8 @@ from inference.core.utils.image_utils import (
     load_image_rgb,
     load_image_with_inferred_type,
     load_image_with_known_type,
+    load_image_with_reduced_decoding,
+    peek_base64_image_header,
 )
 
 
@@ -955,3 +961,168 @@ def test_load_image_rgb_on_rgb_image(load_image_mock: MagicMock) -> None:
     assert result.shape == (128, 128, 3)
     assert np.all(result[:, :, 0] == 1)
     assert np.all(result[:, :, -1] == 255)
+
+
+@pytest.mark.parametrize(
+    "image_size, minimal_size, expected_factor",
+    [
+        ((3000, 4000), (640, 640), 4),
+        ((6000, 8000), (640, 640), 8),
+        ((1280, 1280), (640, 640), 2),
+        ((1279, 1281), (640, 640), 2),
+        ((1000, 4000), (640, 640), 1),
+        ((480, 640), (640, 640), 1),
+    ],
+)
+def test_choose_jpeg_reduction_factor(
+    image_size: tuple, minimal_size: tuple, expected_factor: int
+) -> None:
+    # when
+    result = choose_jpeg_reduction_factor(
+        image_size=image_size, minimal_size=minimal_size
+    )
+
+    # then
+    assert result == expected_factor
+
+
+def _encode_jpeg(image: np.ndarray, exif_orientation: Optional[int] = None) -> bytes:
+    pil_image = Image.fromarray(image[:, :, ::-1])
+    exif = pil_image.getexif()
+    if exif_orientation is not None:
+        exif[0x0112] = exif_orientation
+    buffer = io.BytesIO()
+    pil_image.save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("as_base64", [True, False])
+def test_load_image_with_reduced_decoding_when_jpeg_much_larger_than_required(
+    as_base64: bool,
+) -> None:
+    # given
+    image = np.zeros((1600, 2400, 3), dtype=np.uint8)
+    image[:, :, 2] = 255
+    payload = _encode_jpeg(image=image)
+    if as_base64:
+        payload = base64.b64encode(payload).decode("utf-8")
+
+    # when
+    result, is_bgr, original_size = load_image_with_reduced_decoding(
+        value=payload, minimal_size=(320, 320)
+    )
+
+    # then
+    assert result.shape == (400, 600, 3)
+    assert is_bgr is True
+    assert original_size == (1600, 2400)
+    assert np.all(result[:, :, 2] > 250)
+
+
+def test_load_image_with_reduced_decoding_when_reduction_not_possible() -> None:
+    # given
+    image = np.zeros((600, 800, 3), dtype=np.uint8)
+    payload = _encode_jpeg(image=image)
+
+    # when
+    result, is_bgr, original_size = load_image_with_reduced_decoding(
+        value={"type": "base64", "value": base64.b64encode(payload)},
+        minimal_size=(320, 640),
+    )
+
+    # then
+    assert result.shape == (600, 800, 3)
+    assert original_size is None
+
+
+def test_load_image_with_reduced_decoding_respects_exif_orientation() -> None:
+    # given
+    image = np.zeros((1600, 2400, 3), dtype=np.uint8)
+    payload = _encode_jpeg(image=image, exif_orientation=6)
+
+    # when
+    rotated, _, rotated_original_size = load_image_with_reduced_decoding(
+        value=payload, minimal_size=(320, 320)
+    )
+    not_rotated, _, not_rotated_original_size = load_image_with_reduced_decoding(
+        value=payload, minimal_size=(320, 320), disable_preproc_auto_orient=True
+    )
+
+    # then
+    assert rotated.shape == (600, 400, 3)
+    assert rotated_original_size == (2400, 1600)
+    assert not_rotated.shape == (400, 600, 3)
+    assert not_rotated_original_size == (1600, 2400)
+
+
+def test_load_image_with_reduced_decoding_when_image_is_not_jpeg() -> None:
+    # given
+    image = np.zeros((1600, 2400, 3), dtype=np.uint8)
+    _, payload = cv2.imencode(".png", image)
+
+    # when
+    result, is_bgr, original_size = load_image_with_reduced_decoding(
+        value=payload.tobytes(), minimal_size=(320, 320)
+    )
+
+    # then
+    assert result.shape == (1600, 2400, 3)
+    assert is_bgr is True
+    assert original_size is None
+
+
+def test_load_image_bytes_from_url_returns_not_decoded_payload(
+    requests_mock: Mocker,
+    image_as_png_bytes: bytes,
+) -> None:
+    resource_url = "https://some.com/image.png"
+    requests_mock.get(
+        resource_url,
+        content=image_as_png_bytes,
+    )
+
+    # when
+    result = load_image_bytes_from_url(value=resource_url)
+
+    # then
+    assert result == image_as_png_bytes
+
+
+@pytest.mark.parametrize("extension", [".jpg", ".png", ".webp", ".tiff"])
+@pytest.mark.parametrize("prefix", ["", "data:image/jpeg;base64,"])
+def test_peek_base64_image_header_recognises_common_image_formats(
+    extension: str,
+    prefix: str,
+) -> None:
+    # given
+    _, payload = cv2.imencode(extension, np.zeros((64, 64, 3), dtype=np.uint8))
+    value = prefix + base64.b64encode(payload.tobytes()).decode("ascii")
+
+    # when
+    header = peek_base64_image_header(value=value)
+
+    # then
+    assert header == payload.tobytes()[: len(header)]
+    assert has_known_encoded_image_signature(value=header) is True
+
+
+@pytest.mark.parametrize("value", ["some", "not-a-base64-payload!!", ""])
+def test_peek_base64_image_header_when_payload_is_not_base64(value: str) -> None:
+    # when
+    header = peek_base64_image_header(value=value)
+
+    # then
+    assert header is None or has_known_encoded_image_signature(value=header) is False
+
+
+def test_has_known_encoded_image_signature_when_payload_is_pickled_numpy_array() -> (
+    None
+):
+    # given
+    payload = pickle.dumps(np.zeros((64, 64, 3), dtype=np.uint8))
+
+    # when
+    result = has_known_encoded_image_signature(value=payload)
+
+    # then
+    assert result is False
@@ -0,0 +1,82 @@
+"""
+This is just example, test implementation, please do not assume it being fully functional.
+"""
+
+import asyncio
+import time
+from typing import Any, List, Literal, Type, Union
+
+from pydantic import ConfigDict
+
+from inference.core.workflows.execution_engine.entities.base import OutputDefinition
+from inference.core.workflows.execution_engine.entities.types import (
+    STRING_KIND,
+    Selector,
+)
+from inference.core.workflows.prototypes.block import (
+    BlockResult,
+    WorkflowBlock,
+    WorkflowBlockManifest,
+)
+
+
+class AsyncDelayBlockManifest(WorkflowBlockManifest):
+    model_config = ConfigDict(
+        json_schema_extra={
+            "short_description": "",
+            "long_description": "",
+            "license": "Apache-2.0",
+            "block_type": "dummy",
+        }
+    )
+    type: Literal["AsyncDelay"]
+    value: Union[Selector(kind=[STRING_KIND]), str]
+    delay: float
+
+    @classmethod
+    def describe_outputs(cls) -> List[OutputDefinition]:
+        return [OutputDefinition(name="value", kind=[STRING_KIND])]
+
+
+class AsyncDelayBlock(WorkflowBlock):
+
+    @classmethod
+    def get_manifest(cls) -> Type[WorkflowBlockManifest]:
+        return AsyncDelayBlockManifest
+
+    async def run(self, value: Any, delay: float) -> BlockResult:
+        await asyncio.sleep(delay)
+        return {"value": f"{value}-async"}
+
+
+class SyncDelayBlockManifest(WorkflowBlockManifest):
+    model_config = ConfigDict(
+        json_schema_extra={
+            "short_description": "",
+            "long_description": "",
+            "license": "Apache-2.0",
+            "block_type": "dummy",
+        }
+    )
+    type: Literal["SyncDelay"]
+    value: Union[Selector(kind=[STRING_KIND]), str]
+    delay: float
+
+    @classmethod
+    def describe_outputs(cls) -> List[OutputDefinition]:
+        return [OutputDefinition(name="value", kind=[STRING_KIND])]
+
+
+class SyncDelayBlock(WorkflowBlock):
+
+    @classmethod
+    def get_manifest(cls) -> Type[WorkflowBlockManifest]:
+        return SyncDelayBlockManifest
+
+    def run(self, value: Any, delay: float) -> BlockResult:
+        time.sleep(delay)
+        return {"value": f"{value}-sync"}
+
+
+def load_blocks() -> List[Type[WorkflowBlock]]:
+    return [AsyncDelayBlock, SyncDelayBlock]
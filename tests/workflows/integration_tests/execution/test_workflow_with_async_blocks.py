@@ -0,0 +1,125 @@
+import asyncio
+import time
+from unittest import mock
+from unittest.mock import MagicMock
+
+from inference.core.managers.base import ModelManager
+from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.execution_engine.core import ExecutionEngine
+from inference.core.workflows.execution_engine.introspection import blocks_loader
+
+WORKFLOW_WITH_PARALLEL_ASYNC_STEPS = {
+    "version": "1.0",
+    "inputs": [
+        {"type": "WorkflowParameter", "name": "value"},
+    ],
+    "steps": [
+        {
+            "type": "AsyncDelay",
+            "name": f"async_{i}",
+            "value": "$inputs.value",
+            "delay": 0.5,
+        }
+        for i in range(4)
+    ]
+    + [
+        {
+            "type": "SyncDelay",
+            "name": "sync",
+            "value": "$steps.async_0.value",
+            "delay": 0.0,
+        }
+    ],
+    "outputs": [
+        {
+            "type": "JsonField",
+            "name": f"async_{i}",
+            "selector": f"$steps.async_{i}.value",
+        }
+        for i in range(4)
+    ]
+    + [
+        {
+            "type": "JsonField",
+            "name": "sync",
+            "selector": "$steps.sync.value",
+        }
+    ],
+}
+
+
+@mock.patch.object(blocks_loader, "get_plugin_modules")
+def test_workflow_with_async_blocks_executed_in_asyncio_mode(
+    get_plugin_modules_mock: MagicMock,
+    model_manager: ModelManager,
+) -> None:
+    # given
+    get_plugin_modules_mock.return_value = [
+        "tests.workflows.integration_tests.execution.stub_plugins.async_blocks_plugin"
+    ]
+    workflow_init_parameters = {
+        "workflows_core.model_manager": model_manager,
+        "workflows_core.api_key": None,
+        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
+    }
+    execution_engine = ExecutionEngine.init(
+        workflow_definition=WORKFLOW_WITH_PARALLEL_ASYNC_STEPS,
+        init_parameters=workflow_init_parameters,
+        max_concurrent_steps=1,
+    )
+
+    # when
+    start = time.monotonic()
+    result = asyncio.run(
+        execution_engine.run_async(runtime_parameters={"value": "some"})
+    )
+    duration = time.monotonic() - start
+
+    # then
+    assert result == [
+        {
+            "async_0": "some-async",
+            "async_1": "some-async",
+            "async_2": "some-async",
+            "async_3": "some-async",
+            "sync": "some-async-sync",
+        }
+    ]
+    assert (
+        duration < 1.5
+    ), "Expected async steps to wait concurrently, regardless of single worker thread"
+
+
+@mock.patch.object(blocks_loader, "get_plugin_modules")
+def test_workflow_with_async_blocks_executed_in_synchronous_mode(
+    get_plugin_modules_mock: MagicMock,
+    model_manager: ModelManager,
+) -> None:
+    # given
+    get_plugin_modules_mock.return_value = [
+        "tests.workflows.integration_tests.execution.stub_plugins.async_blocks_plugin"
+    ]
+    workflow_init_parameters = {
+        "workflows_core.model_manager": model_manager,
+        "workflows_core.api_key": None,
+        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
+    }
+    execution_engine = ExecutionEngine.init(
+        workflow_definition=WORKFLOW_WITH_PARALLEL_ASYNC_STEPS,
+        init_parameters=workflow_init_parameters,
+        max_concurrent_steps=4,
+    )
+
+    # when
+    result = execution_engine.run(runtime_parameters={"value": "some"})
+
+    # then
+    assert result == [
+        {
+            "async_0": "some-async",
+            "async_1": "some-async",
+            "async_2": "some-async",
+            "async_3": "some-async",
+            "sync": "some-async-sync",
+        }
+    ]
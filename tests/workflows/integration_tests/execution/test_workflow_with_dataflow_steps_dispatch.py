@@ -0,0 +1,81 @@
+from unittest import mock
+from unittest.mock import MagicMock
+
+from inference.core.managers.base import ModelManager
+from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.execution_engine.core import ExecutionEngine
+from inference.core.workflows.execution_engine.introspection import blocks_loader
+from inference.core.workflows.execution_engine.profiling.core import (
+    BaseWorkflowsProfiler,
+)
+
+WORKFLOW_WITH_SLOW_AND_FAST_BRANCH = {
+    "version": "1.0",
+    "inputs": [
+        {"type": "WorkflowParameter", "name": "value"},
+    ],
+    "steps": [
+        {
+            "type": "SyncDelay",
+            "name": "slow",
+            "value": "$inputs.value",
+            "delay": 1.0,
+        },
+        {
+            "type": "SyncDelay",
+            "name": "fast_1",
+            "value": "$inputs.value",
+            "delay": 0.05,
+        },
+        {
+            "type": "SyncDelay",
+            "name": "fast_2",
+            "value": "$steps.fast_1.value",
+            "delay": 0.05,
+        },
+    ],
+    "outputs": [
+        {"type": "JsonField", "name": "slow", "selector": "$steps.slow.value"},
+        {"type": "JsonField", "name": "fast", "selector": "$steps.fast_2.value"},
+    ],
+}
+
+
+@mock.patch.object(blocks_loader, "get_plugin_modules")
+def test_workflow_step_is_dispatched_as_soon_as_its_predecessors_finish(
+    get_plugin_modules_mock: MagicMock,
+    model_manager: ModelManager,
+) -> None:
+    # given
+    get_plugin_modules_mock.return_value = [
+        "tests.workflows.integration_tests.execution.stub_plugins.async_blocks_plugin"
+    ]
+    workflow_init_parameters = {
+        "workflows_core.model_manager": model_manager,
+        "workflows_core.api_key": None,
+        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
+    }
+    profiler = BaseWorkflowsProfiler.init()
+    execution_engine = ExecutionEngine.init(
+        workflow_definition=WORKFLOW_WITH_SLOW_AND_FAST_BRANCH,
+        init_parameters=workflow_init_parameters,
+        max_concurrent_steps=2,
+        profiler=profiler,
+    )
+
+    # when
+    result = execution_engine.run(runtime_parameters={"value": "some"})
+
+    # then
+    assert result == [{"slow": "some-sync", "fast": "some-sync-sync"}]
+    summary = [
+        event
+        for event in profiler.export_trace()
+        if event["name"] == "steps_dispatch_summary"
+    ]
+    assert len(summary) == 1
+    start_offsets = summary[0]["args"]["steps_start_offsets_ms"]
+    assert (
+        start_offsets["$steps.fast_2"] < 500
+    ), "fast_2 must not wait for slow step from the same topological generation"
+    assert summary[0]["args"]["estimated_idle_time_saved_ms"] > 0
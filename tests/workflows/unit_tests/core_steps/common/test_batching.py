@@ -0,0 +1,144 @@
+import threading
+import time
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from inference.core.entities.requests.inference import ClassificationInferenceRequest
+from inference.core.workflows.core_steps.common.batching import (
+    get_model_max_batch_size,
+    run_inference_in_model_batches,
+)
+from inference.core.workflows.execution_engine.profiling.core import (
+    BaseWorkflowsProfiler,
+    step_profiler_context,
+)
+
+
+class FakeModelManager:
+
+    def __init__(self, model: object, delay: float = 0.0):
+        self._model = model
+        self._delay = delay
+        self._lock = threading.Lock()
+        self.requests_sizes: List[int] = []
+        self.max_concurrent_calls = 0
+        self._running = 0
+
+    def __getitem__(self, model_id: str) -> object:
+        return self._model
+
+    def infer_from_request_sync(
+        self, model_id: str, request: ClassificationInferenceRequest
+    ) -> List[str]:
+        with self._lock:
+            self._running += 1
+            self.max_concurrent_calls = max(self.max_concurrent_calls, self._running)
+            self.requests_sizes.append(len(request.image))
+        time.sleep(self._delay)
+        with self._lock:
+            self._running -= 1
+        return [image.value for image in request.image]
+
+
+def create_request(images_count: int) -> ClassificationInferenceRequest:
+    return ClassificationInferenceRequest(
+        api_key="my-api-key",
+        model_id="some/1",
+        image=[{"type": "url", "value": f"image-{i}"} for i in range(images_count)],
+    )
+
+
+def test_run_inference_in_model_batches_when_images_fit_into_single_batch() -> None:
+    # given
+    model_manager = FakeModelManager(model=MagicMock(batching_enabled=True))
+    request = create_request(images_count=5)
+
+    # when
+    result = run_inference_in_model_batches(
+        model_manager=model_manager,
+        model_id="some/1",
+        request=request,
+        max_batch_size=8,
+    )
+
+    # then
+    assert result == [f"image-{i}" for i in range(5)]
+    assert model_manager.requests_sizes == [5]
+
+
+@pytest.mark.parametrize("max_concurrent_batches", [1, 3])
+def test_run_inference_in_model_batches_chunks_images_and_preserves_order(
+    max_concurrent_batches: int,
+) -> None:
+    # given
+    model_manager = FakeModelManager(model=MagicMock(batching_enabled=True), delay=0.02)
+    request = create_request(images_count=21)
+
+    # when
+    result = run_inference_in_model_batches(
+        model_manager=model_manager,
+        model_id="some/1",
+        request=request,
+        max_batch_size=4,
+        max_concurrent_batches=max_concurrent_batches,
+    )
+
+    # then
+    assert result == [f"image-{i}" for i in range(21)]
+    assert sorted(model_manager.requests_sizes) == [1, 4, 4, 4, 4, 4]
+    assert model_manager.max_concurrent_calls <= max_concurrent_batches
+    assert len(request.image) == 21, "Original request must not be modified"
+
+
+def test_run_inference_in_model_batches_records_batches_in_step_profiler() -> None:
+    # given
+    model_manager = FakeModelManager(model=MagicMock(batching_enabled=True))
+    request = create_request(images_count=5)
+    profiler = BaseWorkflowsProfiler.init()
+
+    # when
+    with step_profiler_context(profiler=profiler):
+        _ = run_inference_in_model_batches(
+            model_manager=model_manager,
+            model_id="some/1",
+            request=request,
+            max_batch_size=2,
+        )
+
+    # then
+    events = [
+        e for e in profiler.export_trace() if e["name"] == "model_batch_inference"
+    ]
+    assert [e["args"]["batch_size"] for e in events] == [2, 2, 1]
+    assert [e["args"]["batch_index"] for e in events] == [0, 1, 2]
+    assert all(e["args"]["model_id"] == "some/1" for e in events)
+
+
+def test_get_model_max_batch_size_when_model_has_fixed_batch_size() -> None:
+    # given
+    model = MagicMock(batching_enabled=False, batch_size=3)
+    model_manager = FakeModelManager(model=model)
+
+    # when
+    result = get_model_max_batch_size(
+        model_manager=model_manager, model_id="some/1", max_batch_size=32
+    )
+
+    # then
+    assert result == 3
+
+
+def test_get_model_max_batch_size_when_model_accepts_dynamic_batches() -> None:
+    # given
+    model = MagicMock(batching_enabled=True, batch_size="batch")
+    model_manager = FakeModelManager(model=model)
+
+    # when
+    result = get_model_max_batch_size(
+        model_manager=model_manager, model_id="some/1", max_batch_size=32
+    )
+
+    # then
+    assert result == 32
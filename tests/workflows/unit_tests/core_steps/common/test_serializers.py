@@ -5,8 +5,10 @@ import numpy as np
 import supervision as sv
 
 from inference.core.workflows.core_steps.common.serializers import (
+    masks_to_first_polygons,
     serialise_image,
     serialise_sv_detections,
+    serialise_sv_detections_columnar,
     serialize_wildcard_kind,
 )
 from inference.core.workflows.execution_engine.entities.base import (
@@ -190,6 +192,127 @@ def test_serialise_sv_detections() -> None:
     }
 
 
+def test_serialise_sv_detections_when_no_detections_given() -> None:
+    # given
+    detections = sv.Detections.empty()
+    detections.data = {"class_name": np.array([]), "detection_id": np.array([])}
+
+    # when
+    result = serialise_sv_detections(detections=detections)
+
+    # then
+    assert result == {"image": {"width": None, "height": None}, "predictions": []}
+
+
+def test_serialise_sv_detections_columnar() -> None:
+    # given
+    detections = sv.Detections(
+        xyxy=np.array([[1, 1, 2, 2], [3, 3, 5, 7]], dtype=np.float64),
+        class_id=np.array([1, 2]),
+        confidence=np.array([0.1, 0.9], dtype=np.float64),
+        mask=np.array(
+            [
+                sv.polygon_to_mask(
+                    np.array([[1, 1], [1, 10], [10, 10], [10, 1]]),
+                    resolution_wh=(15, 15),
+                ),
+                sv.polygon_to_mask(
+                    np.array([[2, 2], [2, 5], [5, 5], [5, 2]]),
+                    resolution_wh=(15, 15),
+                ),
+            ],
+            dtype=bool,
+        ),
+        data={
+            "class_name": np.array(["cat", "dog"]),
+            "detection_id": np.array(["first", "second"]),
+            "keypoints_xy": np.array(
+                [
+                    np.array([[11, 11], [12, 13]], dtype=np.float64),
+                    np.array([[16, 16]], dtype=np.float64),
+                ],
+                dtype="object",
+            ),
+            "keypoints_class_id": np.array(
+                [np.array([1, 2]), np.array([1])], dtype="object"
+            ),
+            "keypoints_class_name": np.array(
+                [np.array(["nose", "ear"]), np.array(["nose"])], dtype="object"
+            ),
+            "keypoints_confidence": np.array(
+                [np.array([0.1, 0.2]), np.array([0.5])], dtype="object"
+            ),
+            "image_dimensions": np.array([[15, 15], [15, 15]]),
+        },
+    )
+
+    # when
+    result = serialise_sv_detections_columnar(detections=detections)
+
+    # then
+    assert result == {
+        "image": {"width": 15, "height": 15},
+        "predictions": {
+            "width": [1.0, 2.0],
+            "height": [1.0, 4.0],
+            "x": [1.5, 4.0],
+            "y": [1.5, 5.0],
+            "confidence": [0.1, 0.9],
+            "class_id": [1, 2],
+            "points": [
+                [[1.0, 1.0], [1.0, 10.0], [10.0, 10.0], [10.0, 1.0]],
+                [[2.0, 2.0], [2.0, 5.0], [5.0, 5.0], [5.0, 2.0]],
+            ],
+            "class": ["cat", "dog"],
+            "detection_id": ["first", "second"],
+            "keypoints": [
+                {
+                    "class_id": [1, 2],
+                    "class": ["nose", "ear"],
+                    "confidence": [0.1, 0.2],
+                    "xy": [[11.0, 11.0], [12.0, 13.0]],
+                },
+                {
+                    "class_id": [1],
+                    "class": ["nose"],
+                    "confidence": [0.5],
+                    "xy": [[16.0, 16.0]],
+                },
+            ],
+        },
+    }
+
+
+def test_masks_to_first_polygons_gives_results_of_sv_mask_to_polygons() -> None:
+    # given
+    masks = np.zeros((4, 50, 60), dtype=np.uint8)
+    # object touching image borders
+    cv2.rectangle(masks[0], (0, 30), (59, 49), 1, -1)
+    # object with a hole and a second, separate part
+    cv2.circle(masks[1], (25, 25), 10, 1, -1)
+    cv2.circle(masks[1], (25, 25), 3, 0, -1)
+    cv2.rectangle(masks[1], (45, 2), (55, 8), 1, -1)
+    # objects exceeding (or not matching) their boxes
+    cv2.ellipse(masks[2], (30, 20), (20, 8), 30, 0, 360, 1, -1)
+    cv2.rectangle(masks[3], (5, 5), (6, 40), 1, -1)
+    masks = masks.astype(bool)
+    xyxy = np.array(
+        [[0, 30, 59, 49], [15, 15, 35, 35], [20, 15, 40, 25], [5.5, 5.5, 6.5, 40]],
+        dtype=np.float32,
+    )
+
+    # when
+    result_with_boxes = masks_to_first_polygons(masks=masks, xyxy=xyxy)
+    result_without_boxes = masks_to_first_polygons(masks=masks)
+
+    # then
+    expected = [sv.mask_to_polygons(mask=mask)[0] for mask in masks]
+    for polygons in [result_with_boxes, result_without_boxes]:
+        assert len(polygons) == len(expected)
+        for polygon, expected_polygon in zip(polygons, expected):
+            assert np.array_equal(polygon, expected_polygon)
+
+
 def test_serialise_image() -> None:
     # given
     np_image = np.zeros((192, 168, 3), dtype=np.uint8)
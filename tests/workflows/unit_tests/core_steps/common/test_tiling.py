@@ -0,0 +1,197 @@
+from typing import Optional
+
+import numpy as np
+import pytest
+import supervision as sv
+
+from inference.core.workflows.core_steps.common.tiling import (
+    generate_tiles,
+    stitch_tiles_detections,
+)
+from inference.core.workflows.execution_engine.constants import IMAGE_DIMENSIONS_KEY
+from inference.core.workflows.execution_engine.entities.base import (
+    ImageParentMetadata,
+    WorkflowImageData,
+)
+
+
+def create_tile_detections(
+    xyxy: list,
+    confidence: list,
+    class_id: list,
+    mask_wh: Optional[tuple] = None,
+) -> sv.Detections:
+    mask = None
+    if mask_wh is not None:
+        mask = np.zeros((len(xyxy), mask_wh[1], mask_wh[0]), dtype=bool)
+        for single_mask, (x_min, y_min, x_max, y_max) in zip(mask, xyxy):
+            single_mask[y_min:y_max, x_min:x_max] = True
+    return sv.Detections(
+        xyxy=np.array(xyxy, dtype=np.float64).reshape(-1, 4),
+        mask=mask,
+        confidence=np.array(confidence, dtype=np.float64),
+        class_id=np.array(class_id, dtype=int),
+        data={"class_name": np.array([f"class_{c}" for c in class_id], dtype=str)},
+    )
+
+
+def test_generate_tiles_creates_views_of_image_with_offsets() -> None:
+    # given
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="image"),
+        numpy_image=np.zeros((100, 150, 3), dtype=np.uint8),
+    )
+
+    # when
+    tiles, offsets = generate_tiles(
+        image=image, slice_wh=(100, 100), overlap_ratio_wh=(0.5, 0.0)
+    )
+
+    # then
+    assert offsets.tolist() == [[0, 0], [50, 0], [100, 0]]
+    assert [t.numpy_image.shape for t in tiles] == [
+        (100, 100, 3),
+        (100, 100, 3),
+        (100, 50, 3),
+    ]
+    assert all(np.shares_memory(t.numpy_image, image.numpy_image) for t in tiles)
+    assert [t.parent_metadata.origin_coordinates.left_top_x for t in tiles] == [
+        0,
+        50,
+        100,
+    ]
+
+
+def test_stitch_tiles_detections_shifts_boxes_and_applies_class_aware_nms() -> None:
+    # given
+    tiles_detections = [
+        create_tile_detections(
+            xyxy=[[40, 10, 60, 30], [0, 0, 10, 10]],
+            confidence=[0.9, 0.5],
+            class_id=[0, 1],
+        ),
+        create_tile_detections(xyxy=[], confidence=[], class_id=[]),
+        create_tile_detections(
+            xyxy=[[0, 10, 20, 30], [1, 10, 21, 30]],
+            confidence=[0.8, 0.7],
+            class_id=[0, 1],
+        ),
+    ]
+
+    # when
+    result = stitch_tiles_detections(
+        tiles_detections=tiles_detections,
+        offsets=np.array([[0, 0], [0, 50], [40, 0]]),
+        resolution_wh=(100, 80),
+        iou_threshold=0.5,
+        class_agnostic_nms=False,
+    )
+
+    # then
+    assert np.allclose(
+        result.xyxy, np.array([[40, 10, 60, 30], [0, 0, 10, 10], [41, 10, 61, 30]])
+    )
+    assert result.class_id.tolist() == [0, 1, 1]
+    assert result["class_name"].tolist() == ["class_0", "class_1", "class_1"]
+    assert result[IMAGE_DIMENSIONS_KEY].tolist() == [[80, 100]] * 3
+
+
+def test_stitch_tiles_detections_when_class_agnostic_nms_requested() -> None:
+    # given
+    tiles_detections = [
+        create_tile_detections(
+            xyxy=[[40, 10, 60, 30], [0, 0, 10, 10]],
+            confidence=[0.9, 0.5],
+            class_id=[0, 1],
+        ),
+        create_tile_detections(
+            xyxy=[[0, 10, 20, 30], [1, 10, 21, 30], [30, 30, 40, 40]],
+            confidence=[0.8, 0.7, 0.6],
+            class_id=[0, 1, 2],
+        ),
+    ]
+
+    # when
+    result = stitch_tiles_detections(
+        tiles_detections=tiles_detections,
+        offsets=np.array([[0, 0], [40, 0]]),
+        resolution_wh=(100, 80),
+        iou_threshold=0.5,
+        class_agnostic_nms=True,
+    )
+
+    # then
+    assert np.allclose(
+        result.xyxy, np.array([[40, 10, 60, 30], [0, 0, 10, 10], [70, 30, 80, 40]])
+    )
+    assert result.confidence.tolist() == [0.9, 0.5, 0.6]
+
+
+def test_stitch_tiles_detections_pastes_masks_of_kept_detections() -> None:
+    # given
+    tiles_detections = [
+        create_tile_detections(
+            xyxy=[[40, 10, 50, 30]],
+            confidence=[0.9],
+            class_id=[0],
+            mask_wh=(50, 50),
+        ),
+        create_tile_detections(
+            xyxy=[[0, 10, 10, 30], [20, 0, 30, 10]],
+            confidence=[0.8, 0.7],
+            class_id=[0, 0],
+            mask_wh=(30, 50),
+        ),
+    ]
+
+    # when
+    result = stitch_tiles_detections(
+        tiles_detections=tiles_detections,
+        offsets=np.array([[0, 0], [40, 20]]),
+        resolution_wh=(70, 70),
+        iou_threshold=0.5,
+        class_agnostic_nms=False,
+    )
+
+    # then
+    assert result.mask.shape == (3, 70, 70)
+    for mask, (x_min, y_min, x_max, y_max) in zip(result.mask, result.xyxy.astype(int)):
+        expected_mask = np.zeros((70, 70), dtype=bool)
+        expected_mask[y_min:y_max, x_min:x_max] = True
+        assert np.array_equal(mask, expected_mask)
+
+
+def test_stitch_tiles_detections_when_all_tiles_are_empty() -> None:
+    # given
+    tiles_detections = [
+        create_tile_detections(xyxy=[], confidence=[], class_id=[], mask_wh=(50, 50)),
+        create_tile_detections(xyxy=[], confidence=[], class_id=[], mask_wh=(20, 50)),
+    ]
+
+    # when
+    result = stitch_tiles_detections(
+        tiles_detections=tiles_detections,
+        offsets=np.array([[0, 0], [50, 0]]),
+        resolution_wh=(70, 50),
+        iou_threshold=0.5,
+        class_agnostic_nms=False,
+    )
+
+    # then
+    assert len(result) == 0
+    assert result.mask.shape == (0, 50, 70)
+    assert "class_name" in result.data
+
+
+def test_stitch_tiles_detections_when_offsets_do_not_match_tiles() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = stitch_tiles_detections(
+            tiles_detections=[
+                create_tile_detections(xyxy=[], confidence=[], class_id=[])
+            ],
+            offsets=np.array([[0, 0], [50, 0]]),
+            resolution_wh=(70, 50),
+            iou_threshold=0.5,
+            class_agnostic_nms=False,
+        )
@@ -1,10 +1,29 @@
-from typing import Any
+from typing import Any, List
+from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
+from inference.core.entities.requests.inference import ObjectDetectionInferenceRequest
+from inference.core.entities.responses.inference import (
+    InferenceResponseImage,
+    ObjectDetectionInferenceResponse,
+    ObjectDetectionPrediction,
+)
+from inference.core.workflows.core_steps.common.entities import StepExecutionMode
 from inference.core.workflows.core_steps.models.roboflow.object_detection.v2 import (
     BlockManifest,
+    RoboflowObjectDetectionModelBlockV2,
+)
+from inference.core.workflows.execution_engine.constants import (
+    IMAGE_DIMENSIONS_KEY,
+    PARENT_ID_KEY,
+)
+from inference.core.workflows.execution_engine.entities.base import (
+    Batch,
+    ImageParentMetadata,
+    WorkflowImageData,
 )
 
 
@@ -109,6 +128,10 @@ def test_object_detection_model_validation_when_active_learning_flag_has_invalid
         ("iou_threshold", 1.1),
         ("max_detections", 0),
         ("max_candidates", 0),
+        ("tiled_inference", "some"),
+        ("slice_width", 0),
+        ("overlap_ratio_width", 1.0),
+        ("overlap_ratio_height", -0.1),
     ],
 )
 def test_object_detection_model_when_parameters_have_invalid_type(
@@ -127,3 +150,116 @@ def test_object_detection_model_when_parameters_have_invalid_type(
     # when
     with pytest.raises(ValidationError):
         _ = BlockManifest.validate(data)
+
+
+def test_object_detection_model_validation_when_tiled_inference_is_configured() -> None:
+    # given
+    data = {
+        "type": "roboflow_core/roboflow_object_detection_model@v2",
+        "name": "some",
+        "images": "$inputs.image",
+        "model_id": "some/1",
+        "tiled_inference": True,
+        "slice_width": 320,
+        "slice_height": "$inputs.slice_height",
+        "overlap_ratio_width": 0.1,
+        "overlap_ratio_height": "$inputs.overlap",
+    }
+
+    # when
+    result = BlockManifest.validate(data)
+
+    # then
+    assert result.tiled_inference is True
+    assert result.slice_width == 320
+    assert result.slice_height == "$inputs.slice_height"
+    assert result.overlap_ratio_width == 0.1
+    assert result.overlap_ratio_height == "$inputs.overlap"
+
+
+def infer_bright_objects(
+    model_id: str, request: ObjectDetectionInferenceRequest
+) -> List[ObjectDetectionInferenceResponse]:
+    # fake model detecting bounding box of all non-zero pixels of the image
+    responses = []
+    for image in request.image:
+        pixels = image.value
+        ys, xs = np.nonzero(pixels[:, :, 0])
+        predictions = []
+        if len(xs):
+            x_min, x_max, y_min, y_max = xs.min(), xs.max() + 1, ys.min(), ys.max() + 1
+            predictions.append(
+                ObjectDetectionPrediction(
+                    **{
+                        "x": (x_min + x_max) / 2,
+                        "y": (y_min + y_max) / 2,
+                        "width": x_max - x_min,
+                        "height": y_max - y_min,
+                        "confidence": len(xs) / pixels[:, :, 0].size,
+                        "class": "object",
+                        "class_id": 0,
+                    }
+                )
+            )
+        responses.append(
+            ObjectDetectionInferenceResponse(
+                predictions=predictions,
+                image=InferenceResponseImage(
+                    width=pixels.shape[1], height=pixels.shape[0]
+                ),
+            )
+        )
+    return responses
+
+
+def test_object_detection_model_block_in_tiled_inference_mode() -> None:
+    # given
+    model_manager = MagicMock()
+    model_manager.__getitem__.return_value = MagicMock(batching_enabled=True)
+    model_manager.infer_from_request_sync.side_effect = infer_bright_objects
+    pixels = np.zeros((200, 300, 3), dtype=np.uint8)
+    pixels[20:40, 30:60] = 255
+    pixels[150:170, 250:280] = 255
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="image"),
+        numpy_image=pixels,
+    )
+    block = RoboflowObjectDetectionModelBlockV2(
+        model_manager=model_manager,
+        api_key=None,
+        step_execution_mode=StepExecutionMode.LOCAL,
+    )
+
+    # when
+    result = block.run(
+        images=Batch(content=[image, image], indices=[(0,), (1,)]),
+        model_id="some/1",
+        class_agnostic_nms=False,
+        class_filter=None,
+        confidence=0.4,
+        iou_threshold=0.3,
+        max_detections=300,
+        max_candidates=3000,
+        disable_active_learning=True,
+        active_learning_target_dataset=None,
+        tiled_inference=True,
+        slice_width=100,
+        slice_height=100,
+        overlap_ratio_width=0.0,
+        overlap_ratio_height=0.0,
+    )
+
+    # then
+    requested_images = sum(
+        len(call.kwargs["request"].image)
+        for call in model_manager.infer_from_request_sync.call_args_list
+    )
+    assert requested_images == 12, "Expected 6 tiles of each image to be inferred"
+    assert len(result) == 2
+    for image_result in result:
+        detections = image_result["predictions"]
+        assert np.allclose(
+            detections.xyxy, np.array([[30, 20, 60, 40], [250, 150, 280, 170]])
+        )
+        assert detections[PARENT_ID_KEY].tolist() == ["image", "image"]
+        assert detections[IMAGE_DIMENSIONS_KEY].tolist() == [[200, 300], [200, 300]]
@@ -1,11 +1,13 @@
 from datetime import datetime
 from typing import Tuple, Union
+from unittest import mock
 
 import numpy as np
 import pytest
 import supervision as sv
 from pydantic import ValidationError
 
+from inference.core.workflows.core_steps.transformations.dynamic_crop import v1
 from inference.core.workflows.core_steps.transformations.dynamic_crop.v1 import (
     BlockManifest,
     convert_color_to_bgr_tuple,
@@ -402,3 +404,68 @@ def test_crop_image_when_background_removal_requested_and_mask_found() -> None:
     assert (
         result[2]["crops"].numpy_image == expected_third_crop
     ).all(), "Image must have expected size and color"
+
+
+def test_crop_image_does_not_copy_pixels_of_origin_image() -> None:
+    # given
+    np_image = np.random.randint(0, 256, size=(1000, 1000, 3), dtype=np.uint8)
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="origin_image"),
+        numpy_image=np_image,
+    )
+    detections = sv.Detections(
+        xyxy=np.array([[0, 0, 20, 20], [80, 80, 120, 120]], dtype=np.float64),
+        class_id=np.array([1, 1]),
+        confidence=np.array([0.5, 0.5], dtype=np.float64),
+        data={"detection_id": np.array(["one", "two"])},
+    )
+
+    # when
+    result = crop_image(
+        image=image, detections=detections, mask_opacity=0.0, background_color=(0, 0, 0)
+    )
+
+    # then
+    assert all(np.shares_memory(r["crops"].numpy_image, np_image) for r in result)
+    assert np.array_equal(result[1]["crops"].numpy_image, np_image[80:120, 80:120])
+
+
+def test_crop_image_defers_background_removal_until_crop_pixels_are_needed() -> None:
+    # given
+    np_image = np.ones((100, 100, 3), dtype=np.uint8) * 39
+    mask = np.zeros((2, 100, 100), dtype=np.bool_)
+    mask[0, 0:15, 0:15] = 1
+    mask[1, 50:55, 50:55] = 1
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="origin_image"),
+        numpy_image=np_image,
+    )
+    detections = sv.Detections(
+        xyxy=np.array([[0, 0, 20, 20], [50, 50, 60, 60]], dtype=np.float64),
+        class_id=np.array([1, 1]),
+        mask=mask,
+        confidence=np.array([0.5, 0.5], dtype=np.float64),
+        data={"detection_id": np.array(["one", "two"])},
+    )
+
+    # when
+    with mock.patch.object(
+        v1, "overlay_crop_with_mask", wraps=v1.overlay_crop_with_mask
+    ) as overlay_mock:
+        result = crop_image(
+            image=image,
+            detections=detections,
+            mask_opacity=1.0,
+            background_color=(127, 127, 127),
+        )
+        calls_before_access = overlay_mock.call_count
+        first_crop = result[0]["crops"].numpy_image
+        _ = result[0]["crops"].numpy_image
+
+    # then
+    assert calls_before_access == 0, "Expected overlay not to be computed eagerly"
+    assert overlay_mock.call_count == 1, "Expected only accessed crop to be computed"
+    expected_first_crop = np.ones((20, 20, 3), dtype=np.uint8) * 127
+    expected_first_crop[0:15, 0:15, :] = 39
+    assert np.array_equal(first_crop, expected_first_crop)
+    assert result[1]["crops"].parent_metadata.origin_coordinates.left_top_x == 50
@@ -3,6 +3,7 @@ import pytest
 from inference.core.workflows.errors import WorkflowEnvironmentConfigurationError
 from inference.core.workflows.execution_engine.v1.compiler.cache import (
     BasicWorkflowsCache,
+    compute_workflow_definition_fingerprint,
 )
 
 
@@ -83,3 +84,19 @@ def test_cache_being_emptied_properly() -> None:
     assert cache.get(key_one) is None
     assert cache.get(key_two) == "my_value_2"
     assert cache.get(key_three) == "my_value_3"
+
+
+def test_workflow_definition_fingerprint_does_not_depend_on_keys_order() -> None:
+    # given
+    first_definition = {"version": "1.0", "inputs": [], "steps": [{"a": 1, "b": 2}]}
+    second_definition = {"steps": [{"b": 2, "a": 1}], "inputs": [], "version": "1.0"}
+
+    # when
+    first_result = compute_workflow_definition_fingerprint(first_definition)
+    second_result = compute_workflow_definition_fingerprint(second_definition)
+
+    # then
+    assert first_result == second_result
+    assert first_result != compute_workflow_definition_fingerprint(
+        {"version": "1.1", "inputs": [], "steps": [{"a": 1, "b": 2}]}
+    )
@@ -0,0 +1,223 @@
+from typing import Type
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+import supervision as sv
+
+from inference.core.workflows.core_steps.analytics.line_counter.v2 import (
+    LineCounterBlockV2,
+)
+from inference.core.workflows.core_steps.analytics.path_deviation.v2 import (
+    PathDeviationAnalyticsBlockV2,
+)
+from inference.core.workflows.core_steps.analytics.time_in_zone.v2 import (
+    TimeInZoneBlockV2,
+)
+from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.core_steps.transformations.byte_tracker.v3 import (
+    ByteTrackerBlockV3,
+)
+from inference.core.workflows.core_steps.transformations.stabilize_detections.v1 import (
+    StabilizeTrackedDetectionsBlockV1,
+)
+from inference.core.workflows.core_steps.visualizations.trace.v1 import (
+    TraceVisualizationBlockV1,
+)
+from inference.core.workflows.execution_engine.v1.compiler.pool import (
+    CompiledWorkflowsPool,
+)
+
+WORKFLOW_WITH_TRACKER = {
+    "version": "1.0",
+    "inputs": [
+        {"type": "WorkflowImage", "name": "image"},
+    ],
+    "steps": [
+        {
+            "type": "ObjectDetectionModel",
+            "name": "model",
+            "image": "$inputs.image",
+            "model_id": "yolov8n-640",
+        },
+        {
+            "type": "roboflow_core/byte_tracker@v3",
+            "name": "byte_tracker",
+            "image": "$inputs.image",
+            "detections": "$steps.model.predictions",
+        },
+        {
+            "type": "roboflow_core/trace_visualization@v1",
+            "name": "trace_visualization",
+            "image": "$inputs.image",
+            "predictions": "$steps.byte_tracker.tracked_detections",
+        },
+        {
+            "type": "roboflow_core/bounding_box_visualization@v1",
+            "name": "bounding_box_visualization",
+            "image": "$inputs.image",
+            "predictions": "$steps.byte_tracker.tracked_detections",
+        },
+    ],
+    "outputs": [
+        {
+            "type": "JsonField",
+            "name": "visualization",
+            "selector": "$steps.trace_visualization.image",
+        },
+        {
+            "type": "JsonField",
+            "name": "bounding_boxes",
+            "selector": "$steps.bounding_box_visualization.image",
+        },
+    ],
+}
+
+
+def _init_parameters(model_manager: MagicMock, api_key: str = "my-key") -> dict:
+    return {
+        "workflows_core.model_manager": model_manager,
+        "workflows_core.api_key": api_key,
+        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
+    }
+
+
+def test_pool_shares_stateless_steps_and_instantiates_stateful_ones_per_run() -> None:
+    # given
+    pool = CompiledWorkflowsPool(size=4)
+    model_manager = MagicMock()
+
+    # when
+    first = pool.get_compiled_workflow(
+        workflow_definition=WORKFLOW_WITH_TRACKER,
+        init_parameters=_init_parameters(model_manager=model_manager),
+    )
+    second = pool.get_compiled_workflow(
+        workflow_definition=WORKFLOW_WITH_TRACKER,
+        init_parameters=_init_parameters(model_manager=model_manager),
+    )
+
+    # then
+    assert first is not second
+    assert first.steps["model"].step is second.steps["model"].step
+    assert (
+        first.steps["bounding_box_visualization"].step
+        is second.steps["bounding_box_visualization"].step
+    )
+    assert first.steps["byte_tracker"].step is not second.steps["byte_tracker"].step
+    assert (
+        first.steps["trace_visualization"].step
+        is not second.steps["trace_visualization"].step
+    )
+    assert first.execution_graph is second.execution_graph
+
+
+def test_pool_does_not_share_steps_when_init_parameters_differ() -> None:
+    # given
+    pool = CompiledWorkflowsPool(size=4)
+
+    # when
+    first = pool.get_compiled_workflow(
+        workflow_definition=WORKFLOW_WITH_TRACKER,
+        init_parameters=_init_parameters(model_manager=MagicMock()),
+    )
+    second = pool.get_compiled_workflow(
+        workflow_definition=WORKFLOW_WITH_TRACKER,
+        init_parameters=_init_parameters(model_manager=MagicMock()),
+    )
+    third = pool.get_compiled_workflow(
+        workflow_definition=WORKFLOW_WITH_TRACKER,
+        init_parameters=_init_parameters(
+            model_manager=MagicMock(), api_key="other-key"
+        ),
+    )
+
+    # then
+    assert first.steps["model"].step is not second.steps["model"].step
+    assert second.steps["model"].step is not third.steps["model"].step
+
+
+def test_pool_instantiates_steps_requesting_per_run_init_parameters() -> None:
+    # given
+    pool = CompiledWorkflowsPool(
+        size=4,
+        per_run_init_parameters={"workflows_core.api_key"},
+    )
+    model_manager = MagicMock()
+
+    # when
+    first = pool.get_compiled_workflow(
+        workflow_definition=WORKFLOW_WITH_TRACKER,
+        init_parameters=_init_parameters(model_manager=model_manager),
+    )
+    second = pool.get_compiled_workflow(
+        workflow_definition=WORKFLOW_WITH_TRACKER,
+        init_parameters=_init_parameters(
+            model_manager=model_manager, api_key="other-key"
+        ),
+    )
+
+    # then
+    assert first.steps["model"].step is not second.steps["model"].step
+    assert second.steps["model"].step._api_key == "other-key"
+    assert (
+        first.steps["bounding_box_visualization"].step
+        is second.steps["bounding_box_visualization"].step
+    )
+    assert second.init_parameters["workflows_core.api_key"] == "other-key"
+
+
+def test_pool_does_not_share_trace_history_between_runs() -> None:
+    # given
+    pool = CompiledWorkflowsPool(size=4)
+    model_manager = MagicMock()
+    first = pool.get_compiled_workflow(
+        workflow_definition=WORKFLOW_WITH_TRACKER,
+        init_parameters=_init_parameters(model_manager=model_manager),
+    )
+    detections = sv.Detections(
+        xyxy=np.array([[10, 10, 20, 20]], dtype=np.float64),
+        class_id=np.array([0]),
+        tracker_id=np.array([1]),
+    )
+    annotator = first.steps["trace_visualization"].step.getAnnotator(
+        color_palette="DEFAULT",
+        palette_size=10,
+        custom_colors=[],
+        color_axis="CLASS",
+        position="CENTER",
+        trace_length=30,
+        thickness=1,
+    )
+    _ = annotator.annotate(
+        scene=np.zeros((32, 32, 3), dtype=np.uint8), detections=detections
+    )
+
+    # when
+    second = pool.get_compiled_workflow(
+        workflow_definition=WORKFLOW_WITH_TRACKER,
+        init_parameters=_init_parameters(model_manager=model_manager),
+    )
+
+    # then
+    assert len(first.steps["trace_visualization"].step.annotatorCache) == 1
+    assert second.steps["trace_visualization"].step.annotatorCache == {}
+
+
+@pytest.mark.parametrize(
+    "block_class",
+    [
+        ByteTrackerBlockV3,
+        TraceVisualizationBlockV1,
+        TimeInZoneBlockV2,
+        LineCounterBlockV2,
+        PathDeviationAnalyticsBlockV2,
+        StabilizeTrackedDetectionsBlockV1,
+    ],
+)
+def test_blocks_keeping_state_between_runs_are_not_shared_by_pool(
+    block_class: Type,
+) -> None:
+    # blocks keeping state of videos / tracks in instance must never be shared among
+    # requests by `CompiledWorkflowsPool`
+    assert block_class.is_stateful() is True
@@ -1,5 +1,9 @@
 import base64
 import os
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest import mock
 from unittest.mock import MagicMock
@@ -951,3 +955,106 @@ def test_workflow_image_build_create_crop_with_video_metadata_preservation() ->
         result.video_metadata.video_identifier == "video_id | crop: my_crop"
     ), "Expected preserved metadata with updated id"
     assert result.video_metadata.fps == 40, "Expected preserved metadata"
+
+
+@mock.patch.object(base, "attempt_loading_image_from_string")
+def test_workflow_image_decodes_base64_image_once_when_accessed_concurrently(
+    attempt_loading_image_from_string_mock: MagicMock,
+) -> None:
+    # given
+    calls_lock = threading.Lock()
+    calls = []
+
+    def decode(value: str) -> tuple:
+        with calls_lock:
+            calls.append(value)
+        time.sleep(0.05)
+        return np.zeros((192, 168, 3), dtype=np.uint8), True
+
+    attempt_loading_image_from_string_mock.side_effect = decode
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        base64_image="base64-payload",
+    )
+
+    # when
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: image.numpy_image, range(8)))
+
+    # then
+    assert calls == ["base64-payload"], "Expected image to be decoded exactly once"
+    assert all(result is results[0] for result in results)
+
+
+@mock.patch.object(base, "attempt_loading_image_from_string")
+def test_workflow_image_does_not_decode_image_to_provide_encoded_representation(
+    attempt_loading_image_from_string_mock: MagicMock,
+) -> None:
+    # given
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        base64_image="base64-payload",
+    )
+
+    # when
+    base64_image = image.base64_image
+    video_metadata = image.video_metadata
+    inference_format = image.to_inference_format()
+
+    # then
+    assert base64_image == "base64-payload"
+    assert video_metadata.video_identifier == "parent"
+    assert inference_format == {"type": "base64", "value": "base64-payload"}
+    attempt_loading_image_from_string_mock.assert_not_called()
+
+
+def test_workflow_image_can_be_pickled() -> None:
+    # given
+    base64_image = base64.b64encode(
+        cv2.imencode(".png", np.zeros((192, 168, 3), dtype=np.uint8))[1]
+    ).decode("ascii")
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        base64_image=base64_image,
+    )
+
+    # when
+    result = pickle.loads(pickle.dumps(image))
+
+    # then
+    assert result.base64_image == base64_image
+    assert np.allclose(result.numpy_image, np.zeros((192, 168, 3), dtype=np.uint8))
+
+
+def test_workflow_image_crop_materialised_by_factory_once() -> None:
+    # given
+    origin_image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        numpy_image=np.zeros((192, 168, 3), dtype=np.uint8),
+    )
+    factory = MagicMock(return_value=np.ones((10, 20, 3), dtype=np.uint8))
+
+    # when
+    crop = WorkflowImageData.create_crop(
+        origin_image_data=origin_image,
+        crop_identifier="crop",
+        cropped_image=None,
+        offset_x=5,
+        offset_y=10,
+        cropped_image_factory=factory,
+    )
+    replaced = WorkflowImageData.copy_and_replace(
+        origin_image_data=crop,
+        parent_metadata=ImageParentMetadata(parent_id="other"),
+    )
+    factory.assert_not_called()
+    first_result = crop.numpy_image
+    second_result = crop.numpy_image
+
+    # then
+    assert factory.call_count == 1
+    assert first_result is second_result
+    assert np.array_equal(first_result, np.ones((10, 20, 3), dtype=np.uint8))
+    assert crop.parent_metadata.origin_coordinates.left_top_x == 5
+    assert crop.parent_metadata.origin_coordinates.left_top_y == 10
+    assert replaced.numpy_image.shape == (10, 20, 3)
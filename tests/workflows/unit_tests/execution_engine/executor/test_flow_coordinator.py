@@ -153,6 +153,77 @@ def test_parallel_flow_coordinator_when_there_are_two_parallel_execution_paths()
     assert result is None, "Execution path should end up to this point"
 
 
+def test_parallel_flow_coordinator_releases_steps_as_soon_as_their_predecessors_complete() -> (
+    None
+):
+    # given
+    graph = nx.DiGraph()
+    graph.add_node("input_1", node_compilation_output=assembly_dummy_input("input_1"))
+    for step in ["step_1", "step_2", "step_3", "step_4"]:
+        graph.add_node(step, node_compilation_output=assembly_dummy_step(step))
+    graph.add_node(
+        "output_1", node_compilation_output=assembly_dummy_output("output_1")
+    )
+    graph.add_edge("input_1", "step_1")
+    graph.add_edge("input_1", "step_2")
+    graph.add_edge("step_1", "step_3")
+    graph.add_edge("step_2", "step_4")
+    graph.add_edge("step_1", "step_4")
+    graph.add_edge("step_3", "output_1")
+    graph.add_edge("step_4", "output_1")
+
+    # when
+    coordinator = ParallelStepExecutionCoordinator.init(execution_graph=graph)
+
+    # then
+    assert set(coordinator.get_steps_ready_for_execution()) == {"step_1", "step_2"}
+    assert coordinator.get_steps_ready_for_execution() == []
+    coordinator.mark_step_as_completed(step_selector="step_1")
+    assert coordinator.get_steps_ready_for_execution() == [
+        "step_3"
+    ], "step_3 depends only on step_1 - must not wait for step_2"
+    coordinator.mark_step_as_completed(step_selector="step_3")
+    assert coordinator.get_steps_ready_for_execution() == []
+    coordinator.mark_step_as_completed(step_selector="step_2")
+    assert coordinator.get_steps_ready_for_execution() == ["step_4"]
+    assert not coordinator.all_steps_completed()
+    coordinator.mark_step_as_completed(step_selector="step_4")
+    assert coordinator.all_steps_completed()
+
+
+def test_parallel_flow_coordinator_prioritises_steps_heading_critical_path() -> None:
+    # given
+    graph = nx.DiGraph()
+    graph.add_node("input_1", node_compilation_output=assembly_dummy_input("input_1"))
+    for step in ["step_a", "step_b", "step_c", "step_d", "step_e"]:
+        graph.add_node(step, node_compilation_output=assembly_dummy_step(step))
+    graph.add_node(
+        "output_1", node_compilation_output=assembly_dummy_output("output_1")
+    )
+    graph.add_edge("input_1", "step_a")
+    graph.add_edge("input_1", "step_b")
+    graph.add_edge("input_1", "step_c")
+    graph.add_edge("step_c", "step_d")
+    graph.add_edge("step_d", "step_e")
+    for step in ["step_a", "step_b", "step_e"]:
+        graph.add_edge(step, "output_1")
+
+    # when
+    coordinator = ParallelStepExecutionCoordinator.init(execution_graph=graph)
+
+    # then
+    assert coordinator.get_critical_path_length(step_selector="step_c") == 3
+    assert coordinator.get_steps_ready_for_execution(limit=1) == [
+        "step_c"
+    ], "step_c heads the longest chain of steps, so it must go first"
+    coordinator.mark_step_as_completed(step_selector="step_c")
+    assert coordinator.get_steps_ready_for_execution(limit=2) == [
+        "step_d",
+        "step_a",
+    ], "step_d (which became ready later) must overtake remaining steps"
+    assert coordinator.get_steps_ready_for_execution() == ["step_b"]
+
+
 def assembly_dummy_input(name: str) -> InputNode:
     return InputNode(
         node_category=NodeCategory.INPUT_NODE,
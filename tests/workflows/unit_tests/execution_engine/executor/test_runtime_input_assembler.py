@@ -1,9 +1,11 @@
+import base64
 import time
 from datetime import datetime
 from typing import Any
 from unittest import mock
 from unittest.mock import MagicMock
 
+import cv2
 import numpy as np
 import pytest
 
@@ -46,12 +48,14 @@ def test_assemble_runtime_parameters_when_image_is_not_provided() -> None:
         )
 
 
-@mock.patch.object(deserializers, "load_image_from_url")
+@mock.patch.object(deserializers, "load_image_bytes_from_url")
 def test_assemble_runtime_parameters_when_image_is_provided_as_single_element_dict(
-    load_image_from_url_mock: MagicMock,
+    load_image_bytes_from_url_mock: MagicMock,
 ) -> None:
     # given
-    load_image_from_url_mock.return_value = np.zeros((192, 168, 3), dtype=np.uint8)
+    load_image_bytes_from_url_mock.return_value = cv2.imencode(
+        ".png", np.zeros((192, 168, 3), dtype=np.uint8)
+    )[1].tobytes()
     runtime_parameters = {
         "image1": {
             "type": "url",
@@ -79,6 +83,60 @@ def test_assemble_runtime_parameters_when_image_is_provided_as_single_element_di
     ), "Expected parent id to be given after input param name"
 
 
+@mock.patch.object(deserializers, "attempt_loading_image_from_string")
+def test_assemble_runtime_parameters_when_image_is_provided_as_base64_encoded_jpeg(
+    attempt_loading_image_from_string_mock: MagicMock,
+) -> None:
+    # given
+    base64_image = base64.b64encode(
+        cv2.imencode(".jpg", np.zeros((192, 168, 3), dtype=np.uint8))[1]
+    ).decode("ascii")
+    runtime_parameters = {"image1": {"type": "base64", "value": base64_image}}
+    defined_inputs = [WorkflowImage(type="WorkflowImage", name="image1")]
+
+    # when
+    result = assemble_runtime_parameters(
+        runtime_parameters=runtime_parameters,
+        defined_inputs=defined_inputs,
+        kinds_deserializers=KINDS_DESERIALIZERS,
+    )
+
+    # then
+    attempt_loading_image_from_string_mock.assert_not_called()
+    assert (
+        result["image1"][0].base64_image == base64_image
+    ), "Expected original payload to be preserved"
+    assert np.allclose(
+        result["image1"][0].numpy_image, np.zeros((192, 168, 3), dtype=np.uint8)
+    ), "Expected image to be decoded on first access"
+
+
+@pytest.mark.parametrize("encoded_image_size", [100, 4])
+def test_assemble_runtime_parameters_when_image_is_provided_as_corrupted_base64_encoded_jpeg(
+    encoded_image_size: int,
+) -> None:
+    # given
+    encoded_image = cv2.imencode(".jpg", np.zeros((192, 168, 3), dtype=np.uint8))[
+        1
+    ].tobytes()
+    corrupted_image = encoded_image[:encoded_image_size] + b"\x00" * 64
+    runtime_parameters = {
+        "image1": {
+            "type": "base64",
+            "value": base64.b64encode(corrupted_image).decode("ascii"),
+        }
+    }
+    defined_inputs = [WorkflowImage(type="WorkflowImage", name="image1")]
+
+    # when
+    with pytest.raises(RuntimeInputError):
+        _ = assemble_runtime_parameters(
+            runtime_parameters=runtime_parameters,
+            defined_inputs=defined_inputs,
+            kinds_deserializers=KINDS_DESERIALIZERS,
+        )
+
+
 def test_assemble_runtime_parameters_when_image_is_provided_as_single_element_dict_pointing_local_file_when_load_of_local_files_allowed(
     example_image_file: str,
 ) -> None:
@@ -2,8 +2,11 @@ from typing import Optional
 
 from inference.core.workflows.execution_engine.profiling.core import (
     BaseWorkflowsProfiler,
+    NullWorkflowsProfiler,
     WorkflowsProfiler,
     execution_phase,
+    get_step_profiler,
+    step_profiler_context,
 )
 
 
@@ -404,3 +407,25 @@ def test_base_profiler_workflow_run_start_handling_pre_workflow_start_events() -
     assert len(trace) == 3, "Expected three events in trace"
     events_names = [e["name"] for e in trace]
     assert events_names == ["pre_start_event", "workflow_run", "event_1"]
+
+
+def test_get_step_profiler_outside_of_step_execution() -> None:
+    # when
+    result = get_step_profiler()
+
+    # then
+    assert isinstance(result, NullWorkflowsProfiler)
+
+
+def test_get_step_profiler_within_step_execution() -> None:
+    # given
+    profiler = BaseWorkflowsProfiler.init()
+
+    # when
+    with step_profiler_context(profiler=profiler):
+        result = get_step_profiler()
+    result_after_context = get_step_profiler()
+
+    # then
+    assert result is profiler
+    assert isinstance(result_after_context, NullWorkflowsProfiler)